@@ -0,0 +1,76 @@
+"""Compare whole-game simulation speed of the scalar and batch engines.
+
+Plays random-vs-random two-player games to the end: once with a MaskBoard
+per player (one salvo per board per step in Python), once with the NumPy
+BatchBoards engine (one salvo for every board per step). Batch placement is
+also timed on its own. Needs NumPy (`pip install .[sim]`).
+
+Usage:
+    python -m benchmarks.bench_batch [--games N]
+"""
+
+import argparse
+import random
+import time
+
+import numpy as np
+
+from game.batch_engine import BatchBoards, play_random
+from game.mask_board import MaskBoard
+from game.rules import STANDARD_RULES
+
+
+def _scalar_game(rng: random.Random) -> int:
+    """Play one random game on MaskBoards; return the rounds it took."""
+    boards: list[MaskBoard] = []
+    targets: list[list[int]] = []
+    for _ in range(2):
+        board = MaskBoard(STANDARD_RULES)
+        board.place_fleet_randomly(rng)
+        boards.append(board)
+        cells: list[int] = list(range(STANDARD_RULES.grid.cell_count))
+        rng.shuffle(cells)
+        targets.append(cells)
+    rounds: int = 0
+    while not (boards[0].is_defeated or boards[1].is_defeated):
+        rounds += 1
+        shots = (boards[0].shots_available, boards[1].shots_available)
+        for firing, target in ((0, 1), (1, 0)):
+            salvo: list[int] = targets[target][: shots[firing]]
+            del targets[target][: shots[firing]]
+            boards[target].receive_salvo(salvo)
+    return rounds
+
+
+def measure(games: int) -> dict[str, float]:
+    rng = random.Random(0)
+    started: float = time.perf_counter()
+    scalar_rounds: int = sum(_scalar_game(rng) for _ in range(games))
+    scalar: float = time.perf_counter() - started
+
+    started = time.perf_counter()
+    BatchBoards.random(games * 2, seed=0)
+    placement: float = time.perf_counter() - started
+    started = time.perf_counter()
+    outcome = play_random(games, seed=0)
+    batch: float = time.perf_counter() - started - placement
+    return {
+        "scalar games/s": games / scalar,
+        "batch games/s (play only)": games / batch,
+        "batch games/s (with placement)": games / (batch + placement),
+        "scalar mean rounds": scalar_rounds / games,
+        "batch mean rounds": float(np.mean(outcome.rounds)),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=20000)
+    args = parser.parse_args()
+
+    for metric, value in measure(args.games).items():
+        print(f"{metric:<32} {value:>12,.1f}")
+
+
+if __name__ == "__main__":
+    main()
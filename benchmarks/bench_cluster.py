@@ -0,0 +1,169 @@
+"""Measure how login throughput scales with the number of worker processes.
+
+One state owner process (`python main.py --state-owner`) holds the game state
+and N worker processes serve the app with STATE_SOCKET pointing at it, as
+under `uvicorn --workers N`. Every worker logs in its share of the players
+through the full app (POST /login, via a TestClient), which stores each one
+with a single call to the owner. With --bare, workers make that call
+directly, leaving out the HTTP handling.
+
+Wall-clock throughput is only meaningful with a core per process, so the CPU
+time each side spends per login is reported too: with enough cores the
+cluster can serve min(N / worker time, 1 / owner time) logins per second.
+
+Usage:
+    python -m benchmarks.bench_cluster [--operations N] [--workers 1 2 4 8] [--bare]
+"""
+
+import argparse
+import multiprocessing
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from multiprocessing.synchronize import Barrier
+from pathlib import Path
+from typing import NamedTuple
+
+from services.state_owner import StateClient
+
+_ROOT: Path = Path(__file__).resolve().parent.parent
+
+
+class RunResult(NamedTuple):
+    """Throughput and CPU cost per login for one cluster size."""
+
+    logins_per_second: float
+    worker_cpu_per_login: float
+    owner_cpu_per_login: float
+
+    def projected(self, worker_count: int) -> float:
+        """Logins per second with a core for every process."""
+        return min(
+            worker_count / self.worker_cpu_per_login, 1 / self.owner_cpu_per_login
+        )
+
+
+def _worker(
+    index: int,
+    socket_path: str,
+    operations: int,
+    bare: bool,
+    barrier: Barrier,
+    results: "multiprocessing.Queue[tuple[float, float]]",
+) -> None:
+    os.environ["STATE_SOCKET"] = socket_path
+    from fastapi.testclient import TestClient
+
+    import main
+    from game.player import Player, PlayerStatus
+    from routes.auth import _register_player
+
+    with TestClient(main.app) as client:
+        barrier.wait()
+        started: float = time.perf_counter()
+        cpu_started: float = time.process_time()
+        for i in range(operations):
+            name: str = f"W{index} P{i}"
+            if bare:
+                assert main.state_client is not None
+                main.state_client.call(
+                    _register_player, Player(name, PlayerStatus.AVAILABLE), "human"
+                )
+                continue
+            client.cookies.clear()
+            response = client.post(
+                "/login",
+                data={"player_name": name, "game_mode": "human"},
+                follow_redirects=False,
+            )
+            assert response.status_code == 303, response.text
+        cpu: float = time.process_time() - cpu_started
+        finished: float = time.perf_counter()
+        results.put((finished - started, cpu))
+
+
+def _start_owner(socket_path: str) -> subprocess.Popen[bytes]:
+    environment: dict[str, str] = {
+        name: value for name, value in os.environ.items() if name != "STATE_SOCKET"
+    }
+    owner = subprocess.Popen(
+        [sys.executable, "main.py", "--state-owner", socket_path],
+        cwd=_ROOT,
+        env=environment,
+    )
+    while not os.path.exists(socket_path):
+        if owner.poll() is not None:
+            raise RuntimeError("The state owner exited during start-up")
+        time.sleep(0.05)
+    return owner
+
+
+def run(worker_count: int, operations: int, bare: bool = False) -> RunResult:
+    """Log `operations` players in across `worker_count` worker processes."""
+    context = multiprocessing.get_context("spawn")
+    barrier: Barrier = context.Barrier(worker_count + 1)
+    results: multiprocessing.Queue[tuple[float, float]] = context.Queue()
+    per_worker: int = operations // worker_count
+    with tempfile.TemporaryDirectory() as directory:
+        socket_path: str = str(Path(directory) / "state.sock")
+        owner = _start_owner(socket_path)
+        try:
+            processes = [
+                context.Process(
+                    target=_worker,
+                    args=(index, socket_path, per_worker, bare, barrier, results),
+                )
+                for index in range(worker_count)
+            ]
+            for process in processes:
+                process.start()
+            # time.process_time is run in the owner, so this is its CPU time
+            client = StateClient(socket_path)
+            barrier.wait()
+            owner_cpu_started: float = client.call(time.process_time)
+            finished = [results.get() for _ in processes]
+            owner_cpu: float = client.call(time.process_time) - owner_cpu_started
+            for process in processes:
+                process.join()
+        finally:
+            owner.terminate()
+            owner.wait()
+    total: int = per_worker * worker_count
+    return RunResult(
+        logins_per_second=total / max(elapsed for elapsed, _ in finished),
+        worker_cpu_per_login=sum(cpu for _, cpu in finished) / total,
+        owner_cpu_per_login=owner_cpu / total,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--operations", type=int, default=4000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument(
+        "--bare", action="store_true", help="call the owner without HTTP"
+    )
+    args = parser.parse_args()
+
+    print(f"cores available: {len(os.sched_getaffinity(0))}")
+    print(
+        f"{'workers':>7} {'logins/s':>10} {'worker us':>10} {'owner us':>9}"
+        f" {'projected/s':>12} {'speed-up':>9}"
+    )
+    baseline: float | None = None
+    for worker_count in args.workers:
+        result: RunResult = run(worker_count, args.operations, args.bare)
+        projected: float = result.projected(worker_count)
+        baseline = baseline or projected
+        print(
+            f"{worker_count:>7} {result.logins_per_second:>10,.0f}"
+            f" {result.worker_cpu_per_login * 1e6:>10,.0f}"
+            f" {result.owner_cpu_per_login * 1e6:>9,.0f}"
+            f" {projected:>12,.0f} {projected / baseline:>8.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
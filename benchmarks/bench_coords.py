@@ -0,0 +1,94 @@
+"""Compare Coord enum lookups with the flyweight cell tables.
+
+Times adjacency, ship footprints and name parsing three ways: the original
+CoordDetails/enum arithmetic, the public CoordHelper API (now backed by the
+cell tables) and the raw int cell tables used by engine code.
+
+Usage:
+    python -m benchmarks.bench_coords [--number N]
+"""
+
+import argparse
+import timeit
+from collections.abc import Callable
+
+from game.cells import NEIGHBOURS, footprint, parse_cell
+from game.model import Coord, CoordDetails, CoordHelper, Orientation, coord_to_cell
+
+_COORDS_BY_VALUE: dict[CoordDetails, Coord] = {coord.value: coord for coord in Coord}
+
+
+def _enum_adjacent(centre: Coord) -> set[Coord]:
+    """Adjacency as originally written: build CoordDetails, catch KeyError."""
+    adjacent: set[Coord] = set()
+    for row_delta in (-1, 0, 1):
+        for col_delta in (-1, 0, 1):
+            if row_delta == 0 and col_delta == 0:
+                continue
+            try:
+                adjacent.add(
+                    _COORDS_BY_VALUE[
+                        CoordDetails(
+                            centre.value.row_index + row_delta,
+                            centre.value.col_index + col_delta,
+                        )
+                    ]
+                )
+            except KeyError:
+                pass
+    return adjacent
+
+
+def _enum_footprint(start: Coord, length: int) -> list[Coord]:
+    """A diagonal-down footprint as originally written."""
+    return [start] + [
+        _COORDS_BY_VALUE[
+            CoordDetails(start.value.row_index + i, start.value.col_index + i)
+        ]
+        for i in range(1, length)
+    ]
+
+
+def _per_call_ns(operation: Callable[[], object], number: int) -> float:
+    return min(timeit.repeat(operation, number=number, repeat=5)) / number * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000)
+    args = parser.parse_args()
+
+    centre: Coord = Coord.E5
+    cell: int = coord_to_cell(centre)
+    cases: dict[str, dict[str, Callable[[], object]]] = {
+        "adjacency": {
+            "enum": lambda: _enum_adjacent(centre),
+            "CoordHelper": lambda: CoordHelper.coords_adjacent_to_a_coord(centre),
+            "cells": lambda: NEIGHBOURS[cell],
+        },
+        "footprint": {
+            "enum": lambda: _enum_footprint(centre, 5),
+            "CoordHelper": lambda: CoordHelper.coords_for_length_and_orientation(
+                centre, 5, Orientation.DIAGONAL_DOWN
+            ),
+            "cells": lambda: footprint(cell, 5, 1, 1),
+        },
+        "name parsing": {
+            "enum": lambda: Coord["E5"],
+            "CoordHelper": lambda: Coord["e5".upper()],
+            "cells": lambda: parse_cell("e5"),
+        },
+    }
+    print(f"{'operation':<14} {'enum ns':>10} {'CoordHelper ns':>15} {'cells ns':>10}")
+    for name, implementations in cases.items():
+        timings: list[float] = [
+            _per_call_ns(operation, args.number)
+            for operation in implementations.values()
+        ]
+        print(
+            f"{name:<14} {timings[0]:>10,.0f} {timings[1]:>15,.0f} {timings[2]:>10,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Measure memory held per logged-in player and per active game.
+
+Uses tracemalloc to count the bytes still allocated after logging players in
+(GameService plus lobby) and after pairing them into two-player games with
+full fleets placed, then divides by the number of players or games.
+
+Usage:
+    python -m benchmarks.bench_memory [--players N]
+"""
+
+import argparse
+import gc
+import random
+import tracemalloc
+from collections.abc import Callable
+
+from game.game_service import GameService
+from game.lobby import Lobby
+from game.player import Player, PlayerStatus
+from game.repository import InMemoryRepository
+from services.lobby_service import LobbyService
+
+
+def _bytes_allocated(step: Callable[[], None]) -> int:
+    """Run `step` and return the bytes it left allocated."""
+    gc.collect()
+    before: int = tracemalloc.get_traced_memory()[0]
+    step()
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0] - before
+
+
+def measure(players: int) -> dict[str, float]:
+    random.seed(0)
+    repository = InMemoryRepository()
+    game_service = GameService(repository)
+    lobby_service = LobbyService(Lobby(repository))
+    logged_in: list[Player] = []
+
+    def log_in() -> None:
+        for i in range(players):
+            player = Player(f"Player {i}", PlayerStatus.AVAILABLE)
+            game_service.add_player(player)
+            lobby_service.join_lobby(player)
+            logged_in.append(player)
+
+    def start_games() -> None:
+        for player_1, player_2 in zip(logged_in[::2], logged_in[1::2]):
+            for player in (player_1, player_2):
+                lobby_service.leave_lobby(player.id)
+                game_service.place_ships_randomly(player.id)
+            game_id: str = game_service.create_two_player_game(player_1.id, player_2.id)
+            for player in (player_1, player_2):
+                game_service.transfer_ship_placement_board_to_game(
+                    game_id, player.id, player
+                )
+
+    tracemalloc.start()
+    try:
+        player_bytes: int = _bytes_allocated(log_in)
+        game_bytes: int = _bytes_allocated(start_games)
+    finally:
+        tracemalloc.stop()
+    return {
+        "bytes per logged-in player": player_bytes / players,
+        "bytes per active game": game_bytes / (players // 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--players", type=int, default=2000)
+    args = parser.parse_args()
+
+    for metric, value in measure(args.players).items():
+        print(f"{metric:<28} {value:>10,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Time the bitmask engine and GameBoard at 10x10, 20x20 and 26x26.
+
+For each board size the standard fleet is repeated to keep the standard ship
+density (Rules.scaled). Reports the one-off cost of building the placement
+tables, random fleet placement, shot resolution over whole games (random
+salvos until the fleet is sunk) and the memory held by one placed board.
+The "board" columns time the same placement and shots on the GameBoards
+GameService plays with.
+
+Usage:
+    python -m benchmarks.bench_rules [--games N]
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+
+from game.cells import CellGrid
+from game.game_service import GameService
+from game.mask_board import MaskBoard
+from game.model import ORIENTATION_STEPS, GameBoard
+from game.player import Player, PlayerStatus
+from game.rules import Rules
+
+SIZES: tuple[int, ...] = (10, 20, 26)
+
+
+def _build_tables(rules: Rules) -> float:
+    """Seconds to build the cell and placement tables from scratch."""
+    started: float = time.perf_counter()
+    grid = CellGrid(rules.rows, rules.cols)
+    for length in {ship.length for ship in rules.fleet}:
+        for row_step, col_step in ORIENTATION_STEPS.values():
+            grid.placements(length, row_step, col_step)
+    return time.perf_counter() - started
+
+
+def _play_out(board: MaskBoard, rng: random.Random) -> int:
+    """Fire random salvos at `board` until its fleet is sunk; return shots."""
+    targets: list[int] = list(range(board.rules.grid.cell_count))
+    rng.shuffle(targets)
+    fired: int = 0
+    while not board.is_defeated:
+        salvo: list[int] = targets[fired : fired + board.rules.shots_per_round]
+        board.receive_salvo(salvo)
+        fired += len(salvo)
+    return fired
+
+
+def _play_out_board(board: GameBoard, rng: random.Random) -> int:
+    """Fire random salvos at a GameBoard until its fleet is sunk; return shots."""
+    targets = [board.coord_at(cell) for cell in range(board.rules.grid.cell_count)]
+    rng.shuffle(targets)
+    fired: int = 0
+    round_number: int = 1
+    while not board.all_ships_sunk:
+        salvo = targets[fired : fired + board.rules.shots_per_round]
+        board.receive_salvo(salvo, round_number)
+        fired += len(salvo)
+        round_number += 1
+    return fired
+
+
+def run_size(size: int, games: int) -> dict[str, float]:
+    rules = Rules.scaled(size, size)
+    rng = random.Random(size)
+    results: dict[str, float] = {
+        "ships": len(rules.fleet),
+        "tables ms": _build_tables(rules) * 1e3,
+    }
+
+    board = MaskBoard(rules)
+    started: float = time.perf_counter()
+    for _ in range(games):
+        board.place_fleet_randomly(rng)
+    results["placement us"] = (time.perf_counter() - started) / games * 1e6
+
+    boards: list[MaskBoard] = []
+    for _ in range(games):
+        boards.append(MaskBoard(rules))
+        boards[-1].place_fleet_randomly(rng)
+    started = time.perf_counter()
+    shots: int = sum(_play_out(board, rng) for board in boards)
+    results["ns per shot"] = (time.perf_counter() - started) / shots * 1e9
+
+    game_service = GameService(rules=rules)
+    player = Player("Bench", PlayerStatus.AVAILABLE)
+    game_service.add_player(player)
+    game_boards: list[GameBoard] = []
+    started = time.perf_counter()
+    for _ in range(games):
+        game_service.place_ships_randomly(player.id, rng)
+        game_boards.append(game_service.ship_placement_boards.pop(player.id))
+    results["board placement us"] = (time.perf_counter() - started) / games * 1e6
+    started = time.perf_counter()
+    shots = sum(_play_out_board(board, rng) for board in game_boards)
+    results["board ns per shot"] = (time.perf_counter() - started) / shots * 1e9
+
+    tracemalloc.start()
+    before: int = tracemalloc.get_traced_memory()[0]
+    placed = MaskBoard(rules)
+    placed.place_fleet_randomly(rng)
+    results["bytes per board"] = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=500)
+    args = parser.parse_args()
+
+    rows: dict[int, dict[str, float]] = {
+        size: run_size(size, args.games) for size in SIZES
+    }
+    metrics: list[str] = list(rows[SIZES[0]])
+    print(f"{'board':<8}" + "".join(f"{metric:>19}" for metric in metrics))
+    for size, results in rows.items():
+        print(
+            f"{f'{size}x{size}':<8}"
+            + "".join(f"{results[metric]:>19,.1f}" for metric in metrics)
+        )
+
+
+if __name__ == "__main__":
+    main()
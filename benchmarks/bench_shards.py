@@ -0,0 +1,89 @@
+"""Measure how placement throughput scales with the number of game shards.
+
+Each operation randomly places a fleet for one player and renders the ship
+placement board, routed through ShardRouter by player ID. Many players are
+driven concurrently so that work can spread across shards. Scaling beyond one
+shard needs a free-threaded (3.13t) interpreter; with the GIL the shard
+threads take turns.
+
+Usage:
+    python -m benchmarks.bench_shards [--operations N] [--shards 0 1 2 4 8]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+from jinja2 import Environment, FileSystemLoader
+from markupsafe import Markup
+
+from game.game_service import GameService
+from game.player import Player, PlayerStatus
+from services.shard_router import ShardRouter
+
+TEMPLATES = Environment(loader=FileSystemLoader("templates"))
+PLAYERS: int = 64
+
+
+async def run(shard_count: int, operations: int) -> float:
+    """Return placement+render operations per second for `shard_count` shards."""
+    game_service = GameService()
+    router = ShardRouter(shard_count)
+    template = TEMPLATES.get_template("ship_placement.html")
+    grid_template = TEMPLATES.get_template("components/board_grid.html")
+    players: list[Player] = [
+        Player(f"Player {i}", PlayerStatus.AVAILABLE) for i in range(PLAYERS)
+    ]
+    for player in players:
+        game_service.add_player(player)
+
+    def place_and_render(player_id: str) -> str:
+        game_service.place_ships_randomly(player_id)
+        board = game_service.get_or_create_ship_placement_board(player_id)
+        return template.render(
+            player_name=player_id,
+            placed_ships=board.get_placed_ships_for_display(),
+            grid=Markup(
+                grid_template.render(
+                    grid=board.display_grid(),
+                    show_ships=True,
+                    table_testid="ship-grid",
+                    cell_testid_prefix="grid-cell-",
+                )
+            ),
+            status_message="All ships placed - click Ready when done",
+        )
+
+    started: float = time.perf_counter()
+    await asyncio.gather(
+        *(
+            router.run(
+                players[i % PLAYERS].id, place_and_render, players[i % PLAYERS].id
+            )
+            for i in range(operations)
+        )
+    )
+    elapsed: float = time.perf_counter() - started
+    router.shutdown()
+    return operations / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--operations", type=int, default=2000)
+    parser.add_argument("--shards", type=int, nargs="+", default=[0, 1, 2, 4, 8])
+    args = parser.parse_args()
+
+    gil_enabled: bool = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"GIL enabled: {gil_enabled}")
+    print(f"{'shards':>6} {'ops/s':>12} {'speed-up':>9}")
+    baseline: float | None = None
+    for shard_count in args.shards:
+        rate: float = asyncio.run(run(shard_count, args.operations))
+        baseline = baseline or rate
+        print(f"{shard_count:>6} {rate:>12,.0f} {rate / baseline:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
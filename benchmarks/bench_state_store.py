@@ -0,0 +1,100 @@
+"""Compare the in-memory and SQLite state repositories.
+
+Measures operations per second for logins, ready toggles and lobby long-poll
+renders against each backend, including the time for the SQLite writer to
+drain its final batch.
+
+Usage:
+    python -m benchmarks.bench_state_store [--operations N]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+from jinja2 import Environment, FileSystemLoader
+
+from game.game_service import GameService
+from game.lobby import Lobby
+from game.player import Player, PlayerStatus
+from game.repository import InMemoryRepository, SqliteRepository, StateRepository
+from routes.lobby import _build_lobby_context
+from services.lobby_service import LobbyService
+
+TEMPLATES = Environment(loader=FileSystemLoader("templates"))
+LOBBY_SIZE: int = 50
+
+
+def _timed(
+    repository: StateRepository, operations: int, operation: Callable[[int], None]
+) -> float:
+    """Run `operation` N times then flush, returning operations per second."""
+    started: float = time.perf_counter()
+    for i in range(operations):
+        operation(i)
+    repository.flush()
+    return operations / (time.perf_counter() - started)
+
+
+def run_backend(repository: StateRepository, operations: int) -> dict[str, float]:
+    game_service = GameService(repository)
+    lobby_service = LobbyService(Lobby(repository))
+    players: list[Player] = []
+
+    def login(i: int) -> None:
+        player = Player(f"Player {i}", PlayerStatus.AVAILABLE)
+        game_service.add_player(player)
+        lobby_service.join_lobby(player)
+        players.append(player)
+
+    def toggle_ready(i: int) -> None:
+        player_id: str = players[i % len(players)].id
+        if game_service.is_player_ready(player_id):
+            game_service.ready_players.discard(player_id)
+            repository.mark_dirty("ready_players", player_id)
+            game_service.notify_placement_change()
+        else:
+            game_service.set_player_ready(player_id)
+
+    template = TEMPLATES.get_template("components/lobby_dynamic_content.html")
+
+    def render_long_poll(i: int) -> None:
+        player: Player = players[i % LOBBY_SIZE]
+        context = _build_lobby_context(
+            player_id=player.id,
+            player_name=player.name,
+            lobby_version=lobby_service.get_lobby_version(),
+            lobby_service=lobby_service,
+        )
+        template.render(context)
+
+    results: dict[str, float] = {"logins/s": _timed(repository, operations, login)}
+    results["ready toggles/s"] = _timed(repository, operations, toggle_ready)
+    # Keep the lobby a realistic size for rendering
+    for player in players[LOBBY_SIZE:]:
+        lobby_service.leave_lobby(player.id)
+    results["long-poll renders/s"] = _timed(repository, operations, render_long_poll)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--operations", type=int, default=2000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        backends: dict[str, StateRepository] = {
+            "memory": InMemoryRepository(),
+            "sqlite": SqliteRepository(str(Path(tmp_dir) / "state.db")),
+        }
+        print(f"{'backend':<8} {'metric':<22} {'ops/s':>12}")
+        for name, repository in backends.items():
+            for metric, rate in run_backend(repository, args.operations).items():
+                print(f"{name:<8} {metric:<22} {rate:>12,.0f}")
+            repository.close()
+
+
+if __name__ == "__main__":
+    main()
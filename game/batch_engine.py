@@ -0,0 +1,311 @@
+"""Many boards at once in NumPy arrays, for bulk simulation.
+
+Row `b` of each array is one board. `ship_ids` holds the fleet index of the
+ship on each cell (-1 = water), `shots` marks the cells already fired at, and
+`hits_left` counts the unhit cells of each ship. A step fires one salvo at
+every board with a few array operations, and sunk ships, shots available and
+defeat come out of `hits_left` in bulk. The rules are those of the scalar
+engine in game.mask_board, and `from_mask_boards` builds a batch from
+MaskBoards.
+
+NumPy is an optional dependency (`pip install .[sim]`), so nothing in the web
+app imports this module.
+"""
+
+import random
+from collections.abc import Sequence
+from functools import cache
+from typing import NamedTuple
+
+import numpy as np
+import numpy.typing as npt
+
+from game.mask_board import RANDOM_PLACEMENT_TRIES, MaskBoard
+from game.model import ORIENTATION_STEPS
+from game.rules import STANDARD_RULES, Rules
+
+NO_SHOT: int = -1  # Pads salvos shorter than the salvo array is wide
+WATER: int = -1
+
+
+class BatchSalvoResult(NamedTuple):
+    """What one salvo per board did, one row per board."""
+
+    hits: npt.NDArray[np.int16]  # (boards, ships) hits on each ship
+    sunk: npt.NDArray[np.bool_]  # (boards, ships) ships sunk by this salvo
+
+
+class BatchBoards:
+    """A batch of boards, all with the same rules and fully placed fleets.
+
+    Args:
+        rules: Board size and fleet shared by every board
+        ship_ids: (boards, cells) fleet index of the ship on each cell, or -1
+    """
+
+    __slots__ = ("hits_left", "rules", "ship_ids", "ship_shots", "shots")
+
+    def __init__(self, rules: Rules, ship_ids: npt.NDArray[np.int8]) -> None:
+        self.rules: Rules = rules
+        self.ship_ids: npt.NDArray[np.int8] = ship_ids
+        self.shots: npt.NDArray[np.bool_] = np.zeros(ship_ids.shape, dtype=bool)
+        # Unhit cells per ship: the ship's length until it is hit
+        ships: int = len(rules.fleet)
+        self.hits_left: npt.NDArray[np.int16] = np.stack(
+            [(ship_ids == index).sum(axis=1) for index in range(ships)], axis=1
+        ).astype(np.int16)
+        self.ship_shots: npt.NDArray[np.int16] = np.array(
+            [ship.shots_available for ship in rules.fleet], dtype=np.int16
+        )
+
+    @classmethod
+    def from_mask_boards(cls, boards: Sequence[MaskBoard]) -> "BatchBoards":
+        """Pack placed MaskBoards (with no shots yet) into one batch.
+
+        Raises:
+            ValueError: If the boards have different rules, have shots
+                received, or have ships not placed
+        """
+        rules: Rules = boards[0].rules
+        ship_ids = np.full((len(boards), rules.grid.cell_count), WATER, np.int8)
+        for row, board in enumerate(boards):
+            if board.rules != rules:
+                raise ValueError("Every board in a batch needs the same rules")
+            if board.shots_received:
+                raise ValueError("Boards must be packed before any shots")
+            for index, mask in enumerate(board.ship_masks):
+                if not mask:
+                    raise ValueError(f"{rules.fleet[index].name} is not placed")
+                ship_ids[row, rules.grid.mask_to_cells(mask)] = index
+        return cls(rules, ship_ids)
+
+    @classmethod
+    def random(
+        cls, count: int, rules: Rules = STANDARD_RULES, seed: int | None = None
+    ) -> "BatchBoards":
+        """Return `count` boards with randomly placed fleets.
+
+        Same procedure as MaskBoard.place_fleet_randomly, run for every board
+        at once: longest ship first, a random direction then a random spot,
+        retried up to the same number of times, then a uniform pick among the
+        legal spots. The rare board left with no legal spot for a ship is laid
+        out again by the scalar engine.
+        """
+        rng = np.random.default_rng(seed)
+        ship_ids = np.full((count, rules.grid.cell_count), WATER, np.int8)
+        forbidden = np.zeros(ship_ids.shape, dtype=bool)
+        stuck = np.zeros(count, dtype=bool)
+        order: list[int] = sorted(
+            range(len(rules.fleet)), key=lambda i: -rules.fleet[i].length
+        )
+        for index in order:
+            table = _placement_table(rules, rules.fleet[index].length)
+            choice = np.full(count, -1, dtype=np.intp)
+            pending = ~stuck
+            for _ in range(RANDOM_PLACEMENT_TRIES):
+                rows = np.flatnonzero(pending)
+                if not len(rows):
+                    break
+                direction = rng.integers(len(table.counts), size=len(rows))
+                spot = table.offsets[direction] + (
+                    rng.random(len(rows)) * table.counts[direction]
+                ).astype(np.intp)
+                # A direction with no in-bounds spot wastes the try, as in
+                # the scalar engine
+                spot = np.minimum(spot, len(table.footprints) - 1)
+                fits = (table.counts[direction] > 0) & ~(
+                    table.footprints[spot] & forbidden[rows]
+                ).any(axis=1)
+                choice[rows[fits]] = spot[fits]
+                pending[rows[fits]] = False
+            rows = np.flatnonzero(pending)
+            if len(rows):
+                legal = ~(table.footprints & forbidden[rows, None]).any(axis=2)
+                keys = np.where(legal, rng.random(legal.shape), -1.0)
+                choice[rows] = keys.argmax(axis=1)
+                stuck[rows[~legal.any(axis=1)]] = True
+                choice[stuck] = -1
+            placed = np.flatnonzero(choice >= 0)
+            ship_ids[placed] = np.where(
+                table.footprints[choice[placed]], index, ship_ids[placed]
+            )
+            forbidden[placed] |= table.halos[choice[placed]]
+
+        for row in np.flatnonzero(stuck):
+            board = MaskBoard(rules)
+            board.place_fleet_randomly(random.Random(int(rng.integers(2**63))))
+            ship_ids[row] = WATER
+            for index, mask in enumerate(board.ship_masks):
+                ship_ids[row, rules.grid.mask_to_cells(mask)] = index
+        return cls(rules, ship_ids)
+
+    def __len__(self) -> int:
+        return self.ship_ids.shape[0]
+
+    def receive_salvos(self, salvos: npt.NDArray[np.integer]) -> BatchSalvoResult:
+        """Fire one salvo at every board.
+
+        Args:
+            salvos: (boards, width) cells fired at each board; pad short
+                salvos with NO_SHOT
+
+        Returns:
+            The hits on each ship and the ships sunk, per board
+
+        Raises:
+            ValueError: If a cell is off the board, or a board is fired at a
+                cell it was already shot at (nothing is applied)
+        """
+        salvos = np.asarray(salvos)
+        if salvos.ndim != 2 or salvos.shape[0] != len(self):
+            raise ValueError(f"Expected one salvo row per board ({len(self)})")
+        if ((salvos < NO_SHOT) | (salvos >= self.rules.grid.cell_count)).any():
+            raise ValueError("Salvo contains a cell that is off the board")
+        board_index, column = np.nonzero(salvos != NO_SHOT)
+        cells = salvos[board_index, column]
+        if self.shots[board_index, cells].any():
+            raise ValueError("Salvo contains a cell that has already been shot at")
+        # Repeats within a salvo show up as equal neighbours once sorted
+        ordered = np.sort(salvos, axis=1)
+        if ((ordered[:, 1:] == ordered[:, :-1]) & (ordered[:, 1:] != NO_SHOT)).any():
+            raise ValueError("Salvo fires at the same cell twice")
+
+        self.shots[board_index, cells] = True
+        ship = self.ship_ids[board_index, cells].astype(np.intp)
+        on_ship = ship != WATER
+        ships: int = self.hits_left.shape[1]
+        hits = (
+            np.bincount(
+                board_index[on_ship] * ships + ship[on_ship],
+                minlength=self.hits_left.size,
+            )
+            .reshape(self.hits_left.shape)
+            .astype(np.int16)
+        )
+        self.hits_left -= hits
+        return BatchSalvoResult(hits, (hits > 0) & (self.hits_left == 0))
+
+    @property
+    def afloat(self) -> npt.NDArray[np.bool_]:
+        """(boards, ships) True for each ship not yet sunk."""
+        return self.hits_left > 0
+
+    @property
+    def shots_available(self) -> npt.NDArray[np.int16]:
+        """Shots each board's owner may fire: the shots of each unsunk ship."""
+        return (self.afloat * self.ship_shots).sum(axis=1, dtype=np.int16)
+
+    @property
+    def defeated(self) -> npt.NDArray[np.bool_]:
+        """True for each board whose fleet has all been sunk."""
+        return ~self.afloat.any(axis=1)
+
+    def random_salvos(
+        self, rng: np.random.Generator, sizes: npt.NDArray[np.integer]
+    ) -> npt.NDArray[np.int16]:
+        """Pick `sizes[b]` random unshot cells to fire at board `b`.
+
+        Args:
+            rng: Source of randomness
+            sizes: Salvo size per board (the firing player's shots available)
+
+        Returns:
+            (boards, max(sizes)) salvos, padded with NO_SHOT
+        """
+        width: int = int(sizes.max(initial=0))
+        keys = rng.random(self.shots.shape)
+        keys[self.shots] = np.inf  # Already shot: sorts last
+        cells = np.argsort(keys, axis=1)[:, :width].astype(np.int16)
+        unshot = (~self.shots).sum(axis=1)
+        cells[np.arange(width) >= np.minimum(sizes, unshot)[:, None]] = NO_SHOT
+        return cells
+
+
+class BatchOutcome(NamedTuple):
+    """Results of a batch of two-player games, one entry per game."""
+
+    rounds: npt.NDArray[np.int16]  # Round in which the game ended
+    winner: npt.NDArray[np.int8]  # 1 or 2, or 0 for a draw
+
+
+def play_random(
+    count: int, rules: Rules = STANDARD_RULES, seed: int | None = None
+) -> BatchOutcome:
+    """Play `count` two-player games in which both players fire at random.
+
+    Each round both players fire all their available shots at the same time,
+    so sinking each other's last ship in the same round is a draw.
+    """
+    rng = np.random.default_rng(seed)
+    boards = [
+        BatchBoards.random(count, rules, int(rng.integers(2**63))) for _ in range(2)
+    ]
+    # Firing at random unshot cells is firing down a shuffled list of cells
+    orders = [
+        rng.permuted(np.tile(np.arange(rules.grid.cell_count), (count, 1)), axis=1)
+        for _ in range(2)
+    ]
+    fired = [np.zeros(count, dtype=np.intp) for _ in range(2)]
+    rounds = np.zeros(count, dtype=np.int16)
+    playing = np.ones(count, dtype=bool)
+    round_number: int = 0
+    while playing.any():
+        round_number += 1
+        # Each player's salvo size comes from their own fleet; finished games
+        # fire nothing
+        shots = [np.where(playing, board.shots_available, 0) for board in boards]
+        boards[1].receive_salvos(_next_salvos(orders[1], fired[1], shots[0]))
+        boards[0].receive_salvos(_next_salvos(orders[0], fired[0], shots[1]))
+        finished = playing & (boards[0].defeated | boards[1].defeated)
+        rounds[finished] = round_number
+        playing &= ~finished
+    defeated_1, defeated_2 = boards[0].defeated, boards[1].defeated
+    winner = np.where(defeated_1 & defeated_2, 0, np.where(defeated_2, 1, 2))
+    return BatchOutcome(rounds, winner.astype(np.int8))
+
+
+def _next_salvos(
+    order: npt.NDArray[np.intp],
+    fired: npt.NDArray[np.intp],
+    sizes: npt.NDArray[np.integer],
+) -> npt.NDArray[np.intp]:
+    """Take the next `sizes[b]` cells of each board's firing order."""
+    cell_count: int = order.shape[1]
+    width: int = int(sizes.max(initial=0))
+    sizes = np.minimum(sizes, cell_count - fired)
+    columns = np.minimum(fired[:, None] + np.arange(width), cell_count - 1)
+    salvos = np.take_along_axis(order, columns, axis=1)
+    salvos[np.arange(width) >= sizes[:, None]] = NO_SHOT
+    fired += sizes
+    return salvos
+
+
+class _PlacementTable(NamedTuple):
+    footprints: npt.NDArray[np.bool_]  # (placements, cells) cells covered
+    halos: npt.NDArray[np.bool_]  # (placements, cells) covered or touching
+    offsets: npt.NDArray[np.intp]  # First placement of each direction
+    counts: npt.NDArray[np.intp]  # Placements in each direction
+
+
+@cache
+def _placement_table(rules: Rules, length: int) -> _PlacementTable:
+    """Every in-bounds placement of a ship, grouped by direction."""
+    grid = rules.grid
+    masks: list[int] = []
+    counts: list[int] = []
+    for row_step, col_step in ORIENTATION_STEPS.values():
+        placements = grid.placements(length, row_step, col_step)
+        masks.extend(mask for _, mask in placements)
+        counts.append(len(placements))
+    footprints = np.zeros((len(masks), grid.cell_count), dtype=bool)
+    halos = np.zeros_like(footprints)
+    for row, mask in enumerate(masks):
+        halo: int = 0
+        for cell in grid.mask_to_cells(mask):
+            halo |= grid.halo_masks[cell]
+        footprints[row, grid.mask_to_cells(mask)] = True
+        halos[row, grid.mask_to_cells(halo)] = True
+    count_array = np.array(counts, dtype=np.intp)
+    return _PlacementTable(
+        footprints, halos, np.cumsum(count_array) - count_array, count_array
+    )
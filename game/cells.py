@@ -0,0 +1,172 @@
+"""Flyweight cell tables for engine code.
+
+Internally a cell is a plain int (`(row - 1) * cols + (col - 1)`, so on the
+standard 10x10 board A1 is 0 and J10 is 99). Its row, column, name and
+neighbours are looked up in tables built once per board size, instead of going
+through the `Coord` enum and building CoordDetails tuples on every step. Sets
+of cells are big-int bitmasks with one bit per cell, so the same code serves
+any board up to 26x26. game.model converts between standard-board cells and
+the public `Coord` enum at API boundaries (see `coord_to_cell` /
+`cell_to_coord`).
+"""
+
+from functools import cache
+from string import ascii_uppercase
+
+MAX_BOARD_SIZE: int = len(ascii_uppercase)  # Rows are lettered A-Z
+
+
+class CellGrid:
+    """Cell tables for a board of `rows` x `cols` cells.
+
+    Use `grid_for` to share one instance per board size.
+
+    Args:
+        rows: Number of rows (1-26, lettered from A)
+        cols: Number of columns (1-26, numbered from 1)
+
+    Raises:
+        ValueError: If either dimension is outside 1-26
+    """
+
+    def __init__(self, rows: int, cols: int) -> None:
+        if not (1 <= rows <= MAX_BOARD_SIZE and 1 <= cols <= MAX_BOARD_SIZE):
+            raise ValueError(
+                f"Board must be between 1x1 and {MAX_BOARD_SIZE}x{MAX_BOARD_SIZE},"
+                f" got {rows}x{cols}"
+            )
+        self.rows: int = rows
+        self.cols: int = cols
+        self.cell_count: int = rows * cols
+        self.all_cells: int = (1 << self.cell_count) - 1
+        self.row_letters: str = ascii_uppercase[:rows]
+        # 1-based row and column of each cell
+        self.cell_row: tuple[int, ...] = tuple(
+            cell // cols + 1 for cell in range(self.cell_count)
+        )
+        self.cell_col: tuple[int, ...] = tuple(
+            cell % cols + 1 for cell in range(self.cell_count)
+        )
+        self.cell_name: tuple[str, ...] = tuple(
+            f"{self.row_letters[row - 1]}{col}"
+            for row, col in zip(self.cell_row, self.cell_col)
+        )
+        self.cell_by_name: dict[str, int] = {
+            name: cell for cell, name in enumerate(self.cell_name)
+        }
+        # The (up to eight) cells surrounding each cell
+        self.neighbours: tuple[tuple[int, ...], ...] = tuple(
+            tuple(
+                neighbour
+                for row_delta in (-1, 0, 1)
+                for col_delta in (-1, 0, 1)
+                if (row_delta, col_delta) != (0, 0)
+                and (
+                    neighbour := self.cell_at(
+                        self.cell_row[cell] + row_delta,
+                        self.cell_col[cell] + col_delta,
+                    )
+                )
+                is not None
+            )
+            for cell in range(self.cell_count)
+        )
+        # Cell plus its neighbours, as a mask
+        self.halo_masks: tuple[int, ...] = tuple(
+            (1 << cell) | self.cells_to_mask(self.neighbours[cell])
+            for cell in range(self.cell_count)
+        )
+        self._placements: dict[tuple[int, int, int], tuple[tuple[int, int], ...]] = {}
+
+    def cell_at(self, row: int, col: int) -> int | None:
+        """Return the cell at a 1-based row and column, or None if off the board."""
+        if 1 <= row <= self.rows and 1 <= col <= self.cols:
+            return (row - 1) * self.cols + (col - 1)
+        return None
+
+    def parse(self, name: str) -> int:
+        """Return the cell for a name like "E5" (case-insensitive).
+
+        Raises:
+            KeyError: If the name is not a cell on the board
+        """
+        return self.cell_by_name[name.upper()]
+
+    def footprint(
+        self, start: int, length: int, row_step: int, col_step: int
+    ) -> tuple[int, ...] | None:
+        """Return the cells a ship covers from `start`, or None if it leaves the board.
+
+        Args:
+            start: The ship's first cell
+            length: Number of cells the ship covers
+            row_step: Row change per cell (-1, 0 or 1)
+            col_step: Column change per cell (-1, 0 or 1)
+        """
+        cells: list[int] = []
+        for i in range(length):
+            cell: int | None = self.cell_at(
+                self.cell_row[start] + row_step * i,
+                self.cell_col[start] + col_step * i,
+            )
+            if cell is None:
+                return None
+            cells.append(cell)
+        return tuple(cells)
+
+    def placements(
+        self, length: int, row_step: int, col_step: int
+    ) -> tuple[tuple[int, int], ...]:
+        """Return (start cell, footprint mask) for every in-bounds placement.
+
+        Built on first use for each ship length and direction, then reused.
+        """
+        key: tuple[int, int, int] = (length, row_step, col_step)
+        placements = self._placements.get(key)
+        if placements is None:
+            found: list[tuple[int, int]] = []
+            for start in range(self.cell_count):
+                cells = self.footprint(start, length, row_step, col_step)
+                if cells is not None:
+                    found.append((start, self.cells_to_mask(cells)))
+            placements = self._placements[key] = tuple(found)
+        return placements
+
+    @staticmethod
+    def cells_to_mask(cells: "tuple[int, ...] | list[int]") -> int:
+        """OR together the bits of the given cells."""
+        mask: int = 0
+        for cell in cells:
+            mask |= 1 << cell
+        return mask
+
+    @staticmethod
+    def mask_to_cells(mask: int) -> list[int]:
+        """Return the cells set in `mask`, in ascending order."""
+        cells: list[int] = []
+        while mask:
+            low_bit: int = mask & -mask
+            cells.append(low_bit.bit_length() - 1)
+            mask ^= low_bit
+        return cells
+
+
+@cache
+def grid_for(rows: int, cols: int) -> CellGrid:
+    """Return the shared CellGrid for a board size."""
+    return CellGrid(rows, cols)
+
+
+# Tables for the standard 10x10 board
+STANDARD_GRID: CellGrid = grid_for(10, 10)
+BOARD_SIZE: int = STANDARD_GRID.rows
+CELL_COUNT: int = STANDARD_GRID.cell_count
+ROW_LETTERS: str = STANDARD_GRID.row_letters
+CELL_ROW: tuple[int, ...] = STANDARD_GRID.cell_row
+CELL_COL: tuple[int, ...] = STANDARD_GRID.cell_col
+CELL_NAME: tuple[str, ...] = STANDARD_GRID.cell_name
+CELL_BY_NAME: dict[str, int] = STANDARD_GRID.cell_by_name
+NEIGHBOURS: tuple[tuple[int, ...], ...] = STANDARD_GRID.neighbours
+cell_at = STANDARD_GRID.cell_at
+parse_cell = STANDARD_GRID.parse
+footprint = cache(STANDARD_GRID.footprint)
@@ -69,3 +69,14 @@ class UnknownGameException(Exception):
     """Raised when referencing a game that doesn't exist."""
 
     pass
+
+
+class FleetLayoutError(ShipPlacementError):
+    """Raised when a whole-fleet layout breaks one or more placement rules.
+
+    Every violation found is listed, not just the first.
+    """
+
+    def __init__(self, violations: list[str]):
+        super().__init__("; ".join(violations))
+        self.violations: list[str] = violations
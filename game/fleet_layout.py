@@ -0,0 +1,151 @@
+"""Whole-fleet layouts: parsing, share codes and single-pass validation.
+
+A fleet is five ShipPlacements, one per ship type. Layouts can be exchanged as
+a compact share code of five dot-separated tokens, each a ship code, a start
+cell and an orientation code, e.g. "AA1H.BC1H.CE1V.SE5D.DJ9H" (A=Carrier,
+B=Battleship, C=Cruiser, S=Submarine, D=Destroyer; H=horizontal, V=vertical,
+D=diagonal down, U=diagonal up).
+
+validate_fleet checks every rule in one pass over precomputed placement masks
+and reports every violation, so a layout can be accepted or rejected as a
+whole before the board is touched.
+"""
+
+from typing import NamedTuple
+
+from game.exceptions import FleetLayoutError
+from game.model import Coord, CoordHelper, GameBoard, Orientation, Ship, ShipType
+from game.placement_masks import HALO_MASKS, cell_bit, coords_to_mask
+
+ORIENTATION_CODES: dict[Orientation, str] = {
+    Orientation.HORIZONTAL: "H",
+    Orientation.VERTICAL: "V",
+    Orientation.DIAGONAL_DOWN: "D",
+    Orientation.DIAGONAL_UP: "U",
+}
+_ORIENTATIONS_BY_CODE: dict[str, Orientation] = {
+    code: orientation for orientation, code in ORIENTATION_CODES.items()
+}
+_SHIP_TYPES_BY_CODE: dict[str, ShipType] = {
+    ship_type.code: ship_type for ship_type in ShipType
+}
+
+
+class ShipPlacement(NamedTuple):
+    """Where one ship of a fleet goes."""
+
+    ship_type: ShipType
+    start: Coord
+    orientation: Orientation
+
+    @property
+    def share_token(self) -> str:
+        return (
+            f"{self.ship_type.code}{self.start.name}"
+            f"{ORIENTATION_CODES[self.orientation]}"
+        )
+
+
+def parse_share_code(code: str) -> list[ShipPlacement]:
+    """Parse a fleet share code.
+
+    Args:
+        code: Dot-separated tokens such as "AA1H.BC1H.CE1V.SE5D.DJ9H"
+
+    Returns:
+        The placements in the order given
+
+    Raises:
+        FleetLayoutError: Listing every token that could not be parsed
+    """
+    placements: list[ShipPlacement] = []
+    violations: list[str] = []
+    for token in filter(None, code.strip().upper().split(".")):
+        ship_type: ShipType | None = _SHIP_TYPES_BY_CODE.get(token[0])
+        orientation: Orientation | None = _ORIENTATIONS_BY_CODE.get(token[-1])
+        start: Coord | None = Coord.__members__.get(token[1:-1])
+        if len(token) < 4 or not (ship_type and orientation and start):
+            violations.append(f"Invalid share code token: {token}")
+            continue
+        placements.append(ShipPlacement(ship_type, start, orientation))
+    if violations:
+        raise FleetLayoutError(violations)
+    return placements
+
+
+def to_share_code(board: GameBoard) -> str:
+    """Return the share code for the ships on a board (in ship type order)."""
+    tokens: list[str] = []
+    ships: dict[ShipType, Ship] = {ship.ship_type: ship for ship in board.ships}
+    for ship_type in ShipType:
+        ship: Ship | None = ships.get(ship_type)
+        if ship and ship.positions:
+            tokens.append(
+                ShipPlacement(
+                    ship_type, ship.positions[0], _orientation_of(ship.positions)
+                ).share_token
+            )
+    return ".".join(tokens)
+
+
+def _orientation_of(positions: list[Coord]) -> Orientation:
+    first, second = positions[0].value, positions[1].value
+    if first.row_index == second.row_index:
+        return Orientation.HORIZONTAL
+    if first.col_index == second.col_index:
+        return Orientation.VERTICAL
+    if second.row_index > first.row_index:
+        return Orientation.DIAGONAL_DOWN
+    return Orientation.DIAGONAL_UP
+
+
+def validate_fleet(placements: list[ShipPlacement]) -> list[str]:
+    """Check a whole fleet against every placement rule in one pass.
+
+    Rules: exactly one of each ship type, every ship inside the board, and no
+    ship overlapping or touching another.
+
+    Args:
+        placements: The fleet to check
+
+    Returns:
+        Human-readable violations (empty if the fleet is valid)
+    """
+    violations: list[str] = []
+    seen: set[ShipType] = set()
+    # Footprint and halo of each in-bounds ship checked so far
+    checked: list[tuple[ShipType, int, int]] = []
+
+    for placement in placements:
+        name: str = placement.ship_type.ship_name
+        if placement.ship_type in seen:
+            violations.append(f"{name} is placed more than once")
+            continue
+        seen.add(placement.ship_type)
+
+        try:
+            positions: list[Coord] = CoordHelper.coords_for_length_and_orientation(
+                placement.start, placement.ship_type.length, placement.orientation
+            )
+        except KeyError:
+            violations.append(
+                f"{name} at {placement.start.name} {placement.orientation.value} "
+                "goes outside the board"
+            )
+            continue
+
+        footprint: int = coords_to_mask(positions)
+        halo: int = 0
+        for coord in positions:
+            halo |= HALO_MASKS[cell_bit(coord)]
+        for other_type, other_footprint, other_halo in checked:
+            if footprint & other_footprint:
+                violations.append(f"{name} overlaps {other_type.ship_name}")
+            elif footprint & other_halo:
+                violations.append(f"{name} touches {other_type.ship_name}")
+        checked.append((placement.ship_type, footprint, halo))
+
+    for ship_type in ShipType:
+        if ship_type not in seen:
+            violations.append(f"{ship_type.ship_name} is missing")
+    return violations
@@ -0,0 +1,126 @@
+"""Backtracking solver that fits the remaining ships around a partial fleet.
+
+Works on the placement masks: each candidate placement is a footprint mask
+(the cells it covers) and a halo mask (those cells and their neighbours).
+Ships are placed longest first, since they have the fewest legal spots. A
+branch is pruned when the free cells left cannot hold the remaining ships'
+lengths, or when any remaining ship has no legal spot left. Dead
+(forbidden zone, remaining ships) states are remembered so they are never
+explored twice.
+"""
+
+import random
+from typing import NamedTuple
+
+from game.fleet_layout import ShipPlacement
+from game.model import Coord, GameBoard, Orientation, ShipType
+from game.placement_masks import (
+    FOOTPRINTS,
+    HALO_MASKS,
+    cell_bit,
+    forbidden_mask,
+    mask_to_coords,
+)
+
+ALL_CELLS: int = (1 << 100) - 1
+
+
+class _Candidate(NamedTuple):
+    start: Coord
+    orientation: Orientation
+    footprint: int
+    halo: int
+
+
+def _build_candidates() -> dict[int, list[_Candidate]]:
+    candidates: dict[int, list[_Candidate]] = {}
+    for (length, orientation), starts in FOOTPRINTS.items():
+        options: list[_Candidate] = candidates.setdefault(length, [])
+        for start_bit, footprint in starts:
+            halo: int = 0
+            for coord in mask_to_coords(footprint):
+                halo |= HALO_MASKS[cell_bit(coord)]
+            options.append(
+                _Candidate(mask_to_coords(start_bit)[0], orientation, footprint, halo)
+            )
+    return candidates
+
+
+# Ship length -> every in-bounds placement of a ship that long
+CANDIDATES: dict[int, list[_Candidate]] = _build_candidates()
+
+
+def remaining_ship_types(board: GameBoard) -> list[ShipType]:
+    """Return the ship types not yet on the board, longest first."""
+    placed: set[ShipType] = {ship.ship_type for ship in board.snapshot().ships}
+    return sorted(
+        (ship_type for ship_type in ShipType if ship_type not in placed),
+        key=lambda ship_type: -ship_type.length,
+    )
+
+
+def complete_fleet(
+    board: GameBoard, rng: random.Random | None = None
+) -> list[ShipPlacement] | None:
+    """Find placements for every ship not yet on the board.
+
+    The ships already placed are kept as they are.
+
+    Args:
+        board: The partially placed board
+        rng: Shuffles candidate order for varied layouts (None = deterministic)
+
+    Returns:
+        Placements for the remaining ships (empty if the fleet is complete), or
+        None if they cannot all fit around the ships already placed
+    """
+    remaining: list[ShipType] = remaining_ship_types(board)
+    dead_ends: set[tuple[int, int]] = set()
+
+    def solve(forbidden: int, index: int) -> list[ShipPlacement] | None:
+        if index == len(remaining):
+            return []
+        if (forbidden, index) in dead_ends:
+            return None
+
+        # Prune: the free cells must be able to hold every remaining ship...
+        lengths_left: int = sum(ship.length for ship in remaining[index:])
+        if (ALL_CELLS & ~forbidden).bit_count() < lengths_left:
+            dead_ends.add((forbidden, index))
+            return None
+        # ...and each remaining ship needs at least one legal spot
+        options_by_ship: list[list[_Candidate]] = []
+        for ship_type in remaining[index:]:
+            options: list[_Candidate] = [
+                candidate
+                for candidate in CANDIDATES[ship_type.length]
+                if not candidate.footprint & forbidden
+            ]
+            if not options:
+                dead_ends.add((forbidden, index))
+                return None
+            options_by_ship.append(options)
+
+        options = options_by_ship[0]
+        if rng is not None:
+            rng.shuffle(options)
+        for candidate in options:
+            rest: list[ShipPlacement] | None = solve(
+                forbidden | candidate.halo, index + 1
+            )
+            if rest is not None:
+                return [
+                    ShipPlacement(
+                        remaining[index], candidate.start, candidate.orientation
+                    ),
+                    *rest,
+                ]
+        dead_ends.add((forbidden, index))
+        return None
+
+    return solve(forbidden_mask(board), 0)
+
+
+def can_complete(board: GameBoard) -> bool:
+    """Return True if the ships not yet placed still fit on the board."""
+    return complete_fleet(board) is not None
@@ -1,27 +1,42 @@
 import asyncio
 import random
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from typing import TYPE_CHECKING
 
 from game.exceptions import (
     DuplicatePlayerException,
+    FleetLayoutError,
     PlayerAlreadyInGameException,
     PlayerNotInGameException,
     UnknownGameException,
     UnknownPlayerException,
 )
 from game.model import (
+    BoardSnapshot,
     Coord,
+    DeltaKind,
     Game,
     GameBoard,
     GameMode,
     GameStatus,
-    Orientation,
     Ship,
     ShipType,
 )
+from game.fleet_layout import ShipPlacement, validate_fleet
+from game.fleet_solver import complete_fleet
+from game.locks import StripedLock, ThreadSafeEvent
+from game.mask_board import MaskBoard
+from game.placement_history import PlacementHistory
 from game.player import Player, PlayerStatus
+from game.repository import InMemoryRepository, StateRepository
+from game.rules import STANDARD_RULES, Rules
+from game.strategies import RoundReport
 
 if TYPE_CHECKING:
+    from game.game_store import TieredGameStore
     from services.lobby_service import LobbyService
 
 # Re-export for backwards compatibility
@@ -39,20 +54,163 @@ __all__ = [
 
 
 class GameService:
-    def __init__(self) -> None:
-        self.games: dict[str, Game] = {}  # game_id->Game
-        self.games_by_player: dict[str, Game] = {}  # player_id->Game
-        self.players: dict[str, Player] = {}  # player_id->Player
-        self.ship_placement_boards: dict[
-            str, GameBoard
-        ] = {}  # player_id->GameBoard for ship placement phase
-        self.ready_players: set[str] = set()
+    def __init__(
+        self, repository: StateRepository | None = None, rules: Rules = STANDARD_RULES
+    ) -> None:
+        # State collections are owned by the repository (in-memory by default)
+        self.repository: StateRepository = repository or InMemoryRepository()
+        # Board size and fleet of the boards and games this service creates
+        self.rules: Rules = rules
+        self.games: dict[str, Game] = self.repository.games  # game_id->Game
+        # player_id->Game
+        self.games_by_player: dict[str, Game] = self.repository.games_by_player
+        self.players: dict[str, Player] = self.repository.players  # player_id->Player
+        # player_id->GameBoard for ship placement phase
+        self.ship_placement_boards: dict[str, GameBoard] = (
+            self.repository.ship_placement_boards
+        )
+        self.ready_players: set[str] = self.repository.ready_players
+        # player_id->undo/redo history of their ship placement board
+        self.placement_histories: dict[str, PlacementHistory] = {}
+        # Last activity timestamps (time.monotonic) used by the idle-state reaper
+        self.player_last_activity: dict[str, float] = {}  # player_id->timestamp
+        self.game_last_activity: dict[str, float] = {}  # game_id->timestamp
+        self.computer_player_ids: set[str] = set()
+        # Optional hot/cold tiering of idle game boards (see enable_tiering)
+        self.game_store: "TieredGameStore | None" = None
+        # Multi-step mutations lock the player/game IDs they touch
+        self.locks: StripedLock = StripedLock()
+        self.repository.register_locks(
+            self.locks,
+            "players",
+            "games",
+            "games_by_player",
+            "ship_placement_boards",
+            "ready_players",
+        )
         # Initialize placement version tracking
         self._placement_version: int = 0
-        self._placement_change_event: "asyncio.Event" = asyncio.Event()
+        self._placement_version_lock: threading.Lock = threading.Lock()
+        self._placement_change_event: "asyncio.Event" = ThreadSafeEvent()
 
     def add_player(self, player: Player) -> None:
         self.players[player.id] = player
+        self.repository.mark_dirty("players", player.id)
+        self.touch_player(player.id)
+
+    def touch_player(self, player_id: str) -> None:
+        """Record activity for a player (and the game they are in, if any).
+
+        Args:
+            player_id: The player ID
+        """
+        self.player_last_activity[player_id] = time.monotonic()
+        game: Game | None = self.games_by_player.get(player_id)
+        if game:
+            self.touch_game(game.id)
+
+    def touch_game(self, game_id: str) -> None:
+        """Record activity for a game, reloading its boards if they were spilled.
+
+        Args:
+            game_id: The game ID
+        """
+        self.game_last_activity[game_id] = time.monotonic()
+        if self.game_store is not None and game_id in self.games:
+            self.game_store.touch(self.games[game_id])
+
+    def enable_tiering(self, game_store: "TieredGameStore") -> None:
+        """Spill idle game boards to disk using the given store.
+
+        Args:
+            game_store: The TieredGameStore that owns spilled boards
+        """
+        self.game_store = game_store
+        game_store.locks = self.locks
+        for game in list(self.games.values()):
+            game_store.touch(game)
+
+    def spill_idle_games(self, now: float | None = None) -> int:
+        """Spill the boards of games that have been idle past the store threshold.
+
+        Args:
+            now: Current time.monotonic() value (defaults to the real clock)
+
+        Returns:
+            The number of games spilled (0 if tiering is not enabled)
+        """
+        if self.game_store is None:
+            return 0
+        if now is None:
+            now = time.monotonic()
+        return self.game_store.spill_idle(self.game_last_activity, now)
+
+    def remove_player(self, player_id: str) -> None:
+        """Forget a player and any placement state they left behind.
+
+        Players still in a game are left alone - evict the game first.
+
+        Args:
+            player_id: The player ID
+
+        Raises:
+            PlayerAlreadyInGameException: If the player is still in a game
+        """
+        with self.locks.hold(player_id):
+            if player_id in self.games_by_player:
+                raise PlayerAlreadyInGameException(
+                    f"Player with id:{player_id} is still in a game"
+                )
+            self.players.pop(player_id, None)
+            self.ship_placement_boards.pop(player_id, None)
+            self.placement_histories.pop(player_id, None)
+            self.ready_players.discard(player_id)
+            self.player_last_activity.pop(player_id, None)
+            self.computer_player_ids.discard(player_id)
+        for collection in ("players", "ship_placement_boards", "ready_players"):
+            self.repository.mark_dirty(collection, player_id)
+
+    def evict_game(self, game_id: str) -> Game:
+        """Remove a game and the per-player state that belongs to it.
+
+        Computer opponents created for the game are removed as well, since
+        nothing else refers to them. Other players still marked IN_GAME are
+        made AVAILABLE again.
+
+        Args:
+            game_id: The game ID
+
+        Returns:
+            The evicted Game object
+
+        Raises:
+            UnknownGameException: If game doesn't exist
+        """
+        game: Game = self._get_game_or_raise(game_id)
+        players: list[Player] = [p for p in (game.player_1, game.player_2) if p]
+        with self.locks.hold(game_id, *(player.id for player in players)):
+            if self.games.pop(game_id, None) is None:
+                raise UnknownGameException(f"Game with id:{game_id} does not exist")
+            self.game_last_activity.pop(game_id, None)
+            if self.game_store is not None:
+                self.game_store.discard(game)
+
+            for player in players:
+                if self.games_by_player.get(player.id) is game:
+                    del self.games_by_player[player.id]
+                self.ready_players.discard(player.id)
+                if player.id in self.computer_player_ids:
+                    self.remove_player(player.id)
+                elif player.status == PlayerStatus.IN_GAME:
+                    player.status = PlayerStatus.AVAILABLE
+
+        player_ids: list[str] = [player.id for player in players]
+        self.repository.mark_dirty("games", game_id)
+        self.repository.mark_dirty("games_by_player", *player_ids)
+        self.repository.mark_dirty("ready_players", *player_ids)
+        self.repository.mark_dirty("players", *player_ids)
+        self._notify_placement_change()
+        return game
 
     def get_player(self, player_id: str) -> Player | None:
         """Get player by ID
@@ -65,6 +223,32 @@ class GameService:
         """
         return self.players.get(player_id)
 
+    def get_game(self, game_id: str) -> Game | None:
+        """Get game by ID
+
+        Args:
+            game_id: The game ID to look up
+
+        Returns:
+            Game object if found, None otherwise
+        """
+        return self.games.get(game_id)
+
+    def get_game_for_player(self, player_id: str) -> Game | None:
+        """Get the game a player is in
+
+        Args:
+            player_id: The player ID to look up
+
+        Returns:
+            The player's Game if they are in one, None otherwise
+        """
+        return self.games_by_player.get(player_id)
+
+    def is_computer_player(self, player_id: str) -> bool:
+        """Check whether a player is the computer in a single-player game."""
+        return player_id in self.computer_player_ids
+
     def _get_player_or_raise(self, player_id: str) -> Player:
         """Get player by ID or raise UnknownPlayerException.
 
@@ -110,7 +294,10 @@ class GameService:
             UnknownGameException: If game doesn't exist
         """
         game = self._get_game_or_raise(game_id)
-        game.status = new_status
+        with self.locks.hold(game_id):
+            game.status = new_status
+        self.repository.mark_dirty("games", game_id)
+        self.touch_game(game_id)
 
     def start_game(self, game_id: str) -> None:
         """Transition game from SETUP to PLAYING.
@@ -138,60 +325,80 @@ class GameService:
         Returns:
             The game ID (new or existing)
         """
-        # Check if game already exists (handles concurrent accepts)
-        if sender_id in self.games_by_player:
-            return self.games_by_player[sender_id].id
-        if receiver_id in self.games_by_player:
-            return self.games_by_player[receiver_id].id
-
-        # Create new game
-        game_id = self.create_two_player_game(sender_id, receiver_id)
-        game = self.games[game_id]
-        game.status = GameStatus.SETUP
-        return game_id
+        with self.locks.hold(sender_id, receiver_id):
+            # Check if game already exists (handles concurrent accepts)
+            if sender_id in self.games_by_player:
+                return self.games_by_player[sender_id].id
+            if receiver_id in self.games_by_player:
+                return self.games_by_player[receiver_id].id
+
+            # Create new game
+            game_id = self.create_two_player_game(sender_id, receiver_id)
+            game = self.games[game_id]
+            game.status = GameStatus.SETUP
+            self.repository.mark_dirty("games", game_id)
+            return game_id
 
     def create_single_player_game(self, player_id: str) -> str:
         player = self._get_player_or_raise(player_id)
 
-        if player_id in self.games_by_player or player.status == PlayerStatus.IN_GAME:
-            raise PlayerAlreadyInGameException(
-                f"Player {player.name} with id: {player_id} is already in a game"
+        with self.locks.hold(player_id):
+            if (
+                player_id in self.games_by_player
+                or player.status == PlayerStatus.IN_GAME
+            ):
+                raise PlayerAlreadyInGameException(
+                    f"Player {player.name} with id: {player_id} is already in a game"
+                )
+
+            new_game: Game = Game(
+                player_1=player, game_mode=GameMode.SINGLE_PLAYER, rules=self.rules
             )
-
-        new_game: Game = Game(player_1=player, game_mode=GameMode.SINGLE_PLAYER)
-        self.games[new_game.id] = new_game
-        self.games_by_player[player_id] = new_game
-        player.status = PlayerStatus.IN_GAME
+            self.games[new_game.id] = new_game
+            self.games_by_player[player_id] = new_game
+            player.status = PlayerStatus.IN_GAME
+        self.repository.mark_dirty("games", new_game.id)
+        self.repository.mark_dirty("games_by_player", player_id)
+        self.repository.mark_dirty("players", player_id)
+        self.touch_game(new_game.id)
         return new_game.id
 
     def create_two_player_game(self, player_1_id: str, player_2_id: str) -> str:
         player_1: Player = self._get_player_or_raise(player_1_id)
         player_2: Player = self._get_player_or_raise(player_2_id)
 
-        # Check if either player is already in a game
-        if player_1_id in self.games_by_player:
-            raise PlayerAlreadyInGameException(
-                f"Player {player_1.name} with id: {player_1_id} is already in a game"
+        with self.locks.hold(player_1_id, player_2_id):
+            # Check if either player is already in a game
+            if player_1_id in self.games_by_player:
+                raise PlayerAlreadyInGameException(
+                    f"Player {player_1.name} with id: {player_1_id} is already in a game"
+                )
+
+            if player_2_id in self.games_by_player:
+                raise PlayerAlreadyInGameException(
+                    f"Player {player_2.name} with id: {player_2_id} is already in a game"
+                )
+
+            if player_1_id == player_2_id:
+                raise DuplicatePlayerException(
+                    f"Two player game must have two different players: {player_1.name}"
+                )
+
+            new_game: Game = Game(
+                player_1=player_1,
+                player_2=player_2,
+                game_mode=GameMode.TWO_PLAYER,
+                rules=self.rules,
             )
-
-        if player_2_id in self.games_by_player:
-            raise PlayerAlreadyInGameException(
-                f"Player {player_2.name} with id: {player_2_id} is already in a game"
-            )
-
-        if player_1_id == player_2_id:
-            raise DuplicatePlayerException(
-                f"Two player game must have two different players: {player_1.name}"
-            )
-
-        new_game: Game = Game(
-            player_1=player_1, player_2=player_2, game_mode=GameMode.TWO_PLAYER
-        )
-        self.games[new_game.id] = new_game
-        self.games_by_player[player_1_id] = new_game
-        self.games_by_player[player_2_id] = new_game
-        player_1.status = PlayerStatus.IN_GAME
-        player_2.status = PlayerStatus.IN_GAME
+            self.games[new_game.id] = new_game
+            self.games_by_player[player_1_id] = new_game
+            self.games_by_player[player_2_id] = new_game
+            player_1.status = PlayerStatus.IN_GAME
+            player_2.status = PlayerStatus.IN_GAME
+        self.repository.mark_dirty("games", new_game.id)
+        self.repository.mark_dirty("games_by_player", player_1_id, player_2_id)
+        self.repository.mark_dirty("players", player_1_id, player_2_id)
+        self.touch_game(new_game.id)
         self._notify_placement_change()
 
         return new_game.id
@@ -212,9 +419,13 @@ class GameService:
             UnknownGameException: If game doesn't exist
         """
         game = self._get_game_or_raise(game_id)
-        if player_id in self.ship_placement_boards:
-            game.board[player] = self.ship_placement_boards[player_id]
-            del self.ship_placement_boards[player_id]
+        with self.locks.hold(game_id, player_id):
+            board: GameBoard | None = self.ship_placement_boards.pop(player_id, None)
+            self.placement_histories.pop(player_id, None)
+            if board is not None:
+                game.board[player] = board
+        self.repository.mark_dirty("ship_placement_boards", player_id)
+        self.repository.mark_dirty("games", game_id)
 
     # TODO: Review this function and the commonality with get_or_create_ship_placement_board to see if we need both
     def get_game_board(self, player_id: str) -> GameBoard:
@@ -225,6 +436,7 @@ class GameService:
             raise PlayerNotInGameException(
                 f"Player {player.name} with id:{player_id} exists but is not in a game"
             )
+        self.touch_game(game.id)
         return game.board[player]
 
     # TODO: Review this function and the commonality with get_game_board to see if we need both
@@ -245,80 +457,198 @@ class GameService:
         """
         player: Player = self._get_player_or_raise(player_id)
 
-        # If player already has a ship placement board, return it
-        if player_id in self.ship_placement_boards:
-            return self.ship_placement_boards[player_id]
+        with self.locks.hold(player_id):
+            # If player already has a ship placement board, return it
+            if player_id in self.ship_placement_boards:
+                return self.ship_placement_boards[player_id]
 
-        # If player is already in a game, return their game board
-        if player_id in self.games_by_player:
-            game: Game = self.games_by_player[player_id]
-            return game.board[player]
+            # If player is already in a game, return their game board
+            if player_id in self.games_by_player:
+                game: Game = self.games_by_player[player_id]
+                return game.board[player]
 
-        # Create a new ship placement board
-        new_board: GameBoard = GameBoard()
-        self.ship_placement_boards[player_id] = new_board
-        return new_board
+            # Create a new ship placement board
+            new_board: GameBoard = GameBoard(self.rules)
+            self.ship_placement_boards[player_id] = new_board
+            self._board_changed(player_id)
+            return new_board
 
-    def place_ships_randomly(self, player_id: str) -> None:
-        """Place all 5 ships randomly on the board following placement rules.
+    def _board_changed(self, player_id: str) -> None:
+        """Record a change to the player's board (placement or game).
 
-        Clears any existing ships and places all ships randomly.
+        Marks the row holding the board as changed and counts the change as
+        player activity, so the reaper does not drop a board being worked on.
+        """
+        self.player_last_activity[player_id] = time.monotonic()
+        if player_id in self.ship_placement_boards:
+            self.repository.mark_dirty("ship_placement_boards", player_id)
+        elif player_id in self.games_by_player:
+            self.repository.mark_dirty("games", self.games_by_player[player_id].id)
+
+    def place_ships_randomly(
+        self, player_id: str, rng: random.Random | None = None
+    ) -> None:
+        """Place the whole fleet randomly on the board following placement rules.
+
+        Clears any existing ships and places all ships randomly. The layout is
+        found on a MaskBoard for the board's rules, so this costs the same
+        few mask operations per ship on any board size.
 
         Args:
             player_id: The player ID
+            rng: Source of randomness (seeded by the caller for repeatable
+                placements; defaults to one seeded from the random module)
 
         Raises:
             UnknownPlayerException: If player doesn_t exist
+            RuntimeError: If the fleet does not fit the board's rules
+        """
+
+        if rng is None:
+            rng = random.Random(random.getrandbits(64))
+
+        with self.locks.hold(player_id):
+            # Get or create the board
+            board = self.get_or_create_ship_placement_board(player_id)
+
+            layout = MaskBoard(board.rules)
+            layout.place_fleet_randomly(rng)
+
+            # Clear existing ships, then copy the layout over in fleet order
+            board.clear_all_ships()
+            for index, ship_type in enumerate(board.fleet):
+                start, orientation = layout.placement_of(index)
+                board.place_ship(Ship(ship_type), board.coord_at(start), orientation)
+            self._board_changed(player_id)
+
+    def place_fleet(self, player_id: str, placements: list[ShipPlacement]) -> None:
+        """Replace the player's ships with a whole fleet, all or nothing.
+
+        The fleet is validated in one pass before the board is touched.
+
+        Args:
+            player_id: The player ID
+            placements: One placement for each of the five ship types
+
+        Raises:
+            FleetLayoutError: Listing every rule the fleet breaks
+            UnknownPlayerException: If player doesn't exist
+            ValueError: If this service does not play by the standard rules
         """
+        self._require_standard_rules("Whole-fleet placement")
+        violations: list[str] = validate_fleet(placements)
+        if violations:
+            raise FleetLayoutError(violations)
+
+        with self.locks.hold(player_id):
+            board = self.get_or_create_ship_placement_board(player_id)
+            board.clear_all_ships()
+            for placement in placements:
+                board.place_ship(
+                    Ship(placement.ship_type), placement.start, placement.orientation
+                )
+            self._board_changed(player_id)
+
+    def auto_complete_fleet(self, player_id: str) -> bool:
+        """Place the ships not yet on the board, keeping those already placed.
 
-        # Get or create the board
-        board = self.get_or_create_ship_placement_board(player_id)
-
-        # Clear existing ships
-        board.clear_all_ships()
-
-        # All ship types to place
-        ship_types = [
-            ShipType.CARRIER,
-            ShipType.BATTLESHIP,
-            ShipType.CRUISER,
-            ShipType.SUBMARINE,
-            ShipType.DESTROYER,
-        ]
-
-        # All possible coordinates and orientations
-        all_coords = list(Coord)
-        all_orientations = list(Orientation)
-
-        # Place each ship
-        for ship_type in ship_types:
-            ship = Ship(ship_type)
-            placed = False
-            max_attempts = 1000
-            attempts = 0
-
-            while not placed and attempts < max_attempts:
-                attempts += 1
-                # Pick random start position and orientation
-                start = random.choice(all_coords)
-                orientation = random.choice(all_orientations)
-
-                try:
-                    board.place_ship(ship, start, orientation)
-                    placed = True
-                except Exception:
-                    # Try again with different position/orientation
-                    continue
-
-            if not placed:
-                # Retry the whole process if we get stuck
-                board.clear_all_ships()
-                self.place_ships_randomly(player_id)
-                return
+        Args:
+            player_id: The player ID
+
+        Returns:
+            True if the fleet is now complete, False if the remaining ships
+            cannot fit around the ships already placed (the board is unchanged)
+
+        Raises:
+            UnknownPlayerException: If player doesn't exist
+            ValueError: If this service does not play by the standard rules
+        """
+        self._require_standard_rules("Fleet auto-completion")
+        with self.locks.hold(player_id):
+            board = self.get_or_create_ship_placement_board(player_id)
+            placements: list[ShipPlacement] | None = complete_fleet(
+                board, random.Random(random.getrandbits(64))
+            )
+            if placements is None:
+                return False
+            for placement in placements:
+                board.place_ship(
+                    Ship(placement.ship_type), placement.start, placement.orientation
+                )
+            self._board_changed(player_id)
+            return True
+
+    def _require_standard_rules(self, action: str) -> None:
+        # Fleet layouts (share codes, the solver) are defined for the standard
+        # board and fleet only
+        if self.rules != STANDARD_RULES:
+            raise ValueError(f"{action} needs the standard rules")
+
+    @contextmanager
+    def placement_step(self, player_id: str) -> Iterator[GameBoard]:
+        """Run one placement action as a single undoable step.
+
+        Yields the player's placement board. If the action changes it, the
+        snapshot from before is recorded in the player's undo history.
+
+        Args:
+            player_id: The player ID
+
+        Raises:
+            UnknownPlayerException: If player doesn't exist
+        """
+        with self.locks.hold(player_id):
+            board: GameBoard = self.get_or_create_ship_placement_board(player_id)
+            before: BoardSnapshot = board.snapshot()
+            yield board
+            if board.version != before.version:
+                self.placement_histories.setdefault(
+                    player_id, PlacementHistory()
+                ).record(before)
+                self._board_changed(player_id)
+
+    def undo_placement(self, player_id: str) -> bool:
+        """Put the player's board back as it was before their last action.
+
+        Returns:
+            True if a step was undone, False if there was nothing to undo
+        """
+        return self._step_placement_history(player_id, PlacementHistory.undo)
+
+    def redo_placement(self, player_id: str) -> bool:
+        """Re-apply the placement action most recently undone.
+
+        Returns:
+            True if a step was redone, False if there was nothing to redo
+        """
+        return self._step_placement_history(player_id, PlacementHistory.redo)
+
+    def _step_placement_history(
+        self,
+        player_id: str,
+        step: Callable[[PlacementHistory, BoardSnapshot], BoardSnapshot | None],
+    ) -> bool:
+        with self.locks.hold(player_id):
+            board: GameBoard | None = self.ship_placement_boards.get(player_id)
+            history: PlacementHistory | None = self.placement_histories.get(player_id)
+            if board is None or history is None:
+                return False
+            target: BoardSnapshot | None = step(history, board.snapshot())
+            if target is None:
+                return False
+            board.restore(target)
+            self._board_changed(player_id)
+            return True
+
+    def get_placement_history(self, player_id: str) -> PlacementHistory:
+        """Get the player's placement history (empty if they have none)."""
+        return self.placement_histories.get(player_id) or PlacementHistory()
 
     def set_player_ready(self, player_id: str) -> None:
         """Mark a player as ready for game."""
         self.ready_players.add(player_id)
+        self.player_last_activity[player_id] = time.monotonic()
+        self.repository.mark_dirty("ready_players", player_id)
         self._notify_placement_change()
 
     def is_player_ready(self, player_id: str) -> bool:
@@ -343,26 +673,116 @@ class GameService:
         computer = Player(name="Computer", status=PlayerStatus.AVAILABLE)
         self.add_player(computer)
         computer_id = computer.id
+        self.computer_player_ids.add(computer_id)
+
+        with self.locks.hold(player_id, computer_id):
+            # Create game (using TWO_PLAYER mode to support 2 boards)
+            game_id = self.create_two_player_game(player_id, computer_id)
+            game = self.games[game_id]
+            player = self.players[player_id]
+
+            # Transfer player_s board
+            if player_id in self.ship_placement_boards:
+                game.board[player] = self.ship_placement_boards[player_id]
+                del self.ship_placement_boards[player_id]
+                self.placement_histories.pop(player_id, None)
+
+            # Place computer ships randomly
+            self.place_ships_randomly(computer_id)
+
+            # Transfer computer_s board
+            if computer_id in self.ship_placement_boards:
+                game.board[computer] = self.ship_placement_boards[computer_id]
+                del self.ship_placement_boards[computer_id]
+
+        self.repository.mark_dirty("games", game_id)
+        self.repository.mark_dirty("ship_placement_boards", player_id, computer_id)
+        return game_id
 
-        # Create game (using TWO_PLAYER mode to support 2 boards)
-        game_id = self.create_two_player_game(player_id, computer_id)
-        game = self.games[game_id]
-        player = self.players[player_id]
+    def resolve_round(
+        self, game_id: str, salvos: dict[str, list[Coord]]
+    ) -> dict[str, RoundReport]:
+        """Fire each player's salvo for the current round and report the hits.
 
-        # Transfer player_s board
-        if player_id in self.ship_placement_boards:
-            game.board[player] = self.ship_placement_boards[player_id]
-            del self.ship_placement_boards[player_id]
+        Every salvo is checked before any lands, so an invalid one leaves the
+        game unchanged. The game finishes once a fleet has been sunk (both
+        fleets sunk in the same round is a draw).
 
-        # Place computer ships randomly
-        self.place_ships_randomly(computer_id)
+        Args:
+            game_id: The game ID
+            salvos: Player ID -> the cells they fire at this round
 
-        # Transfer computer_s board
-        if computer_id in self.ship_placement_boards:
-            game.board[computer] = self.ship_placement_boards[computer_id]
-            del self.ship_placement_boards[computer_id]
+        Returns:
+            Player ID -> what that player learns about their own salvo
 
-        return game_id
+        Raises:
+            UnknownGameException: If game doesn't exist
+            PlayerNotInGameException: If a salvo is from a player not in the game
+            ValueError: If the game is over, or a salvo is empty, has more
+                shots than the player has available, repeats a shot or fires
+                off the board
+        """
+        game: Game = self._get_game_or_raise(game_id)
+        players: dict[str, Player] = {
+            player.id: player for player in (game.player_1, game.player_2) if player
+        }
+        with self.locks.hold(game_id):
+            if game.status in (GameStatus.FINISHED, GameStatus.ABANDONED):
+                raise ValueError(f"Game {game_id} is over")
+            targets: dict[str, GameBoard] = {}
+            for player_id, salvo in salvos.items():
+                if player_id not in players:
+                    raise PlayerNotInGameException(
+                        f"Player with id: {player_id} is not in game {game_id}"
+                    )
+                (opponent,) = [p for p in players.values() if p.id != player_id]
+                target: GameBoard = game.board[opponent]
+                shots: int = game.board[players[player_id]].shots_available
+                if not 0 < len(salvo) <= shots:
+                    raise ValueError(f"Salvo must have 1 to {shots} shots")
+                target.check_salvo(salvo)
+                targets[player_id] = target
+
+            round_number: int = game.round_number
+            reports: dict[str, RoundReport] = {}
+            for player_id, salvo in salvos.items():
+                target = targets[player_id]
+                hits: dict[ShipType, int] = target.receive_salvo(salvo, round_number)
+                for coord in salvo:
+                    game.board[players[player_id]].record_shot_fired(
+                        coord, round_number
+                    )
+                sunk: tuple[ShipType, ...] = tuple(
+                    ship_type for ship_type in hits if target.is_sunk(ship_type)
+                )
+                reports[player_id] = RoundReport(round_number, tuple(salvo), hits, sunk)
+                game.record_delta(
+                    DeltaKind.SHOT,
+                    {
+                        "player": player_id,
+                        "round": round_number,
+                        "coords": [coord.name for coord in salvo],
+                    },
+                )
+                if hits:
+                    game.record_delta(
+                        DeltaKind.HIT,
+                        {
+                            "player": player_id,
+                            "round": round_number,
+                            "hits": {ship.ship_name: n for ship, n in hits.items()},
+                        },
+                    )
+                for ship_type in sunk:
+                    game.record_delta(
+                        DeltaKind.SUNK,
+                        {"player": player_id, "ship": ship_type.ship_name},
+                    )
+            if any(game.board[player].all_ships_sunk for player in players.values()):
+                game.status = GameStatus.FINISHED
+        self.repository.mark_dirty("games", game_id)
+        self.touch_game(game_id)
+        return reports
 
     def get_game_status_by_player_id(self, player_id: str) -> GameStatus:
         player = self._get_player_or_raise(player_id)
@@ -382,7 +802,30 @@ class GameService:
         raise NotImplementedError("Complete unit tests first")
 
     def abandon_game_by_player_id(self, player_id: str) -> None:
-        raise NotImplementedError("Complete unit tests first")
+        """Mark the player's game as ABANDONED.
+
+        The game stays registered until the reaper evicts it, so the opponent
+        can still see what happened.
+
+        Args:
+            player_id: The player abandoning their game
+
+        Raises:
+            UnknownPlayerException: If player doesn't exist
+            PlayerNotInGameException: If player is not in a game
+        """
+        player = self._get_player_or_raise(player_id)
+        try:
+            game = self.games_by_player[player_id]
+        except KeyError:
+            raise PlayerNotInGameException(
+                f"Player {player.name} with id:{player_id} exists but is not in a game"
+            )
+        with self.locks.hold(player_id, game.id):
+            game.status = GameStatus.ABANDONED
+        self.repository.mark_dirty("games", game.id)
+        self.touch_game(game.id)
+        self._notify_placement_change()
 
     def get_opponent_id(self, player_id: str) -> str | None:
         """Get the opponent's ID for a player in a game.
@@ -468,7 +911,8 @@ class GameService:
 
     def _notify_placement_change(self) -> None:
         """Increment version and notify waiters of placement state change."""
-        self._placement_version += 1
+        with self._placement_version_lock:
+            self._placement_version += 1
         self._placement_change_event.set()
 
     async def wait_for_placement_change(self, since_version: int) -> None:
@@ -0,0 +1,206 @@
+"""Hot/cold tiering for game boards.
+
+Most games are parked while players think, so their boards do not need to be
+resident. The TieredGameStore serialises the boards of idle games to a local
+spill directory and leaves the Game object behind as a small stub; the boards
+are faulted back in transparently the next time `Game.board` is accessed.
+"""
+
+import json
+import logging
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable
+
+from game.locks import StripedLock
+from game.model import Game, GameBoard
+from game.serialisation import board_from_dict, board_to_dict
+
+if TYPE_CHECKING:
+    from game.player import Player
+
+logger = logging.getLogger(__name__)
+
+
+class LatencyStats:
+    """Running count, total and maximum of operation latencies."""
+
+    def __init__(self) -> None:
+        self.count: int = 0
+        self.total_seconds: float = 0.0
+        self.max_seconds: float = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.count += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+    def as_dict(self) -> dict[str, float]:
+        """Latency summary in milliseconds."""
+        mean: float = self.total_seconds / self.count if self.count else 0.0
+        return {
+            "count": self.count,
+            "mean_ms": round(mean * 1000, 3),
+            "max_ms": round(self.max_seconds * 1000, 3),
+        }
+
+
+class TieredGameStore:
+    """Keeps recently used games resident and spills the rest to disk.
+
+    Args:
+        spill_dir: Directory the spilled boards are written to
+        idle_threshold: Seconds of inactivity before a game is spilled
+        max_resident: Maximum number of games with resident boards (None for no cap)
+    """
+
+    def __init__(
+        self,
+        spill_dir: str | Path,
+        idle_threshold: float = 5 * 60.0,
+        max_resident: int | None = None,
+    ) -> None:
+        self.spill_dir: Path = Path(spill_dir)
+        self.spill_dir.mkdir(parents=True, exist_ok=True)
+        self.idle_threshold: float = idle_threshold
+        self.max_resident: int | None = max_resident
+        self._resident: OrderedDict[str, Game] = OrderedDict()  # game_id->Game, LRU
+        self.spill_latency: LatencyStats = LatencyStats()
+        self.reload_latency: LatencyStats = LatencyStats()
+        # The lock games are changed under (GameService.enable_tiering installs
+        # the service's) and whether a game has commands in flight
+        self.locks: StripedLock = StripedLock()
+        self.is_busy: Callable[[str], bool] = lambda game_id: False
+
+    def _spill_path(self, game_id: str) -> Path:
+        return self.spill_dir / f"{game_id}.json"
+
+    @property
+    def resident_count(self) -> int:
+        return len(self._resident)
+
+    def touch(self, game: Game) -> None:
+        """Mark a game as most recently used, faulting its boards in if needed.
+
+        Args:
+            game: The game being accessed
+        """
+        if game.is_spilled:
+            game.board  # noqa: B018 - fault the boards in via the loader
+        self._resident[game.id] = game
+        self._resident.move_to_end(game.id)
+        self._enforce_cap()
+
+    def discard(self, game: Game) -> None:
+        """Forget a game entirely, removing any spill file.
+
+        Args:
+            game: The game being removed
+        """
+        self._resident.pop(game.id, None)
+        self._spill_path(game.id).unlink(missing_ok=True)
+
+    def spill(self, game: Game) -> bool:
+        """Write a game's boards to disk and release them from memory.
+
+        A game whose lock (or either player's) is held elsewhere, or which has
+        commands in flight, is in use and is left resident.
+
+        Args:
+            game: The game to spill
+
+        Returns:
+            True if the game was spilled, False if it was already spilled, in
+            use or could not be written
+        """
+        players: list[str] = [
+            player.id for player in (game.player_1, game.player_2) if player
+        ]
+        with self.locks.try_hold(game.id, *players) as held:
+            if not held or game.is_spilled or self.is_busy(game.id):
+                return False
+            return self._spill_locked(game)
+
+    def _spill_locked(self, game: Game) -> bool:
+        started: float = time.perf_counter()
+        record: dict[str, Any] = {
+            "game_id": game.id,
+            "boards": {
+                player.id: board_to_dict(board) for player, board in game.board.items()
+            },
+        }
+        try:
+            self._spill_path(game.id).write_text(json.dumps(record))
+        except OSError:
+            logger.exception("Failed to spill game %s", game.id)
+            return False
+
+        game.spill_boards(self._load)
+        self._resident.pop(game.id, None)
+        self.spill_latency.record(time.perf_counter() - started)
+        return True
+
+    def spill_idle(self, last_activity: dict[str, float], now: float) -> int:
+        """Spill every resident game idle for longer than the threshold.
+
+        Args:
+            last_activity: game_id->time.monotonic() of last activity
+            now: Current time.monotonic() value
+
+        Returns:
+            The number of games spilled
+        """
+        idle_games: list[Game] = [
+            game
+            for game_id, game in list(self._resident.items())
+            if now - last_activity.get(game_id, now) >= self.idle_threshold
+        ]
+        return sum(1 for game in idle_games if self.spill(game))
+
+    def _enforce_cap(self) -> None:
+        """Spill the least recently used games until back under the cap.
+
+        Games in use are skipped, so the store may stay over the cap until
+        they are released.
+        """
+        if self.max_resident is None:
+            return
+        excess: int = len(self._resident) - self.max_resident
+        for game in list(self._resident.values()):
+            if excess <= 0:
+                break
+            if game.is_spilled:
+                self._resident.pop(game.id, None)
+                excess -= 1
+            elif self.spill(game):
+                excess -= 1
+
+    def _load(self, game: Game) -> dict["Player", GameBoard]:
+        """Board loader installed on spilled games."""
+        started: float = time.perf_counter()
+        path: Path = self._spill_path(game.id)
+        record: dict[str, Any] = json.loads(path.read_text())
+        players: dict[str, "Player"] = {
+            player.id: player for player in (game.player_1, game.player_2) if player
+        }
+        boards: dict["Player", GameBoard] = {
+            players[player_id]: board_from_dict(board_data, game.rules)
+            for player_id, board_data in record["boards"].items()
+        }
+        path.unlink(missing_ok=True)
+        self.reload_latency.record(time.perf_counter() - started)
+
+        self._resident[game.id] = game
+        self._resident.move_to_end(game.id)
+        self._enforce_cap()
+        return boards
+
+    def get_stats(self) -> dict[str, Any]:
+        """Store counters in a JSON-friendly format."""
+        return {
+            "resident_games": self.resident_count,
+            "max_resident": self.max_resident,
+            "spill": self.spill_latency.as_dict(),
+            "reload": self.reload_latency.as_dict(),
+        }
@@ -0,0 +1,276 @@
+"""Work out where the opponent's ships can be from the hits reported.
+
+A player learns how many hits each opponent ship took in each round, but not
+which shots hit (Game_Play.md). The solver turns those reports into the
+placements each ship can still be in, in three stages:
+
+1. Per ship. Keep the placements whose overlap with every round's shots
+   equals the hits reported for that ship (game.salvo_optimiser's
+   PlacementTable).
+2. Propagation. Drop a placement if some other ship would have nowhere left
+   to go, because every placement of that ship overlaps or touches it.
+   Repeat until nothing changes.
+3. Joint count. The most constrained ships are enumerated together to
+   count the fleet layouts each placement appears in. The enumeration is
+   memoised on the cells still open to the ships after it. Ships left with
+   too many placements to enumerate in time are weighted per ship instead.
+"""
+
+import time
+from collections.abc import Iterable
+from typing import NamedTuple
+
+from game.cells import CELL_COUNT
+from game.model import GameBoard, ShipType, coord_to_cell
+from game.placement_masks import HALO_MASKS
+from game.salvo_optimiser import PLACEMENTS, PlacementTable
+
+# Default time allowed for one inference, in seconds
+INFERENCE_TIME_BUDGET: float = 0.05
+# Steps (states x placements) the joint enumeration may take before it
+# leaves the remaining ships to be weighted per ship
+MAX_JOINT_WORK: int = 30_000
+
+
+def _build_halos() -> dict[int, int]:
+    halos: dict[int, int] = {}
+    for masks in PLACEMENTS.values():
+        for mask in masks:
+            halo: int = 0
+            for cell in range(CELL_COUNT):
+                if mask >> cell & 1:
+                    halo |= HALO_MASKS[cell]
+            halos[mask] = halo
+    return halos
+
+
+# Footprint mask -> the cells it covers or touches
+HALOS: dict[int, int] = _build_halos()
+
+
+class RoundEvidence(NamedTuple):
+    """One round's report to the firing player."""
+
+    round_number: int
+    shots: int  # Mask of the cells fired at
+    hits: dict[ShipType, int]  # Hits on each ship type hit this round
+    sunk: tuple[ShipType, ...]  # Ship types sunk this round
+
+
+class ShipInference(NamedTuple):
+    """Where one opponent ship can be."""
+
+    ship_type: ShipType
+    placements: int  # Placements that fit the evidence
+    chances: tuple[float, ...]  # Chance that each cell holds this ship
+    certain: int  # Mask of the cells every remaining placement covers
+    sunk: bool
+    joint: bool  # Weighted by the fleet layouts it appears in, not per ship
+
+
+class Inference(NamedTuple):
+    """The solver's answer for a whole fleet."""
+
+    ships: tuple[ShipInference, ...]
+    layouts: int  # Layouts of the jointly counted ships that fit the evidence
+    fired: int  # Mask of every cell fired at
+    elapsed: float  # Seconds taken
+
+    def chances(self) -> list[float]:
+        """Return the chance that each cell holds a ship not yet sunk."""
+        totals: list[float] = [0.0] * CELL_COUNT
+        for ship in self.ships:
+            if not ship.sunk:
+                for cell, chance in enumerate(ship.chances):
+                    totals[cell] += chance
+        return totals
+
+
+def evidence_from_board(board: GameBoard) -> list[RoundEvidence]:
+    """Return the round reports a player was given for their shots at `board`.
+
+    Args:
+        board: The opponent's board (its ships and the shots it received)
+
+    Returns:
+        One RoundEvidence per round, in order
+    """
+    shots_by_round: dict[int, int] = {}
+    for coord, round_number in board.shots_received.items():
+        shots_by_round[round_number] = shots_by_round.get(round_number, 0) | (
+            1 << coord_to_cell(coord)
+        )
+    # A ship is reported sunk in the round its last cell was hit
+    sunk_in: dict[int, list[ShipType]] = {}
+    for ship in board.ships:
+        if ship.positions and all(
+            coord in board.shots_received for coord in ship.positions
+        ):
+            last_hit: int = max(board.shots_received[coord] for coord in ship.positions)
+            sunk_in.setdefault(last_hit, []).append(ship.ship_type)
+
+    evidence: list[RoundEvidence] = []
+    for round_number in sorted(shots_by_round):
+        shots: int = shots_by_round[round_number]
+        hits: dict[ShipType, int] = {}
+        for ship in board.ships:
+            count: int = sum(
+                1 for coord in ship.positions if shots >> coord_to_cell(coord) & 1
+            )
+            if count:
+                hits[ship.ship_type] = count
+        evidence.append(
+            RoundEvidence(
+                round_number, shots, hits, tuple(sunk_in.get(round_number, ()))
+            )
+        )
+    return evidence
+
+
+def _propagate(placements: dict[ShipType, list[int]], deadline: float) -> None:
+    """Drop placements that leave another ship with nowhere to go."""
+    changed: bool = True
+    while changed and time.perf_counter() < deadline:
+        changed = False
+        for ship_type, masks in placements.items():
+            others: list[list[int]] = [
+                other
+                for other_type, other in placements.items()
+                if other_type != ship_type
+            ]
+            kept: list[int] = [
+                mask
+                for mask in masks
+                if all(
+                    any(not other_mask & HALOS[mask] for other_mask in other)
+                    for other in others
+                )
+            ]
+            if len(kept) != len(masks):
+                placements[ship_type] = kept
+                changed = True
+
+
+def _joint_support(
+    ships: list[list[int]], deadline: float
+) -> tuple[int, int, list[dict[int, int]]]:
+    """Count the layouts of the leading ships and the layouts each placement is in.
+
+    Ships are added in order until the next one would take the enumeration
+    past MAX_JOINT_WORK steps or the deadline.
+
+    Returns:
+        (ships counted, layouts, per counted ship {placement: layouts
+        containing it})
+    """
+    # Cells any later ship could cover: only these matter to the rest
+    relevant: list[int] = [0] * (len(ships) + 1)
+    for index in range(len(ships) - 1, -1, -1):
+        covered: int = 0
+        for mask in ships[index]:
+            covered |= mask
+        relevant[index] = relevant[index + 1] | covered
+
+    # Forward: ways to place ships[:index], by the cells they rule out
+    forward: list[dict[int, int]] = [{0: 1}]
+    work: int = 0
+    for index, masks in enumerate(ships):
+        work += len(forward[index]) * len(masks)
+        if work > MAX_JOINT_WORK or time.perf_counter() > deadline:
+            break
+        states: dict[int, int] = {}
+        for blocked, ways in forward[index].items():
+            for mask in masks:
+                if not mask & blocked:
+                    state: int = (blocked | HALOS[mask]) & relevant[index + 1]
+                    states[state] = states.get(state, 0) + ways
+        forward.append(states)
+    counted: int = len(forward) - 1
+
+    # Backward: ways to place ships[index:counted] from each state. States
+    # keep the cells the uncounted ships could cover too, which only makes
+    # them finer than needed
+    completions: list[dict[int, int]] = [{} for _ in range(counted)] + [
+        dict.fromkeys(forward[counted], 1)
+    ]
+    for index in range(counted - 1, -1, -1):
+        for blocked in forward[index]:
+            completions[index][blocked] = sum(
+                completions[index + 1][(blocked | HALOS[mask]) & relevant[index + 1]]
+                for mask in ships[index]
+                if not mask & blocked
+            )
+
+    support: list[dict[int, int]] = []
+    for index in range(counted):
+        counts: dict[int, int] = dict.fromkeys(ships[index], 0)
+        for blocked, ways in forward[index].items():
+            for mask in ships[index]:
+                if not mask & blocked:
+                    state = (blocked | HALOS[mask]) & relevant[index + 1]
+                    counts[mask] += ways * completions[index + 1][state]
+        support.append(counts)
+    return counted, completions[0][0], support
+
+
+def _ship_inference(
+    ship_type: ShipType,
+    weights: dict[int, int],
+    sunk: bool,
+    joint: bool,
+) -> ShipInference:
+    live: dict[int, int] = {mask: weight for mask, weight in weights.items() if weight}
+    total: int = sum(live.values())
+    chances: list[float] = [0.0] * CELL_COUNT
+    certain: int = -1 if live else 0
+    for mask, weight in live.items():
+        certain &= mask
+        for cell in range(CELL_COUNT):
+            if mask >> cell & 1:
+                chances[cell] += weight / total
+    return ShipInference(ship_type, len(live), tuple(chances), certain, sunk, joint)
+
+
+def infer(
+    evidence: Iterable[RoundEvidence], budget: float = INFERENCE_TIME_BUDGET
+) -> Inference:
+    """Work out where each opponent ship can be.
+
+    Args:
+        evidence: The round reports, in order
+        budget: Seconds allowed; propagation and the joint count stop early
+            when it runs out (the answer is then less sharp, never wrong)
+
+    Returns:
+        Each ship's remaining placements, cell chances and certain cells
+    """
+    started: float = time.perf_counter()
+    deadline: float = started + budget
+    table = PlacementTable()
+    for report in evidence:
+        table.add_round(report.shots, report.hits, report.sunk)
+    placements: dict[ShipType, list[int]] = table.placements
+    _propagate(placements, deadline)
+
+    # Enumerate jointly from the most constrained ship
+    order: list[ShipType] = sorted(placements, key=lambda ship: len(placements[ship]))
+    counted, layouts, support = _joint_support(
+        [placements[ship] for ship in order], deadline
+    )
+    joint_ships: list[ShipType] = order[:counted]
+    weights: dict[ShipType, dict[int, int]] = {
+        ship: dict.fromkeys(placements[ship], 1) for ship in placements
+    }
+    for ship, counts in zip(joint_ships, support):
+        weights[ship] = counts
+
+    ships: tuple[ShipInference, ...] = tuple(
+        _ship_inference(
+            ship_type,
+            weights[ship_type],
+            ship_type in table.sunk,
+            ship_type in joint_ships,
+        )
+        for ship_type in ShipType
+    )
+    return Inference(ships, layouts, table.fired, time.perf_counter() - started)
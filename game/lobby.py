@@ -1,20 +1,42 @@
 import asyncio
+import threading
 from datetime import datetime
+from game.locks import StripedLock, ThreadSafeEvent
 from game.player import GameRequest, Player, PlayerStatus
+from game.repository import InMemoryRepository, StateRepository
 
 
 class Lobby:
-    def __init__(self):
-        self.players: dict[str, Player] = {}  # player_id -> Player
-        self.game_requests: dict[str, GameRequest] = {}  # receiver_id -> GameRequest
-        self.active_games: dict[str, str] = {}  # player_id -> opponent_id
-        self.decline_notifications: dict[str, str] = {}  # sender_id -> decliner_id
+    def __init__(self, repository: StateRepository | None = None):
+        # State collections are owned by the repository (in-memory by default)
+        self.repository: StateRepository = repository or InMemoryRepository()
+        # player_id -> Player
+        self.players: dict[str, Player] = self.repository.lobby_players
+        # receiver_id -> GameRequest
+        self.game_requests: dict[str, GameRequest] = self.repository.game_requests
+        # player_id -> opponent_id
+        self.active_games: dict[str, str] = self.repository.active_games
+        # sender_id -> decliner_id
+        self.decline_notifications: dict[str, str] = (
+            self.repository.decline_notifications
+        )
+        # Multi-step mutations lock the player IDs they touch
+        self.locks: StripedLock = StripedLock()
+        self.repository.register_locks(
+            self.locks,
+            "lobby_players",
+            "game_requests",
+            "active_games",
+            "decline_notifications",
+        )
         self.version: int = 0
-        self.change_event: asyncio.Event = asyncio.Event()
+        self._version_lock: threading.Lock = threading.Lock()
+        self.change_event: asyncio.Event = ThreadSafeEvent()
 
     def _notify_change(self) -> None:
         """Increment version and notify all waiters of state change"""
-        self.version += 1
+        with self._version_lock:
+            self.version += 1
         self.change_event.set()
 
     def add_player(self, player: Player) -> None:
@@ -23,7 +45,9 @@ class Lobby:
         Args:
             player: The Player object to add to the lobby
         """
-        self.players[player.id] = player
+        with self.locks.hold(player.id):
+            self.players[player.id] = player
+        self.repository.mark_dirty("lobby_players", player.id)
         self._notify_change()
 
     def remove_player(self, player_id: str) -> None:
@@ -32,11 +56,11 @@ class Lobby:
         Args:
             player_id: The ID of the player to remove
         """
-        if player_id in self.players:
-            del self.players[player_id]
-            self._notify_change()
-        else:
-            raise ValueError(f"Player with ID '{player_id}' not found in lobby")
+        with self.locks.hold(player_id):
+            if self.players.pop(player_id, None) is None:
+                raise ValueError(f"Player with ID '{player_id}' not found in lobby")
+        self.repository.mark_dirty("lobby_players", player_id)
+        self._notify_change()
 
     def clear_all_except(self, player_id: str) -> None:
         """Keep only the specified player in the lobby
@@ -44,17 +68,18 @@ class Lobby:
         Args:
             player_id: The ID of the player to keep
         """
-        if player_id in self.players:
-            player = self.players[player_id]
-            self.players.clear()
-            self.players[player_id] = player
-        else:
+        with self.locks.hold_all():
+            player: Player | None = self.players.get(player_id)
+            removed: list[str] = [key for key in self.players if key != player_id]
             self.players.clear()
+            if player is not None:
+                self.players[player_id] = player
+        self.repository.mark_dirty("lobby_players", *removed)
 
     def get_available_players(self) -> list[Player]:
         return [
             player
-            for player in self.players.values()
+            for player in list(self.players.values())
             if player.status == PlayerStatus.AVAILABLE
         ]
 
@@ -65,9 +90,11 @@ class Lobby:
             player_id: The ID of the player
             status: The new status to set
         """
-        if player_id not in self.players:
-            raise ValueError(f"Player with ID '{player_id}' not found in lobby")
-        self.players[player_id].status = status
+        with self.locks.hold(player_id):
+            if player_id not in self.players:
+                raise ValueError(f"Player with ID '{player_id}' not found in lobby")
+            self.players[player_id].status = status
+        self.repository.mark_dirty("lobby_players", player_id)
         self._notify_change()
 
     def get_player_status(self, player_id: str) -> PlayerStatus:
@@ -79,9 +106,10 @@ class Lobby:
         Returns:
             The player's current status
         """
-        if player_id not in self.players:
+        player: Player | None = self.players.get(player_id)
+        if player is None:
             raise ValueError(f"Player with ID '{player_id}' not found in lobby")
-        return self.players[player_id].status
+        return player.status
 
     def send_game_request(self, sender_id: str, receiver_id: str) -> None:
         """Send a game request from sender to receiver
@@ -90,31 +118,34 @@ class Lobby:
             sender_id: The ID of the player sending the request
             receiver_id: The ID of the player receiving the request
         """
-        # Validate that both players exist
-        if sender_id not in self.players:
-            raise ValueError(f"Player with ID '{sender_id}' not found in lobby")
-        if receiver_id not in self.players:
-            raise ValueError(f"Player with ID '{receiver_id}' not found in lobby")
-
-        # Validate that sender is available
-        if self.players[sender_id].status != PlayerStatus.AVAILABLE:
-            raise ValueError(f"Sender with ID {sender_id} is not available")
-
-        # Validate that receiver is available
-        if self.players[receiver_id].status != PlayerStatus.AVAILABLE:
-            raise ValueError(f"Receiver with ID {receiver_id} is not available")
-
-        # Create the game request
-        request = GameRequest(
-            sender_id=sender_id, receiver_id=receiver_id, timestamp=datetime.now()
-        )
+        with self.locks.hold(sender_id, receiver_id):
+            # Validate that both players exist
+            if sender_id not in self.players:
+                raise ValueError(f"Player with ID '{sender_id}' not found in lobby")
+            if receiver_id not in self.players:
+                raise ValueError(f"Player with ID '{receiver_id}' not found in lobby")
+
+            # Validate that sender is available
+            if self.players[sender_id].status != PlayerStatus.AVAILABLE:
+                raise ValueError(f"Sender with ID {sender_id} is not available")
+
+            # Validate that receiver is available
+            if self.players[receiver_id].status != PlayerStatus.AVAILABLE:
+                raise ValueError(f"Receiver with ID {receiver_id} is not available")
+
+            # Create the game request
+            request = GameRequest(
+                sender_id=sender_id, receiver_id=receiver_id, timestamp=datetime.now()
+            )
 
-        # Store the request
-        self.game_requests[receiver_id] = request
+            # Store the request
+            self.game_requests[receiver_id] = request
 
-        # Update player statuses
-        self.players[sender_id].status = PlayerStatus.REQUESTING_GAME
-        self.players[receiver_id].status = PlayerStatus.PENDING_RESPONSE
+            # Update player statuses
+            self.players[sender_id].status = PlayerStatus.REQUESTING_GAME
+            self.players[receiver_id].status = PlayerStatus.PENDING_RESPONSE
+        self.repository.mark_dirty("game_requests", receiver_id)
+        self.repository.mark_dirty("lobby_players", sender_id, receiver_id)
         self._notify_change()
 
     def get_pending_request(self, receiver_id: str) -> GameRequest | None:
@@ -137,7 +168,7 @@ class Lobby:
         Returns:
             The GameRequest if one exists, None otherwise
         """
-        for request in self.game_requests.values():
+        for request in list(self.game_requests.values()):
             if request.sender_id == sender_id:
                 return request
         return None
@@ -151,26 +182,28 @@ class Lobby:
         Returns:
             Tuple of (sender_id, receiver_id)
         """
-        # Check if there's a pending request
-        if receiver_id not in self.game_requests:
-            raise ValueError(
-                f"No pending game request for player with ID {receiver_id}"
-            )
-
-        request = self.game_requests[receiver_id]
-        sender_id = request.sender_id
-
-        # Update both players to IN_GAME
-        self.players[sender_id].status = PlayerStatus.IN_GAME
-        self.players[receiver_id].status = PlayerStatus.IN_GAME
-
-        # Create bidirectional pairing
-        self.active_games[sender_id] = receiver_id
-        self.active_games[receiver_id] = sender_id
-
-        # Remove the request
-        del self.game_requests[receiver_id]
-
+        sender_id: str = self._locked_pending_sender(receiver_id)
+        with self.locks.hold(sender_id, receiver_id):
+            request = self.game_requests.get(receiver_id)
+            if request is None or request.sender_id != sender_id:
+                raise ValueError(
+                    f"No pending game request for player with ID {receiver_id}"
+                )
+
+            # Update both players to IN_GAME
+            self.players[sender_id].status = PlayerStatus.IN_GAME
+            self.players[receiver_id].status = PlayerStatus.IN_GAME
+
+            # Create bidirectional pairing
+            self.active_games[sender_id] = receiver_id
+            self.active_games[receiver_id] = sender_id
+
+            # Remove the request
+            del self.game_requests[receiver_id]
+
+        self.repository.mark_dirty("game_requests", receiver_id)
+        self.repository.mark_dirty("active_games", sender_id, receiver_id)
+        self.repository.mark_dirty("lobby_players", sender_id, receiver_id)
         self._notify_change()
 
         return sender_id, receiver_id
@@ -184,28 +217,46 @@ class Lobby:
         Returns:
             The sender_id of the player whose request was declined
         """
-        # Check if there's a pending request
-        if receiver_id not in self.game_requests:
-            raise ValueError(
-                f"No pending game request for player with ID {receiver_id}"
-            )
-
-        request = self.game_requests[receiver_id]
-        sender_id = request.sender_id
-
-        # Return both players to AVAILABLE
-        self.players[sender_id].status = PlayerStatus.AVAILABLE
-        self.players[receiver_id].status = PlayerStatus.AVAILABLE
+        sender_id: str = self._locked_pending_sender(receiver_id)
+        with self.locks.hold(sender_id, receiver_id):
+            request = self.game_requests.get(receiver_id)
+            if request is None or request.sender_id != sender_id:
+                raise ValueError(
+                    f"No pending game request for player with ID {receiver_id}"
+                )
+
+            # Return both players to AVAILABLE
+            self.players[sender_id].status = PlayerStatus.AVAILABLE
+            self.players[receiver_id].status = PlayerStatus.AVAILABLE
+
+            # Store decline notification for sender
+            self.decline_notifications[sender_id] = receiver_id
+
+            # Remove the request
+            del self.game_requests[receiver_id]
+
+        self.repository.mark_dirty("game_requests", receiver_id)
+        self.repository.mark_dirty("decline_notifications", sender_id)
+        self.repository.mark_dirty("lobby_players", sender_id, receiver_id)
+        self._notify_change()
 
-        # Store decline notification for sender
-        self.decline_notifications[sender_id] = receiver_id
+        return sender_id
 
-        # Remove the request
-        del self.game_requests[receiver_id]
+    def _locked_pending_sender(self, receiver_id: str) -> str:
+        """Return the sender of the receiver's pending request.
 
-        self._notify_change()
+        The caller must re-check the request once it holds both players' locks.
 
-        return sender_id
+        Raises:
+            ValueError: If the receiver has no pending request
+        """
+        with self.locks.hold(receiver_id):
+            request: GameRequest | None = self.game_requests.get(receiver_id)
+        if request is None:
+            raise ValueError(
+                f"No pending game request for player with ID {receiver_id}"
+            )
+        return request.sender_id
 
     def get_opponent(self, player_id: str) -> str | None:
         """Get the opponent for a player in an active game.
@@ -218,6 +269,32 @@ class Lobby:
         """
         return self.active_games.get(player_id)
 
+    def end_pairing(self, player_id: str) -> str | None:
+        """Dissolve a player's pairing and make both players available again.
+
+        Args:
+            player_id: The ID of either player in the pairing
+
+        Returns:
+            The opponent's ID, or None if the player was not paired
+        """
+        opponent_id: str | None = self.active_games.get(player_id)
+        paired: list[str] = [player_id]
+        if opponent_id is not None:
+            paired.append(opponent_id)
+        with self.locks.hold(*paired):
+            for member_id in paired:
+                # Leave the opponent's entry alone if they have paired again
+                if self.active_games.get(member_id) in paired:
+                    del self.active_games[member_id]
+                player: Player | None = self.players.get(member_id)
+                if player is not None and player.status == PlayerStatus.IN_GAME:
+                    player.status = PlayerStatus.AVAILABLE
+        self.repository.mark_dirty("active_games", *paired)
+        self.repository.mark_dirty("lobby_players", *paired)
+        self._notify_change()
+        return opponent_id
+
     def get_decline_notification(self, player_id: str) -> str | None:
         """Get and clear decline notification for a player.
 
@@ -227,7 +304,43 @@ class Lobby:
         Returns:
             The ID of the player who declined, or None if no notification
         """
-        return self.decline_notifications.pop(player_id, None)
+        decliner_id: str | None = self.decline_notifications.pop(player_id, None)
+        if decliner_id is not None:
+            self.repository.mark_dirty("decline_notifications", player_id)
+        return decliner_id
+
+    def prune_decline_notifications(self) -> int:
+        """Drop decline notifications whose recipient has left the lobby.
+
+        Returns:
+            The number of notifications removed
+        """
+        orphaned: list[str] = [
+            sender_id
+            for sender_id in list(self.decline_notifications)
+            if sender_id not in self.players
+        ]
+        for sender_id in orphaned:
+            self.decline_notifications.pop(sender_id, None)
+        self.repository.mark_dirty("decline_notifications", *orphaned)
+        return len(orphaned)
+
+    def prune_active_games(self) -> int:
+        """Drop pairings where neither player is still in the lobby.
+
+        Returns:
+            The number of pairing entries removed
+        """
+        orphaned: list[str] = [
+            player_id
+            for player_id, opponent_id in list(self.active_games.items())
+            if player_id not in self.players and opponent_id not in self.players
+        ]
+        for player_id in orphaned:
+            with self.locks.hold(player_id):
+                self.active_games.pop(player_id, None)
+        self.repository.mark_dirty("active_games", *orphaned)
+        return len(orphaned)
 
     def get_version(self) -> int:
         """Return the current version of the lobby state"""
@@ -0,0 +1,109 @@
+"""Synchronisation helpers for running GameService and Lobby across threads.
+
+On free-threaded CPython, handlers running on shard threads can mutate the
+same state concurrently. Multi-step mutations take a StripedLock keyed by the
+player and game IDs involved, so unrelated players and games never contend.
+Read paths (long-poll renders) take no locks. They iterate over snapshots
+(`list(d.values())`) and read single attributes, which are atomic.
+"""
+
+import asyncio
+import threading
+import zlib
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+
+class StripedLock:
+    """A fixed pool of re-entrant locks selected by hashing a key.
+
+    Locks for several keys are always acquired in stripe order, so callers
+    holding any combination of keys cannot deadlock. Nested holds must use the
+    same keys or a subset of them.
+
+    Args:
+        stripes: Number of locks in the pool
+    """
+
+    def __init__(self, stripes: int = 64) -> None:
+        self._locks: list[threading.RLock] = [threading.RLock() for _ in range(stripes)]
+
+    def stripe_for(self, key: str) -> int:
+        """Return the index of the lock guarding `key`."""
+        return zlib.crc32(key.encode()) % len(self._locks)
+
+    @contextmanager
+    def hold(self, *keys: str | None) -> Iterator[None]:
+        """Hold the locks for all given keys (None entries are ignored)."""
+        stripes: list[int] = sorted(
+            {self.stripe_for(key) for key in keys if key is not None}
+        )
+        for stripe in stripes:
+            self._locks[stripe].acquire()
+        try:
+            yield
+        finally:
+            for stripe in reversed(stripes):
+                self._locks[stripe].release()
+
+    @contextmanager
+    def try_hold(self, *keys: str | None) -> Iterator[bool]:
+        """Hold the locks for all given keys if none of them is contended.
+
+        Yields True while holding every lock, or False (holding none) if any
+        lock is held by another thread. Never blocks.
+        """
+        stripes: list[int] = sorted(
+            {self.stripe_for(key) for key in keys if key is not None}
+        )
+        acquired: list[int] = []
+        for stripe in stripes:
+            if not self._locks[stripe].acquire(blocking=False):
+                break
+            acquired.append(stripe)
+        try:
+            yield len(acquired) == len(stripes)
+        finally:
+            for stripe in reversed(acquired):
+                self._locks[stripe].release()
+
+    @contextmanager
+    def hold_all(self) -> Iterator[None]:
+        """Hold every stripe (for whole-collection operations)."""
+        for lock in self._locks:
+            lock.acquire()
+        try:
+            yield
+        finally:
+            for lock in reversed(self._locks):
+                lock.release()
+
+
+class ThreadSafeEvent(asyncio.Event):
+    """asyncio.Event whose set() may be called from any thread.
+
+    Calls made off the loop that waiters are parked on are handed to that
+    loop with call_soon_threadsafe.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._waiter_loop: asyncio.AbstractEventLoop | None = None
+
+    async def wait(self) -> bool:
+        self._waiter_loop = asyncio.get_running_loop()
+        return await super().wait()
+
+    def set(self) -> None:
+        loop: asyncio.AbstractEventLoop | None = self._waiter_loop
+        if loop is None or not loop.is_running() or _running_loop() is loop:
+            super().set()
+        else:
+            loop.call_soon_threadsafe(super().set)
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
@@ -0,0 +1,238 @@
+"""A board held entirely as big-int bitmasks, for any Rules.
+
+Each ship is a mask of the cells it covers, and the hits on it are a second
+mask. Shots received, the occupied cells and the no-go zone around ships are
+masks too. So placement checks, shot resolution and sunk detection are a
+handful of integer operations, however large the board. GameBoard is the
+Coord-based model behind the web UI, checked against the same masks; MaskBoard
+is what engine code (simulation, strategy search, random placement) runs on,
+and `from_game_board` converts one.
+"""
+
+import random
+from collections.abc import Iterable
+from typing import NamedTuple
+
+from game.exceptions import (
+    ShipAlreadyPlacedError,
+    ShipPlacementOutOfBoundsError,
+    ShipPlacementTooCloseError,
+)
+from game.model import ORIENTATION_STEPS, GameBoard, Orientation
+from game.rules import STANDARD_RULES, Rules
+
+# Random placement tries this many random spots for a ship before listing
+# every legal one
+RANDOM_PLACEMENT_TRIES: int = 20
+_MAX_FLEET_ATTEMPTS: int = 100
+
+
+class SalvoResult(NamedTuple):
+    """What one salvo did to a board."""
+
+    hits: tuple[int, ...]  # Hits on each ship (by fleet index) in this salvo
+    sunk: tuple[int, ...]  # Fleet indexes of the ships this salvo sank
+
+
+class MaskBoard:
+    """One player's ships and the shots they have received, as bitmasks.
+
+    Args:
+        rules: Board size and fleet (ships are referred to by fleet index)
+    """
+
+    __slots__ = (
+        "forbidden",
+        "hit_masks",
+        "occupied",
+        "rules",
+        "ship_masks",
+        "shots_received",
+    )
+
+    def __init__(self, rules: Rules = STANDARD_RULES) -> None:
+        self.rules: Rules = rules
+        self.clear()
+
+    def clear(self) -> None:
+        """Remove every ship and shot."""
+        self.ship_masks: list[int] = [0] * len(self.rules.fleet)  # 0 = not placed
+        self.hit_masks: list[int] = [0] * len(self.rules.fleet)
+        self.occupied: int = 0
+        self.forbidden: int = 0  # Ships and their halos
+        self.shots_received: int = 0
+
+    @classmethod
+    def from_game_board(cls, board: GameBoard) -> "MaskBoard":
+        """Convert a GameBoard (ships and shots received), keeping its rules."""
+        mask_board = cls(board.rules)
+        fleet_index: dict[str, int] = {
+            ship.name: index for index, ship in enumerate(board.rules.fleet)
+        }
+        for placed in board.snapshot().ships:
+            mask: int = 0
+            for coord in placed.positions:
+                mask |= 1 << board.cell_of(coord)
+            mask_board._add_ship(fleet_index[placed.ship_type.ship_name], mask)
+        mask_board.receive_salvo(
+            [board.cell_of(coord) for coord in board.shots_received]
+        )
+        return mask_board
+
+    def _add_ship(self, index: int, mask: int) -> None:
+        halo_masks = self.rules.grid.halo_masks
+        self.ship_masks[index] = mask
+        self.occupied |= mask
+        while mask:
+            low_bit: int = mask & -mask
+            self.forbidden |= halo_masks[low_bit.bit_length() - 1]
+            mask ^= low_bit
+
+    def place(self, index: int, start: int, orientation: Orientation) -> None:
+        """Place fleet ship `index` with the same rules as GameBoard.place_ship.
+
+        Raises:
+            ShipAlreadyPlacedError: If the ship is already on the board
+            ShipPlacementOutOfBoundsError: If the ship would leave the board
+            ShipPlacementTooCloseError: If it would overlap or touch a ship
+        """
+        ship = self.rules.fleet[index]
+        if self.ship_masks[index]:
+            raise ShipAlreadyPlacedError(f"{ship.name} already placed on board")
+        row_step, col_step = ORIENTATION_STEPS[orientation]
+        cells = self.rules.grid.footprint(start, ship.length, row_step, col_step)
+        if cells is None:
+            raise ShipPlacementOutOfBoundsError(
+                f"Ship placement out of bounds: {ship.name} {orientation.name}"
+                f" at {self.rules.grid.cell_name[start]}"
+            )
+        mask: int = self.rules.grid.cells_to_mask(cells)
+        if mask & self.forbidden:
+            raise ShipPlacementTooCloseError(
+                f"Ship placement is too close to another ship: {ship.name}"
+                f" {orientation.name} at {self.rules.grid.cell_name[start]}",
+                is_overlap=bool(mask & self.occupied),
+            )
+        self._add_ship(index, mask)
+
+    def placement_of(self, index: int) -> tuple[int, Orientation]:
+        """Return the start cell and orientation of placed fleet ship `index`.
+
+        These are the arguments `place` (or GameBoard.place_ship) takes to put
+        the ship where it is now.
+
+        Raises:
+            ValueError: If the ship has not been placed
+        """
+        mask: int = self.ship_masks[index]
+        if not mask:
+            raise ValueError(f"{self.rules.fleet[index].name} has not been placed")
+        grid = self.rules.grid
+        cells: list[int] = grid.mask_to_cells(mask)
+        for orientation, (row_step, col_step) in ORIENTATION_STEPS.items():
+            # Diagonal up ships start at their lowest row, the highest cell
+            for start in (cells[0], cells[-1]):
+                footprint = grid.footprint(start, len(cells), row_step, col_step)
+                if footprint is not None and grid.cells_to_mask(footprint) == mask:
+                    return start, orientation
+        raise AssertionError(f"Ship mask {mask:#x} is not a straight line")
+
+    def legal_placements(self, index: int) -> list[int]:
+        """Return the footprint masks where fleet ship `index` could go now."""
+        length: int = self.rules.fleet[index].length
+        return [
+            mask
+            for row_step, col_step in ORIENTATION_STEPS.values()
+            for _, mask in self.rules.grid.placements(length, row_step, col_step)
+            if not mask & self.forbidden
+        ]
+
+    def place_fleet_randomly(self, rng: random.Random | None = None) -> None:
+        """Clear the board and place the whole fleet at random legal spots.
+
+        Raises:
+            RuntimeError: If no layout was found (the fleet is too big for the
+                board)
+        """
+        rng = rng or random.Random()
+        order: list[int] = sorted(
+            range(len(self.rules.fleet)), key=lambda i: -self.rules.fleet[i].length
+        )
+        for _ in range(_MAX_FLEET_ATTEMPTS):
+            self.clear()
+            if all(self._place_randomly(index, rng) for index in order):
+                return
+        raise RuntimeError(
+            f"Could not fit the fleet on a {self.rules.rows}x{self.rules.cols} board"
+        )
+
+    def _place_randomly(self, index: int, rng: random.Random) -> bool:
+        length: int = self.rules.fleet[index].length
+        steps: list[tuple[int, int]] = list(ORIENTATION_STEPS.values())
+        for _ in range(RANDOM_PLACEMENT_TRIES):
+            placements = self.rules.grid.placements(length, *rng.choice(steps))
+            _, mask = rng.choice(placements) if placements else (0, 0)
+            if mask and not mask & self.forbidden:
+                self._add_ship(index, mask)
+                return True
+        legal: list[int] = self.legal_placements(index)
+        if not legal:
+            return False
+        self._add_ship(index, rng.choice(legal))
+        return True
+
+    def receive_salvo(self, cells: Iterable[int]) -> SalvoResult:
+        """Resolve a salvo of shots at this board.
+
+        Args:
+            cells: The cells fired at (each may only be fired at once per game)
+
+        Returns:
+            The hits on each ship and the ships sunk by this salvo
+
+        Raises:
+            ValueError: If a cell is off the board or was already shot at
+        """
+        salvo: int = 0
+        for cell in cells:
+            if not 0 <= cell < self.rules.grid.cell_count:
+                raise ValueError(f"Cell {cell} is off the board")
+            bit: int = 1 << cell
+            if (self.shots_received | salvo) & bit:
+                raise ValueError(
+                    f"{self.rules.grid.cell_name[cell]} has already been shot at"
+                )
+            salvo |= bit
+        self.shots_received |= salvo
+
+        hits: list[int] = [0] * len(self.ship_masks)
+        sunk: list[int] = []
+        if salvo & self.occupied:
+            for index, ship_mask in enumerate(self.ship_masks):
+                hit: int = salvo & ship_mask
+                if hit:
+                    hits[index] = hit.bit_count()
+                    self.hit_masks[index] |= hit
+                    if self.hit_masks[index] == ship_mask:
+                        sunk.append(index)
+        return SalvoResult(tuple(hits), tuple(sunk))
+
+    def is_sunk(self, index: int) -> bool:
+        ship_mask: int = self.ship_masks[index]
+        return bool(ship_mask) and self.hit_masks[index] == ship_mask
+
+    @property
+    def shots_available(self) -> int:
+        """Shots this board's owner may fire: the shots of each unsunk ship."""
+        return sum(
+            ship.shots_available
+            for index, ship in enumerate(self.rules.fleet)
+            if self.ship_masks[index] and not self.is_sunk(index)
+        )
+
+    @property
+    def is_defeated(self) -> bool:
+        """True once every placed ship has been sunk."""
+        return bool(self.occupied) and self.shots_received & self.occupied == (
+            self.occupied
+        )
@@ -1,13 +1,27 @@
+import itertools
+import os
 import secrets
+import threading
+from collections import deque
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
 from enum import Enum, StrEnum
-from typing import TYPE_CHECKING, Any, NamedTuple
-
+from functools import cache
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, NamedTuple
+
+from game.cells import (
+    CELL_NAME,
+    NEIGHBOURS,
+    STANDARD_GRID,
+    CellGrid,
+    footprint,
+)
 from game.exceptions import (
     ShipAlreadyPlacedError,
     ShipPlacementOutOfBoundsError,
     ShipPlacementTooCloseError,
 )
+from game.rules import STANDARD_FLEET, STANDARD_RULES, Rules, ShipSpec
 
 if TYPE_CHECKING:
     from game.player import Player
@@ -22,7 +36,11 @@ __all__ = [
     "CoordDetails",
     "Coord",
     "CoordHelper",
+    "coord_to_cell",
+    "cell_to_coord",
     "Ship",
+    "GridCell",
+    "GridRow",
     "GameBoard",
     "GameBoardHelper",
     "GameMode",
@@ -39,11 +57,13 @@ class Orientation(StrEnum):
 
 
 class ShipType(Enum):
-    CARRIER = ("Carrier", 5, 2, "A")
-    BATTLESHIP = ("Battleship", 4, 1, "B")
-    CRUISER = ("Cruiser", 3, 1, "C")
-    SUBMARINE = ("Submarine", 3, 1, "S")
-    DESTROYER = ("Destroyer", 2, 1, "D")
+    """The ships of the standard fleet (each value is its ShipSpec)."""
+
+    CARRIER = STANDARD_FLEET[0]
+    BATTLESHIP = STANDARD_FLEET[1]
+    CRUISER = STANDARD_FLEET[2]
+    SUBMARINE = STANDARD_FLEET[3]
+    DESTROYER = STANDARD_FLEET[4]
 
     def __init__(self, ship_name: str, length: int, shots_available: int, code: str):
         self.ship_name = ship_name
@@ -73,6 +93,72 @@ _coords: dict[str, CoordDetails] = {
 Coord = Enum("Coord", _coords)
 
 
+# Flyweight cell index <-> Coord, for converting at the engine's boundaries
+_COORD_BY_CELL: tuple[Coord, ...] = tuple(Coord[name] for name in CELL_NAME)
+_CELL_BY_COORD: dict[Coord, int] = {
+    coord: cell for cell, coord in enumerate(_COORD_BY_CELL)
+}
+
+# Row and column change per cell along a ship in each orientation
+ORIENTATION_STEPS: dict[Orientation, tuple[int, int]] = {
+    Orientation.HORIZONTAL: (0, 1),
+    Orientation.VERTICAL: (1, 0),
+    Orientation.DIAGONAL_DOWN: (1, 1),
+    Orientation.DIAGONAL_UP: (-1, 1),
+}
+
+
+class BoardCells(NamedTuple):
+    """The coordinates of one board size and their cell index tables.
+
+    The standard board's coordinates are the Coord enum. Other sizes get an
+    enum of their own with the same shape: members named "A1", "B7"... whose
+    values are CoordDetails, so code that reads `coord.name` or
+    `coord.value` works on any board.
+    """
+
+    grid: CellGrid
+    coords: type[Enum]
+    coord_by_cell: tuple[Any, ...]
+    cell_by_coord: dict[Any, int]
+
+
+@cache
+def board_cells(grid: CellGrid) -> BoardCells:
+    """Return the shared coordinate tables for a board size."""
+    if grid is STANDARD_GRID:
+        return BoardCells(grid, Coord, _COORD_BY_CELL, _CELL_BY_COORD)
+    coords: type[Enum] = Enum(
+        f"Coord{grid.rows}x{grid.cols}",
+        {
+            name: CoordDetails(row, col)
+            for name, row, col in zip(grid.cell_name, grid.cell_row, grid.cell_col)
+        },
+        module=__name__,
+    )
+    coord_by_cell: tuple[Any, ...] = tuple(coords[name] for name in grid.cell_name)
+    cell_by_coord: dict[Any, int] = {
+        coord: cell for cell, coord in enumerate(coord_by_cell)
+    }
+    # Standard Coords name the same cells where the board has them
+    cell_by_coord.update(
+        (coord, grid.cell_by_name[coord.name])
+        for coord in _COORD_BY_CELL
+        if coord.name in grid.cell_by_name
+    )
+    return BoardCells(grid, coords, coord_by_cell, cell_by_coord)
+
+
+def coord_to_cell(coord: Coord) -> int:
+    """Return the flyweight cell index (0-99) of a Coord."""
+    return _CELL_BY_COORD[coord]
+
+
+def cell_to_coord(cell: int) -> Coord:
+    """Return the Coord for a flyweight cell index (0-99)."""
+    return _COORD_BY_CELL[cell]
+
+
 class CoordHelper:
     _coords_by_value: dict[CoordDetails, Coord] = {
         coord.value: coord for coord in Coord
@@ -86,64 +172,22 @@ class CoordHelper:
     def coords_for_length_and_orientation(
         cls, start: Coord, length: int, orientation: Orientation
     ) -> list[Coord]:
-        coords: list[Coord] = [start]
-
-        if orientation == Orientation.HORIZONTAL:
-            for i in range(1, length):
-                coords.append(
-                    cls.lookup(
-                        CoordDetails(start.value.row_index, start.value.col_index + i)
-                    )
-                )
-        elif orientation == Orientation.VERTICAL:
-            for i in range(1, length):
-                coords.append(
-                    cls.lookup(
-                        CoordDetails(start.value.row_index + i, start.value.col_index)
-                    )
-                )
-        elif orientation == Orientation.DIAGONAL_DOWN:
-            for i in range(1, length):
-                coords.append(
-                    cls.lookup(
-                        CoordDetails(
-                            start.value.row_index + i, start.value.col_index + i
-                        )
-                    )
-                )
-
-        elif orientation == Orientation.DIAGONAL_UP:
-            for i in range(1, length):
-                coords.append(
-                    cls.lookup(
-                        CoordDetails(
-                            start.value.row_index - i, start.value.col_index + i
-                        )
-                    )
-                )
-        else:
+        """Return the cells a ship covers, raising KeyError if it leaves the board."""
+        try:
+            row_step, col_step = ORIENTATION_STEPS[orientation]
+        except KeyError:
             raise ValueError(f"Invalid orientation: {orientation}")
 
-        return coords
+        cells: tuple[int, ...] | None = footprint(
+            _CELL_BY_COORD[start], length, row_step, col_step
+        )
+        if cells is None:
+            raise KeyError(f"{length} cells {orientation} from {start.name}")
+        return [_COORD_BY_CELL[cell] for cell in cells]
 
     @classmethod
     def coords_adjacent_to_a_coord(cls, centre: Coord) -> set[Coord]:
-        adjacent_coords: set[Coord] = set()
-        for row_delta in [-1, 0, 1]:
-            for col_delta in [-1, 0, 1]:
-                if row_delta == 0 and col_delta == 0:
-                    continue
-                try:
-                    adjacent_coord: Coord = cls.lookup(
-                        CoordDetails(
-                            centre.value.row_index + row_delta,
-                            centre.value.col_index + col_delta,
-                        )
-                    )
-                    adjacent_coords.add(adjacent_coord)
-                except KeyError:
-                    pass  # skip any coords that are out of bounds
-        return adjacent_coords
+        return {_COORD_BY_CELL[cell] for cell in NEIGHBOURS[_CELL_BY_COORD[centre]]}
 
     @classmethod
     def coords_adjacent_to_a_coords_list(cls, coords: list[Coord]) -> set[Coord]:
@@ -154,7 +198,7 @@ class CoordHelper:
         return adjacent_coords
 
 
-@dataclass
+@dataclass(slots=True)
 class Ship:
     ship_type: ShipType
     positions: list[Coord] = field(default_factory=list)
@@ -168,6 +212,85 @@ class Ship:
         return self.ship_type.shots_available
 
 
+class GridCell(NamedTuple):
+    """One cell of a board's display grid, ready for a template."""
+
+    coord: str
+    ship_code: str | None = None
+    ship_name: str | None = None
+    shot_round: int | None = None  # Round the cell was shot in, if it was
+    # False in the opponent's view, where whether a shot hit is not known
+    ships_shown: bool = True
+
+    @property
+    def is_hit(self) -> bool:
+        return (
+            self.ships_shown
+            and self.shot_round is not None
+            and self.ship_code is not None
+        )
+
+    @property
+    def is_miss(self) -> bool:
+        return (
+            self.ships_shown and self.shot_round is not None and self.ship_code is None
+        )
+
+
+class GridRow(NamedTuple):
+    label: str
+    cells: tuple[GridCell, ...]
+
+
+class PlacedShip(NamedTuple):
+    ship_type: ShipType
+    positions: tuple[Coord, ...]
+
+
+# Interned PlacedShips: there are only a few hundred legal placements per ship
+# type, so every board's snapshots share the same entries
+_placed_ships: dict[tuple[ShipType, tuple[Coord, ...]], PlacedShip] = {}
+
+
+def placed_ship(ship_type: ShipType, positions: list[Coord]) -> PlacedShip:
+    """Return the shared PlacedShip for a ship type at these positions."""
+    placed = PlacedShip(ship_type, tuple(positions))
+    return _placed_ships.setdefault(placed, placed)
+
+
+class BoardSnapshot(NamedTuple):
+    """Immutable view of a board's ships at one version.
+
+    Snapshots share their PlacedShip entries with the snapshots before them,
+    and nothing in them can change, so they can be read from any thread
+    without locking.
+    """
+
+    version: int
+    ships: tuple[PlacedShip, ...] = ()
+
+
+# Board IDs, used to key caches of rendered boards. Prefixed with the process
+# ID so boards made in a worker never share an ID with the state owner's.
+_board_uids: Iterator[int] = itertools.count((os.getpid() << 32) + 1)
+
+
+# ShipType for each spec of the standard fleet, so boards with any fleet that
+# includes standard ships hold those as ShipType
+_SHIP_TYPE_BY_SPEC: dict[ShipSpec, ShipType] = {
+    ship_type.value: ship_type for ship_type in ShipType
+}
+
+
+class _ShipMasks(NamedTuple):
+    """Bitmasks of a board's ships, kept until its ships change."""
+
+    ship_count: int
+    ships: tuple[tuple[ShipType, int], ...]  # Each ship type and its cells
+    occupied: int  # Cells covered by any ship
+    forbidden: int  # Occupied cells and their neighbours
+
+
 class GameBoard:
     """
     Model class representing a players game board. The game board records:
@@ -178,21 +301,128 @@ class GameBoard:
     Main functionality of the game board includes:
     - placing ships
     - locating ships by coords
+
+    The board's size and fleet come from its Rules. Placement checks and shot
+    resolution work on bitmasks over `rules.grid`, so they cost the same
+    handful of integer operations on any board size.
+
+    Args:
+        rules: Board size and fleet (the standard 10x10 rules by default)
     """
 
-    def __init__(self) -> None:
+    __slots__ = (
+        "rules",
+        "ships",
+        "shots_received",
+        "shots_fired",
+        "uid",
+        "version",
+        "_cells",
+        "_masks",
+        "_placed_ships_cache",
+        "_grid_cache",
+        "_shots_grid_cache",
+        "_snapshot",
+    )
+
+    def __init__(self, rules: Rules = STANDARD_RULES) -> None:
+        self.rules: Rules = rules
+        self._cells: BoardCells = board_cells(rules.grid)
+        self._masks: _ShipMasks | None = None
         self.ships: list[Ship] = []
-        self.shots_received: dict = {}
-        self.shots_fired: dict = {}
+        self.shots_received: dict[Coord, int] = {}  # Coord->round number
+        self.shots_fired: dict[Coord, int] = {}  # Coord->round number
+        self.uid: int = next(_board_uids)
+        # Bumped on every change so views of the board can be cached
+        self.version: int = 0
+        # Display projections memoised against the version they were built at
+        self._placed_ships_cache: tuple[int, dict[str, dict[str, Any]]] | None = None
+        self._grid_cache: tuple[int, tuple[GridRow, ...]] | None = None
+        self._shots_grid_cache: tuple[int, tuple[GridRow, ...]] | None = None
+        self._snapshot: BoardSnapshot = BoardSnapshot(-1)  # Built on first use
 
-    def _invalid_coords(self) -> set[Coord]:
-        invalid_coords: set[Coord] = set()
+    @property
+    def fleet(self) -> tuple[ShipType | ShipSpec, ...]:
+        """The ships to place on this board (ShipType for standard ships)."""
+        return tuple(_SHIP_TYPE_BY_SPEC.get(spec, spec) for spec in self.rules.fleet)
+
+    def coord(self, name: str) -> Coord:
+        """Return this board's coordinate for a cell name such as "E5".
+
+        Raises:
+            KeyError: If the name is not a cell on this board
+        """
+        return self._cells.coord_by_cell[self.rules.grid.parse(name)]
+
+    def coord_at(self, cell: int) -> Coord:
+        """Return this board's coordinate for a cell index of `rules.grid`."""
+        return self._cells.coord_by_cell[cell]
+
+    def cell_of(self, coord: Coord) -> int:
+        """Return the `rules.grid` cell index of a coordinate.
+
+        Raises:
+            KeyError: If the coordinate is not on this board
+        """
+        return self._cells.cell_by_coord[coord]
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle by cell index, so a board can be sent to another process.
+
+        The Coord enums of non-standard boards are built at run time and
+        cannot be pickled by name. The uid and version are kept, so a copy
+        shares the original's rendered fragments and ETags.
+        """
+        cell_by_coord: dict[Any, int] = self._cells.cell_by_coord
+        return (
+            _unpickle_board,
+            (
+                self.rules,
+                [
+                    (ship.ship_type, [cell_by_coord[coord] for coord in ship.positions])
+                    for ship in self.ships
+                ],
+                {cell_by_coord[c]: n for c, n in self.shots_received.items()},
+                {cell_by_coord[c]: n for c, n in self.shots_fired.items()},
+                self.uid,
+                self.version,
+            ),
+        )
+
+    def _own_coord(self, coord: Coord) -> Coord:
+        # This board's member for a coordinate (a standard Coord names the
+        # same cell on larger boards)
+        return self._cells.coord_by_cell[self._cells.cell_by_coord[coord]]
+
+    def _ship_masks(self) -> _ShipMasks:
+        masks: _ShipMasks | None = self._masks
+        # Ship changes reset the masks; the count also catches ships appended
+        # directly (as board_from_dict does)
+        if masks is not None and masks.ship_count == len(self.ships):
+            return masks
+        halo_masks: tuple[int, ...] = self.rules.grid.halo_masks
+        cell_by_coord: dict[Any, int] = self._cells.cell_by_coord
+        ships: list[tuple[ShipType, int]] = []
+        occupied: int = 0
+        forbidden: int = 0
         for ship in self.ships:
-            invalid_coords.update(
-                CoordHelper.coords_adjacent_to_a_coords_list(ship.positions)
-            )
-            invalid_coords.update(ship.positions)
-        return invalid_coords
+            mask: int = 0
+            for coord in ship.positions:
+                cell: int = cell_by_coord[coord]
+                mask |= 1 << cell
+                forbidden |= halo_masks[cell]
+            ships.append((ship.ship_type, mask))
+            occupied |= mask
+        masks = self._masks = _ShipMasks(
+            len(self.ships), tuple(ships), occupied, forbidden
+        )
+        return masks
+
+    def _invalid_coords(self) -> set[Coord]:
+        return {
+            self._cells.coord_by_cell[cell]
+            for cell in self.rules.grid.mask_to_cells(self._ship_masks().forbidden)
+        }
 
     def place_ship(self, ship: Ship, start: Coord, orientation: Orientation) -> bool:
         """Place a ship on the board with spacing validation.
@@ -207,40 +437,49 @@ class GameBoard:
         }
 
         if ship.ship_type not in ship_types_already_on_board:
-            # get all invalid positions
-            all_invalid_coords: set[Coord] = self._invalid_coords()
-
-            # get planned ship positions
             try:
-                positions: list[Coord] = CoordHelper.coords_for_length_and_orientation(
-                    start, ship.length, orientation
-                )
-
+                row_step, col_step = ORIENTATION_STEPS[orientation]
             except KeyError:
+                raise ValueError(f"Invalid orientation: {orientation}")
+            grid: CellGrid = self.rules.grid
+            cell: int | None = self._cells.cell_by_coord.get(start)
+            cells: tuple[int, ...] | None = (
+                None
+                if cell is None
+                else grid.footprint(cell, ship.length, row_step, col_step)
+            )
+            if cells is None:
                 raise ShipPlacementOutOfBoundsError(
                     f"Ship placement out of bounds: {ship.ship_type.name} {orientation.name} at {start.name}"
                 )
 
-            # check ship positions don't include an invalid position
-            invalid_ship_positions: set[Coord] = set(positions).intersection(
-                all_invalid_coords
-            )
-            if len(invalid_ship_positions) > 0:
-                # Check if this is actual overlap or just touching
-                existing_positions: set[Coord] = set()
-                for existing_ship in self.ships:
-                    existing_positions.update(existing_ship.positions)
-
-                is_overlap: bool = bool(existing_positions.intersection(positions))
-
+            mask: int = grid.cells_to_mask(cells)
+            masks: _ShipMasks = self._ship_masks()
+            if mask & masks.forbidden:
                 raise ShipPlacementTooCloseError(
                     f"Ship placement is too close to another ship: {ship.ship_type.name} {orientation.name} at {start.name}",
-                    is_overlap=is_overlap,
+                    is_overlap=bool(mask & masks.occupied),
                 )
 
+            positions: list[Coord] = [self._cells.coord_by_cell[c] for c in cells]
+            previous: BoardSnapshot = self.snapshot()
             self.ships.append(ship)
+            halo: int = 0
+            for c in cells:
+                halo |= grid.halo_masks[c]
+            self._masks = _ShipMasks(
+                len(self.ships),
+                (*masks.ships, (ship.ship_type, mask)),
+                masks.occupied | mask,
+                masks.forbidden | halo,
+            )
             # add positions to ship
             ship.positions = positions
+            self.version += 1
+            self._snapshot = BoardSnapshot(
+                self.version,
+                (*previous.ships, placed_ship(ship.ship_type, positions)),
+            )
 
         else:
             raise ShipAlreadyPlacedError(
@@ -260,19 +499,148 @@ class GameBoard:
         """
         for i, ship in enumerate(self.ships):
             if ship.ship_type == ship_type:
+                previous: BoardSnapshot = self.snapshot()
                 self.ships.pop(i)
+                self._masks = None
+                self.version += 1
+                self._snapshot = BoardSnapshot(
+                    self.version,
+                    tuple(
+                        placed
+                        for placed in previous.ships
+                        if placed.ship_type != ship_type
+                    ),
+                )
                 return True
         return False
 
     def clear_all_ships(self) -> None:
         """Remove all ships from the board."""
-        self.ships.clear()
+        if self.ships:
+            self.ships.clear()
+            self._masks = None
+            self.version += 1
+            self._snapshot = BoardSnapshot(self.version)
 
-    def ship_type_at(self, coord: Coord) -> ShipType | None:
-        # TODO: Reimplement this using a cached map of Coords to Ship.code
+    def snapshot(self) -> BoardSnapshot:
+        """Return an immutable snapshot of the ships at the current version.
+
+        Placing or removing a ship derives the next snapshot from the last one,
+        so taking a snapshot after each change costs O(1).
+        """
+        if self._snapshot.version != self.version:
+            self._snapshot = BoardSnapshot(
+                self.version,
+                tuple(
+                    placed_ship(ship.ship_type, ship.positions) for ship in self.ships
+                ),
+            )
+        return self._snapshot
+
+    def restore(self, snapshot: BoardSnapshot) -> None:
+        """Put the ships back as they were in `snapshot`, without re-validating.
+
+        The board's version still moves forward, so caches keyed on it stay
+        correct.
+        """
+        self.ships = [
+            Ship(placed.ship_type, list(placed.positions)) for placed in snapshot.ships
+        ]
+        self._masks = None
+        self.version += 1
+        self._snapshot = BoardSnapshot(self.version, snapshot.ships)
+
+    def receive_shot(self, coord: Coord, round_number: int) -> None:
+        """Record a shot fired at this board by the opponent."""
+        self.shots_received[self._own_coord(coord)] = round_number
+        self.version += 1
+
+    def record_shot_fired(self, coord: Coord, round_number: int) -> None:
+        """Record a shot this board's owner fired at the opponent."""
+        self.shots_fired[self._own_coord(coord)] = round_number
+        self.version += 1
+
+    def check_salvo(self, coords: Iterable[Coord]) -> None:
+        """Check a salvo could be fired at this board, without recording it.
+
+        Raises:
+            ValueError: If a cell is off the board or was already shot at
+        """
+        self._salvo_mask(list(coords))
+
+    def _salvo_mask(self, salvo: list[Coord]) -> int:
+        cell_by_coord: dict[Any, int] = self._cells.cell_by_coord
+        salvo_mask: int = 0
+        for coord in salvo:
+            cell: int | None = cell_by_coord.get(coord)
+            if cell is None:
+                raise ValueError(f"Shot is off the board: {coord.name}")
+            salvo_mask |= 1 << cell
+        if salvo_mask.bit_count() != len(salvo) or any(
+            self._own_coord(coord) in self.shots_received for coord in salvo
+        ):
+            raise ValueError(f"Salvo repeats a shot: {[coord.name for coord in salvo]}")
+        return salvo_mask
+
+    def receive_salvo(
+        self, coords: Iterable[Coord], round_number: int
+    ) -> dict[ShipType, int]:
+        """Record a round's shots fired at this board and report the hits.
+
+        Args:
+            coords: The cells fired at this round
+            round_number: The round the shots were fired in
+
+        Returns:
+            The number of hits on each ship type that was hit
+
+        Raises:
+            ValueError: If a cell is off the board or was already shot at
+                (nothing is recorded)
+        """
+        salvo: list[Coord] = list(coords)
+        salvo_mask: int = self._salvo_mask(salvo)
+        for coord in salvo:
+            self.shots_received[self._own_coord(coord)] = round_number
+        hits: dict[ShipType, int] = {}
+        for ship_type, ship_mask in self._ship_masks().ships:
+            hit_count: int = (ship_mask & salvo_mask).bit_count()
+            if hit_count:
+                hits[ship_type] = hit_count
+        self.version += 1
+        return hits
+
+    def is_sunk(self, ship_type: ShipType) -> bool:
+        """Return True if the ship is on the board and every cell has been hit."""
         for ship in self.ships:
-            if coord in ship.positions:
-                return ship.ship_type
+            if ship.ship_type == ship_type:
+                return all(coord in self.shots_received for coord in ship.positions)
+        return False
+
+    @property
+    def shots_available(self) -> int:
+        """Shots this board's owner may fire: the shots of each unsunk ship."""
+        return sum(
+            ship.shots_available
+            for ship in self.ships
+            if not self.is_sunk(ship.ship_type)
+        )
+
+    @property
+    def all_ships_sunk(self) -> bool:
+        """True once ships have been placed and every one has been sunk."""
+        return bool(self.ships) and all(
+            self.is_sunk(ship.ship_type) for ship in self.ships
+        )
+
+    def ship_type_at(self, coord: Coord) -> ShipType | None:
+        cell: int | None = self._cells.cell_by_coord.get(coord)
+        if cell is None:
+            return None
+        bit: int = 1 << cell
+        for ship_type, ship_mask in self._ship_masks().ships:
+            if ship_mask & bit:
+                return ship_type
         return None
 
     def get_placed_ships_for_display(self) -> dict[str, dict[str, Any]]:
@@ -285,7 +653,12 @@ class GameBoard:
                 "Battleship": {"cells": ["B1", "B2", ...], "code": "B"},
                 ...
             }
+
+            The result is cached until the board changes, so it must not be
+            modified by the caller.
         """
+        if self._placed_ships_cache and self._placed_ships_cache[0] == self.version:
+            return self._placed_ships_cache[1]
         placed_ships: dict[str, dict[str, Any]] = {}
         for ship in self.ships:
             cells: list[str] = [coord.name for coord in ship.positions]
@@ -293,8 +666,85 @@ class GameBoard:
                 "cells": cells,
                 "code": ship.ship_type.code,
             }
+        self._placed_ships_cache = (self.version, placed_ships)
         return placed_ships
 
+    def display_grid(self, show_ships: bool = True) -> tuple[GridRow, ...]:
+        """Get the grid of ships and shots received, row by row
+
+        Built once per board version and view, so repeated renders of an
+        unchanged board reuse the same grid.
+
+        Args:
+            show_ships: False for the opponent's view, whose cells carry only
+                the round each shot was fired in: where ships are, and so
+                which shots hit, is never revealed (Game_Rules.md)
+
+        Returns:
+            A GridRow per board row (A-J on the standard board), each holding
+            a GridCell per column
+        """
+        cached = self._grid_cache if show_ships else self._shots_grid_cache
+        if cached and cached[0] == self.version:
+            return cached[1]
+        grid: CellGrid = self.rules.grid
+        cell_by_coord: dict[Any, int] = self._cells.cell_by_coord
+        ship_at: list[ShipType | None] = [None] * grid.cell_count
+        if show_ships:
+            for ship in self.ships:
+                for coord in ship.positions:
+                    ship_at[cell_by_coord[coord]] = ship.ship_type
+        shot_at: list[int | None] = [None] * grid.cell_count
+        for coord, round_number in self.shots_received.items():
+            shot_at[cell_by_coord[coord]] = round_number
+        cells: list[GridCell] = []
+        for cell in range(grid.cell_count):
+            ship_type: ShipType | None = ship_at[cell]
+            cells.append(
+                GridCell(
+                    coord=grid.cell_name[cell],
+                    ship_code=ship_type.code if ship_type else None,
+                    ship_name=ship_type.ship_name if ship_type else None,
+                    shot_round=shot_at[cell],
+                    ships_shown=show_ships,
+                )
+            )
+        rows: tuple[GridRow, ...] = tuple(
+            GridRow(letter, tuple(cells[row * grid.cols : (row + 1) * grid.cols]))
+            for row, letter in enumerate(grid.row_letters)
+        )
+        if show_ships:
+            self._grid_cache = (self.version, rows)
+        else:
+            self._shots_grid_cache = (self.version, rows)
+        return rows
+
+
+def _unpickle_board(
+    rules: Rules,
+    ships: list[tuple["ShipType | ShipSpec", list[int]]],
+    shots_received: dict[int, int],
+    shots_fired: dict[int, int],
+    uid: int,
+    version: int,
+) -> GameBoard:
+    """Rebuild a board from the state saved by GameBoard.__reduce__."""
+    board = GameBoard(rules)
+    board.ships.extend(
+        Ship(kind, [board.coord_at(cell) for cell in cells]) for kind, cells in ships
+    )
+    board.shots_received.update(
+        (board.coord_at(cell), round_number)
+        for cell, round_number in shots_received.items()
+    )
+    board.shots_fired.update(
+        (board.coord_at(cell), round_number)
+        for cell, round_number in shots_fired.items()
+    )
+    board.uid = uid
+    board.version = version
+    return board
+
 
 class GameBoardHelper:
     @classmethod
@@ -309,13 +759,14 @@ class GameBoardHelper:
         }
         invalid_coords: set[Coord] = board._invalid_coords() if show_invalid else set()
 
+        grid: CellGrid = board.rules.grid
         output: list[str] = []
-        output.append("  1 2 3 4 5 6 7 8 9 10")
-        output.append("-|--------------------")
-        for row_index, row_letter in enumerate("ABCDEFGHIJ", start=1):
+        output.append("  " + " ".join(str(col) for col in range(1, grid.cols + 1)))
+        output.append("-|" + "--" * grid.cols)
+        for row, row_letter in enumerate(grid.row_letters):
             row_output: str = f"{row_letter}|"
-            for col_index in range(1, 11):
-                coord: Coord = CoordHelper.lookup(CoordDetails(row_index, col_index))
+            for cell in range(row * grid.cols, (row + 1) * grid.cols):
+                coord: Coord = board.coord_at(cell)
                 ship_type: ShipType | None = ship_coords.get(coord)
                 if ship_type:
                     row_output += ship_type.code + " "
@@ -345,21 +796,74 @@ class GameStatus(StrEnum):
     ABANDONED = "abandoned"
 
 
+class DeltaKind(StrEnum):
+    """Kinds of change recorded in a game's delta feed."""
+
+    SHOT = "shot"
+    HIT = "hit"
+    SUNK = "sunk"
+    STATUS = "status"
+
+
+class GameDelta(NamedTuple):
+    """One versioned change to a game's state."""
+
+    version: int
+    kind: DeltaKind
+    data: dict[str, Any]
+
+
 class Game:
     """Game state management for tracking game sessions.
 
     Manages the lifecycle of a battleships game, including player assignments,
     game mode, status tracking, and individual player boards.
+
+    Every change is recorded as a GameDelta with a monotonically increasing
+    version. The most recent DELTA_BUFFER_SIZE deltas are kept so reconnecting
+    clients can catch up without a full re-render (see deltas_since).
+
+    Args:
+        player_1: The player who started the game
+        game_mode: Single or two player
+        player_2: The opponent in a two player game
+        rules: Board size and fleet for both boards (standard by default)
     """
 
+    DELTA_BUFFER_SIZE: int = 256
+    # Spilling and reloading are rare, so one lock shared by all games keeps
+    # each Game small. Re-entrant because a loader may spill other games.
+    _BOARD_LOAD_LOCK: ClassVar[threading.RLock] = threading.RLock()
+
+    __slots__ = (
+        "player_1",
+        "game_mode",
+        "player_2",
+        "rules",
+        "_id",
+        "_status",
+        "version",
+        "deltas",
+        "_board",
+        "_board_loader",
+    )
+
     def __init__(
-        self, player_1: "Player", game_mode: GameMode, player_2: "Player | None" = None
+        self,
+        player_1: "Player",
+        game_mode: GameMode,
+        player_2: "Player | None" = None,
+        rules: Rules = STANDARD_RULES,
     ) -> None:
         self.player_1: "Player" = player_1
         self.game_mode: GameMode = game_mode
         self.player_2: "Player | None" = player_2
+        self.rules: Rules = rules
         self._id: str = self._generate_id()
-        self.status: GameStatus = GameStatus.CREATED
+        self._status: GameStatus = GameStatus.CREATED
+        self.version: int = 0
+        # Created on the first delta: an empty bounded deque costs ~760 bytes
+        self.deltas: deque[GameDelta] | tuple[()] = ()
 
         # Validate that two player games have an opponent
         if self.game_mode == GameMode.TWO_PLAYER and not self.player_2:
@@ -370,10 +874,122 @@ class Game:
             raise ValueError("Single player games cannot have two players")
 
         # Create game boards
-        self.board: dict["Player", GameBoard] = {}
-        self.board[self.player_1] = GameBoard()
+        self._board: dict["Player", GameBoard] | None = {}
+        self._board[self.player_1] = GameBoard(rules)
         if self.player_2:
-            self.board[self.player_2] = GameBoard()
+            self._board[self.player_2] = GameBoard(rules)
+        self._board_loader: Callable[["Game"], dict["Player", GameBoard]] | None = None
+
+    def __getstate__(self) -> tuple[None, dict[str, Any]]:
+        """Pickle with the boards loaded, as a spill loader cannot be sent along."""
+        state: dict[str, Any] = {slot: getattr(self, slot) for slot in self.__slots__}
+        state["_board"] = self.board
+        state["_board_loader"] = None
+        return None, state
+
+    @property
+    def status(self) -> GameStatus:
+        return self._status
+
+    @status.setter
+    def status(self, new_status: GameStatus) -> None:
+        if new_status != self._status:
+            self._status = new_status
+            self.record_delta(DeltaKind.STATUS, {"status": new_status.value})
+
+    def record_delta(self, kind: DeltaKind, data: dict[str, Any]) -> GameDelta:
+        """Bump the game version and append a delta to the feed.
+
+        Args:
+            kind: What kind of change this is
+            data: JSON-serialisable details of the change
+
+        Returns:
+            The recorded delta
+        """
+        self.version += 1
+        delta = GameDelta(self.version, kind, data)
+        if not isinstance(self.deltas, deque):
+            self.deltas = deque(maxlen=self.DELTA_BUFFER_SIZE)
+        self.deltas.append(delta)
+        return delta
+
+    def deltas_since(self, version: int) -> list[GameDelta] | None:
+        """Return the deltas a client at `version` has not seen yet.
+
+        Args:
+            version: The last game version the client saw
+
+        Returns:
+            The missing deltas in order (empty if up to date), or None if the
+            client is too far behind (or ahead) and needs a full snapshot
+        """
+        if version == self.version:
+            return []
+        oldest: int = self.deltas[0].version if self.deltas else self.version + 1
+        if version > self.version or version < oldest - 1:
+            return None
+        return [delta for delta in self.deltas if delta.version > version]
+
+    def restore_version(self, status: GameStatus, version: int) -> None:
+        """Adopt a status and version from a persisted or remote copy.
+
+        The delta feed is cleared because it no longer covers the gap, so
+        clients behind `version` will be sent a snapshot.
+        """
+        self._status = status
+        self.version = version
+        self.deltas = ()
+
+    @property
+    def board(self) -> dict["Player", GameBoard]:
+        """Player boards for this game, reloaded on access if they were spilled.
+
+        If the loader fails it is kept, so the next access tries again.
+        """
+        board: dict["Player", GameBoard] | None = self._board
+        if board is not None:
+            return board
+        with self._BOARD_LOAD_LOCK:
+            if self._board is None:
+                if self._board_loader is None:
+                    raise RuntimeError(f"Boards for game {self._id} are not available")
+                self._board = self._board_loader(self)
+                self._board_loader = None
+            return self._board
+
+    @property
+    def round_number(self) -> int:
+        """The round being played: one past the last round any shot was fired in."""
+        return 1 + max(
+            (
+                max(board.shots_received.values(), default=0)
+                for board in self.board.values()
+            ),
+            default=0,
+        )
+
+    @property
+    def is_spilled(self) -> bool:
+        """True if the boards have been released and will be reloaded on access."""
+        return self._board is None
+
+    def spill_boards(
+        self, loader: Callable[["Game"], dict["Player", GameBoard]]
+    ) -> dict["Player", GameBoard]:
+        """Release the boards, leaving a stub that calls `loader` on next access.
+
+        Args:
+            loader: Callable that rebuilds the boards for this game
+
+        Returns:
+            The boards that were released
+        """
+        with self._BOARD_LOAD_LOCK:
+            boards: dict["Player", GameBoard] = self.board
+            self._board = None
+            self._board_loader = loader
+        return boards
 
     @property
     def id(self) -> str:
@@ -0,0 +1,52 @@
+"""Undo/redo history for ship placement.
+
+Each placement action records the board snapshot from before it. Snapshots
+are immutable and share structure, so the history is cheap to keep. Undo and
+redo restore a snapshot directly, without re-validating the placement rules
+that already held when it was taken.
+"""
+
+from collections import deque
+
+from game.model import BoardSnapshot
+
+MAX_HISTORY: int = 50
+
+
+class PlacementHistory:
+    """Bounded undo and redo stacks of board snapshots.
+
+    Args:
+        max_steps: Number of undo steps kept (the oldest are dropped)
+    """
+
+    def __init__(self, max_steps: int = MAX_HISTORY) -> None:
+        self._undo: deque[BoardSnapshot] = deque(maxlen=max_steps)
+        self._redo: list[BoardSnapshot] = []
+
+    @property
+    def can_undo(self) -> bool:
+        return bool(self._undo)
+
+    @property
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    def record(self, before: BoardSnapshot) -> None:
+        """Record the state before a new action (this discards the redo stack)."""
+        self._undo.append(before)
+        self._redo.clear()
+
+    def undo(self, current: BoardSnapshot) -> BoardSnapshot | None:
+        """Step back, returning the snapshot to restore (None if none is left)."""
+        if not self._undo:
+            return None
+        self._redo.append(current)
+        return self._undo.pop()
+
+    def redo(self, current: BoardSnapshot) -> BoardSnapshot | None:
+        """Step forward again, returning the snapshot to restore (None if none)."""
+        if not self._redo:
+            return None
+        self._undo.append(current)
+        return self._redo.pop()
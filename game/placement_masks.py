@@ -0,0 +1,112 @@
+"""Bitmask placement checks for the 10x10 board.
+
+Each cell is one bit of a 100-bit int (bit `(row - 1) * 10 + (col - 1)`, so A1
+is bit 0 and J10 bit 99). For every ship length, orientation and start cell
+the footprint mask is computed once at import, and every cell has a halo mask
+(the cell plus its neighbours). A board's forbidden zone is the OR of the
+halos of its ships' cells, and a start cell is legal exactly when the
+footprint does not intersect it, which is the same rule GameBoard.place_ship
+enforces with ShipPlacementOutOfBoundsError and ShipPlacementTooCloseError.
+"""
+
+from game.model import (
+    Coord,
+    CoordHelper,
+    GameBoard,
+    Orientation,
+    ShipType,
+    coord_to_cell,
+)
+
+
+def cell_bit(coord: Coord) -> int:
+    """Return the bit index of a cell (its flyweight cell index)."""
+    return coord_to_cell(coord)
+
+
+def coords_to_mask(coords: list[Coord]) -> int:
+    """OR together the bits of the given cells."""
+    mask: int = 0
+    for coord in coords:
+        mask |= 1 << cell_bit(coord)
+    return mask
+
+
+def mask_to_coords(mask: int) -> list[Coord]:
+    """Return the cells set in `mask`, in board order (A1, A2, ... J10)."""
+    coords: list[Coord] = []
+    while mask:
+        low_bit: int = mask & -mask
+        coords.append(_COORDS_BY_BIT[low_bit.bit_length() - 1])
+        mask ^= low_bit
+    return coords
+
+
+def _build_footprints() -> dict[tuple[int, Orientation], list[tuple[int, int]]]:
+    footprints: dict[tuple[int, Orientation], list[tuple[int, int]]] = {}
+    for length in sorted({ship_type.length for ship_type in ShipType}):
+        for orientation in Orientation:
+            starts: list[tuple[int, int]] = []
+            for start in Coord:
+                try:
+                    positions: list[Coord] = (
+                        CoordHelper.coords_for_length_and_orientation(
+                            start, length, orientation
+                        )
+                    )
+                except KeyError:
+                    continue  # Runs off the board
+                starts.append((1 << cell_bit(start), coords_to_mask(positions)))
+            footprints[(length, orientation)] = starts
+    return footprints
+
+
+_COORDS_BY_BIT: list[Coord] = sorted(Coord, key=cell_bit)
+
+# Cell plus its (up to eight) neighbours, indexed by bit
+HALO_MASKS: list[int] = [
+    coords_to_mask([coord, *CoordHelper.coords_adjacent_to_a_coord(coord)])
+    for coord in _COORDS_BY_BIT
+]
+
+# (ship length, orientation) -> [(start bit, footprint mask)] for in-bounds starts
+FOOTPRINTS: dict[tuple[int, Orientation], list[tuple[int, int]]] = _build_footprints()
+
+
+def forbidden_mask(board: GameBoard) -> int:
+    """Return the cells no new ship may cover: placed ships and their halos."""
+    mask: int = 0
+    for ship in board.snapshot().ships:
+        for coord in ship.positions:
+            mask |= HALO_MASKS[cell_bit(coord)]
+    return mask
+
+
+def legal_start_mask(
+    board: GameBoard, ship_type: ShipType, orientation: Orientation
+) -> int:
+    """Return a mask of the start cells where `ship_type` can be placed.
+
+    Args:
+        board: The board to place on
+        ship_type: The ship to place
+        orientation: The orientation to place it in
+
+    Returns:
+        Mask of legal start cells (0 if the ship type is already on the board)
+    """
+    if any(ship.ship_type == ship_type for ship in board.snapshot().ships):
+        return 0
+    forbidden: int = forbidden_mask(board)
+    legal: int = 0
+    for start_bit, footprint in FOOTPRINTS[(ship_type.length, orientation)]:
+        if not footprint & forbidden:
+            legal |= start_bit
+    return legal
+
+
+def legal_starts(
+    board: GameBoard, ship_type: ShipType, orientation: Orientation
+) -> list[Coord]:
+    """Return the start cells where `ship_type` can be placed, in board order."""
+    return mask_to_coords(legal_start_mask(board, ship_type, orientation))
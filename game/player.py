@@ -11,7 +11,7 @@ class PlayerStatus(StrEnum):
     IN_GAME = "In Game"
 
 
-@dataclass
+@dataclass(slots=True)
 class GameRequest:
     sender_id: str
     receiver_id: str
@@ -19,6 +19,8 @@ class GameRequest:
 
 
 class Player:
+    __slots__ = ("name", "status", "_id")
+
     def __init__(self, name: str, status: PlayerStatus) -> None:
         self.name: str = name
         self.status: PlayerStatus
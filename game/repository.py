@@ -0,0 +1,327 @@
+"""Pluggable state repositories for GameService and Lobby.
+
+A StateRepository owns the collections that GameService and Lobby keep their
+state in. InMemoryRepository is plain dicts and sets (the original behaviour).
+SqliteRepository keeps the same in-memory working set but makes it durable: a
+single writer thread batches changes into a SQLite database (WAL mode) and
+the state is reloaded from it on start-up.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from contextlib import AbstractContextManager, nullcontext
+from typing import Any, Callable
+
+from game.locks import StripedLock
+from game.model import Game, GameBoard
+from game.player import GameRequest, Player
+from game.serialisation import (
+    board_from_dict,
+    board_to_dict,
+    game_from_dict,
+    game_request_from_dict,
+    game_request_to_dict,
+    game_to_dict,
+    player_from_dict,
+    player_to_dict,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class StateRepository:
+    """Interface for the state collections used by GameService and Lobby.
+
+    Every repository serves reads and writes from in-process dicts and sets so
+    that GameService and Lobby can mutate them directly. Implementations hook
+    mark_dirty/flush/close to make that state durable.
+    """
+
+    def __init__(self) -> None:
+        # GameService state
+        self.players: dict[str, Player] = {}  # player_id->Player
+        self.games: dict[str, Game] = {}  # game_id->Game
+        self.games_by_player: dict[str, Game] = {}  # player_id->Game
+        self.ship_placement_boards: dict[str, GameBoard] = {}  # player_id->GameBoard
+        self.ready_players: set[str] = set()
+        # Lobby state
+        self.lobby_players: dict[str, Player] = {}  # player_id->Player
+        self.game_requests: dict[str, GameRequest] = {}  # receiver_id->GameRequest
+        self.active_games: dict[str, str] = {}  # player_id->opponent_id
+        self.decline_notifications: dict[str, str] = {}  # sender_id->decliner_id
+        # collection->StripedLock its owner holds (by row key) to change a row
+        self.row_locks: dict[str, StripedLock] = {}
+
+    def register_locks(self, locks: StripedLock, *collections: str) -> None:
+        """Record the lock that guards the rows of the given collections.
+
+        GameService and Lobby only change a row while holding `locks` for the
+        row's key, so a repository that reads rows from another thread takes
+        the same lock to see each row whole.
+
+        Args:
+            locks: The owner's StripedLock
+            *collections: Names of the collections it guards
+        """
+        for collection in collections:
+            self.row_locks[collection] = locks
+
+    def mark_dirty(self, collection: str, *keys: str) -> None:
+        """Signal that rows of a collection have changed and may need persisting.
+
+        Args:
+            collection: Name of the changed collection (e.g. "games")
+            *keys: Keys of the changed rows, including rows that were removed
+        """
+
+    def flush(self) -> None:
+        """Persist any pending changes before returning."""
+
+    def close(self) -> None:
+        """Release any resources held by the repository."""
+
+
+class InMemoryRepository(StateRepository):
+    """Repository holding all state in plain in-process dicts and sets."""
+
+
+_SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS state (
+    collection TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (collection, key)
+)
+"""
+_UPSERT: str = (
+    "INSERT INTO state (collection, key, value) VALUES (?, ?, ?) "
+    "ON CONFLICT (collection, key) DO UPDATE SET value = excluded.value"
+)
+_DELETE: str = "DELETE FROM state WHERE collection = ? AND key = ?"
+_SELECT: str = "SELECT key, value FROM state WHERE collection = ?"
+
+# Lobby and GameService share Player objects, so a change to one is a change
+# to both rows
+_PLAYER_COLLECTIONS: tuple[str, ...] = ("players", "lobby_players")
+_ROW_ENCODERS: dict[str, Callable[[Any], Any]] = {
+    "players": player_to_dict,
+    "games_by_player": lambda game: game.id,
+    "ship_placement_boards": board_to_dict,
+    "lobby_players": player_to_dict,
+    "game_requests": game_request_to_dict,
+    "active_games": lambda opponent_id: opponent_id,
+    "decline_notifications": lambda decliner_id: decliner_id,
+}
+
+
+class SqliteRepository(StateRepository):
+    """Durable repository backed by a SQLite database.
+
+    Reads are served from the in-memory working set. Changes are persisted by a
+    single writer thread which, once signalled via mark_dirty, waits for
+    `batch_interval` seconds to coalesce further changes and then writes the
+    rows marked since the last batch in one transaction. Only marked rows are
+    serialised, so a batch costs what changed rather than the whole state.
+
+    Args:
+        path: Path of the SQLite database file
+        batch_interval: Seconds to wait after a change before writing a batch
+
+    Each committed batch is reported to `on_batch`, when set, as a list of the
+    (collection, key) pairs written. The database belongs to one process; in a
+    multi-worker deployment that is the state owner (see services.state_owner).
+    """
+
+    def __init__(self, path: str, batch_interval: float = 0.05) -> None:
+        super().__init__()
+        self.path: str = path
+        self.batch_interval: float = batch_interval
+        self.batches_written: int = 0
+        self.rows_written: int = 0
+        self._written: dict[str, dict[str, str]] = {}  # collection->key->json
+        self._pending: set[tuple[str, str]] = set()  # (collection, key) to write
+        self._pending_lock: threading.Lock = threading.Lock()
+        self._dirty: threading.Event = threading.Event()
+        self._closed: threading.Event = threading.Event()
+        self._write_lock: threading.Lock = threading.Lock()
+        self.on_batch: Callable[[list[tuple[str, str]]], None] | None = None
+
+        self._connection: sqlite3.Connection = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(_SCHEMA)
+        self._load()
+
+        self._writer: threading.Thread = threading.Thread(
+            target=self._writer_loop, name="sqlite-state-writer", daemon=True
+        )
+        self._writer.start()
+
+    def mark_dirty(self, collection: str, *keys: str) -> None:
+        collections: tuple[str, ...] = (
+            _PLAYER_COLLECTIONS if collection in _PLAYER_COLLECTIONS else (collection,)
+        )
+        with self._pending_lock:
+            self._pending.update((name, key) for name in collections for key in keys)
+        self._dirty.set()
+
+    def flush(self) -> None:
+        self._write_batch()
+
+    def close(self) -> None:
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        self._dirty.set()
+        self._writer.join()
+        self._write_batch()
+        self._connection.close()
+
+    def _writer_loop(self) -> None:
+        while not self._closed.is_set():
+            self._dirty.wait()
+            if self._closed.is_set():
+                break
+            self._closed.wait(self.batch_interval)
+            self._dirty.clear()
+            try:
+                self._write_batch()
+            except Exception:
+                logger.exception("Failed to persist state to %s", self.path)
+                self._dirty.set()
+
+    def _encode_game(self, game: Game) -> str | None:
+        """Serialise a game, or None if it is spilled and was never written.
+
+        A spilled game's boards are not reloaded here: any change to them would
+        have faulted them back in, so the last written boards are still current.
+        """
+        if not game.is_spilled:
+            return json.dumps(game_to_dict(game))
+        previous: str | None = self._written.get("games", {}).get(game.id)
+        if previous is None:
+            return None
+        return json.dumps(game_to_dict(game, boards=json.loads(previous)["boards"]))
+
+    def _hold_row(self, collection: str, key: str) -> AbstractContextManager[Any]:
+        """Hold the owner's lock for one row (and a game's players' locks).
+
+        A player in a game changes their board under their own lock rather
+        than the game's, so a game row is only whole under all three.
+        """
+        locks: StripedLock | None = self.row_locks.get(collection)
+        if locks is None:
+            return nullcontext()
+        keys: list[str] = [key]
+        game: Game | None = self.games.get(key) if collection == "games" else None
+        if game is not None:
+            keys += [player.id for player in (game.player_1, game.player_2) if player]
+        return locks.hold(*keys)
+
+    def _encode_row(self, collection: str, key: str) -> str | None:
+        """Serialise one row of the working set (None if it no longer exists)."""
+        with self._hold_row(collection, key):
+            return self._encode_unlocked_row(collection, key)
+
+    def _encode_unlocked_row(self, collection: str, key: str) -> str | None:
+        if collection == "ready_players":
+            return "true" if key in self.ready_players else None
+        value: Any = getattr(self, collection).get(key)
+        if value is None:
+            return None
+        if collection == "games":
+            return self._encode_game(value)
+        return json.dumps(_ROW_ENCODERS[collection](value))
+
+    def _write_batch(self) -> None:
+        with self._write_lock:
+            with self._pending_lock:
+                pending: set[tuple[str, str]] = self._pending
+                self._pending = set()
+            try:
+                changed: list[tuple[str, str]] = self._commit_rows(pending)
+            except Exception:
+                # Nothing was written, so every row is still to be written
+                with self._pending_lock:
+                    self._pending |= pending
+                raise
+        if changed and self.on_batch is not None:
+            self.on_batch(changed)
+
+    def _commit_rows(self, pending: set[tuple[str, str]]) -> list[tuple[str, str]]:
+        """Write the pending rows that differ from the database in one transaction.
+
+        Returns:
+            The (collection, key) pairs that were written or deleted
+        """
+        upserts: list[tuple[str, str, str]] = []
+        deletes: list[tuple[str, str]] = []
+        deferred: set[tuple[str, str]] = set()
+        for collection, key in pending:
+            written: str | None = self._written.get(collection, {}).get(key)
+            value: str | None = self._encode_row(collection, key)
+            if value is None and collection == "games" and key in self.games:
+                # Spilled before it was first written - retry next batch
+                deferred.add((collection, key))
+            elif value is None:
+                if written is not None:
+                    deletes.append((collection, key))
+            elif value != written:
+                upserts.append((collection, key, value))
+
+        if upserts or deletes:
+            cursor = self._connection.cursor()
+            cursor.execute("BEGIN")
+            try:
+                cursor.executemany(_UPSERT, upserts)
+                cursor.executemany(_DELETE, deletes)
+                cursor.execute("COMMIT")
+            except Exception:
+                cursor.execute("ROLLBACK")
+                raise
+            for collection, key, value in upserts:
+                self._written.setdefault(collection, {})[key] = value
+            for collection, key in deletes:
+                self._written[collection].pop(key, None)
+            self.batches_written += 1
+            self.rows_written += len(upserts) + len(deletes)
+        if deferred:
+            with self._pending_lock:
+                self._pending |= deferred
+        return [(collection, key) for collection, key, _ in upserts] + deletes
+
+    def _rows(self, collection: str) -> dict[str, Any]:
+        """Read a collection, recording its rows as the last written values."""
+        cursor = self._connection.execute(_SELECT, (collection,))
+        rows: dict[str, str] = dict(cursor.fetchall())
+        self._written[collection] = rows
+        return {key: json.loads(value) for key, value in rows.items()}
+
+    def _load(self) -> None:
+        """Populate the working set from the database."""
+        for player_id, data in self._rows("players").items():
+            self.players[player_id] = player_from_dict(data)
+        for player_id, data in self._rows("lobby_players").items():
+            # Lobby and GameService share Player objects
+            self.lobby_players[player_id] = self.players.get(
+                player_id
+            ) or player_from_dict(data)
+
+        known_players: dict[str, Player] = {**self.lobby_players, **self.players}
+        for game_id, data in self._rows("games").items():
+            self.games[game_id] = game_from_dict(data, known_players)
+        for player_id, game_id in self._rows("games_by_player").items():
+            if game_id in self.games:
+                self.games_by_player[player_id] = self.games[game_id]
+
+        for player_id, data in self._rows("ship_placement_boards").items():
+            self.ship_placement_boards[player_id] = board_from_dict(data)
+        self.ready_players.update(self._rows("ready_players"))
+        for receiver_id, data in self._rows("game_requests").items():
+            self.game_requests[receiver_id] = game_request_from_dict(data)
+        self.active_games.update(self._rows("active_games"))
+        self.decline_notifications.update(self._rows("decline_notifications"))
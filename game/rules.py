@@ -0,0 +1,113 @@
+"""Board size and fleet composition for a game.
+
+The standard rules (Game_Rules.md) are a 10x10 board and the five ShipTypes.
+A Rules object describes any other board up to 26x26 and any fleet. Every
+Game and GameBoard carries the Rules it is played by (GameService creates
+them with its own), and the bitmask engine in game.mask_board and the batch
+engine in game.batch_engine take Rules too.
+
+This module sits below game.model, which builds ShipType from STANDARD_FLEET.
+"""
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, NamedTuple
+
+from game.cells import CellGrid, grid_for
+
+if TYPE_CHECKING:
+    from game.model import ShipType
+
+
+class ShipSpec(NamedTuple):
+    """One ship in a fleet.
+
+    A ShipSpec stands in for a ShipType on boards with a non-standard fleet,
+    so it answers to the same `ship_name`, `length`, `shots_available` and
+    `code`.
+    """
+
+    name: str
+    length: int
+    shots_available: int
+    code: str
+
+    @property
+    def ship_name(self) -> str:
+        return self.name
+
+    @classmethod
+    def from_ship_type(cls, ship_type: "ShipType") -> "ShipSpec":
+        return cls(
+            ship_type.ship_name,
+            ship_type.length,
+            ship_type.shots_available,
+            ship_type.code,
+        )
+
+
+# The standard fleet, in ShipType order
+STANDARD_FLEET: tuple[ShipSpec, ...] = (
+    ShipSpec("Carrier", 5, 2, "A"),
+    ShipSpec("Battleship", 4, 1, "B"),
+    ShipSpec("Cruiser", 3, 1, "C"),
+    ShipSpec("Submarine", 3, 1, "S"),
+    ShipSpec("Destroyer", 2, 1, "D"),
+)
+
+
+@dataclass(frozen=True)
+class Rules:
+    """Board dimensions and fleet for one game.
+
+    Args:
+        rows: Number of board rows (1-26)
+        cols: Number of board columns (1-26)
+        fleet: The ships each player places
+
+    Raises:
+        ValueError: If the board size is out of range, the fleet is empty or
+            repeats a ship name, or a ship is too long to fit on the board
+    """
+
+    rows: int = 10
+    cols: int = 10
+    fleet: tuple[ShipSpec, ...] = STANDARD_FLEET
+    grid: CellGrid = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Raises ValueError for sizes outside 1-26
+        object.__setattr__(self, "grid", grid_for(self.rows, self.cols))
+        if not self.fleet:
+            raise ValueError("A fleet needs at least one ship")
+        if len({ship.name for ship in self.fleet}) != len(self.fleet):
+            raise ValueError("Ships in a fleet must have different names")
+        for ship in self.fleet:
+            if not 1 <= ship.length <= max(self.rows, self.cols):
+                raise ValueError(
+                    f"{ship.name} of length {ship.length} does not fit a"
+                    f" {self.rows}x{self.cols} board"
+                )
+
+    def __reduce__(self) -> tuple[type["Rules"], tuple[int, int, tuple[ShipSpec, ...]]]:
+        # Rebuilt from its fields, so a copy shares the cached CellGrid
+        return Rules, (self.rows, self.cols, self.fleet)
+
+    @property
+    def shots_per_round(self) -> int:
+        """Shots available in a round while the whole fleet is afloat."""
+        return sum(ship.shots_available for ship in self.fleet)
+
+    @classmethod
+    def scaled(cls, rows: int, cols: int) -> "Rules":
+        """Rules for a larger board with the standard fleet repeated to keep
+        roughly the standard ship density (one fleet per 100 cells)."""
+        copies: int = max(1, (rows * cols) // 100)
+        fleet: tuple[ShipSpec, ...] = tuple(
+            ship._replace(name=f"{ship.name} {copy}" if copies > 1 else ship.name)
+            for copy in range(1, copies + 1)
+            for ship in STANDARD_FLEET
+        )
+        return cls(rows, cols, fleet)
+
+
+STANDARD_RULES: Rules = Rules()
@@ -0,0 +1,173 @@
+"""JSON-friendly serialisation of game model objects.
+
+Game state is persisted in a human readable text format (see Code_Architecture.md),
+so model objects are converted to plain dicts of strings and ints.
+"""
+
+from datetime import datetime
+from typing import Any
+
+from game.model import Coord, Game, GameBoard, GameMode, GameStatus, Ship
+from game.player import GameRequest, Player, PlayerStatus
+from game.rules import STANDARD_RULES, Rules, ShipSpec
+
+
+def _shots_to_dict(shots: dict[Coord, int]) -> dict[str, int]:
+    return {coord.name: round_number for coord, round_number in shots.items()}
+
+
+def _shots_from_dict(board: GameBoard, data: dict[str, int]) -> dict[Coord, int]:
+    return {board.coord(name): round_number for name, round_number in data.items()}
+
+
+def rules_to_dict(rules: Rules) -> dict[str, Any]:
+    """Convert Rules to a JSON-serialisable dict."""
+    return {
+        "rows": rules.rows,
+        "cols": rules.cols,
+        "fleet": [list(ship) for ship in rules.fleet],
+    }
+
+
+def rules_from_dict(data: dict[str, Any] | None) -> Rules:
+    """Rebuild Rules from rules_to_dict output (None for the standard rules)."""
+    if data is None:
+        return STANDARD_RULES
+    return Rules(
+        data["rows"], data["cols"], tuple(ShipSpec(*ship) for ship in data["fleet"])
+    )
+
+
+def board_to_dict(board: GameBoard) -> dict[str, Any]:
+    """Convert a GameBoard to a JSON-serialisable dict.
+
+    Args:
+        board: The board to serialise
+
+    Returns:
+        Dictionary with ships (type name and position names) and shots, plus
+        the board's rules unless they are the standard ones
+    """
+    data: dict[str, Any] = {
+        "ships": [
+            {
+                "ship_type": ship.ship_type.name,
+                "positions": [coord.name for coord in ship.positions],
+            }
+            for ship in board.ships
+        ],
+        "shots_received": _shots_to_dict(board.shots_received),
+        "shots_fired": _shots_to_dict(board.shots_fired),
+        "version": board.version,
+    }
+    if board.rules != STANDARD_RULES:
+        data["rules"] = rules_to_dict(board.rules)
+    return data
+
+
+def board_from_dict(data: dict[str, Any], rules: Rules | None = None) -> GameBoard:
+    """Rebuild a GameBoard from the output of board_to_dict.
+
+    Ship positions are restored as stored; placement rules are not re-validated.
+
+    Args:
+        data: Dictionary produced by board_to_dict
+        rules: The board's rules (by default, those stored with the board)
+
+    Returns:
+        The reconstructed GameBoard
+    """
+    board = GameBoard(rules or rules_from_dict(data.get("rules")))
+    # Standard ships are stored by ShipType name, others by ShipSpec name
+    kinds = {kind.name: kind for kind in board.fleet}
+    for ship_data in data["ships"]:
+        ship = Ship(
+            kinds[ship_data["ship_type"]],
+            [board.coord(name) for name in ship_data["positions"]],
+        )
+        board.ships.append(ship)
+    board.shots_received.update(_shots_from_dict(board, data.get("shots_received", {})))
+    board.shots_fired.update(_shots_from_dict(board, data.get("shots_fired", {})))
+    board.version = data.get("version", 0)
+    return board
+
+
+def player_to_dict(player: Player) -> dict[str, Any]:
+    """Convert a Player to a JSON-serialisable dict."""
+    return {"id": player.id, "name": player.name, "status": player.status.value}
+
+
+def player_from_dict(data: dict[str, Any]) -> Player:
+    """Rebuild a Player (keeping its original ID) from player_to_dict output."""
+    player = Player(data["name"], PlayerStatus(data["status"]))
+    player._id = data["id"]
+    return player
+
+
+def game_request_to_dict(request: GameRequest) -> dict[str, Any]:
+    """Convert a GameRequest to a JSON-serialisable dict."""
+    return {
+        "sender_id": request.sender_id,
+        "receiver_id": request.receiver_id,
+        "timestamp": request.timestamp.isoformat(),
+    }
+
+
+def game_request_from_dict(data: dict[str, Any]) -> GameRequest:
+    """Rebuild a GameRequest from game_request_to_dict output."""
+    return GameRequest(
+        sender_id=data["sender_id"],
+        receiver_id=data["receiver_id"],
+        timestamp=datetime.fromisoformat(data["timestamp"]),
+    )
+
+
+def game_to_dict(game: Game, boards: dict[str, Any] | None = None) -> dict[str, Any]:
+    """Convert a Game (including both boards) to a JSON-serialisable dict.
+
+    Players are stored by ID only; game_from_dict resolves them again.
+
+    Args:
+        game: The game to convert
+        boards: Already serialised boards to store instead of reading
+            `game.board` (e.g. for a game whose boards are spilled)
+    """
+    if boards is None:
+        boards = {
+            player.id: board_to_dict(board) for player, board in game.board.items()
+        }
+    data: dict[str, Any] = {
+        "id": game.id,
+        "game_mode": game.game_mode.value,
+        "status": game.status.value,
+        "version": game.version,
+        "player_1_id": game.player_1.id,
+        "player_2_id": game.player_2.id if game.player_2 else None,
+        "boards": boards,
+    }
+    if game.rules != STANDARD_RULES:
+        data["rules"] = rules_to_dict(game.rules)
+    return data
+
+
+def game_from_dict(data: dict[str, Any], players: dict[str, Player]) -> Game:
+    """Rebuild a Game from game_to_dict output.
+
+    Args:
+        data: Dictionary produced by game_to_dict
+        players: player_id->Player used to resolve the game's players
+
+    Returns:
+        The reconstructed Game, sharing Player objects with `players`
+    """
+    player_1: Player = players[data["player_1_id"]]
+    player_2: Player | None = (
+        players[data["player_2_id"]] if data["player_2_id"] else None
+    )
+    rules: Rules = rules_from_dict(data.get("rules"))
+    game = Game(player_1, GameMode(data["game_mode"]), player_2, rules)
+    game._id = data["id"]
+    game.restore_version(GameStatus(data["status"]), data.get("version", 0))
+    for player_id, board_data in data["boards"].items():
+        game.board[players[player_id]] = board_from_dict(board_data, rules)
+    return game
@@ -0,0 +1,187 @@
+"""Computer strategies for choosing a salvo each round.
+
+A strategy sees what a real player sees (Game_Play.md): the shots it fired
+in each round, and after each round how many hits each opponent ship took
+and which ships were sunk, but not which of its shots hit. Strategies are
+registered by name in STRATEGIES so the tournament (game.tournament) and the
+single-player game can pick one by name.
+"""
+
+import random
+from abc import ABC, abstractmethod
+from typing import NamedTuple
+
+from game.cells import CELL_COUNT, NEIGHBOURS
+from game.model import Coord, ShipType, cell_to_coord, coord_to_cell
+from game.salvo_optimiser import (
+    INFORMATION_WEIGHT,
+    SALVO_TIME_BUDGET,
+    PlacementTable,
+    choose_salvo,
+)
+
+
+class RoundReport(NamedTuple):
+    """What a player learns about their own salvo once a round resolves."""
+
+    round_number: int
+    shots: tuple[Coord, ...]
+    hits: dict[ShipType, int]  # Hits on each opponent ship type hit this round
+    sunk: tuple[ShipType, ...]  # Opponent ships sunk this round
+
+
+class Strategy(ABC):
+    """Base class for computer strategies.
+
+    Subclasses implement `choose_salvo`, and override `observe` if they learn from the
+    round reports (call the base method to keep the shared bookkeeping).
+
+    Args:
+        rng: Source of randomness (seeded by the caller for repeatable games)
+    """
+
+    name: str = ""
+
+    def __init__(self, rng: random.Random | None = None) -> None:
+        self.rng: random.Random = rng or random.Random()
+        self.reports: list[RoundReport] = []
+        self.fired: set[int] = set()  # Cells already fired at
+        self.sunk: set[ShipType] = set()
+
+    @abstractmethod
+    def choose_salvo(self, shots: int, budget: float | None = None) -> list[Coord]:
+        """Return up to `shots` distinct cells not yet fired at.
+
+        Args:
+            shots: Number of shots to fire
+            budget: Seconds allowed, for strategies that search (None = the
+                strategy's own default)
+        """
+
+    def observe(self, report: RoundReport) -> None:
+        """Record the outcome of this strategy's salvo for a round."""
+        self.reports.append(report)
+        self.fired.update(coord_to_cell(coord) for coord in report.shots)
+        self.sunk.update(report.sunk)
+
+    def _unfired(self) -> list[int]:
+        return [cell for cell in range(CELL_COUNT) if cell not in self.fired]
+
+
+class RandomStrategy(Strategy):
+    """Fire at cells chosen uniformly at random."""
+
+    name = "random"
+
+    def choose_salvo(self, shots: int, budget: float | None = None) -> list[Coord]:
+        unfired: list[int] = self._unfired()
+        picks = self.rng.sample(unfired, min(shots, len(unfired)))
+        return [cell_to_coord(cell) for cell in picks]
+
+
+class HuntStrategy(Strategy):
+    """Follow up rounds that hit a ship that is still afloat.
+
+    Cells next to the shots of such a round are preferred, weighted by how
+    many hits the round scored. The rest of the salvo is spread out: each
+    random pick avoids cells next to the salvo's earlier picks, so one ship
+    rarely soaks up several shots while its hits cannot be told apart.
+    """
+
+    name = "hunt"
+
+    def choose_salvo(self, shots: int, budget: float | None = None) -> list[Coord]:
+        weights: dict[int, int] = {}
+        for report in self.reports:
+            live_hits: int = sum(
+                hits
+                for ship_type, hits in report.hits.items()
+                if ship_type not in self.sunk
+            )
+            if not live_hits:
+                continue
+            for coord in report.shots:
+                for cell in NEIGHBOURS[coord_to_cell(coord)]:
+                    if cell not in self.fired:
+                        weights[cell] = weights.get(cell, 0) + live_hits
+
+        salvo: list[int] = []
+        # Best follow-up cells first, ties broken at random
+        ranked: list[int] = sorted(
+            weights, key=lambda cell: (-weights[cell], self.rng.random())
+        )
+        salvo.extend(ranked[:shots])
+
+        unfired: list[int] = self._unfired()
+        self.rng.shuffle(unfired)
+        near_salvo: set[int] = {n for cell in salvo for n in NEIGHBOURS[cell]}
+        for spread_out in (True, False):
+            for cell in unfired:
+                if len(salvo) == shots:
+                    break
+                if cell in salvo or (spread_out and cell in near_salvo):
+                    continue
+                salvo.append(cell)
+                near_salvo.update(NEIGHBOURS[cell])
+        return [cell_to_coord(cell) for cell in salvo]
+
+
+class OptimiserStrategy(Strategy):
+    """Choose each salvo jointly with game.salvo_optimiser."""
+
+    name = "optimiser"
+    information_weight: float = INFORMATION_WEIGHT
+    budget: float = SALVO_TIME_BUDGET
+
+    def __init__(self, rng: random.Random | None = None) -> None:
+        super().__init__(rng)
+        self.table: PlacementTable = PlacementTable()
+
+    def choose_salvo(self, shots: int, budget: float | None = None) -> list[Coord]:
+        cells = choose_salvo(
+            self.table,
+            shots,
+            self.information_weight,
+            self.budget if budget is None else budget,
+        )
+        return [cell_to_coord(cell) for cell in cells]
+
+    def observe(self, report: RoundReport) -> None:
+        super().observe(report)
+        shots: int = 0
+        for coord in report.shots:
+            shots |= 1 << coord_to_cell(coord)
+        self.table.add_round(shots, report.hits, report.sunk)
+
+
+class GreedyHitsStrategy(OptimiserStrategy):
+    """Fire at the cells most likely to hold a ship."""
+
+    name = "likeliest"
+    information_weight = 0.0
+
+
+# Strategy name -> class
+STRATEGIES: dict[str, type[Strategy]] = {
+    strategy.name: strategy
+    for strategy in (
+        RandomStrategy,
+        HuntStrategy,
+        OptimiserStrategy,
+        GreedyHitsStrategy,
+    )
+}
+
+
+def make_strategy(name: str, rng: random.Random | None = None) -> Strategy:
+    """Create a registered strategy by name.
+
+    Raises:
+        ValueError: If no strategy has that name
+    """
+    strategy: type[Strategy] | None = STRATEGIES.get(name)
+    if strategy is None:
+        raise ValueError(
+            f"Unknown strategy: {name} (choose from {', '.join(STRATEGIES)})"
+        )
+    return strategy(rng)
@@ -0,0 +1,269 @@
+"""Headless tournament between computer strategies.
+
+Every pair of strategies plays a series of games through GameService and
+Game, with no HTTP involved. Seats alternate between games. Games are spread
+over a process pool. Each game's seed is derived from the tournament seed and
+the game's index, so results do not depend on the number of workers. The
+report gives each strategy's win rate, mean rounds per game and the latency
+of its `choose_salvo` decisions.
+
+Usage:
+    python -m game.tournament [--strategies NAME ...] [--games N]
+        [--workers N] [--seed N]
+"""
+
+import argparse
+import itertools
+import math
+import os
+import random
+import statistics
+import time
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+from game.game_service import GameService
+from game.model import Coord, GameBoard
+from game.player import Player, PlayerStatus
+from game.strategies import STRATEGIES, Strategy, make_strategy
+
+# More rounds than this means a strategy is not firing (100 cells, 1+ shot)
+MAX_ROUNDS: int = 100
+# Seconds allowed per salvo: unbounded, so searching strategies always finish
+# and results do not depend on how fast (or how loaded) the machine is
+SALVO_BUDGET: float = math.inf
+_CHUNK_SIZE: int = 250
+
+
+class GameResult:
+    """Outcome of one tournament game."""
+
+    __slots__ = ("latencies", "rounds", "strategies", "winner")
+
+    def __init__(
+        self,
+        strategies: tuple[str, str],
+        winner: int,
+        rounds: int,
+        latencies: tuple[list[float], list[float]],
+    ) -> None:
+        self.strategies: tuple[str, str] = strategies
+        self.winner: int = winner  # 1 or 2 (the seat), or 0 for a draw
+        self.rounds: int = rounds
+        # Seconds per choose_salvo call, per seat
+        self.latencies: tuple[list[float], list[float]] = latencies
+
+
+@dataclass
+class StrategyStats:
+    """One strategy's results across the tournament."""
+
+    games: int = 0
+    wins: int = 0
+    draws: int = 0
+    rounds: int = 0
+    latencies: list[float] = field(default_factory=list)
+
+    def add(self, other: "StrategyStats") -> None:
+        self.games += other.games
+        self.wins += other.wins
+        self.draws += other.draws
+        self.rounds += other.rounds
+        self.latencies.extend(other.latencies)
+
+    @property
+    def win_rate(self) -> float:
+        """Wins per game, counting a draw as half a win."""
+        return (self.wins + self.draws / 2) / self.games if self.games else 0.0
+
+    @property
+    def mean_rounds(self) -> float:
+        return self.rounds / self.games if self.games else 0.0
+
+    def latency_percentile(self, percent: int) -> float:
+        """Return a decision latency percentile in seconds."""
+        if len(self.latencies) < 2:
+            return self.latencies[0] if self.latencies else 0.0
+        return statistics.quantiles(self.latencies, n=100, method="inclusive")[
+            percent - 1
+        ]
+
+
+def game_seed(seed: int, index: int) -> int:
+    """Seed for game `index` of a tournament run with `seed`."""
+    return random.Random(f"{seed}:{index}").getrandbits(64)
+
+
+def _fire(strategy: Strategy, shots: int) -> tuple[list[Coord], float]:
+    started: float = time.perf_counter()
+    salvo: list[Coord] = strategy.choose_salvo(shots, SALVO_BUDGET)
+    latency: float = time.perf_counter() - started
+    if len(salvo) != len(set(salvo)) or len(salvo) > shots:
+        raise ValueError(f"{strategy.name} chose an invalid salvo: {salvo}")
+    return salvo, latency
+
+
+def play_game(
+    game_service: GameService, strategy_names: tuple[str, str], seed: int
+) -> GameResult:
+    """Play one game to the end between two strategies.
+
+    Args:
+        game_service: The service to create the game in (it is evicted after)
+        strategy_names: The strategies in seat 1 and seat 2
+        seed: Seeds the fleet placements and both strategies
+
+    Returns:
+        The game's result
+    """
+    rng = random.Random(seed)
+    players: list[Player] = []
+    for name in strategy_names:
+        player = Player(name=f"Computer ({name})", status=PlayerStatus.AVAILABLE)
+        game_service.add_player(player)
+        game_service.place_ships_randomly(player.id, random.Random(rng.getrandbits(64)))
+        players.append(player)
+    game_id: str = game_service.create_two_player_game(players[0].id, players[1].id)
+    for player in players:
+        game_service.transfer_ship_placement_board_to_game(game_id, player.id, player)
+    game_service.start_game(game_id)
+
+    game = game_service.games[game_id]
+    boards: list[GameBoard] = [game.board[player] for player in players]
+    strategies: list[Strategy] = [
+        make_strategy(name, random.Random(rng.getrandbits(64)))
+        for name in strategy_names
+    ]
+    latencies: tuple[list[float], list[float]] = ([], [])
+    round_number: int = 0
+    while not (boards[0].all_ships_sunk or boards[1].all_ships_sunk):
+        round_number += 1
+        if round_number > MAX_ROUNDS:
+            raise RuntimeError(f"Game did not finish: {strategy_names}")
+        # Both players aim before either salvo lands
+        salvos: dict[str, list[Coord]] = {}
+        for seat in (0, 1):
+            salvo, latency = _fire(strategies[seat], boards[seat].shots_available)
+            salvos[players[seat].id] = salvo
+            latencies[seat].append(latency)
+        reports = game_service.resolve_round(game_id, salvos)
+        for seat in (0, 1):
+            strategies[seat].observe(reports[players[seat].id])
+
+    sunk_1, sunk_2 = boards[0].all_ships_sunk, boards[1].all_ships_sunk
+    winner: int = 0 if sunk_1 and sunk_2 else 1 if sunk_2 else 2
+    game_service.evict_game(game_id)
+    for player in players:
+        game_service.remove_player(player.id)
+    return GameResult(strategy_names, winner, round_number, latencies)
+
+
+def _play_chunk(
+    games: list[tuple[tuple[str, str], int]],
+) -> dict[str, StrategyStats]:
+    """Play a list of (strategies, seed) games and total the results."""
+    game_service = GameService()
+    stats: dict[str, StrategyStats] = {}
+    for strategy_names, seed in games:
+        result = play_game(game_service, strategy_names, seed)
+        for seat, name in enumerate(strategy_names):
+            entry = stats.setdefault(name, StrategyStats())
+            entry.games += 1
+            entry.wins += result.winner == seat + 1
+            entry.draws += result.winner == 0
+            entry.rounds += result.rounds
+            entry.latencies.extend(result.latencies[seat])
+    return stats
+
+
+def schedule(
+    strategy_names: list[str], games: int, seed: int
+) -> Iterator[tuple[tuple[str, str], int]]:
+    """Yield (strategies by seat, seed) for every game of the tournament.
+
+    Each pair of strategies (or a lone strategy against itself) plays
+    `games` games, swapping seats after each one.
+    """
+    pairs = list(itertools.combinations(strategy_names, 2)) or [
+        (strategy_names[0], strategy_names[0])
+    ]
+    index: int = 0
+    for first, second in pairs:
+        for game in range(games):
+            seats = (first, second) if game % 2 == 0 else (second, first)
+            yield seats, game_seed(seed, index)
+            index += 1
+
+
+def run_tournament(
+    strategy_names: list[str], games: int, seed: int = 0, workers: int | None = None
+) -> dict[str, StrategyStats]:
+    """Play the tournament and return each strategy's results.
+
+    Args:
+        strategy_names: Registered strategy names (see game.strategies)
+        games: Games per pair of strategies
+        seed: Tournament seed; every game's seed is derived from it
+        workers: Worker processes (default: one per CPU; 1 plays in-process)
+
+    Raises:
+        ValueError: If a strategy name is not registered
+    """
+    for name in strategy_names:
+        make_strategy(name)
+    planned: list[tuple[tuple[str, str], int]] = list(
+        schedule(strategy_names, games, seed)
+    )
+    chunks = [
+        planned[start : start + _CHUNK_SIZE]
+        for start in range(0, len(planned), _CHUNK_SIZE)
+    ]
+    totals: dict[str, StrategyStats] = {
+        name: StrategyStats() for name in strategy_names
+    }
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        results = list(map(_play_chunk, chunks))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_play_chunk, chunks))
+    for chunk_stats in results:
+        for name, stats in chunk_stats.items():
+            totals[name].add(stats)
+    return totals
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--strategies", nargs="+", default=list(STRATEGIES), choices=STRATEGIES
+    )
+    parser.add_argument("--games", type=int, default=1000, help="games per pair")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    started: float = time.perf_counter()
+    totals = run_tournament(args.strategies, args.games, args.seed, args.workers)
+    elapsed: float = time.perf_counter() - started
+
+    print(
+        f"{'strategy':<12}{'games':>8}{'win rate':>10}{'mean rounds':>13}"
+        f"{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+    )
+    for name, stats in sorted(totals.items(), key=lambda item: -item[1].win_rate):
+        print(
+            f"{name:<12}{stats.games:>8,}{stats.win_rate:>10.1%}"
+            f"{stats.mean_rounds:>13.1f}"
+            + "".join(
+                f"{stats.latency_percentile(percent) * 1e3:>9.3f}"
+                for percent in (50, 95, 99)
+            )
+        )
+    played: int = sum(stats.games for stats in totals.values()) // 2
+    print(f"{played:,} games in {elapsed:.1f}s ({played / elapsed:,.0f} games/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,12 @@ This is the main entry point for the application. Routes are organized
 into separate router modules in the `routes` package.
 """
 
+import asyncio
 import os
+import signal
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import cast
 
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
@@ -12,9 +17,22 @@ from fastapi.templating import Jinja2Templates
 from starlette.middleware.sessions import SessionMiddleware
 
 from game.lobby import Lobby
+from game.repository import InMemoryRepository, SqliteRepository, StateRepository
 from services.auth_service import AuthService
+from services.computer_opponent import ComputerOpponents
+from services.fragment_cache import FragmentCache
+from services.game_actor import GameActorRegistry
 from services.lobby_service import LobbyService
+from services.reaper_service import ReaperConfig, ReaperService
+from services.shard_router import ShardRouter
+from services.state_owner import (
+    RemoteGameService,
+    RemoteLobbyService,
+    StateClient,
+    StateOwner,
+)
 from game.game_service import GameService
+from game.game_store import TieredGameStore
 
 # Import routers
 from routes.helpers import set_up_helpers
@@ -26,24 +44,118 @@ from routes.ship_placement import (
 )
 from routes.gameplay import set_up_gameplay_router, router as gameplay_router
 from routes.start_game import set_up_start_game_router, router as start_game_router
-
-app: FastAPI = FastAPI()
+from routes.metrics import set_up_metrics_router, router as metrics_router
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Run background maintenance tasks for the lifetime of the app."""
+    if state_client is not None:
+        await state_client.start()
+    if reaper_service is not None:
+        reaper_service.start()
+    yield
+    if reaper_service is not None:
+        await reaper_service.stop()
+    if game_actors is not None:
+        await game_actors.stop()
+    if computer_opponents is not None:
+        computer_opponents.shutdown()
+    if state_client is not None:
+        await state_client.stop()
+    shard_router.shutdown()
+    if state_repository is not None:
+        state_repository.close()
+
+
+app: FastAPI = FastAPI(lifespan=lifespan)
 app.add_middleware(SessionMiddleware, secret_key="your-secret-key-here")
 app.mount("/static", StaticFiles(directory="static"), name="static")
 templates: Jinja2Templates = Jinja2Templates(directory="templates")
 
 
-# Global lobby instance for state management
-_game_lobby: Lobby = Lobby()
-
-# Service instances
 auth_service: AuthService = AuthService()
-lobby_service: LobbyService = LobbyService(_game_lobby)
-game_service: GameService = GameService()
+
+# Multi-worker deployments: a worker started with STATE_SOCKET set holds no
+# game state; the state owner (`python main.py --state-owner <path>`) does, and
+# the worker reaches it over that Unix-domain socket (see services.state_owner)
+state_client: StateClient | None = (
+    StateClient(os.environ["STATE_SOCKET"]) if os.environ.get("STATE_SOCKET") else None
+)
+
+state_repository: StateRepository | None = None
+_game_lobby: Lobby | None = None
+game_actors: GameActorRegistry | None = None
+computer_opponents: ComputerOpponents | None = None
+reaper_service: ReaperService | None = None
+
+if state_client is not None:
+    lobby_service: LobbyService = cast(LobbyService, RemoteLobbyService(state_client))
+    game_service: GameService = cast(GameService, RemoteGameService(state_client))
+else:
+    # Shared state repository - durable SQLite store when STATE_DB is set
+    state_repository = (
+        SqliteRepository(os.environ["STATE_DB"])
+        if os.environ.get("STATE_DB")
+        else InMemoryRepository()
+    )
+
+    # Global lobby instance for state management
+    _game_lobby = Lobby(state_repository)
+
+    # Service instances
+    lobby_service = LobbyService(_game_lobby)
+    game_service = GameService(state_repository)
+
+    # Optional hot/cold tiering: spill idle game boards to a local directory
+    if os.environ.get("GAME_SPILL_DIR"):
+        _max_resident: str | None = os.environ.get("GAME_MAX_RESIDENT")
+        game_service.enable_tiering(
+            TieredGameStore(
+                spill_dir=os.environ["GAME_SPILL_DIR"],
+                idle_threshold=float(os.environ.get("GAME_SPILL_IDLE_SECONDS", "300")),
+                max_resident=int(_max_resident) if _max_resident else None,
+            )
+        )
+
+    # Per-game actors serialise placement, ready, fire and abandon commands
+    game_actors = GameActorRegistry(game_service)
+    if game_service.game_store is not None:
+        # Never spill a game while its actor is working on it
+        game_service.game_store.is_busy = game_actors.is_busy
+
+    # The computer's next salvo is worked out on COMPUTER_SALVO_WORKERS
+    # background threads while the human aims (0 = only when the human fires)
+    computer_opponents = ComputerOpponents(
+        game_service, workers=int(os.environ.get("COMPUTER_SALVO_WORKERS", "1"))
+    )
+
+    reaper_service = ReaperService(
+        game_service,
+        lobby_service,
+        ReaperConfig(archive_dir=os.environ.get("GAME_ARCHIVE_DIR")),
+    )
+
+# Per-player/per-game CPU work runs on GAME_SHARDS threads (0 = inline)
+shard_router: ShardRouter = ShardRouter(int(os.environ.get("GAME_SHARDS", "0")))
+
+# Rendered board tables are cached per board version and viewpoint
+fragment_cache: FragmentCache = FragmentCache(
+    int(os.environ.get("BOARD_FRAGMENT_CACHE_BYTES", str(4 * 1024 * 1024)))
+)
 
 
 # Set up helpers module first (shared by all routers)
-set_up_helpers(templates, game_service, lobby_service)
+set_up_helpers(
+    templates,
+    game_service,
+    lobby_service,
+    shard_router,
+    game_actors,
+    fragment_cache,
+    computer_opponents,
+    state_client,
+)
 
 # Set up all routers with their dependencies
 set_up_auth_router(templates, auth_service, game_service, lobby_service)
@@ -51,6 +163,9 @@ set_up_lobby_router(templates, game_service, lobby_service)
 set_up_ship_placement_router(templates, game_service, lobby_service)
 set_up_gameplay_router(templates, game_service)
 set_up_start_game_router(templates, game_service, lobby_service)
+set_up_metrics_router(
+    reaper_service, game_service, shard_router, game_actors, computer_opponents
+)
 
 # Include all routers
 app.include_router(auth_router)
@@ -58,6 +173,7 @@ app.include_router(lobby_router)
 app.include_router(ship_placement_router)
 app.include_router(gameplay_router)
 app.include_router(start_game_router)
+app.include_router(metrics_router)
 
 
 # === Testing Endpoints ===
@@ -78,7 +194,42 @@ async def health_check() -> dict[str, str]:
     return {"status": "healthy"}
 
 
-if __name__ == "__main__":
-    import uvicorn
+async def serve_state(socket_path: str) -> None:
+    """Own the game state and serve it to workers until SIGINT or SIGTERM.
+
+    Runs the app's lifespan (reaper, actors, repository) without serving HTTP.
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    Args:
+        socket_path: Filesystem path of the Unix-domain socket to listen on
+    """
+    if state_client is not None:
+        raise RuntimeError("The state owner must not have STATE_SOCKET set")
+    stopping = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stopping.set)
+    owner = StateOwner(socket_path, lobby_service, game_service)
+    async with lifespan(app):
+        await owner.start()
+        try:
+            await stopping.wait()
+        finally:
+            await owner.stop()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Battleships game server")
+    parser.add_argument(
+        "--state-owner",
+        metavar="SOCKET_PATH",
+        help="serve the game state to workers on this socket instead of HTTP",
+    )
+    args = parser.parse_args()
+    if args.state_owner:
+        asyncio.run(serve_state(args.state_owner))
+    else:
+        import uvicorn
+
+        uvicorn.run(app, host="0.0.0.0", port=8000)
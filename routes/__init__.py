@@ -6,6 +6,7 @@ This package contains router modules organized by domain:
 - ship_placement: Ship placement routes
 - gameplay: Active game gameplay routes
 - start_game: Game start confirmation routes
+- metrics: Operational metrics routes
 """
 
 from routes.auth import router as auth_router
@@ -13,6 +14,7 @@ from routes.lobby import router as lobby_router
 from routes.ship_placement import router as ship_placement_router
 from routes.gameplay import router as gameplay_router
 from routes.start_game import router as start_game_router
+from routes.metrics import router as metrics_router
 
 __all__ = [
     "auth_router",
@@ -20,4 +22,5 @@ __all__ = [
     "ship_placement_router",
     "gameplay_router",
     "start_game_router",
+    "metrics_router",
 ]
@@ -12,6 +12,7 @@ from routes.helpers import (
     _get_game_service,
     _get_lobby_service,
     _get_templates,
+    _on_owner,
     _redirect_or_htmx,
     SESSION_PLAYER_ID_KEY,
 )
@@ -71,8 +72,6 @@ async def login_submit(
 ) -> HTMLResponse | RedirectResponse | Response:
     """Handle login form submission"""
     auth_service = _get_auth_service()
-    game_service = _get_game_service()
-    lobby_service = _get_lobby_service()
 
     validation = auth_service.validate_player_name(player_name, strip_quotes=True)
 
@@ -87,20 +86,10 @@ async def login_submit(
 
     # Generate and store player ID in session and player object in game service
     player: Player = Player(player_name, PlayerStatus.AVAILABLE)
-    game_service.add_player(player)
     request.session[SESSION_PLAYER_ID_KEY] = player.id
 
     try:
-        redirect_url: str
-        if game_mode == "human":
-            lobby_service.join_lobby(player)  # Add the player to the lobby
-            redirect_url = "/lobby"
-
-        elif game_mode == "computer":
-            redirect_url = "/start-game"
-        else:
-            raise ValueError(f"Invalid game mode: {game_mode}")
-
+        redirect_url: str = _on_owner(_register_player, player, game_mode)
         return _redirect_or_htmx(request, redirect_url)
     except ValueError as e:
         return _create_login_error_response(
@@ -112,6 +101,30 @@ async def login_submit(
         )
 
 
+def _register_player(player: Player, game_mode: str) -> str:
+    """Add a new player, joining the lobby for a human opponent.
+
+    Args:
+        player: The player who logged in
+        game_mode: "human" or "computer"
+
+    Returns:
+        The URL to send the player to next
+
+    Raises:
+        ValueError: If the game mode is invalid or the player cannot join
+            the lobby (the player is added either way)
+    """
+    _get_game_service().add_player(player)
+    if game_mode == "human":
+        # The same Player object is shared with the game service
+        _get_lobby_service().join_lobby(player)
+        return "/lobby"
+    elif game_mode == "computer":
+        return "/start-game"
+    raise ValueError(f"Invalid game mode: {game_mode}")
+
+
 @router.post("/player-name")
 async def validate_player_name(
     request: Request, player_name: str = Form()
@@ -1,24 +1,53 @@
 """Active game gameplay routes."""
 
+from functools import cache
 from typing import Any, NamedTuple
 
-from fastapi import APIRouter, HTTPException, Request, status
-from fastapi.responses import HTMLResponse
+from fastapi import APIRouter, Form, HTTPException, Request, status
+from fastapi.responses import HTMLResponse, RedirectResponse, Response
 from fastapi.templating import Jinja2Templates
 
+from game.cells import BOARD_SIZE, CELL_COUNT, CELL_NAME, ROW_LETTERS
 from game.game_service import Game, GameService, GameStatus
-from game.model import GameBoard
+from game.hit_inference import (
+    Inference,
+    RoundEvidence,
+    evidence_from_board,
+    infer,
+)
+from game.model import Coord, GameBoard, GameDelta
 from game.player import Player
+from game.rules import Rules
+from services.game_actor import GameCommand
 
 from routes.helpers import (
+    BoardViewpoint,
+    _etag,
+    _etag_headers,
+    _get_computer_opponents,
+    _get_fragment_cache,
     _get_game_service,
     _get_player_from_session,
+    _get_shard_router,
     _get_templates,
+    _not_modified,
+    _on_shard,
+    _render_board_grid,
+    _submit_command,
 )
 
 router: APIRouter = APIRouter(prefix="", tags=["gameplay"])
 
 
+@cache
+def _no_opponent_board(rules: Rules) -> GameBoard:
+    """Return the empty target grid for games against the computer.
+
+    Shared per rules so its rendered fragment is cached once; never mutated.
+    """
+    return GameBoard(rules)
+
+
 class PlayerGameRole(NamedTuple):
     """Represents a player's role in a game."""
 
@@ -39,7 +68,7 @@ def _get_game_or_404(game_id: str) -> Game:
         HTTPException: 404 if game not found
     """
     game_service = _get_game_service()
-    game: Game | None = game_service.games.get(game_id)
+    game: Game | None = game_service.get_game(game_id)
     if not game:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -72,16 +101,23 @@ def _get_player_role(game: Game, player: Player) -> PlayerGameRole:
         )
 
 
-def _format_board_for_template(board: GameBoard) -> dict[str, Any]:
+def _format_board_for_template(
+    board: GameBoard, viewpoint: BoardViewpoint, name: str
+) -> dict[str, Any]:
     """Convert board to template-friendly format.
 
     Args:
         board: The GameBoard to format
+        viewpoint: Whether the viewer owns the board (ships shown) or not
+        name: Prefix for the table and cell test IDs ("player" or "opponent")
 
     Returns:
         Dictionary with board data for template rendering
     """
-    return {"ships": board.get_placed_ships_for_display()}
+    return {
+        "ships": board.get_placed_ships_for_display(),
+        "grid": _render_board_grid(board, viewpoint, f"{name}-board", f"{name}-cell-"),
+    }
 
 
 def _get_game_status_message(game: Game) -> str | None:
@@ -128,13 +164,105 @@ def _create_gameplay_context(
         "player_name": current_player.name,
         "opponent_name": opponent_name,
         "game_id": game_id,
-        "player_board": _format_board_for_template(player_board),
-        "opponent_board": _format_board_for_template(opponent_board),
-        "round_number": 1,  # Placeholder - will be dynamic later
+        "player_board": _format_board_for_template(
+            player_board, BoardViewpoint.OWNER, "player"
+        ),
+        "opponent_board": _format_board_for_template(
+            opponent_board, BoardViewpoint.OPPONENT, "opponent"
+        ),
+        "round_number": game.round_number,
         "status_message": status_message,
+        "can_fire": bool(
+            opponent
+            and _get_game_service().is_computer_player(opponent.id)
+            and game.status not in (GameStatus.FINISHED, GameStatus.ABANDONED)
+        ),
+        "shots_available": player_board.shots_available,
+        "game_version": game.version,
     }
 
 
+def _build_game_snapshot(game: Game, role: PlayerGameRole) -> dict[str, Any]:
+    """Build the full game state visible to one player.
+
+    The opponent's ship positions are never included - only the shots the
+    player has fired at them.
+
+    Args:
+        game: The Game object
+        role: The viewing player's role in the game
+
+    Returns:
+        JSON-serialisable snapshot of the player's view of the game
+    """
+    player_board: GameBoard = game.board[role.current_player]
+    opponent_board: GameBoard | None = (
+        game.board[role.opponent] if role.opponent else None
+    )
+    return {
+        "status": game.status.value,
+        "player_board": {
+            "ships": player_board.get_placed_ships_for_display(),
+            "shots_received": {
+                coord.name: round_number
+                for coord, round_number in player_board.shots_received.items()
+            },
+        },
+        "opponent_board": {
+            "shots_received": {
+                coord.name: round_number
+                for coord, round_number in opponent_board.shots_received.items()
+            }
+            if opponent_board
+            else {},
+        },
+    }
+
+
+def _delta_to_dict(delta: GameDelta) -> dict[str, Any]:
+    """Convert a GameDelta to a JSON-serialisable dict."""
+    return {"version": delta.version, "kind": delta.kind.value, "data": delta.data}
+
+
+def _render_hit_inference(board: GameBoard) -> str:
+    """Solve where the ships on `board` can be and render the overlay.
+
+    Args:
+        board: The opponent's board (only the round reports are used)
+
+    Returns:
+        The overlay HTML
+    """
+    evidence: list[RoundEvidence] = evidence_from_board(board)
+    inference: Inference = infer(evidence)
+    chances: list[float] = inference.chances()
+    cells: list[tuple[float, bool]] = [
+        (chances[cell], bool(inference.fired >> cell & 1)) for cell in range(CELL_COUNT)
+    ]
+    return (
+        _get_templates()
+        .get_template("components/hit_inference.html")
+        .render(
+            rounds=[
+                (report.round_number, report.hits, report.sunk) for report in evidence
+            ],
+            ships=[
+                (
+                    ship,
+                    [CELL_NAME[c] for c in range(CELL_COUNT) if ship.certain >> c & 1],
+                )
+                for ship in inference.ships
+            ],
+            layouts=inference.layouts,
+            elapsed_ms=inference.elapsed * 1000,
+            rows=[
+                (letter, cells[row * BOARD_SIZE : (row + 1) * BOARD_SIZE])
+                for row, letter in enumerate(ROW_LETTERS)
+            ],
+        )
+    )
+
+
 def set_up_gameplay_router(
     templates: Jinja2Templates,
     game_service: GameService,
@@ -143,8 +271,8 @@ def set_up_gameplay_router(
     return router
 
 
-@router.get("/game/{game_id}", response_class=HTMLResponse)
-async def game_page(request: Request, game_id: str) -> HTMLResponse:
+@router.get("/game/{game_id}", response_model=None)
+async def game_page(request: Request, game_id: str) -> HTMLResponse | Response:
     """Display the gameplay page for an active game.
 
     Args:
@@ -169,19 +297,156 @@ async def game_page(request: Request, game_id: str) -> HTMLResponse:
     # Get boards for both players
     player_board: GameBoard = game.board[role.current_player]
     opponent_board: GameBoard = (
-        game.board[role.opponent] if role.opponent else GameBoard()
+        game.board[role.opponent] if role.opponent else _no_opponent_board(game.rules)
     )
 
-    # Render gameplay template
-    return templates.TemplateResponse(
-        request=request,
-        name="gameplay.html",
-        context=_create_gameplay_context(
-            current_player=role.current_player,
-            opponent=role.opponent,
-            player_board=player_board,
-            opponent_board=opponent_board,
-            game_id=game_id,
-            game=game,
-        ),
+    etag: str = _etag(
+        player.id,
+        "game",
+        game_id,
+        game.version,
+        player_board.version,
+        opponent_board.version,
+    )
+    not_modified: Response | None = _not_modified(request, etag)
+    if not_modified:
+        return not_modified
+
+    context: dict[str, Any] = _create_gameplay_context(
+        current_player=role.current_player,
+        opponent=role.opponent,
+        player_board=player_board,
+        opponent_board=opponent_board,
+        game_id=game_id,
+        game=game,
     )
+
+    # Render gameplay template on the game's shard
+    response: HTMLResponse = await _get_shard_router().run(
+        game_id, templates.TemplateResponse, request, "gameplay.html", context
+    )
+    response.headers.update(_etag_headers(etag))
+    return response
+
+
+@router.get("/game/{game_id}/hit-inference", response_class=HTMLResponse)
+async def hit_inference(request: Request, game_id: str) -> HTMLResponse:
+    """Show where the opponent's ships can be, given the hits reported so far.
+
+    Args:
+        request: The FastAPI request object containing session data
+        game_id: The unique identifier for the game
+
+    Returns:
+        HTMLResponse with the hit-inference overlay
+
+    Raises:
+        HTTPException: 404 if game not found, 403 if player not in this game
+    """
+    player: Player = _get_player_from_session(request)
+    game: Game = _get_game_or_404(game_id)
+    role: PlayerGameRole = _get_player_role(game, player)
+    opponent_board: GameBoard = (
+        game.board[role.opponent] if role.opponent else _no_opponent_board(game.rules)
+    )
+
+    fragment_cache = _get_fragment_cache()
+    key = ("hit-inference", opponent_board.uid, opponent_board.version)
+    html: str | None = fragment_cache.get(key)
+    if html is None:
+        html = await _get_shard_router().run(
+            game_id, _render_hit_inference, opponent_board
+        )
+        fragment_cache.put(key, html)
+    return HTMLResponse(html)
+
+
+@router.post("/game/{game_id}/fire", response_model=None)
+async def fire_salvo(
+    request: Request, game_id: str, shots: str = Form(default="")
+) -> RedirectResponse:
+    """Fire the player's salvo for this round in a game against the computer.
+
+    The computer's salvo is normally ready already (see
+    services.computer_opponent), so the round resolves straight away.
+
+    Args:
+        request: The FastAPI request object containing session data
+        game_id: The unique identifier for the game
+        shots: The cells to fire at, separated by spaces or commas (e.g. "A1 C4")
+
+    Returns:
+        RedirectResponse back to the gameplay page
+
+    Raises:
+        HTTPException: 404 if game not found, 403 if player not in this game,
+            400 if the game is not against the computer or is over, or the
+            salvo is invalid
+    """
+    player: Player = _get_player_from_session(request)
+    game: Game = _get_game_or_404(game_id)
+    _get_player_role(game, player)
+
+    try:
+        salvo: list[Coord] = [
+            Coord[name.upper()] for name in shots.replace(",", " ").split()
+        ]
+    except KeyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown cell: {e.args[0]}",
+        )
+
+    try:
+        await _submit_command(
+            player.id,
+            GameCommand.FIRE,
+            _on_shard,
+            game_id,
+            _play_round,
+            game_id,
+            player.id,
+            salvo,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return RedirectResponse(
+        url=f"/game/{game_id}", status_code=status.HTTP_303_SEE_OTHER
+    )
+
+
+def _play_round(game_id: str, player_id: str, salvo: list[Coord]) -> None:
+    """Resolve the human's salvo and the computer's reply (see fire_salvo)."""
+    _get_computer_opponents().play_round(game_id, player_id, salvo)
+
+
+@router.get("/game/{game_id}/deltas")
+async def game_deltas(request: Request, game_id: str, since: int) -> dict[str, Any]:
+    """Return the changes to a game since the client's last seen version.
+
+    Reconnecting clients present the game version they last rendered. If that
+    version is still covered by the game's delta buffer only the missing
+    deltas are returned; otherwise a full snapshot of the player's view is.
+
+    Args:
+        request: The FastAPI request object containing session data
+        game_id: The unique identifier for the game
+        since: The last game version the client saw
+
+    Returns:
+        {"version", "deltas"} or {"version", "snapshot"}
+
+    Raises:
+        HTTPException: 404 if game not found, 403 if player not in this game
+    """
+    player: Player = _get_player_from_session(request)
+    game: Game = _get_game_or_404(game_id)
+    role: PlayerGameRole = _get_player_role(game, player)
+
+    deltas: list[GameDelta] | None = game.deltas_since(since)
+    if deltas is None:
+        return {"version": game.version, "snapshot": _build_game_snapshot(game, role)}
+    return {
+        "version": game.version,
+        "deltas": [_delta_to_dict(delta) for delta in deltas],
+    }
@@ -3,13 +3,27 @@
 These helpers are duplicated to avoid circular imports and keep routers self-contained.
 """
 
+import hashlib
+from collections.abc import Callable
+from enum import StrEnum
+from typing import Any, TypeVar
+
 from fastapi import HTTPException, Request, status
 from fastapi.responses import HTMLResponse, RedirectResponse, Response
 from fastapi.templating import Jinja2Templates
+from markupsafe import Markup
 
 from game.game_service import GameService
+from game.model import GameBoard
 from game.player import Player
+from services.computer_opponent import ComputerOpponents
+from services.fragment_cache import FragmentCache
+from services.game_actor import GameActorRegistry, GameCommand
 from services.lobby_service import LobbyService
+from services.shard_router import ShardRouter
+from services.state_owner import StateClient
+
+T = TypeVar("T")
 
 # Session key constant
 SESSION_PLAYER_ID_KEY = "player-id"
@@ -18,21 +32,58 @@ SESSION_PLAYER_ID_KEY = "player-id"
 _templates: Jinja2Templates | None = None
 _game_service: GameService | None = None
 _lobby_service: LobbyService | None = None
+_shard_router: ShardRouter = ShardRouter()
+_game_actors: GameActorRegistry | None = None
+_fragment_cache: FragmentCache = FragmentCache()
+_computer_opponents: ComputerOpponents | None = None
+# Set in worker processes, whose state is held by the state owner
+_state_client: StateClient | None = None
+
+# Conditional GET counters (exposed via /metrics/etags)
+_etag_stats: dict[str, int] = {"requests": 0, "not_modified": 0}
 
 
 def set_up_helpers(
     templates: Jinja2Templates,
     game_service: GameService,
     lobby_service: LobbyService,
+    shard_router: ShardRouter | None = None,
+    game_actors: GameActorRegistry | None = None,
+    fragment_cache: FragmentCache | None = None,
+    computer_opponents: ComputerOpponents | None = None,
+    state_client: StateClient | None = None,
 ) -> None:
     """Configure the helpers module with required dependencies.
 
-    Must be called before any routes are used.
+    Must be called before any routes are used. Without a shard_router,
+    per-player and per-game work runs inline on the event loop.
+
+    In a worker process, pass the services' remote stand-ins and the
+    state_client: game commands and _on_owner calls then run in the state
+    owner (see services.state_owner), so there are no local game actors or
+    computer opponents.
     """
-    global _templates, _game_service, _lobby_service
+    global _templates, _game_service, _lobby_service, _shard_router, _game_actors
+    global _fragment_cache, _computer_opponents, _state_client
     _templates = templates
     _game_service = game_service
     _lobby_service = lobby_service
+    _shard_router = shard_router or ShardRouter()
+    _fragment_cache = fragment_cache or FragmentCache()
+    _state_client = state_client
+    if state_client is None:
+        _game_actors = game_actors or GameActorRegistry(game_service)
+        _computer_opponents = computer_opponents or ComputerOpponents(game_service)
+    else:
+        _game_actors = None
+        _computer_opponents = None
+
+
+class BoardViewpoint(StrEnum):
+    """Who a rendered board is for: its owner sees ships, others only shots."""
+
+    OWNER = "owner"
+    OPPONENT = "opponent"
 
 
 def _get_templates() -> Jinja2Templates:
@@ -56,6 +107,67 @@ def _get_lobby_service() -> LobbyService:
     return _lobby_service
 
 
+def _get_shard_router() -> ShardRouter:
+    """Get the shard router for per-player and per-game work."""
+    return _shard_router
+
+
+def _get_game_actors() -> GameActorRegistry:
+    """Get the game actor registry, raising if not initialised."""
+    if _game_actors is None:
+        raise RuntimeError("Helpers not initialised - call set_up_helpers first")
+    return _game_actors
+
+
+def _get_computer_opponents() -> ComputerOpponents:
+    """Get the computer opponents service, raising if not initialised."""
+    if _computer_opponents is None:
+        raise RuntimeError("Helpers not initialised - call set_up_helpers first")
+    return _computer_opponents
+
+
+def _on_owner(fn: Callable[..., T], *args: Any) -> T:
+    """Run `fn(*args)` where the game state is held and return its result.
+
+    That is here, unless this is a worker process, when it is the state owner.
+    Reads and writes that must not interleave with other requests go in one
+    such function. `fn` must be module-level, reach the services through the
+    getters above, and take and return picklable values.
+    """
+    if _state_client is None:
+        return fn(*args)
+    return _state_client.call(fn, *args)
+
+
+async def _submit_command(
+    player_id: str, command: GameCommand, operation: Callable[..., T], *args: Any
+) -> T:
+    """Queue `operation(*args)` on the player's game actor and await it.
+
+    As GameActorRegistry.submit, but a worker process submits it to the state
+    owner's actors, so the same rules as for _on_owner apply to `operation`.
+    """
+    if _state_client is not None:
+        return await _state_client.call_async(
+            _submit_command, player_id, command, operation, *args
+        )
+    return await _get_game_actors().submit(player_id, command, operation, *args)
+
+
+async def _on_shard(key: str, fn: Callable[..., T], *args: Any) -> T:
+    """Run `fn(*args)` on the shard owning `key` (for use as a game command)."""
+    return await _get_shard_router().run(key, fn, *args)
+
+
+def _find_active_player(player_id: str) -> Player | None:
+    """Return the player and record their activity (None if unknown)."""
+    game_service = _get_game_service()
+    player: Player | None = game_service.get_player(player_id)
+    if player:
+        game_service.touch_player(player_id)
+    return player
+
+
 def _get_player_id(request: Request) -> str:
     """Get player ID from session.
 
@@ -90,8 +202,7 @@ def _get_player_from_session(request: Request) -> Player:
         HTTPException: 401 if no session, 404 if player not found
     """
     player_id: str = _get_player_id(request)
-    game_service = _get_game_service()
-    player: Player | None = game_service.get_player(player_id)
+    player: Player | None = _on_owner(_find_active_player, player_id)
     if not player:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -206,3 +317,109 @@ def _redirect_or_htmx(
     if request.headers.get("HX-Request"):
         return _htmx_redirect(url)
     return RedirectResponse(url=url, status_code=status_code)
+
+
+def _etag(viewer_id: str, *versions: object) -> str:
+    """Build a weak ETag from the viewer and the versions a view depends on.
+
+    Args:
+        viewer_id: The player the view is rendered for
+        *versions: Version counters (and flags) the rendered output depends on
+
+    Returns:
+        Quoted weak ETag header value
+    """
+    key: str = "|".join(str(part) for part in (viewer_id, *versions))
+    return f'W/"{hashlib.blake2s(key.encode(), digest_size=8).hexdigest()}"'
+
+
+def _not_modified(request: Request, etag: str) -> Response | None:
+    """Return a 304 response if the client already has this ETag.
+
+    Args:
+        request: The FastAPI request object
+        etag: The current ETag for the requested view
+
+    Returns:
+        304 Response if If-None-Match matches, otherwise None
+    """
+    _etag_stats["requests"] += 1
+    if_none_match: str = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        _etag_stats["not_modified"] += 1
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers=_etag_headers(etag)
+        )
+    return None
+
+
+def _etag_headers(etag: str) -> dict[str, str]:
+    """Headers that make browsers revalidate a view with its ETag every time."""
+    return {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+
+def _get_etag_stats() -> dict[str, float]:
+    """Conditional GET counts and the fraction answered with 304."""
+    requests: int = _etag_stats["requests"]
+    not_modified: int = _etag_stats["not_modified"]
+    return {
+        "requests": requests,
+        "not_modified": not_modified,
+        "hit_rate": not_modified / requests if requests else 0.0,
+    }
+
+
+# Event sent (via HX-Trigger) when a long-poll times out with nothing new, so
+# the polling element re-issues the same request without a swap
+LONG_POLL_IDLE_EVENT: str = "long-poll-idle"
+
+
+def _long_poll_idle_response() -> Response:
+    """Return an empty 204 telling HTMX to re-arm the long-poll unchanged.
+
+    HTMX does not swap on 204, so the polling element (and its version) stays
+    in place and its `long-poll-idle` trigger fires the next poll.
+    """
+    return Response(
+        status_code=status.HTTP_204_NO_CONTENT,
+        headers={"HX-Trigger": LONG_POLL_IDLE_EVENT},
+    )
+
+
+def _get_fragment_cache() -> FragmentCache:
+    """Get the cache of rendered board fragments."""
+    return _fragment_cache
+
+
+def _render_board_grid(
+    board: GameBoard,
+    viewpoint: BoardViewpoint,
+    table_testid: str,
+    cell_testid_prefix: str,
+) -> Markup:
+    """Render a board's table, reusing the cached HTML when unchanged.
+
+    Args:
+        board: The board to render
+        viewpoint: Whether ships are shown (OWNER) or only shots (OPPONENT)
+        table_testid: data-testid of the table element
+        cell_testid_prefix: data-testid prefix for each cell (e.g. "player-cell-")
+
+    Returns:
+        The table HTML, safe to insert into a template
+    """
+    key = (board.uid, board.version, viewpoint, table_testid, cell_testid_prefix)
+    html: str | None = _fragment_cache.get(key)
+    if html is None:
+        html = (
+            _get_templates()
+            .get_template("components/board_grid.html")
+            .render(
+                grid=board.display_grid(viewpoint == BoardViewpoint.OWNER),
+                show_ships=viewpoint == BoardViewpoint.OWNER,
+                table_testid=table_testid,
+                cell_testid_prefix=cell_testid_prefix,
+            )
+        )
+        _fragment_cache.put(key, html)
+    return Markup(html)
@@ -11,11 +11,16 @@ from game.player import GameRequest, Player, PlayerStatus
 
 from routes.helpers import (
     _create_login_error_response,
+    _etag,
+    _etag_headers,
     _get_game_service,
     _get_lobby_service,
     _get_player_from_session,
     _get_templates,
     _htmx_redirect,
+    _long_poll_idle_response,
+    _not_modified,
+    _on_owner,
     _redirect_or_htmx,
 )
 
@@ -56,15 +61,9 @@ async def select_opponent(
 ) -> HTMLResponse | Response:
     """Handle opponent selection and return updated lobby view"""
     player: Player = _get_player_from_session(request)
-    lobby_service = _get_lobby_service()
 
     try:
-        # Look up opponent ID by name
-        opponent_id: str | None = lobby_service.get_player_id_by_name(opponent_name)
-        if not opponent_id:
-            raise ValueError(f"Opponent '{opponent_name}' not found in lobby")
-
-        lobby_service.send_game_request(player.id, opponent_id)
+        _on_owner(_send_game_request_by_name, player.id, opponent_name)
 
         # Return updated lobby status (same as long poll endpoint)
         return await _render_lobby_status(request, player.id, player.name)
@@ -74,6 +73,21 @@ async def select_opponent(
         return _create_login_error_response(request, str(e))
 
 
+def _send_game_request_by_name(sender_id: str, opponent_name: str) -> None:
+    """Send a game request to the lobby player with the given name.
+
+    Raises:
+        ValueError: If no such player is in the lobby, or either player
+            cannot take part in a game request
+    """
+    lobby_service = _get_lobby_service()
+    # Look up opponent ID by name
+    opponent_id: str | None = lobby_service.get_player_id_by_name(opponent_name)
+    if not opponent_id:
+        raise ValueError(f"Opponent '{opponent_name}' not found in lobby")
+    lobby_service.send_game_request(sender_id, opponent_id)
+
+
 @router.post("/leave-lobby", response_model=None)
 async def leave_lobby(request: Request) -> RedirectResponse | HTMLResponse | Response:
     """Handle player leaving the lobby"""
@@ -105,8 +119,23 @@ async def leave_lobby(request: Request) -> RedirectResponse | HTMLResponse | Res
 async def lobby_status_component(request: Request) -> HTMLResponse | Response:
     """Return partial HTML with polling for status updates and available for current player"""
     player: Player = _get_player_from_session(request)
+    lobby_service = _get_lobby_service()
 
-    return await _render_lobby_status(request, player.id, player.name)
+    # A pending decline notification is shown once, so it is part of the ETag
+    etag: str = _etag(
+        player.id,
+        "lobby",
+        lobby_service.get_lobby_version(),
+        lobby_service.has_decline_notification(player.id),
+    )
+    not_modified: Response | None = _not_modified(request, etag)
+    if not_modified:
+        return not_modified
+
+    response = await _render_lobby_status(request, player.id, player.name)
+    if response.status_code == status.HTTP_200_OK:
+        response.headers.update(_etag_headers(etag))
+    return response
 
 
 @router.get("/lobby/status/long-poll", response_model=None)
@@ -119,7 +148,8 @@ async def lobby_status_long_poll(
     - This is the first call (version is None)
     - The lobby version has changed since the provided version
 
-    Otherwise waits up to `timeout` seconds for a state change.
+    Otherwise waits up to `timeout` seconds for a state change. If nothing
+    changed by then, an empty 204 re-arms the poll without rendering.
     """
     player: Player = _get_player_from_session(request)
     lobby_service = _get_lobby_service()
@@ -150,8 +180,10 @@ async def lobby_status_long_poll(
         # State changed, return new state
         return await _render_lobby_status(request, player.id, player.name)
     except asyncio.TimeoutError:
-        # Timeout reached, return current state
-        return await _render_lobby_status(request, player.id, player.name)
+        # The version may have moved just as the wait expired
+        if lobby_service.get_lobby_version() != version:
+            return await _render_lobby_status(request, player.id, player.name)
+        return _long_poll_idle_response()
 
 
 async def _render_lobby_status(
@@ -159,18 +191,9 @@ async def _render_lobby_status(
 ) -> HTMLResponse | Response:
     """Helper function to render lobby status (shared by both endpoints)"""
     templates = _get_templates()
-    lobby_service = _get_lobby_service()
-
-    # Get current lobby version for long polling
-    lobby_version = lobby_service.get_lobby_version()
 
     # Build template context with all lobby state
-    context = _build_lobby_context(
-        player_id=player_id,
-        player_name=player_name,
-        lobby_version=lobby_version,
-        lobby_service=lobby_service,
-    )
+    context = _on_owner(_lobby_status_context, player_id, player_name)
 
     # Check if we need to redirect (player is IN_GAME)
     redirect_url = context.pop("_redirect_url", None)
@@ -182,6 +205,18 @@ async def _render_lobby_status(
     )
 
 
+def _lobby_status_context(player_id: str, player_name: str) -> dict[str, Any]:
+    """Build the lobby status context from one consistent view of the lobby."""
+    lobby_service = _get_lobby_service()
+    return _build_lobby_context(
+        player_id=player_id,
+        player_name=player_name,
+        # Current lobby version for long polling
+        lobby_version=lobby_service.get_lobby_version(),
+        lobby_service=lobby_service,
+    )
+
+
 def _build_lobby_context(
     player_id: str,
     player_name: str,
@@ -347,17 +382,15 @@ async def decline_game_request(
 ) -> HTMLResponse:
     """Decline a game request and return to lobby"""
     player: Player = _get_player_from_session(request)
-    lobby_service = _get_lobby_service()
     templates = _get_templates()
 
     try:
-        # Decline the game request
-        sender_id: str = lobby_service.decline_game_request(player.id)
-        sender_name: str | None = lobby_service.get_player_name(sender_id)
-
-        # Get updated lobby data
-        lobby_data: list[Player] = lobby_service.get_lobby_players_for_player(player.id)
-        player_status: str = lobby_service.get_player_status(player.id).value
+        sender_name: str | None
+        lobby_data: list[Player]
+        player_status: str
+        sender_name, lobby_data, player_status = _on_owner(
+            _decline_game_request, player.id
+        )
 
         return templates.TemplateResponse(
             request=request,
@@ -376,6 +409,26 @@ async def decline_game_request(
         return _create_login_error_response(request, str(e))
 
 
+def _decline_game_request(player_id: str) -> tuple[str | None, list[Player], str]:
+    """Decline the player's pending game request.
+
+    Returns:
+        The sender's name, then the updated lobby players and player status
+
+    Raises:
+        ValueError: If the player has no pending request
+    """
+    lobby_service = _get_lobby_service()
+    # Decline the game request
+    sender_id: str = lobby_service.decline_game_request(player_id)
+    sender_name: str | None = lobby_service.get_player_name(sender_id)
+
+    # Get updated lobby data
+    lobby_data: list[Player] = lobby_service.get_lobby_players_for_player(player_id)
+    player_status: str = lobby_service.get_player_status(player_id).value
+    return sender_name, lobby_data, player_status
+
+
 @router.post("/accept-game-request", response_model=None)
 async def accept_game_request(
     request: Request,
@@ -383,15 +436,9 @@ async def accept_game_request(
 ) -> Response | RedirectResponse:
     """Accept a game request, create the game, and redirect to ship placement"""
     player: Player = _get_player_from_session(request)
-    lobby_service = _get_lobby_service()
-    game_service = _get_game_service()
 
     try:
-        # Accept the game request - this pairs players in lobby.active_games
-        sender_id, receiver_id = lobby_service.accept_game_request(player.id)
-
-        # Create the game (idempotent - handles concurrent accepts)
-        game_service.create_game_from_accepted_request(sender_id, receiver_id)
+        _on_owner(_accept_game_request, player.id)
 
         # Redirect to ship placement page
         return _redirect_or_htmx(request, "/place-ships", status.HTTP_302_FOUND)
@@ -401,5 +448,18 @@ async def accept_game_request(
         return _create_login_error_response(request, str(e))
 
 
+def _accept_game_request(player_id: str) -> None:
+    """Accept the player's pending game request and create the game.
+
+    Raises:
+        ValueError: If the player has no pending request
+    """
+    # Accept the game request - this pairs players in lobby.active_games
+    sender_id, receiver_id = _get_lobby_service().accept_game_request(player_id)
+
+    # Create the game (idempotent - handles concurrent accepts)
+    _get_game_service().create_game_from_accepted_request(sender_id, receiver_id)
+
+
 # Forward references for type hints (resolved at runtime)
 from routes.helpers import GameService, LobbyService  # noqa: E402
@@ -0,0 +1,126 @@
+"""Operational metrics routes."""
+
+from typing import Any
+
+from fastapi import APIRouter
+
+from game.game_service import GameService
+from routes.helpers import _get_etag_stats, _get_fragment_cache, _on_owner
+from services.computer_opponent import ComputerOpponents
+from services.game_actor import GameActorRegistry
+from services.reaper_service import ReaperService
+from services.shard_router import ShardRouter
+
+router: APIRouter = APIRouter(prefix="/metrics", tags=["metrics"])
+
+# Module-level service references (set during app initialisation)
+# The reaper, game store, actors and computer opponents live in the state owner
+# (see services.state_owner); the shards, ETags and fragments are per process
+_reaper_service: ReaperService | None = None
+_game_service: GameService | None = None
+_shard_router: ShardRouter | None = None
+_game_actors: GameActorRegistry | None = None
+_computer_opponents: ComputerOpponents | None = None
+
+
+def set_up_metrics_router(
+    reaper_service: ReaperService | None,
+    game_service: GameService,
+    shard_router: ShardRouter | None = None,
+    game_actors: GameActorRegistry | None = None,
+    computer_opponents: ComputerOpponents | None = None,
+) -> APIRouter:
+    """Configure the metrics router with required dependencies.
+
+    A worker process holds no reaper, actors or computer opponents, so passes
+    None for them; their metrics are read from the state owner.
+    """
+    global _reaper_service, _game_service, _shard_router, _game_actors
+    global _computer_opponents
+    _reaper_service = reaper_service
+    _game_service = game_service
+    _shard_router = shard_router
+    _game_actors = game_actors
+    _computer_opponents = computer_opponents
+    return router
+
+
+def _get_reaper_service() -> ReaperService:
+    """Get reaper_service, raising if not initialised."""
+    if _reaper_service is None:
+        raise RuntimeError("Router not initialised - call set_up_metrics_router first")
+    return _reaper_service
+
+
+def _get_game_service() -> GameService:
+    """Get game_service, raising if not initialised."""
+    if _game_service is None:
+        raise RuntimeError("Router not initialised - call set_up_metrics_router first")
+    return _game_service
+
+
+@router.get("/reaper")
+async def reaper_metrics() -> dict[str, Any]:
+    """Counts of idle state reclaimed by the background reaper."""
+    return _on_owner(_reaper_stats)
+
+
+def _reaper_stats() -> dict[str, Any]:
+    return _get_reaper_service().get_stats()
+
+
+@router.get("/game-store")
+async def game_store_metrics() -> dict[str, Any]:
+    """Resident game count and spill/reload latency for hot/cold tiering."""
+    return _on_owner(_game_store_stats)
+
+
+def _game_store_stats() -> dict[str, Any]:
+    game_store = _get_game_service().game_store
+    if game_store is None:
+        return {"enabled": False}
+    return {"enabled": True, **game_store.get_stats()}
+
+
+@router.get("/shards")
+async def shard_metrics() -> dict[str, Any]:
+    """Number of game shards and how much work has been routed to each."""
+    if _shard_router is None:
+        return {"shard_count": 0}
+    return _shard_router.get_stats()
+
+
+@router.get("/game-actors")
+async def game_actor_metrics() -> dict[str, Any]:
+    """Live game actors and the commands queued in their mailboxes."""
+    return _on_owner(_game_actor_stats)
+
+
+def _game_actor_stats() -> dict[str, Any]:
+    if _game_actors is None:
+        return {"actors": 0, "queued_commands": 0}
+    return _game_actors.get_stats()
+
+
+@router.get("/etags")
+async def etag_metrics() -> dict[str, Any]:
+    """Conditional GET hit rate for the page and fragment ETags."""
+    return _get_etag_stats()
+
+
+@router.get("/board-fragments")
+async def board_fragment_metrics() -> dict[str, Any]:
+    """Size and hit rate of the rendered board fragment cache."""
+    return _get_fragment_cache().get_stats()
+
+
+@router.get("/computer-salvos")
+async def computer_salvo_metrics() -> dict[str, Any]:
+    """How often the computer's salvo was ready (speculated) when the human fired."""
+    return _on_owner(_computer_salvo_stats)
+
+
+def _computer_salvo_stats() -> dict[str, Any]:
+    if _computer_opponents is None:
+        return {"games": 0, "speculated": 0, "fallbacks": 0}
+    return _computer_opponents.get_stats()
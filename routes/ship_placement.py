@@ -1,13 +1,16 @@
 """Ship placement routes."""
 
 import asyncio
-from typing import Any
+from collections.abc import Callable
+from typing import Any, NamedTuple
 
 from fastapi import APIRouter, Form, HTTPException, Request, status
-from fastapi.responses import HTMLResponse, RedirectResponse, Response
+from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse, Response
 from fastapi.templating import Jinja2Templates
 
-from game.game_service import GameService, PlayerAlreadyInGameException
+from game.exceptions import FleetLayoutError
+from game.fleet_layout import ShipPlacement, parse_share_code, to_share_code
+from game.game_service import Game, GameService
 from game.model import (
     Coord,
     GameBoard,
@@ -18,63 +21,102 @@ from game.model import (
     ShipPlacementTooCloseError,
     ShipType,
 )
+from game.fleet_solver import can_complete, remaining_ship_types
+from game.placement_masks import legal_starts
 from game.player import Player, PlayerStatus
+from services.game_actor import GameCommand
 from services.lobby_service import LobbyService
 
 from routes.helpers import (
+    BoardViewpoint,
+    _etag,
+    _etag_headers,
     _get_game_service,
     _get_lobby_service,
     _get_player_from_session,
     _get_player_id,
+    _get_shard_router,
     _get_templates,
     _get_validated_player_name,
     _htmx_redirect,
-    _is_multiplayer,
+    _long_poll_idle_response,
+    _not_modified,
+    _on_owner,
+    _on_shard,
     _redirect_or_htmx,
+    _render_board_grid,
+    _submit_command,
 )
 
 router: APIRouter = APIRouter(prefix="", tags=["ship_placement"])
 
+FLEET_DOES_NOT_FIT_MESSAGE: str = (
+    "The remaining ships no longer fit - move or remove a ship"
+)
 
-def _render_ship_placement_page(
-    request: Request,
+
+class PlacementState(NamedTuple):
+    """A player's placement board and everything shown alongside it."""
+
+    board: GameBoard
+    is_ready: bool
+    is_multiplayer: bool
+    can_undo: bool
+    can_redo: bool
+
+
+def _placement_state(player_id: str) -> PlacementState:
+    """Read the player's placement state in one go."""
+    game_service = _get_game_service()
+
+    # Get board state
+    try:
+        board: GameBoard = game_service.get_or_create_ship_placement_board(player_id)
+    except Exception:
+        # Fallback to empty board for error display
+        board = GameBoard(game_service.rules)
+
+    history = game_service.get_placement_history(player_id)
+    return PlacementState(
+        board,
+        game_service.is_player_ready(player_id),
+        game_service.is_multiplayer(player_id),
+        history.can_undo,
+        history.can_redo,
+    )
+
+
+def _ship_placement_context(
     player_name: str,
     player_id: str,
     placement_error: str | None = None,
     status_message: str | None = None,
-    http_status_code: int = 200,
-) -> HTMLResponse:
-    """Render the ship placement page with current board state.
+    state: PlacementState | None = None,
+) -> dict[str, Any]:
+    """Build the template context shared by the placement page and its fragments.
 
     Args:
-        request: The FastAPI request object
         player_name: The player's display name
         player_id: The player's ID
         placement_error: Optional error message to display
         status_message: Optional status message (auto-generated if None)
-        http_status_code: HTTP status code for the response
+        state: The player's placement state (read now if None)
 
     Returns:
-        HTMLResponse with the rendered ship placement page
+        Dictionary with the current board state for the placement templates
     """
-    templates = _get_templates()
-    game_service = _get_game_service()
-
-    # Get board state
-    try:
-        board: GameBoard = game_service.get_or_create_ship_placement_board(player_id)
-    except Exception:
-        # Fallback to empty board for error display
-        board = GameBoard()
-
+    if state is None:
+        state = _on_owner(_placement_state, player_id)
+    board: GameBoard = state.board
     placed_ships = board.get_placed_ships_for_display()
-    is_ready = game_service.is_player_ready(player_id)
-    is_multiplayer_game = _is_multiplayer(player_id)
+    is_ready = state.is_ready
 
     # Auto-generate status message if not provided
     if status_message is None:
         if is_ready:
             status_message = "Waiting for opponent to finish placing ships..."
+        elif len(placed_ships) < 5 and not can_complete(board):
+            status_message = FLEET_DOES_NOT_FIT_MESSAGE
         elif len(placed_ships) < 5:
             status_message = "Place all ships to continue"
         else:
@@ -83,22 +125,152 @@ def _render_ship_placement_page(
     context: dict[str, Any] = {
         "player_name": player_name,
         "placed_ships": placed_ships,
+        "grid": _render_board_grid(
+            board, BoardViewpoint.OWNER, "ship-grid", "grid-cell-"
+        ),
         "is_ready": is_ready,
-        "is_multiplayer": is_multiplayer_game,
+        "can_undo": state.can_undo,
+        "can_redo": state.can_redo,
+        "is_multiplayer": state.is_multiplayer,
         "status_message": status_message,
     }
 
     if placement_error:
         context["placement_error"] = placement_error
 
-    return templates.TemplateResponse(
+    return context
+
+
+def _render_ship_placement_page(
+    request: Request,
+    player_name: str,
+    player_id: str,
+    placement_error: str | None = None,
+    status_message: str | None = None,
+    http_status_code: int = 200,
+) -> HTMLResponse:
+    """Render the ship placement page with current board state.
+
+    Args:
+        request: The FastAPI request object
+        player_name: The player's display name
+        player_id: The player's ID
+        placement_error: Optional error message to display
+        status_message: Optional status message (auto-generated if None)
+        http_status_code: HTTP status code for the response
+
+    Returns:
+        HTMLResponse with the rendered ship placement page
+    """
+    return _get_templates().TemplateResponse(
         request,
         "ship_placement.html",
-        context,
+        _ship_placement_context(
+            player_name, player_id, placement_error, status_message
+        ),
         status_code=http_status_code,
     )
 
 
+class PlacementChange(NamedTuple):
+    """What a single-ship placement action changed on the board."""
+
+    coords: list[Coord]
+    added_ship: str | None = None
+    removed_ship: str | None = None
+
+
+class PlacementOutcome(NamedTuple):
+    """What a placement command did, for rendering once it has finished."""
+
+    placement_error: str | None = None
+    change: PlacementChange | None = None  # None if the whole board changed
+
+
+def _render_placement_update(
+    request: Request,
+    player_name: str,
+    player_id: str,
+    placement_error: str | None = None,
+    change: PlacementChange | None = None,
+) -> HTMLResponse:
+    """Render the result of a placement action.
+
+    HTMX requests get only the parts of the page that the action changed, as
+    out-of-band swaps; anything else gets the full page.
+
+    Args:
+        request: The FastAPI request object
+        player_name: The player's display name
+        player_id: The player's ID
+        placement_error: Optional error message to display
+        change: The cells and ship row changed (None if the whole board changed)
+
+    Returns:
+        HTMLResponse with the changed fragments or the full page
+    """
+    if not request.headers.get("HX-Request"):
+        return _render_ship_placement_page(
+            request, player_name, player_id, placement_error=placement_error
+        )
+
+    state: PlacementState = _on_owner(_placement_state, player_id)
+    context: dict[str, Any] = _ship_placement_context(
+        player_name, player_id, placement_error, state=state
+    )
+    context["changed_cells"] = None
+    if change is not None:
+        grid = state.board.display_grid()
+        context["changed_cells"] = [
+            grid[coord.value.row_index - 1].cells[coord.value.col_index - 1]
+            for coord in change.coords
+        ]
+        context["added_ship"] = change.added_ship
+        context["removed_ship"] = change.removed_ship
+    return _get_templates().TemplateResponse(
+        request, "components/ship_placement_oob.html", context
+    )
+
+
+async def _place_and_render(
+    request: Request,
+    player_name: str,
+    player_id: str,
+    operation: Callable[..., PlacementOutcome],
+    *args: Any,
+) -> HTMLResponse:
+    """Run a placement command on the player's game actor, then render it.
+
+    Args:
+        request: The FastAPI request object
+        player_name: The player's display name
+        player_id: The player's ID
+        operation: Changes the board, given the player ID and `args`
+        *args: Further arguments for `operation`
+
+    Returns:
+        HTMLResponse with the changed fragments or the full page
+    """
+    outcome: PlacementOutcome = await _submit_command(
+        player_id,
+        GameCommand.PLACE,
+        _on_shard,
+        player_id,
+        operation,
+        player_id,
+        *args,
+    )
+    return await _get_shard_router().run(
+        player_id,
+        _render_placement_update,
+        request,
+        player_name,
+        player_id,
+        outcome.placement_error,
+        outcome.change,
+    )
+
+
 def set_up_ship_placement_router(
     templates: Jinja2Templates,
     game_service: GameService,
@@ -108,11 +280,103 @@ def set_up_ship_placement_router(
     return router
 
 
-@router.get("/place-ships", response_class=HTMLResponse)
-async def ship_placement_page(request: Request) -> HTMLResponse:
+@router.get("/place-ships", response_model=None)
+async def ship_placement_page(request: Request) -> HTMLResponse | Response:
     """Display the ship placement page"""
     player: Player = _get_player_from_session(request)
-    return _render_ship_placement_page(request, player.name, player.id)
+    game_service = _get_game_service()
+
+    # The uid matters as well as the version: a replaced board starts again
+    # from version 0, so the version alone could repeat
+    board: GameBoard = game_service.get_or_create_ship_placement_board(player.id)
+    etag: str = _etag(
+        player.id,
+        "place",
+        game_service.get_placement_version(),
+        board.uid,
+        board.version,
+    )
+    not_modified: Response | None = _not_modified(request, etag)
+    if not_modified:
+        return not_modified
+
+    response = _render_ship_placement_page(request, player.name, player.id)
+    response.headers.update(_etag_headers(etag))
+    return response
+
+
+def _find_placement_board(player_id: str) -> GameBoard | None:
+    """Return the board the player is placing ships on, if there is one yet.
+
+    Unlike get_or_create_ship_placement_board this never creates a board.
+    """
+    game_service = _get_game_service()
+    board: GameBoard | None = game_service.ship_placement_boards.get(player_id)
+    game: Game | None = game_service.get_game_for_player(player_id)
+    if board is None and game is not None:
+        player: Player | None = game_service.get_player(player_id)
+        board = game.board.get(player) if player else None
+    return board
+
+
+@router.get("/place-ships/legal-starts")
+async def legal_start_cells(
+    request: Request, ship_name: str, orientation: str
+) -> dict[str, Any]:
+    """List the cells where a ship can start on the player's current board.
+
+    Args:
+        request: The FastAPI request object
+        ship_name: Display name of the ship (e.g. "Carrier")
+        orientation: Orientation value (e.g. "horizontal", "diagonal-up")
+
+    Returns:
+        The ship, orientation and legal start cells in board order
+
+    Raises:
+        HTTPException: 400 if the ship name or orientation is invalid
+    """
+    player: Player = _get_player_from_session(request)
+    try:
+        ship_type: ShipType = ShipType.from_ship_name(ship_name)
+        orient: Orientation = Orientation[orientation.upper().replace("-", "_")]
+    except (ValueError, KeyError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid ship name or orientation",
+        )
+
+    board: GameBoard = _on_owner(_find_placement_board, player.id) or GameBoard(
+        _get_game_service().rules
+    )
+    return {
+        "ship_name": ship_type.ship_name,
+        "orientation": orient.value,
+        "board_version": board.version,
+        "cells": [coord.name for coord in legal_starts(board, ship_type, orient)],
+    }
+
+
+@router.get("/place-ships/feasibility")
+async def fleet_feasibility(request: Request) -> dict[str, Any]:
+    """Say whether the ships not yet placed still fit around those placed.
+
+    Args:
+        request: The FastAPI request object
+
+    Returns:
+        The board version, whether the fleet can be completed and the names of
+        the ships still to place (longest first)
+    """
+    player: Player = _get_player_from_session(request)
+    board: GameBoard = _on_owner(_find_placement_board, player.id) or GameBoard(
+        _get_game_service().rules
+    )
+    return {
+        "board_version": board.version,
+        "feasible": can_complete(board),
+        "remaining": [ship_type.ship_name for ship_type in remaining_ship_types(board)],
+    }
 
 
 @router.post("/place-ship", response_class=HTMLResponse)
@@ -124,12 +388,27 @@ async def place_ship(
     orientation: str = Form(),
 ) -> HTMLResponse:
     """Handle ship placement on the board"""
-    game_service = _get_game_service()
-
     # Validate player owns this session
     _get_validated_player_name(request, player_name)
     player_id: str = _get_player_id(request)
 
+    return await _place_and_render(
+        request,
+        player_name,
+        player_id,
+        _place_ship,
+        ship_name,
+        start_coordinate,
+        orientation,
+    )
+
+
+def _place_ship(
+    player_id: str, ship_name: str, start_coordinate: str, orientation: str
+) -> PlacementOutcome:
+    """Place a ship (runs on the player's shard)."""
+    game_service = _get_game_service()
+
     try:
         # Create the ship based on type name
         ship_type: ShipType = ShipType.from_ship_name(ship_name)
@@ -140,9 +419,9 @@ async def place_ship(
         # Replace hyphens with underscores for enum member lookup
         orient: Orientation = Orientation[orientation.upper().replace("-", "_")]
 
-        # Get or create board for ship placement and place ship
-        board: GameBoard = game_service.get_or_create_ship_placement_board(player_id)
-        board.place_ship(ship, start, orient)
+        # Place the ship on the placement board as one undoable step
+        with game_service.placement_step(player_id) as board:
+            board.place_ship(ship, start, orient)
 
     except (
         ShipAlreadyPlacedError,
@@ -150,18 +429,16 @@ async def place_ship(
         ShipPlacementTooCloseError,
     ) as e:
         # Return page with user-friendly error message
-        return _render_ship_placement_page(
-            request, player_name, player_id, placement_error=e.user_message
-        )
+        return PlacementOutcome(placement_error=e.user_message)
 
     except (ValueError, KeyError):
         # Handle invalid direction/orientation
-        return _render_ship_placement_page(
-            request, player_name, player_id, placement_error="Invalid direction"
-        )
+        return PlacementOutcome(placement_error="Invalid direction")
 
     # Success - return page with updated board
-    return _render_ship_placement_page(request, player_name, player_id)
+    return PlacementOutcome(
+        change=PlacementChange(ship.positions, added_ship=ship.ship_type.ship_name)
+    )
 
 
 @router.post("/remove-ship", response_class=HTMLResponse)
@@ -171,23 +448,133 @@ async def remove_ship(
     ship_name: str = Form(),
 ) -> HTMLResponse:
     """Remove a placed ship from the board"""
-    game_service = _get_game_service()
-
     # Validate player owns this session
     _get_validated_player_name(request, player_name)
     player_id: str = _get_player_id(request)
 
+    return await _place_and_render(
+        request, player_name, player_id, _remove_ship, ship_name
+    )
+
+
+def _remove_ship(player_id: str, ship_name: str) -> PlacementOutcome:
+    """Remove a ship (runs on the player's shard)."""
+    game_service = _get_game_service()
+    change: PlacementChange = PlacementChange([])
+
     # Only remove ship if player is not ready
     if not game_service.is_player_ready(player_id):
-        board: GameBoard = game_service.get_or_create_ship_placement_board(player_id)
         try:
             ship_type: ShipType = ShipType.from_ship_name(ship_name)
-            board.remove_ship(ship_type)
+            with game_service.placement_step(player_id) as board:
+                ship: Ship | None = next(
+                    (ship for ship in board.ships if ship.ship_type == ship_type),
+                    None,
+                )
+                if ship and board.remove_ship(ship_type):
+                    change = PlacementChange(ship.positions, removed_ship=ship_name)
         except ValueError:
             # Invalid ship name - just ignore and return current state
             pass
 
-    return _render_ship_placement_page(request, player_name, player_id)
+    return PlacementOutcome(change=change)
+
+
+@router.post("/place-fleet", response_model=None)
+async def place_fleet(
+    request: Request,
+    player_name: str = Form(),
+    share_code: str = Form(""),
+    ship_name: list[str] = Form([]),
+    start_coordinate: list[str] = Form([]),
+    orientation: list[str] = Form([]),
+) -> JSONResponse:
+    """Place a whole fleet in one request, replacing any ships already placed.
+
+    The fleet is given either as a share code (e.g. "AA1H.BC1H.CE1V.SE5D.DJ9H")
+    or as five repeated ship_name/start_coordinate/orientation fields. It is
+    validated in one pass and either placed entirely or not at all.
+
+    Returns:
+        JSON with the board's share code and version, or every violation
+        (422) if the fleet breaks any placement rule
+    """
+    _get_validated_player_name(request, player_name)
+    player_id: str = _get_player_id(request)
+
+    try:
+        placements: list[ShipPlacement] = (
+            parse_share_code(share_code)
+            if share_code
+            else _parse_fleet_fields(ship_name, start_coordinate, orientation)
+        )
+        board: GameBoard | None = await _submit_command(
+            player_id,
+            GameCommand.PLACE,
+            _on_shard,
+            player_id,
+            _place_fleet,
+            player_id,
+            placements,
+        )
+    except FleetLayoutError as e:
+        return JSONResponse(
+            {"violations": e.violations},
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        )
+    if board is None:
+        return JSONResponse(
+            {"violations": ["Ships cannot be changed once ready"]},
+            status_code=status.HTTP_409_CONFLICT,
+        )
+    return JSONResponse(
+        {"share_code": to_share_code(board), "board_version": board.version}
+    )
+
+
+def _parse_fleet_fields(
+    ship_names: list[str], start_coordinates: list[str], orientations: list[str]
+) -> list[ShipPlacement]:
+    """Build placements from parallel form field lists.
+
+    Raises:
+        FleetLayoutError: Listing every entry that could not be parsed
+    """
+    if not len(ship_names) == len(start_coordinates) == len(orientations):
+        raise FleetLayoutError(
+            ["ship_name, start_coordinate and orientation must be given together"]
+        )
+    placements: list[ShipPlacement] = []
+    violations: list[str] = []
+    for name, start, orient in zip(ship_names, start_coordinates, orientations):
+        try:
+            placements.append(
+                ShipPlacement(
+                    ShipType.from_ship_name(name),
+                    Coord[start.upper()],
+                    Orientation[orient.upper().replace("-", "_")],
+                )
+            )
+        except (ValueError, KeyError):
+            violations.append(f"Invalid placement: {name} {start} {orient}")
+    if violations:
+        raise FleetLayoutError(violations)
+    return placements
+
+
+def _place_fleet(player_id: str, placements: list[ShipPlacement]) -> GameBoard | None:
+    """Place the fleet and return the board (runs on the player's shard).
+
+    Returns None without placing anything if the player is already ready. The
+    check runs here, behind the game's actor, so a READY queued ahead of this
+    PLACE is always seen.
+    """
+    game_service = _get_game_service()
+    if game_service.is_player_ready(player_id):
+        return None
+    with game_service.placement_step(player_id) as board:
+        game_service.place_fleet(player_id, placements)
+    return board
 
 
 @router.post("/random-ship-placement", response_class=HTMLResponse)
@@ -196,17 +583,50 @@ async def random_ship_placement(
     player_name: str = Form(),
 ) -> HTMLResponse:
     """Place all ships randomly on the board"""
+    # Validate player owns this session
+    _get_validated_player_name(request, player_name)
+    player_id: str = _get_player_id(request)
+
+    return await _place_and_render(request, player_name, player_id, _place_randomly)
+
+
+def _place_randomly(player_id: str) -> PlacementOutcome:
+    """Place all ships randomly (runs on the player's shard)."""
     game_service = _get_game_service()
 
+    # Only place ships randomly if player is not ready
+    if not game_service.is_player_ready(player_id):
+        with game_service.placement_step(player_id):
+            game_service.place_ships_randomly(player_id)
+
+    return PlacementOutcome()
+
+
+@router.post("/auto-complete-ships", response_class=HTMLResponse)
+async def auto_complete_ships(
+    request: Request,
+    player_name: str = Form(),
+) -> HTMLResponse:
+    """Place the remaining ships, keeping the ones already placed"""
     # Validate player owns this session
     _get_validated_player_name(request, player_name)
     player_id: str = _get_player_id(request)
 
-    # Only place ships randomly if player is not ready
+    return await _place_and_render(request, player_name, player_id, _auto_complete)
+
+
+def _auto_complete(player_id: str) -> PlacementOutcome:
+    """Fill in the remaining ships (runs on the player's shard)."""
+    game_service = _get_game_service()
+
+    # Only fill in ships if player is not ready
     if not game_service.is_player_ready(player_id):
-        game_service.place_ships_randomly(player_id)
+        with game_service.placement_step(player_id):
+            completed: bool = game_service.auto_complete_fleet(player_id)
+        if not completed:
+            return PlacementOutcome(placement_error=FLEET_DOES_NOT_FIT_MESSAGE)
 
-    return _render_ship_placement_page(request, player_name, player_id)
+    return PlacementOutcome()
 
 
 @router.post("/reset-all-ships", response_class=HTMLResponse)
@@ -215,18 +635,64 @@ async def reset_all_ships(
     player_name: str = Form(),
 ) -> HTMLResponse:
     """Reset all placed ships (clear the board)"""
+    # Validate player owns this session
+    _get_validated_player_name(request, player_name)
+    player_id: str = _get_player_id(request)
+
+    return await _place_and_render(request, player_name, player_id, _reset_ships)
+
+
+def _reset_ships(player_id: str) -> PlacementOutcome:
+    """Clear all ships (runs on the player's shard)."""
     game_service = _get_game_service()
 
+    # Only clear ships if player is not ready
+    if not game_service.is_player_ready(player_id):
+        with game_service.placement_step(player_id) as board:
+            board.clear_all_ships()
+
+    return PlacementOutcome()
+
+
+@router.post("/undo-placement", response_class=HTMLResponse)
+async def undo_placement(
+    request: Request,
+    player_name: str = Form(),
+) -> HTMLResponse:
+    """Undo the last placement action"""
     # Validate player owns this session
     _get_validated_player_name(request, player_name)
     player_id: str = _get_player_id(request)
 
-    # Only clear ships if player is not ready
+    return await _place_and_render(
+        request, player_name, player_id, _step_history, False
+    )
+
+
+@router.post("/redo-placement", response_class=HTMLResponse)
+async def redo_placement(
+    request: Request,
+    player_name: str = Form(),
+) -> HTMLResponse:
+    """Redo the last undone placement action"""
+    # Validate player owns this session
+    _get_validated_player_name(request, player_name)
+    player_id: str = _get_player_id(request)
+
+    return await _place_and_render(request, player_name, player_id, _step_history, True)
+
+
+def _step_history(player_id: str, redo: bool) -> PlacementOutcome:
+    """Undo (or redo) a placement step (runs on the player's shard)."""
+    game_service = _get_game_service()
+    # Only move through the history if player is not ready
     if not game_service.is_player_ready(player_id):
-        board: GameBoard = game_service.get_or_create_ship_placement_board(player_id)
-        board.clear_all_ships()
+        if redo:
+            game_service.redo_placement(player_id)
+        else:
+            game_service.undo_placement(player_id)
 
-    return _render_ship_placement_page(request, player_name, player_id)
+    return PlacementOutcome()
 
 
 @router.post("/ready-for-game", response_model=None)
@@ -237,28 +703,18 @@ async def ready_for_game(
     """Handle player ready state."""
     templates = _get_templates()
     game_service = _get_game_service()
-    lobby_service = _get_lobby_service()
 
     # Validate player
     _get_validated_player_name(request, player_name)
     player_id = _get_player_id(request)
 
-    # Mark player as ready
-    game_service.set_player_ready(player_id)
-
-    # Check if in multiplayer (has opponent in lobby)
-    opponent_id: str | None = lobby_service.get_opponent(player_id)
-
-    if opponent_id:
-        # Check if opponent is ready
-        if game_service.is_player_ready(opponent_id):
-            # Both ready! Create game.
-            game_id = _create_game_for_ready_players(
-                player_id, opponent_id, game_service, lobby_service
-            )
-
-            # Return redirect to game
-            return _redirect_or_htmx(request, f"/game/{game_id}")
+    # Mark ready via the game's actor so both players' ready commands are ordered
+    game_id: str | None = await _submit_command(
+        player_id, GameCommand.READY, _mark_player_ready, player_id
+    )
+    if game_id:
+        # Both ready - redirect to game
+        return _redirect_or_htmx(request, f"/game/{game_id}")
 
     # Single player or waiting for opponent - show placement page with ready state
     return _render_placement_page_waiting(
@@ -266,6 +722,28 @@ async def ready_for_game(
     )
 
 
+def _mark_player_ready(player_id: str) -> str | None:
+    """Mark a player ready and start the game if their opponent is ready too.
+
+    Args:
+        player_id: The player who is ready
+
+    Returns:
+        The game ID if both players are now ready, otherwise None
+    """
+    game_service = _get_game_service()
+    lobby_service = _get_lobby_service()
+    game_service.set_player_ready(player_id)
+
+    # Check if in multiplayer (has opponent in lobby)
+    opponent_id: str | None = lobby_service.get_opponent(player_id)
+    if opponent_id and game_service.is_player_ready(opponent_id):
+        return _create_game_for_ready_players(
+            player_id, opponent_id, game_service, lobby_service
+        )
+    return None
+
+
 def _create_game_for_ready_players(
     player_id: str,
     opponent_id: str,
@@ -295,13 +773,13 @@ def _create_game_for_ready_players(
 
     # Game should already exist from accept-game-request
     # Just transfer the ship placement board to the game
-    if player_id not in game_service.games_by_player:
+    game: Game | None = game_service.get_game_for_player(player_id)
+    if game is None:
         raise HTTPException(
             status_code=500,
             detail="Game not found - should have been created when request was accepted",
         )
 
-    game = game_service.games_by_player[player_id]
     game_id = game.id
 
     # Transfer ship placement board to game (only for the player who just became ready)
@@ -377,16 +855,19 @@ def _check_game_redirect_url(request: Request, player_id: str) -> str | None:
     Returns:
         Redirect URL if game has started, None otherwise
     """
-    from game.model import GameStatus
-
-    game_service = _get_game_service()
     player = _get_player_from_session(request)
+    game_id: str | None = _on_owner(_started_game_id, player.id)
+    return f"/game/{game_id}" if game_id else None
 
-    if player.id in game_service.games_by_player:
-        game = game_service.games_by_player[player.id]
-        # Only redirect if game has actually started
-        if game.status == GameStatus.PLAYING:
-            return f"/game/{game.id}"
+
+def _started_game_id(player_id: str) -> str | None:
+    """Return the ID of the player's game if it has started (is PLAYING)."""
+    from game.model import GameStatus
+
+    game: Game | None = _get_game_service().get_game_for_player(player_id)
+    # Only redirect if game has actually started
+    if game is not None and game.status == GameStatus.PLAYING:
+        return game.id
     return None
 
 
@@ -437,7 +918,7 @@ def _render_opponent_status(
         return _htmx_redirect(redirect_url)
 
     # Fetch opponent status
-    opponent_status = _fetch_opponent_status(opponent_id)
+    opponent_status = _on_owner(_fetch_opponent_status, opponent_id)
 
     return templates.TemplateResponse(
         request=request,
@@ -454,22 +935,28 @@ def _render_opponent_status(
 async def leave_placement(request: Request) -> RedirectResponse:
     """Handle leaving ship placement (e.g. when opponent disconnects)"""
     player = _get_player_from_session(request)
-    lobby_service = _get_lobby_service()
-    game_service = _get_game_service()
 
     # Reset player status to AVAILABLE
     try:
-        lobby_service.update_player_status(player.id, PlayerStatus.AVAILABLE)
-
-        # Notify placement change so opponent's long-poll detects the status change
-        game_service.notify_placement_change()
-
+        _on_owner(_leave_placement, player.id)
     except ValueError:
         pass
 
     return RedirectResponse(url="/lobby", status_code=status.HTTP_303_SEE_OTHER)
 
 
+def _leave_placement(player_id: str) -> None:
+    """Make the player available again and wake their opponent's long-poll.
+
+    Raises:
+        ValueError: If the player is not in the lobby
+    """
+    _get_lobby_service().update_player_status(player_id, PlayerStatus.AVAILABLE)
+
+    # Notify placement change so opponent's long-poll detects the status change
+    _get_game_service().notify_placement_change()
+
+
 @router.get("/place-ships/opponent-status", response_model=None)
 async def ship_placement_opponent_status(
     request: Request,
@@ -480,8 +967,32 @@ async def ship_placement_opponent_status(
     Used for HTMX partial updates during multiplayer ship placement.
     """
     player: Player = _get_player_from_session(request)
-    opponent_id: str = _get_opponent_id_or_404(player.id)
-    return _render_opponent_status(request, opponent_id)
+    opponent_id: str = _on_owner(_get_opponent_id_or_404, player.id)
+    etag: str = _etag(
+        player.id,
+        "opponent-status",
+        opponent_id,
+        *_on_owner(_opponent_status_versions, player.id),
+    )
+    not_modified: Response | None = _not_modified(request, etag)
+    if not_modified:
+        return not_modified
+
+    response = _render_opponent_status(request, opponent_id)
+    if response.status_code == status.HTTP_200_OK:
+        response.headers.update(_etag_headers(etag))
+    return response
+
+
+def _opponent_status_versions(player_id: str) -> tuple[int, int, int | None]:
+    """The placement, lobby and game versions the opponent status depends on."""
+    game_service = _get_game_service()
+    game: Game | None = game_service.get_game_for_player(player_id)
+    return (
+        game_service.get_placement_version(),
+        _get_lobby_service().get_lobby_version(),
+        game.version if game else None,
+    )
 
 
 @router.get("/place-ships/opponent-status/long-poll", response_model=None)
@@ -491,10 +1002,11 @@ async def ship_placement_opponent_status_long_poll(
     """Long polling endpoint for opponent status updates.
 
     Returns immediately if version is None or has changed.
-    Otherwise waits up to `timeout` seconds for a state change.
+    Otherwise waits up to `timeout` seconds for a state change, answering an
+    empty 204 that re-arms the poll if nothing changed.
     """
     player: Player = _get_player_from_session(request)
-    opponent_id: str = _get_opponent_id_or_404(player.id)
+    opponent_id: str = _on_owner(_get_opponent_id_or_404, player.id)
     game_service = _get_game_service()
 
     current_version: int = game_service.get_placement_version()
@@ -509,7 +1021,9 @@ async def ship_placement_opponent_status_long_poll(
             game_service.wait_for_placement_change(version), timeout=timeout
         )
     except asyncio.TimeoutError:
-        pass  # Timeout is fine, just return current state
+        # The version may have moved just as the wait expired
+        if game_service.get_placement_version() == version:
+            return _long_poll_idle_response()
 
     return _render_opponent_status(request, opponent_id)
 
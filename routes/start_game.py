@@ -7,12 +7,16 @@ from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.templating import Jinja2Templates
 
 from game.player import Player, PlayerStatus
+from services.game_actor import GameCommand
 
 from routes.helpers import (
+    _get_computer_opponents,
     _get_game_service,
     _get_lobby_service,
     _get_player_from_session,
     _get_templates,
+    _on_owner,
+    _submit_command,
 )
 
 router: APIRouter = APIRouter(prefix="", tags=["start_game"])
@@ -122,13 +126,12 @@ def _get_redirect_url_for_action(
     Raises:
         HTTPException: 400 if action is somehow invalid (shouldn't happen)
     """
-    game_service = _get_game_service()
     action: str = validated_action.action
 
     if action == "start_game":
         return "/place-ships"
     elif action == "launch_game":
-        game_id: str = game_service.start_single_player_game(player_id)
+        game_id: str = _on_owner(_launch_single_player_game, player_id)
         return f"/game/{game_id}"
     elif action == "abandon_game":
         return "/login"
@@ -140,6 +143,19 @@ def _get_redirect_url_for_action(
         )
 
 
+def _launch_single_player_game(player_id: str) -> str:
+    """Start a game against the computer and return its ID."""
+    game_id: str = _get_game_service().start_single_player_game(player_id)
+    # Work out the computer's first salvo while the player takes aim
+    _get_computer_opponents().prepare(game_id)
+    return game_id
+
+
+def _abandon_game(player_id: str) -> None:
+    """Abandon the player's game (run by its actor)."""
+    _get_game_service().abandon_game_by_player_id(player_id)
+
+
 def _create_start_game_template_context(
     player: Player, opponent_name: str, game_mode: str
 ) -> dict[str, Any]:
@@ -226,6 +242,11 @@ async def start_game_submit(
 
     # Validate and process the action
     validated_action: ValidatedAction = _validate_action(action)
+    if (
+        validated_action.action == "abandon_game"
+        and _get_game_service().get_game_for_player(player.id) is not None
+    ):
+        await _submit_command(player.id, GameCommand.ABANDON, _abandon_game, player.id)
     redirect_url: str = _get_redirect_url_for_action(validated_action, player.id)
 
     return RedirectResponse(url=redirect_url, status_code=status.HTTP_303_SEE_OTHER)
@@ -4,13 +4,13 @@ These endpoints bypass normal authentication and are only meant for testing purp
 They should only be included when TESTING environment variable is set.
 """
 
-import asyncio
-
 from fastapi import APIRouter, Form, HTTPException
 
 from game.game_service import GameService
 from game.lobby import Lobby
+from game.locks import ThreadSafeEvent
 from game.player import Player, PlayerStatus
+from routes.helpers import _on_owner
 from services.lobby_service import LobbyService
 
 router = APIRouter(prefix="/test", tags=["testing"])
@@ -22,14 +22,17 @@ _lobby_service: LobbyService | None = None
 
 
 def set_up_testing_router(
-    lobby: Lobby,
+    lobby: Lobby | None,
     game_service: GameService,
     lobby_service: LobbyService,
 ) -> APIRouter:
     """Configure the testing router with required dependencies.
 
+    The endpoints run in the state owner (see services.state_owner), so a
+    worker process, which holds no Lobby, passes None for it.
+
     Args:
-        lobby: The global Lobby instance
+        lobby: The global Lobby instance (None in a worker process)
         game_service: The GameService instance
         lobby_service: The LobbyService instance
 
@@ -64,23 +67,49 @@ def _get_lobby_service() -> LobbyService:
 @router.post("/reset-lobby")
 async def reset_lobby_for_testing() -> dict[str, str]:
     """Reset lobby and game state - for testing only."""
+    return _on_owner(_reset_lobby)
+
+
+def _reset_lobby() -> dict[str, str]:
     lobby = _get_lobby()
     game_service = _get_game_service()
 
+    # Mark every row about to be cleared so a durable repository drops it too
+    repository = game_service.repository
+    for collection in (
+        "lobby_players",
+        "game_requests",
+        "active_games",
+        "decline_notifications",
+        "games",
+        "games_by_player",
+        "ship_placement_boards",
+        "ready_players",
+    ):
+        repository.mark_dirty(collection, *getattr(repository, collection))
+
     # Reset lobby state
     lobby.players.clear()
     lobby.game_requests.clear()
     lobby.active_games.clear()
+    lobby.decline_notifications.clear()
     lobby.version = 0
-    lobby.change_event = asyncio.Event()
 
     # Reset game service state
     game_service.games.clear()
     game_service.games_by_player.clear()
     game_service.ship_placement_boards.clear()
     game_service.ready_players.clear()
+    game_service.game_last_activity.clear()
     game_service._placement_version = 0
-    game_service._placement_change_event = asyncio.Event()
+
+    # Fresh events, as each test client runs its own event loop, but wake the
+    # waiters on the old ones (such as the state owner's version pushes)
+    lobby_event, lobby.change_event = lobby.change_event, ThreadSafeEvent()
+    placement_event = game_service._placement_change_event
+    game_service._placement_change_event = ThreadSafeEvent()
+    lobby_event.set()
+    placement_event.set()
 
     return {"status": "lobby and games cleared"}
 
@@ -88,6 +117,10 @@ async def reset_lobby_for_testing() -> dict[str, str]:
 @router.post("/add-player-to-lobby")
 async def add_player_to_lobby_for_testing(player_name: str = Form()) -> dict[str, str]:
     """Add a player to the lobby bypassing authentication - for testing only."""
+    return _on_owner(_add_player_to_lobby, player_name)
+
+
+def _add_player_to_lobby(player_name: str) -> dict[str, str]:
     lobby_service = _get_lobby_service()
 
     try:
@@ -103,6 +136,10 @@ async def remove_player_from_lobby_for_testing(
     player_name: str = Form(),
 ) -> dict[str, str]:
     """Remove a player from the lobby bypassing authentication - for testing only."""
+    return _on_owner(_remove_player_from_lobby, player_name)
+
+
+def _remove_player_from_lobby(player_name: str) -> dict[str, str]:
     lobby_service = _get_lobby_service()
 
     try:
@@ -120,6 +157,10 @@ async def send_game_request_for_testing(
     sender_name: str = Form(), target_name: str = Form()
 ) -> dict[str, str]:
     """Send a game request bypassing session validation - for testing only."""
+    return _on_owner(_send_game_request, sender_name, target_name)
+
+
+def _send_game_request(sender_name: str, target_name: str) -> dict[str, str]:
     lobby_service = _get_lobby_service()
 
     try:
@@ -142,6 +183,10 @@ async def send_game_request_for_testing(
 @router.post("/accept-game-request")
 async def accept_game_request_for_testing(player_name: str = Form()) -> dict[str, str]:
     """Accept a game request bypassing session validation - for testing only."""
+    return _on_owner(_accept_game_request, player_name)
+
+
+def _accept_game_request(player_name: str) -> dict[str, str]:
     lobby_service = _get_lobby_service()
     game_service = _get_game_service()
 
@@ -169,6 +214,10 @@ async def accept_game_request_for_testing(player_name: str = Form()) -> dict[str
 @router.post("/decline-game-request")
 async def decline_game_request_for_testing(player_name: str = Form()) -> dict[str, str]:
     """Decline a game request bypassing session validation - for testing only."""
+    return _on_owner(_decline_game_request, player_name)
+
+
+def _decline_game_request(player_name: str) -> dict[str, str]:
     lobby_service = _get_lobby_service()
 
     try:
@@ -0,0 +1,265 @@
+"""The computer's side of single-player games, with speculative salvos.
+
+While the human aims, the server has nothing to do. As soon as a round
+resolves, the computer's salvo for the next round is computed on a
+background worker and cached against that round number, so the round can
+resolve the moment the human fires. If the speculation has not finished (or
+was for another round), the salvo is computed on demand with a strict time
+budget instead: for a searching strategy that means a less considered salvo,
+never a slow response.
+
+The computer only sees what a player would (its own shots and the per-round
+hit reports), so its strategy can be rebuilt from the boards. A game this
+process has not played before (after a restart) is replayed that way on
+first use.
+"""
+
+import copy
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, NamedTuple
+
+from game.cells import STANDARD_GRID
+from game.exceptions import UnknownGameException
+from game.game_service import Game, GameService, GameStatus
+from game.hit_inference import evidence_from_board
+from game.model import Coord, cell_to_coord
+from game.player import Player
+from game.strategies import RoundReport, Strategy, make_strategy
+
+# Strategy the computer plays (see game.strategies)
+COMPUTER_STRATEGY: str = "optimiser"
+# Seconds allowed for a salvo computed while the human waits
+FALLBACK_TIME_BUDGET: float = 0.01
+
+_OVER: tuple[GameStatus, ...] = (GameStatus.FINISHED, GameStatus.ABANDONED)
+
+
+class _Speculation(NamedTuple):
+    round_number: int
+    shots: int
+    salvo: "Future[list[Coord]]"
+
+
+class _Held(NamedTuple):
+    """A strategy and the lock held by whoever is using it."""
+
+    lock: threading.Lock
+    strategy: Strategy
+
+
+class _Opponent:
+    """One game's computer player and the salvo being prepared for it."""
+
+    __slots__ = ("held", "speculation")
+
+    def __init__(self, strategy: Strategy) -> None:
+        # Replaced as a whole (see ComputerOpponents._claim), so a speculation
+        # always locks the strategy it works on
+        self.held: _Held = _Held(threading.Lock(), strategy)
+        self.speculation: _Speculation | None = None
+
+    @property
+    def strategy(self) -> Strategy:
+        return self.held.strategy
+
+
+class ComputerOpponents:
+    """Plays the computer's side of every single-player game.
+
+    Args:
+        game_service: The service holding the games
+        strategy_name: The registered strategy the computer plays
+        workers: Background threads for speculative salvos (0 = none; every
+            salvo is then computed when the human fires)
+        fallback_budget: Seconds allowed for a salvo computed on demand
+
+    Raises:
+        ValueError: If no strategy is registered as `strategy_name`
+    """
+
+    def __init__(
+        self,
+        game_service: GameService,
+        strategy_name: str = COMPUTER_STRATEGY,
+        workers: int = 1,
+        fallback_budget: float = FALLBACK_TIME_BUDGET,
+    ) -> None:
+        if workers < 0:
+            raise ValueError(f"workers must be >= 0, got {workers}")
+        make_strategy(strategy_name)
+        self.game_service: GameService = game_service
+        self.strategy_name: str = strategy_name
+        self.fallback_budget: float = fallback_budget
+        self._executor: ThreadPoolExecutor | None = (
+            ThreadPoolExecutor(max_workers=workers, thread_name_prefix="computer-salvo")
+            if workers
+            else None
+        )
+        self._opponents: dict[str, _Opponent] = {}  # game_id->_Opponent
+        self._lock: threading.Lock = threading.Lock()
+        self.speculated: int = 0  # Salvos taken from a finished speculation
+        self.fallbacks: int = 0  # Salvos computed on demand
+
+    def _computer_in(self, game: Game) -> Player | None:
+        for player in (game.player_1, game.player_2):
+            if player and player.id in self.game_service.computer_player_ids:
+                return player
+        return None
+
+    def _opponent_for(self, game: Game, computer: Player) -> _Opponent:
+        """Return the game's computer player, replaying the rounds so far if new."""
+        with self._lock:
+            opponent: _Opponent | None = self._opponents.get(game.id)
+            if opponent is None:
+                strategy: Strategy = make_strategy(self.strategy_name)
+                (human,) = [player for player in game.board if player is not computer]
+                for evidence in evidence_from_board(game.board[human]):
+                    shots = tuple(
+                        cell_to_coord(cell)
+                        for cell in STANDARD_GRID.mask_to_cells(evidence.shots)
+                    )
+                    strategy.observe(
+                        RoundReport(
+                            evidence.round_number, shots, evidence.hits, evidence.sunk
+                        )
+                    )
+                opponent = self._opponents[game.id] = _Opponent(strategy)
+            return opponent
+
+    def _speculate(self, held: _Held, shots: int) -> list[Coord]:
+        with held.lock:
+            return held.strategy.choose_salvo(shots)
+
+    def prepare(self, game_id: str) -> "Future[list[Coord]] | None":
+        """Start working out the computer's salvo for the game's current round.
+
+        Games that no longer exist are forgotten as a side effect.
+
+        Args:
+            game_id: The game ID
+
+        Returns:
+            The salvo being worked out, or None if the game is over, not
+            against the computer, or speculation is disabled
+        """
+        with self._lock:
+            for stale in self._opponents.keys() - self.game_service.games.keys():
+                del self._opponents[stale]
+        game: Game | None = self.game_service.games.get(game_id)
+        if self._executor is None or game is None or game.status in _OVER:
+            return None
+        computer: Player | None = self._computer_in(game)
+        if computer is None:
+            return None
+        opponent: _Opponent = self._opponent_for(game, computer)
+        shots: int = game.board[computer].shots_available
+        salvo: Future[list[Coord]] = self._executor.submit(
+            self._speculate, opponent.held, shots
+        )
+        opponent.speculation = _Speculation(game.round_number, shots, salvo)
+        return salvo
+
+    def _claim(self, opponent: _Opponent) -> _Held:
+        """Take the opponent's strategy for a round without waiting for it.
+
+        A speculation that has not started is dropped. One still running keeps
+        the strategy it is working on (its salvo will not be used), and the
+        opponent carries on with a copy, so the round never waits out the
+        speculation's time budget.
+
+        Returns:
+            The strategy to play the round with, its lock already held
+        """
+        if opponent.speculation is not None:
+            opponent.speculation.salvo.cancel()
+        held: _Held = opponent.held
+        if held.lock.acquire(blocking=False):
+            return held
+        held = _Held(threading.Lock(), copy.deepcopy(held.strategy))
+        held.lock.acquire()
+        opponent.held = held
+        return held
+
+    def _salvo(
+        self, opponent: _Opponent, strategy: Strategy, round_number: int, shots: int
+    ) -> list[Coord]:
+        """Return the computer's salvo, speculated if ready, else on demand."""
+        speculation: _Speculation | None = opponent.speculation
+        if (
+            speculation is not None
+            and speculation.round_number == round_number
+            and speculation.shots == shots
+            and speculation.salvo.done()
+            and not speculation.salvo.cancelled()
+            and speculation.salvo.exception() is None
+        ):
+            self.speculated += 1
+            return speculation.salvo.result()
+        self.fallbacks += 1
+        return strategy.choose_salvo(shots, self.fallback_budget)
+
+    def play_round(
+        self, game_id: str, player_id: str, salvo: list[Coord]
+    ) -> RoundReport:
+        """Resolve a round: the human's salvo against the computer's.
+
+        The computer's salvo for the next round is then speculated.
+
+        Args:
+            game_id: The game ID
+            player_id: The human player firing
+            salvo: The cells the human fires at this round
+
+        Returns:
+            What the human learns about their salvo
+
+        Raises:
+            UnknownGameException: If game doesn't exist
+            PlayerNotInGameException: If the player is not in the game
+            ValueError: If the game is not against the computer or is over,
+                or the salvo is invalid (see GameService.resolve_round)
+        """
+        game: Game | None = self.game_service.games.get(game_id)
+        if game is None:
+            raise UnknownGameException(f"Game with id:{game_id} does not exist")
+        computer: Player | None = self._computer_in(game)
+        if computer is None:
+            raise ValueError(f"Game {game_id} is not against the computer")
+        if game.status in _OVER:
+            raise ValueError(f"Game {game_id} is over")
+        opponent: _Opponent = self._opponent_for(game, computer)
+        held: _Held = self._claim(opponent)
+        try:
+            computer_salvo: list[Coord] = self._salvo(
+                opponent,
+                held.strategy,
+                game.round_number,
+                game.board[computer].shots_available,
+            )
+            reports: dict[str, RoundReport] = self.game_service.resolve_round(
+                game_id, {player_id: salvo, computer.id: computer_salvo}
+            )
+            opponent.speculation = None
+            held.strategy.observe(reports[computer.id])
+        finally:
+            held.lock.release()
+        if game.status == GameStatus.FINISHED:
+            with self._lock:
+                self._opponents.pop(game_id, None)
+        else:
+            self.prepare(game_id)
+        return reports[player_id]
+
+    def shutdown(self) -> None:
+        """Stop the speculation worker, abandoning queued speculations."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Games tracked and how many salvos were speculated or computed on demand."""
+        return {
+            "games": len(self._opponents),
+            "speculated": self.speculated,
+            "fallbacks": self.fallbacks,
+        }
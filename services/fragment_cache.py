@@ -0,0 +1,82 @@
+"""LRU cache for rendered HTML fragments.
+
+Rendering a 100-cell board table is the bulk of a gameplay or placement page
+render, yet most requests (polls, refreshes, an opponent viewing the same
+shots) see a board that has not changed. Fragments are cached under a key
+that includes the board's version, so a stale entry is never returned: it is
+simply never asked for again and ages out of the LRU.
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+
+class FragmentCache:
+    """Thread-safe LRU of rendered fragments bounded by approximate memory use.
+
+    Args:
+        max_bytes: Memory budget for cached fragments (0 disables caching)
+    """
+
+    def __init__(self, max_bytes: int = 4 * 1024 * 1024) -> None:
+        if max_bytes < 0:
+            raise ValueError(f"max_bytes must be >= 0, got {max_bytes}")
+        self.max_bytes: int = max_bytes
+        self.bytes_used: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self._entries: OrderedDict[Hashable, str] = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+    def get(self, key: Hashable) -> str | None:
+        """Return the cached fragment for `key`, or None on a miss."""
+        with self._lock:
+            html: str | None = self._entries.get(key)
+            if html is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return html
+
+    def put(self, key: Hashable, html: str) -> None:
+        """Cache a fragment, evicting least recently used entries to fit.
+
+        Fragments larger than the whole budget are not cached.
+        """
+        size: int = sys.getsizeof(html)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous: str | None = self._entries.pop(key, None)
+            if previous is not None:
+                self.bytes_used -= sys.getsizeof(previous)
+            while self._entries and self.bytes_used + size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.bytes_used -= sys.getsizeof(evicted)
+                self.evictions += 1
+            self._entries[key] = html
+            self.bytes_used += size
+
+    def clear(self) -> None:
+        """Drop every cached fragment (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self.bytes_used = 0
+
+    def get_stats(self) -> dict[str, Any]:
+        """Entry count, memory use and hit/miss/eviction counters."""
+        lookups: int = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes_used": self.bytes_used,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
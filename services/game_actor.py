@@ -0,0 +1,203 @@
+"""Per-game actors that serialise mutations through an ordered mailbox.
+
+Placement, ready, fire and abandon commands for a game are queued on that
+game's GameActor and executed one at a time by its own asyncio task, so two
+requests for the same game can never interleave (even when the work itself is
+handed off to a shard thread). Commands for different games run
+independently, so a slow command in one game does not hold back any other.
+
+Players who are not in a game yet (single-player ship placement) get an actor
+keyed by their player ID instead.
+"""
+
+import asyncio
+import inspect
+from enum import StrEnum
+from typing import Any, Callable, NamedTuple
+
+from game.game_service import GameService
+
+
+class GameCommand(StrEnum):
+    """Commands accepted by a GameActor's mailbox."""
+
+    PLACE = "place"
+    READY = "ready"
+    FIRE = "fire"
+    ABANDON = "abandon"
+
+
+class _Envelope(NamedTuple):
+    command: GameCommand
+    operation: Callable[..., Any]
+    args: tuple[Any, ...]
+    result: asyncio.Future[Any]
+
+
+class GameActor:
+    """Owns one game's mailbox and the task that drains it.
+
+    The task exits after `idle_timeout` seconds with an empty mailbox and is
+    restarted by the registry on the next command.
+
+    Args:
+        key: The game ID (or player ID before a game exists)
+        idle_timeout: Seconds of inactivity before the task exits
+        on_exit: Called with the actor when its task exits
+    """
+
+    def __init__(
+        self,
+        key: str,
+        idle_timeout: float,
+        on_exit: Callable[["GameActor"], None],
+    ) -> None:
+        self.key: str = key
+        self.idle_timeout: float = idle_timeout
+        self.commands_processed: int = 0
+        self._executing: bool = False
+        self._mailbox: asyncio.Queue[_Envelope] = asyncio.Queue()
+        self._on_exit: Callable[[GameActor], None] = on_exit
+        self._loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        self._task: asyncio.Task[None] = asyncio.create_task(self._run())
+
+    @property
+    def is_running(self) -> bool:
+        """True if the actor can take commands on the current event loop."""
+        return not self._task.done() and self._loop is asyncio.get_running_loop()
+
+    @property
+    def queued(self) -> int:
+        return self._mailbox.qsize()
+
+    @property
+    def in_flight(self) -> bool:
+        """True while a command is queued or executing."""
+        return self._executing or not self._mailbox.empty()
+
+    def post(
+        self, command: GameCommand, operation: Callable[..., Any], *args: Any
+    ) -> asyncio.Future[Any]:
+        """Queue a command, returning a future for its result."""
+        result: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._mailbox.put_nowait(_Envelope(command, operation, args, result))
+        return result
+
+    async def _run(self) -> None:
+        try:
+            while True:
+                try:
+                    envelope = await asyncio.wait_for(
+                        self._mailbox.get(), timeout=self.idle_timeout
+                    )
+                except asyncio.TimeoutError:
+                    return
+                await self._execute(envelope)
+        finally:
+            self._on_exit(self)
+            # Fail anything still queued so callers are not left waiting
+            while not self._mailbox.empty():
+                envelope = self._mailbox.get_nowait()
+                if not envelope.result.done():
+                    envelope.result.set_exception(
+                        RuntimeError(f"Game actor {self.key} stopped")
+                    )
+
+    async def _execute(self, envelope: _Envelope) -> None:
+        if envelope.result.cancelled():
+            return
+        self._executing = True
+        try:
+            value: Any = envelope.operation(*envelope.args)
+            if inspect.isawaitable(value):
+                value = await value
+        except Exception as e:
+            if not envelope.result.done():
+                envelope.result.set_exception(e)
+        else:
+            if not envelope.result.done():
+                envelope.result.set_result(value)
+        finally:
+            self._executing = False
+            self.commands_processed += 1
+
+    async def stop(self) -> None:
+        """Cancel the actor's task, failing any queued commands."""
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+
+
+class GameActorRegistry:
+    """Routes commands to the actor for a player's current game.
+
+    Args:
+        game_service: Used to find the game a player is in
+        idle_timeout: Seconds an actor's task lingers with an empty mailbox
+    """
+
+    def __init__(self, game_service: GameService, idle_timeout: float = 60.0) -> None:
+        self.game_service: GameService = game_service
+        self.idle_timeout: float = idle_timeout
+        self.actors: dict[str, GameActor] = {}  # game_id (or player_id)->GameActor
+
+    def key_for(self, player_id: str) -> str:
+        """Return the actor key for a player: their game ID, else their own ID."""
+        game = self.game_service.games_by_player.get(player_id)
+        return game.id if game else player_id
+
+    def actor_for(self, key: str) -> GameActor:
+        """Return the running actor for `key`, starting one if necessary."""
+        actor: GameActor | None = self.actors.get(key)
+        if actor is None or not actor.is_running:
+            actor = GameActor(key, self.idle_timeout, self._forget)
+            self.actors[key] = actor
+        return actor
+
+    async def submit(
+        self,
+        player_id: str,
+        command: GameCommand,
+        operation: Callable[..., Any],
+        *args: Any,
+    ) -> Any:
+        """Queue `operation(*args)` on the player's game actor and await it.
+
+        `operation` may be a plain function or return an awaitable (e.g. work
+        handed to a shard thread); the actor waits for it to complete before
+        taking the next command.
+
+        Args:
+            player_id: The player issuing the command
+            command: Which command this is
+            operation: The mutation to perform
+            *args: Positional arguments for `operation`
+
+        Returns:
+            Whatever `operation` returns
+
+        Raises:
+            Exception: Anything raised by `operation`
+        """
+        actor: GameActor = self.actor_for(self.key_for(player_id))
+        return await actor.post(command, operation, *args)
+
+    def is_busy(self, key: str) -> bool:
+        """True if the actor for `key` has a command queued or executing."""
+        actor: GameActor | None = self.actors.get(key)
+        return actor is not None and actor.in_flight
+
+    def _forget(self, actor: GameActor) -> None:
+        if self.actors.get(actor.key) is actor:
+            del self.actors[actor.key]
+
+    async def stop(self) -> None:
+        """Stop every actor."""
+        for actor in list(self.actors.values()):
+            await actor.stop()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Number of live actors and commands waiting in their mailboxes."""
+        return {
+            "actors": len(self.actors),
+            "queued_commands": sum(actor.queued for actor in self.actors.values()),
+        }
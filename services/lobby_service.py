@@ -166,6 +166,39 @@ class LobbyService:
         """
         return self.lobby.get_decline_notification(player_id)
 
+    def has_decline_notification(self, player_id: str) -> bool:
+        """Check for a decline notification without clearing it
+
+        Args:
+            player_id: The ID of the player to check
+
+        Returns:
+            True if a decline notification is waiting for the player
+        """
+        return player_id in self.lobby.decline_notifications
+
+    def is_in_lobby(self, player_id: str) -> bool:
+        """Check whether a player is currently in the lobby
+
+        Args:
+            player_id: The ID of the player
+
+        Returns:
+            True if the player is in the lobby, False otherwise
+        """
+        return player_id in self.lobby.players
+
+    def prune_orphaned_state(self) -> tuple[int, int]:
+        """Drop lobby bookkeeping left behind by players who have gone
+
+        Returns:
+            Tuple of (decline notifications removed, pairing entries removed)
+        """
+        return (
+            self.lobby.prune_decline_notifications(),
+            self.lobby.prune_active_games(),
+        )
+
     def get_lobby_version(self) -> int:
         """Get the current version of the lobby state"""
         return self.lobby.get_version()
@@ -190,6 +223,17 @@ class LobbyService:
         # Get opponent from lobby
         return self.lobby.get_opponent(player_id)
 
+    def end_pairing(self, player_id: str) -> str | None:
+        """End a player's lobby pairing, making both players available again.
+
+        Args:
+            player_id: The ID of either player in the pairing
+
+        Returns:
+            The opponent's ID, or None if the player was not paired
+        """
+        return self.lobby.end_pairing(player_id)
+
     # Display helper methods - convert IDs to names for UI
 
     def get_player_id_by_name(self, player_name: str) -> str | None:
@@ -201,7 +245,7 @@ class LobbyService:
         Returns:
             The player's ID if found, None otherwise
         """
-        for player in self.lobby.players.values():
+        for player in list(self.lobby.players.values()):
             if player.name == player_name:
                 return player.id
         return None
@@ -0,0 +1,281 @@
+"""Background reaper that reclaims idle game, placement and player state.
+
+GameService and Lobby keep everything in plain dicts that otherwise only ever
+grow. The reaper periodically archives and evicts finished or abandoned games,
+drops orphaned placement boards and stale ready flags, and forgets players
+who have logged out or gone idle. When tiering is enabled it also spills the
+boards of idle games to disk.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from game.game_service import GameService
+from game.model import Game, GameStatus
+from game.serialisation import board_to_dict
+from services.lobby_service import LobbyService
+
+logger = logging.getLogger(__name__)
+
+
+class ReaperConfig(NamedTuple):
+    """Time-to-live settings (in seconds) for idle state.
+
+    Attributes:
+        interval: Seconds between reaper sweeps
+        finished_game_ttl: Idle time before a FINISHED or ABANDONED game is evicted
+        idle_game_ttl: Idle time before any other game is treated as abandoned
+        placement_board_ttl: Idle time before a ship placement board is dropped
+        ready_flag_ttl: Idle time before a ready flag is cleared
+        player_ttl: Idle time before a player outside a game is forgotten
+        archive_dir: Directory to archive evicted games to (None disables archiving)
+    """
+
+    interval: float = 60.0
+    finished_game_ttl: float = 10 * 60.0
+    idle_game_ttl: float = 2 * 60 * 60.0
+    placement_board_ttl: float = 30 * 60.0
+    ready_flag_ttl: float = 30 * 60.0
+    player_ttl: float = 60 * 60.0
+    archive_dir: str | None = None
+
+
+class ReapResult(NamedTuple):
+    """Counts of state reclaimed by a reaper sweep."""
+
+    games: int = 0
+    archived_games: int = 0
+    placement_boards: int = 0
+    ready_flags: int = 0
+    players: int = 0
+    decline_notifications: int = 0
+    lobby_pairings: int = 0
+    spilled_games: int = 0
+
+    def __add__(self, other: object) -> "ReapResult":
+        if not isinstance(other, ReapResult):
+            return NotImplemented
+        return ReapResult(*(mine + theirs for mine, theirs in zip(self, other)))
+
+
+class ReaperService:
+    """Service that periodically evicts idle state from GameService and Lobby."""
+
+    def __init__(
+        self,
+        game_service: GameService,
+        lobby_service: LobbyService,
+        config: ReaperConfig | None = None,
+    ) -> None:
+        self.game_service: GameService = game_service
+        self.lobby_service: LobbyService = lobby_service
+        self.config: ReaperConfig = config or ReaperConfig()
+        self.totals: ReapResult = ReapResult()
+        self.last_result: ReapResult = ReapResult()
+        self.sweeps: int = 0
+        self._task: asyncio.Task[None] | None = None
+
+    def reap(self, now: float | None = None) -> ReapResult:
+        """Run a single sweep and return what it reclaimed.
+
+        Args:
+            now: Current time.monotonic() value (defaults to the real clock)
+
+        Returns:
+            ReapResult with the counts for this sweep
+        """
+        if now is None:
+            now = time.monotonic()
+
+        games, archived = self._reap_games(now)
+        placement_boards = self._reap_placement_boards(now)
+        ready_flags = self._reap_ready_flags(now)
+        players = self._reap_players(now)
+        decline_notifications, lobby_pairings = (
+            self.lobby_service.prune_orphaned_state()
+        )
+        spilled_games = self.game_service.spill_idle_games(now)
+
+        result = ReapResult(
+            games=games,
+            archived_games=archived,
+            placement_boards=placement_boards,
+            ready_flags=ready_flags,
+            players=players,
+            decline_notifications=decline_notifications,
+            lobby_pairings=lobby_pairings,
+            spilled_games=spilled_games,
+        )
+        self.last_result = result
+        self.totals = self.totals + result
+        self.sweeps += 1
+        return result
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get reaper counters in a JSON-friendly format."""
+        return {
+            "sweeps": self.sweeps,
+            "last": self.last_result._asdict(),
+            "totals": self.totals._asdict(),
+        }
+
+    def start(self) -> None:
+        """Start the background sweep task on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the background sweep task and wait for it to finish."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.config.interval)
+            try:
+                result = self.reap()
+                if any(result):
+                    logger.info("Reaper reclaimed %s", result._asdict())
+            except Exception:
+                logger.exception("Reaper sweep failed")
+
+    def _idle_for(self, last_activity: dict[str, float], key: str, now: float) -> float:
+        """Seconds since the last recorded activity (0 if never recorded)."""
+        return now - last_activity.get(key, now)
+
+    def _reap_games(self, now: float) -> tuple[int, int]:
+        game_service = self.game_service
+        evicted: int = 0
+        archived: int = 0
+
+        for game in list(game_service.games.values()):
+            idle: float = self._idle_for(game_service.game_last_activity, game.id, now)
+            if game.status in (GameStatus.FINISHED, GameStatus.ABANDONED):
+                expired = idle >= self.config.finished_game_ttl
+            else:
+                expired = idle >= self.config.idle_game_ttl
+            if not expired:
+                continue
+
+            if self.config.archive_dir and self._archive_game(game):
+                archived += 1
+            humans: list[str] = [
+                player.id
+                for player in (game.player_1, game.player_2)
+                if player and player.id not in game_service.computer_player_ids
+            ]
+            game_service.evict_game(game.id)
+            # Players are no longer in a game, so they go back to the lobby
+            for player_id in humans:
+                self.lobby_service.end_pairing(player_id)
+            evicted += 1
+
+        return evicted, archived
+
+    def _reap_placement_boards(self, now: float) -> int:
+        game_service = self.game_service
+        reaped: int = 0
+        for player_id in list(game_service.ship_placement_boards):
+            # Re-check under the player's lock: a placement may have just
+            # refreshed the board's activity since the snapshot was taken
+            with game_service.locks.hold(player_id):
+                if player_id not in game_service.ship_placement_boards or not (
+                    self._placement_board_stale(player_id, now)
+                ):
+                    continue
+                del game_service.ship_placement_boards[player_id]
+                game_service.placement_histories.pop(player_id, None)
+                game_service.repository.mark_dirty("ship_placement_boards", player_id)
+            reaped += 1
+        return reaped
+
+    def _placement_board_stale(self, player_id: str, now: float) -> bool:
+        game_service = self.game_service
+        return (
+            player_id not in game_service.players
+            or self._idle_for(game_service.player_last_activity, player_id, now)
+            >= self.config.placement_board_ttl
+        )
+
+    def _reap_ready_flags(self, now: float) -> int:
+        game_service = self.game_service
+        reaped: int = 0
+        for player_id in list(game_service.ready_players):
+            with game_service.locks.hold(player_id):
+                if player_id not in game_service.ready_players or not (
+                    self._ready_flag_stale(player_id, now)
+                ):
+                    continue
+                game_service.ready_players.discard(player_id)
+                game_service.repository.mark_dirty("ready_players", player_id)
+            reaped += 1
+        return reaped
+
+    def _ready_flag_stale(self, player_id: str, now: float) -> bool:
+        game_service = self.game_service
+        return (
+            player_id not in game_service.players
+            or player_id not in game_service.games_by_player
+            or self._idle_for(game_service.player_last_activity, player_id, now)
+            >= self.config.ready_flag_ttl
+        )
+
+    def _reap_players(self, now: float) -> int:
+        game_service = self.game_service
+        lobby_service = self.lobby_service
+        stale: list[str] = [
+            player_id
+            for player_id in game_service.players
+            if player_id not in game_service.games_by_player
+            and self._idle_for(game_service.player_last_activity, player_id, now)
+            >= self.config.player_ttl
+        ]
+        for player_id in stale:
+            if lobby_service.is_in_lobby(player_id):
+                lobby_service.leave_lobby(player_id)
+            game_service.remove_player(player_id)
+        return len(stale)
+
+    def _archive_game(self, game: Game) -> bool:
+        """Write a human readable JSON record of a game before it is evicted.
+
+        Returns:
+            True if the archive file was written, False otherwise
+        """
+        assert self.config.archive_dir is not None
+        timestamp: str = datetime.now().strftime("%Y%m%d-%H%M%S")
+        # Names are neither unique nor safe in a path, so only IDs are used
+        file_name: str = f"{timestamp}_{game.id}.json"
+        record: dict[str, Any] = {
+            "game_id": game.id,
+            "game_mode": game.game_mode.value,
+            "status": game.status.value,
+            "archived_at": datetime.now().isoformat(timespec="seconds"),
+            "players": {
+                player.id: player.name
+                for player in (game.player_1, game.player_2)
+                if player
+            },
+            "boards": {
+                player.id: board_to_dict(board) for player, board in game.board.items()
+            },
+        }
+        try:
+            archive_dir = Path(self.config.archive_dir)
+            archive_dir.mkdir(parents=True, exist_ok=True)
+            (archive_dir / file_name).write_text(json.dumps(record, indent=2))
+        except OSError:
+            logger.exception("Failed to archive game %s", game.id)
+            return False
+        return True
@@ -0,0 +1,84 @@
+"""Route CPU-heavy per-player and per-game work onto shard threads.
+
+Every request handler shares one asyncio loop, so random ship placement and
+template rendering for one game hold up every other game. ShardRouter hashes a
+player or game ID onto one of N shards, each owned by a single worker thread,
+and runs the work there. Work for the same key is always serialised on the
+same shard, while different shards run in parallel on free-threaded CPython.
+
+With `shard_count=0` work runs inline on the event loop (the original
+behaviour).
+"""
+
+import asyncio
+import functools
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+class ShardRouter:
+    """Thin router mapping player/game IDs to single-threaded shard executors.
+
+    Args:
+        shard_count: Number of shard threads (0 runs work inline)
+    """
+
+    def __init__(self, shard_count: int = 0) -> None:
+        if shard_count < 0:
+            raise ValueError(f"shard_count must be >= 0, got {shard_count}")
+        self.shard_count: int = shard_count
+        self._executors: list[ThreadPoolExecutor] = [
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"game-shard-{i}")
+            for i in range(shard_count)
+        ]
+        self.tasks_run: list[int] = [0] * max(shard_count, 1)
+
+    def shard_for(self, key: str) -> int:
+        """Return the shard owning `key`.
+
+        CRC32 is used rather than hash() so the mapping is the same in every
+        worker process.
+
+        Args:
+            key: A player or game ID
+
+        Returns:
+            Shard index in the range [0, shard_count), or 0 when inline
+        """
+        if not self.shard_count:
+            return 0
+        return zlib.crc32(key.encode()) % self.shard_count
+
+    async def run(self, key: str, fn: Callable[..., T], *args: Any) -> T:
+        """Run `fn(*args)` on the shard owning `key` and return its result.
+
+        Exceptions raised by `fn` propagate to the caller.
+
+        Args:
+            key: A player or game ID selecting the shard
+            fn: The function to run
+            *args: Positional arguments for `fn`
+
+        Returns:
+            Whatever `fn` returns
+        """
+        shard: int = self.shard_for(key)
+        self.tasks_run[shard] += 1
+        if not self._executors:
+            return fn(*args)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executors[shard], functools.partial(fn, *args)
+        )
+
+    def shutdown(self) -> None:
+        """Wait for queued work to finish and stop the shard threads."""
+        for executor in self._executors:
+            executor.shutdown(wait=True)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Shard count and number of tasks routed to each shard."""
+        return {"shard_count": self.shard_count, "tasks_per_shard": self.tasks_run}
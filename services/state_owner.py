@@ -0,0 +1,479 @@
+"""One process owns the game state; worker processes reach it over a socket.
+
+With `uvicorn --workers N`, every worker building its own Lobby and
+GameService would mean N copies of the state to keep in step. Instead a single
+owner process (`python main.py --state-owner <socket path>`) holds the only
+Lobby, GameService, game actors, computer opponents and repository, and each
+worker (started with STATE_SOCKET set to the same path) holds none:
+
+- StateOwner serves calls from workers over a Unix-domain socket, and pushes
+  the lobby and placement versions to them whenever either changes.
+- StateClient is a worker's connection to the owner. Calls block the calling
+  thread until the owner answers, so every read sees every earlier write.
+- RemoteLobbyService and RemoteGameService stand in for the services in a
+  worker, forwarding each method call to the owner. Their wait methods are
+  woken by the version pushes, so long-polls park in the worker.
+
+A call is a module-level function and its arguments, run in the owner, where
+the `routes.helpers` getters return the real services. Routes group the reads
+and writes that must happen together into one such function, and render the
+result in the worker. Messages are pickled, so the socket is created readable
+by its owner only.
+"""
+
+import asyncio
+import copyreg
+import fcntl
+import inspect
+import logging
+import os
+import pickle
+import socket
+import struct
+import threading
+from typing import Any, Callable, TypeVar
+
+from fastapi import HTTPException
+
+from game.game_service import GameService
+from game.rules import Rules
+from services.lobby_service import LobbyService
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Version keys pushed to workers
+LOBBY: str = "lobby"
+PLACEMENT: str = "placement"
+# Bytes queued for a subscribed worker before it is disconnected as too slow
+MAX_PENDING_BYTES: int = 1024 * 1024
+
+# Sent in place of a call to turn a connection into a version subscription
+_SUBSCRIBE: str = "subscribe"
+_HEADER: struct.Struct = struct.Struct(">I")
+
+# Services held by the StateOwner in this process, by name
+_owned: dict[str, Any] = {}
+
+# HTTPException does not unpickle from its args; rebuild it from its fields
+copyreg.pickle(
+    HTTPException,
+    lambda e: (HTTPException, (e.status_code, e.detail, e.headers)),
+)
+
+
+def _encode(message: Any) -> bytes:
+    payload: bytes = pickle.dumps(message, pickle.HIGHEST_PROTOCOL)
+    return _HEADER.pack(len(payload)) + payload
+
+
+async def _read_frame(reader: asyncio.StreamReader) -> bytes:
+    """Read one message's bytes, raising IncompleteReadError at end of stream."""
+    (length,) = _HEADER.unpack(await reader.readexactly(_HEADER.size))
+    return await reader.readexactly(length)
+
+
+def _recv_exactly(sock: socket.socket, length: int) -> bytes:
+    buffer = bytearray(length)
+    view = memoryview(buffer)
+    received: int = 0
+    while received < length:
+        count: int = sock.recv_into(view[received:])
+        if not count:
+            raise EOFError("State owner closed the connection")
+        received += count
+    return bytes(buffer)
+
+
+def _call_service(name: str, method: str, args: tuple[Any, ...]) -> Any:
+    """Call a method of a service held by this process's StateOwner."""
+    return getattr(_owned[name], method)(*args)
+
+
+def _service_attribute(name: str, attribute: str) -> Any:
+    """Read an attribute of a service held by this process's StateOwner."""
+    return getattr(_owned[name], attribute)
+
+
+class StateOwner:
+    """Serves this process's Lobby and GameService to worker processes.
+
+    An exclusive lock on `<socket_path>.lock` is held while serving, so only
+    one owner can serve a socket path.
+
+    Args:
+        socket_path: Filesystem path of the Unix-domain socket to listen on
+        lobby_service: The service holding the lobby state
+        game_service: The service holding the game state
+    """
+
+    def __init__(
+        self,
+        socket_path: str,
+        lobby_service: LobbyService,
+        game_service: GameService,
+    ) -> None:
+        self.socket_path: str = socket_path
+        self.lobby_service: LobbyService = lobby_service
+        self.game_service: GameService = game_service
+        self.calls_served: int = 0
+        self._server: asyncio.Server | None = None
+        self._lock_fd: int | None = None
+        self._subscribers: set[asyncio.StreamWriter] = set()
+        self._connections: dict[asyncio.Task[Any], asyncio.StreamWriter] = {}
+        self._watchers: list[asyncio.Task[None]] = []
+
+    async def start(self) -> None:
+        """Listen on the socket, replacing a stale socket file if present.
+
+        Raises:
+            OSError: If another owner is already serving the socket
+        """
+        lock_fd: int = os.open(f"{self.socket_path}.lock", os.O_CREAT | os.O_RDWR)
+        try:
+            fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+            # Calls carry pickles, so no other user may connect
+            umask: int = os.umask(0o177)
+            try:
+                self._server = await asyncio.start_unix_server(
+                    self._handle_connection, path=self.socket_path
+                )
+            finally:
+                os.umask(umask)
+        except OSError:
+            os.close(lock_fd)
+            raise
+        self._lock_fd = lock_fd
+        _owned.update(lobby_service=self.lobby_service, game_service=self.game_service)
+        self._watchers = [
+            asyncio.create_task(
+                self._watch(
+                    self.lobby_service.get_lobby_version,
+                    self.lobby_service.wait_for_lobby_change,
+                )
+            ),
+            asyncio.create_task(
+                self._watch(
+                    self.game_service.get_placement_version,
+                    self.game_service.wait_for_placement_change,
+                )
+            ),
+        ]
+
+    async def stop(self) -> None:
+        """Stop serving and disconnect every worker."""
+        if self._server is None:
+            return
+        self._server.close()
+        for task in self._watchers:
+            task.cancel()
+        # Closed rather than cancelled, so each handler sees the end of its stream
+        for writer in self._connections.values():
+            writer.close()
+        await asyncio.gather(
+            *self._watchers, *self._connections, return_exceptions=True
+        )
+        self._watchers = []
+        await self._server.wait_closed()
+        self._server = None
+        _owned.clear()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        if self._lock_fd is not None:
+            os.close(self._lock_fd)
+            self._lock_fd = None
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        task: asyncio.Task[Any] | None = asyncio.current_task()
+        assert task is not None
+        self._connections[task] = writer
+        try:
+            while True:
+                frame: bytes = await _read_frame(reader)
+                reply: bytes | None = await self._call(frame)
+                if reply is None:
+                    await self._serve_subscriber(reader, writer)
+                    return
+                writer.write(reply)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._connections.pop(task, None)
+            writer.close()
+
+    async def _call(self, frame: bytes) -> bytes | None:
+        """Run one call and encode its reply (None for a subscription request).
+
+        Calls run on the event loop, as route handlers do in a single-process
+        deployment, so a call that does not await runs without interleaving.
+        """
+        try:
+            message: Any = pickle.loads(frame)
+            if message == _SUBSCRIBE:
+                return None
+            fn, args = message
+            self.calls_served += 1
+            result: Any = fn(*args)
+            if inspect.isawaitable(result):
+                result = await result
+            return _encode((True, result))
+        except Exception as e:
+            return self._encode_error(e)
+
+    @staticmethod
+    def _encode_error(error: Exception) -> bytes:
+        reply: bytes = _encode((False, error))
+        try:
+            pickle.loads(reply[_HEADER.size :])
+        except Exception:
+            logger.warning("Sending %r to a worker as a RuntimeError", error)
+            reply = _encode((False, RuntimeError(f"{type(error).__name__}: {error}")))
+        return reply
+
+    async def _serve_subscriber(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self._subscribers.add(writer)
+        try:
+            writer.write(self._versions())
+            # Nothing more is read; this returns when the worker disconnects
+            await reader.read()
+        finally:
+            self._subscribers.discard(writer)
+
+    def _versions(self) -> bytes:
+        return _encode(
+            (
+                self.lobby_service.get_lobby_version(),
+                self.game_service.get_placement_version(),
+            )
+        )
+
+    async def _watch(
+        self,
+        get_version: Callable[[], int],
+        wait_for_change: Callable[[int], Any],
+    ) -> None:
+        """Push the versions to every worker each time `get_version` moves."""
+        version: int = get_version()
+        while True:
+            await wait_for_change(version)
+            version = get_version()
+            frame: bytes = self._versions()
+            for writer in list(self._subscribers):
+                if writer.transport.get_write_buffer_size() > MAX_PENDING_BYTES:
+                    logger.warning("Disconnecting a worker that stopped reading")
+                    writer.close()
+                    self._subscribers.discard(writer)
+                else:
+                    writer.write(frame)
+
+
+class StateClient:
+    """A worker's connection to the StateOwner.
+
+    Calls use blocking sockets, one per thread, so route handlers and shard
+    threads can call the owner alike. start() opens a further connection that
+    receives the owner's lobby and placement versions, which wake this
+    worker's long-polls; it reconnects if the owner restarts.
+
+    Args:
+        socket_path: Filesystem path of the owner's Unix-domain socket
+        reconnect_delay: Seconds between attempts to resubscribe
+    """
+
+    def __init__(self, socket_path: str, reconnect_delay: float = 0.5) -> None:
+        self.socket_path: str = socket_path
+        self.reconnect_delay: float = reconnect_delay
+        self.calls_made: int = 0
+        # Latest versions pushed by the owner (may trail the owner briefly)
+        self.versions: dict[str, int] = {LOBBY: 0, PLACEMENT: 0}
+        self._resets: int = 0
+        self._changed: asyncio.Event = asyncio.Event()
+        self._local: threading.local = threading.local()
+        self._sockets: set[socket.socket] = set()
+        self._sockets_lock: threading.Lock = threading.Lock()
+        self._listener: asyncio.Task[None] | None = None
+
+    def call(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run `fn(*args)` in the owner and return its result.
+
+        `fn` must be a module-level function, and its arguments and result
+        must pickle. Calls are not retried, as a lost reply does not mean the
+        call did not run.
+
+        Raises:
+            ConnectionError: If the owner cannot be reached
+            Exception: Anything raised by `fn`
+        """
+        frame: bytes = _encode((fn, args))
+        try:
+            sock: socket.socket = self._connection()
+            sock.sendall(frame)
+            (length,) = _HEADER.unpack(_recv_exactly(sock, _HEADER.size))
+            ok, value = pickle.loads(_recv_exactly(sock, length))
+        except (OSError, EOFError) as e:
+            self._drop_connection()
+            raise ConnectionError(
+                f"Lost connection to the state owner at {self.socket_path}"
+            ) from e
+        self.calls_made += 1
+        if not ok:
+            raise value
+        return value
+
+    async def call_async(self, fn: Callable[..., T], *args: Any) -> T:
+        """Like call(), but waits on a thread so the event loop keeps running.
+
+        For calls that may take a while in the owner, such as game commands
+        queued behind others.
+        """
+        return await asyncio.to_thread(self.call, fn, *args)
+
+    async def wait_for_change(self, key: str, since_version: int) -> None:
+        """Wait until the owner pushes a `key` version beyond `since_version`.
+
+        Callers check the owner's current version first (with a call), so a
+        version pushed late cannot be mistaken for a new change. A version
+        going backwards (the state was reset) also ends the wait.
+
+        Args:
+            key: LOBBY or PLACEMENT
+            since_version: The version the caller last saw
+        """
+        resets: int = self._resets
+        while self.versions[key] <= since_version and self._resets == resets:
+            await self._changed.wait()
+
+    async def start(self) -> None:
+        """Subscribe to version changes (once, however often it is called)."""
+        if self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        """Unsubscribe and close every connection to the owner."""
+        if self._listener is not None:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+            self._listener = None
+        with self._sockets_lock:
+            sockets: list[socket.socket] = list(self._sockets)
+            self._sockets.clear()
+        for sock in sockets:
+            sock.close()
+
+    def _connection(self) -> socket.socket:
+        sock: socket.socket | None = getattr(self._local, "socket", None)
+        if sock is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                sock.connect(self.socket_path)
+            except OSError:
+                sock.close()
+                raise
+            self._local.socket = sock
+            with self._sockets_lock:
+                self._sockets.add(sock)
+        return sock
+
+    def _drop_connection(self) -> None:
+        sock: socket.socket | None = getattr(self._local, "socket", None)
+        if sock is not None:
+            self._local.socket = None
+            with self._sockets_lock:
+                self._sockets.discard(sock)
+            sock.close()
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                reader, writer = await asyncio.open_unix_connection(self.socket_path)
+            except OSError:
+                logger.warning("State owner unavailable at %s", self.socket_path)
+                await asyncio.sleep(self.reconnect_delay)
+                continue
+            try:
+                writer.write(_encode(_SUBSCRIBE))
+                while True:
+                    lobby_version, placement_version = pickle.loads(
+                        await _read_frame(reader)
+                    )
+                    versions: dict[str, int] = {
+                        LOBBY: lobby_version,
+                        PLACEMENT: placement_version,
+                    }
+                    if any(versions[key] < self.versions[key] for key in versions):
+                        self._resets += 1
+                    self.versions = versions
+                    # A fresh event per change, so no waiter misses a set()
+                    changed, self._changed = self._changed, asyncio.Event()
+                    changed.set()
+            except (asyncio.IncompleteReadError, ConnectionError):
+                pass
+            finally:
+                writer.close()
+            await asyncio.sleep(self.reconnect_delay)
+
+
+class _RemoteService:
+    """Forwards public method calls to a service held by the StateOwner."""
+
+    _name: str
+
+    def __init__(self, client: StateClient) -> None:
+        self._client: StateClient = client
+
+    def __getattr__(self, method: str) -> Callable[..., Any]:
+        if method.startswith("_"):
+            raise AttributeError(method)
+        client: StateClient = self._client
+        name: str = self._name
+
+        def call(*args: Any) -> Any:
+            return client.call(_call_service, name, method, args)
+
+        call.__name__ = method
+        return call
+
+
+class RemoteLobbyService(_RemoteService):
+    """Stands in for the owner's LobbyService in a worker process.
+
+    Args:
+        client: The worker's connection to the owner
+    """
+
+    _name = "lobby_service"
+
+    async def wait_for_lobby_change(self, since_version: int) -> None:
+        await self._client.wait_for_change(LOBBY, since_version)
+
+
+class RemoteGameService(_RemoteService):
+    """Stands in for the owner's GameService in a worker process.
+
+    Args:
+        client: The worker's connection to the owner
+    """
+
+    _name = "game_service"
+
+    def __init__(self, client: StateClient) -> None:
+        super().__init__(client)
+        self._rules: Rules | None = None
+
+    @property
+    def rules(self) -> Rules:
+        """The owner's rules (fixed for its lifetime, so fetched once)."""
+        if self._rules is None:
+            self._rules = self._client.call(_service_attribute, self._name, "rules")
+        return self._rules
+
+    async def wait_for_placement_change(self, since_version: int) -> None:
+        await self._client.wait_for_change(PLACEMENT, since_version)
@@ -0,0 +1,101 @@
+"""Endpoint tests for ETag / If-None-Match handling on polled views."""
+
+from fastapi import status
+from fastapi.testclient import TestClient
+from helpers import send_game_request
+
+
+class TestLobbyStatusETag:
+    def test_lobby_status_returns_etag(self, alice_client: TestClient):
+        response = alice_client.get("/lobby/status")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["etag"].startswith('W/"')
+        assert response.headers["cache-control"] == "private, no-cache"
+
+    def test_matching_etag_returns_304(self, alice_client: TestClient):
+        etag: str = alice_client.get("/lobby/status").headers["etag"]
+
+        response = alice_client.get("/lobby/status", headers={"If-None-Match": etag})
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_lobby_change_produces_new_etag(
+        self, two_player_lobby: tuple[TestClient, TestClient]
+    ):
+        alice_client, _ = two_player_lobby
+        etag: str = alice_client.get("/lobby/status").headers["etag"]
+
+        send_game_request(alice_client, "Bob")
+        response = alice_client.get("/lobby/status", headers={"If-None-Match": etag})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["etag"] != etag
+
+    def test_etag_is_per_player(self, two_player_lobby: tuple[TestClient, TestClient]):
+        alice_client, bob_client = two_player_lobby
+        etag: str = alice_client.get("/lobby/status").headers["etag"]
+
+        response = bob_client.get("/lobby/status", headers={"If-None-Match": etag})
+
+        assert response.status_code == status.HTTP_200_OK
+
+
+class TestShipPlacementETag:
+    def test_matching_etag_returns_304(self, authenticated_client: TestClient):
+        etag: str = authenticated_client.get("/place-ships").headers["etag"]
+
+        response = authenticated_client.get(
+            "/place-ships", headers={"If-None-Match": etag}
+        )
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_placing_ship_produces_new_etag(self, authenticated_client: TestClient):
+        etag: str = authenticated_client.get("/place-ships").headers["etag"]
+        authenticated_client.post(
+            "/place-ship",
+            data={
+                "player_name": "Alice",
+                "ship_name": "Carrier",
+                "start_coordinate": "A1",
+                "orientation": "horizontal",
+            },
+        )
+
+        response = authenticated_client.get(
+            "/place-ships", headers={"If-None-Match": etag}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["etag"] != etag
+
+    def test_replaced_board_produces_new_etag(self, authenticated_client: TestClient):
+        from game.model import GameBoard
+        from main import game_service
+
+        etag: str = authenticated_client.get("/place-ships").headers["etag"]
+        (player_id,) = game_service.ship_placement_boards
+        game_service.ship_placement_boards[player_id] = GameBoard()
+
+        response = authenticated_client.get(
+            "/place-ships", headers={"If-None-Match": etag}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["etag"] != etag
+
+
+class TestETagMetrics:
+    def test_metrics_count_not_modified_responses(self, alice_client: TestClient):
+        before = alice_client.get("/metrics/etags").json()
+        etag: str = alice_client.get("/lobby/status").headers["etag"]
+        alice_client.get("/lobby/status", headers={"If-None-Match": etag})
+
+        after = alice_client.get("/metrics/etags").json()
+
+        assert after["requests"] - before["requests"] == 2
+        assert after["not_modified"] - before["not_modified"] == 1
+        assert 0.0 < after["hit_rate"] <= 1.0
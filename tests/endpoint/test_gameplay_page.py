@@ -5,6 +5,8 @@ Tests verify the game_page function behavior, including helper functions
 that should be extracted for better code organization.
 """
 
+import re
+
 import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
@@ -191,3 +193,302 @@ class TestGameplayPageHelperFunctions:
 
         # Board should be visible in the response
         assert "text/html" in response.headers["content-type"]
+
+
+class TestGameDeltasEndpoint:
+    """Tests for GET /game/{game_id}/deltas"""
+
+    def _launch_game(self, client: TestClient) -> str:
+        create_response = client.post(
+            "/start-game",
+            data={"action": "launch_game", "player_name": "Alice"},
+            follow_redirects=False,
+        )
+        return create_response.headers["location"].split("/")[-1]
+
+    def test_current_version_returns_no_deltas(self, authenticated_client: TestClient):
+        game_id = self._launch_game(authenticated_client)
+        version = authenticated_client.get(
+            f"/game/{game_id}/deltas", params={"since": -1}
+        ).json()["version"]
+
+        response = authenticated_client.get(
+            f"/game/{game_id}/deltas", params={"since": version}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"version": version, "deltas": []}
+
+    def test_unknown_version_returns_snapshot_without_opponent_ships(
+        self, authenticated_client: TestClient
+    ):
+        game_id = self._launch_game(authenticated_client)
+
+        response = authenticated_client.get(
+            f"/game/{game_id}/deltas", params={"since": 999}
+        )
+
+        body = response.json()
+        assert response.status_code == status.HTTP_200_OK
+        assert "snapshot" in body
+        assert "ships" not in body["snapshot"]["opponent_board"]
+
+    def test_deltas_forbidden_for_player_not_in_game(
+        self, alice_client: TestClient, bob_client: TestClient
+    ):
+        game_id = self._launch_game(alice_client)
+
+        response = bob_client.get(f"/game/{game_id}/deltas", params={"since": 0})
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+class TestBoardFragmentCache:
+    """Rendered board tables are cached per board version and viewpoint"""
+
+    def test_unchanged_board_is_served_from_cache(
+        self, authenticated_client: TestClient
+    ):
+        game_url = authenticated_client.post(
+            "/start-game",
+            data={"action": "launch_game", "player_name": "Alice"},
+            follow_redirects=False,
+        ).headers["location"]
+        authenticated_client.get(game_url)
+        before = authenticated_client.get("/metrics/board-fragments").json()
+
+        response = authenticated_client.get(game_url)
+
+        after = authenticated_client.get("/metrics/board-fragments").json()
+        assert response.status_code == status.HTTP_200_OK
+        assert 'data-testid="player-board"' in response.text
+        assert after["hits"] - before["hits"] == 2  # Player and opponent boards
+        assert after["misses"] == before["misses"]
+
+    def test_opponent_view_hides_ships(self, client: TestClient):
+        from game.model import Coord, GameBoard, Orientation, Ship, ShipType
+        from routes.helpers import BoardViewpoint, _render_board_grid
+
+        board = GameBoard()
+        board.place_ship(Ship(ShipType.DESTROYER), Coord.A1, Orientation.HORIZONTAL)
+
+        owner_html = _render_board_grid(
+            board, BoardViewpoint.OWNER, "player-board", "player-cell-"
+        )
+        opponent_html = _render_board_grid(
+            board, BoardViewpoint.OPPONENT, "player-board", "player-cell-"
+        )
+
+        assert 'data-ship="destroyer"' in owner_html
+        assert "data-ship" not in opponent_html
+
+    def test_opponent_view_shows_only_shot_rounds(self, client: TestClient):
+        from game.model import Coord, GameBoard, Orientation, Ship, ShipType
+        from routes.helpers import BoardViewpoint, _render_board_grid
+
+        board = GameBoard()
+        board.place_ship(Ship(ShipType.DESTROYER), Coord.A1, Orientation.HORIZONTAL)
+        board.receive_shot(Coord.A1, 1)
+        board.receive_shot(Coord.J10, 2)
+
+        owner_html = _render_board_grid(
+            board, BoardViewpoint.OWNER, "player-board", "player-cell-"
+        )
+        # Same board version and IDs: only the viewpoint separates the entries
+        opponent_html = _render_board_grid(
+            board, BoardViewpoint.OPPONENT, "player-board", "player-cell-"
+        )
+
+        assert 'data-shot="hit"' in owner_html
+        assert 'data-shot="miss"' in owner_html
+        assert 'data-shot="hit"' not in opponent_html
+        assert 'data-shot="miss"' not in opponent_html
+        assert opponent_html.count('data-shot="fired"') == 2
+        assert 'data-round="2"' in opponent_html
+
+    def test_cell_macro_never_marks_hits_without_ships(self, client: TestClient):
+        from game.model import Coord, GameBoard, Orientation, Ship, ShipType
+        from routes.helpers import _get_templates
+
+        board = GameBoard()
+        board.place_ship(Ship(ShipType.DESTROYER), Coord.A1, Orientation.HORIZONTAL)
+        board.receive_shot(Coord.A1, 1)
+
+        # Even given the owner's grid, the opponent rendering hides the hit
+        html = (
+            _get_templates()
+            .get_template("components/board_grid.html")
+            .render(
+                grid=board.display_grid(),
+                show_ships=False,
+                table_testid="opponent-board",
+                cell_testid_prefix="opponent-cell-",
+            )
+        )
+
+        assert 'data-shot="hit"' not in html
+        assert "data-ship" not in html
+        assert 'data-shot="fired" data-round="1"' in html
+
+    def test_board_change_renders_new_fragment(self, client: TestClient):
+        from game.model import Coord, GameBoard, Orientation, Ship, ShipType
+        from routes.helpers import BoardViewpoint, _render_board_grid
+
+        board = GameBoard()
+        empty_html = _render_board_grid(
+            board, BoardViewpoint.OWNER, "ship-grid", "grid-cell-"
+        )
+        board.place_ship(Ship(ShipType.DESTROYER), Coord.A1, Orientation.HORIZONTAL)
+
+        html = _render_board_grid(
+            board, BoardViewpoint.OWNER, "ship-grid", "grid-cell-"
+        )
+
+        assert "data-ship" not in empty_html
+        assert 'data-ship="destroyer"' in html
+
+
+class TestHitInferenceOverlay:
+    """Tests for GET /game/{game_id}/hit-inference"""
+
+    def _launch_game(self, client: TestClient) -> str:
+        create_response = client.post(
+            "/start-game",
+            data={"action": "launch_game", "player_name": "Alice"},
+            follow_redirects=False,
+        )
+        return create_response.headers["location"].split("/")[-1]
+
+    def test_game_page_offers_the_overlay(self, authenticated_client: TestClient):
+        game_id = self._launch_game(authenticated_client)
+
+        response = authenticated_client.get(f"/game/{game_id}")
+
+        assert 'data-testid="show-hit-inference"' in response.text
+        assert f'hx-get="/game/{game_id}/hit-inference"' in response.text
+
+    def test_overlay_before_any_shots(self, authenticated_client: TestClient):
+        game_id = self._launch_game(authenticated_client)
+
+        response = authenticated_client.get(f"/game/{game_id}/hit-inference")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert 'data-testid="hit-inference"' in response.text
+        assert "No shots fired yet." in response.text
+
+    def test_overlay_forbidden_for_player_not_in_game(
+        self, alice_client: TestClient, bob_client: TestClient
+    ):
+        game_id = self._launch_game(alice_client)
+
+        response = bob_client.get(f"/game/{game_id}/hit-inference")
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_overlay_shows_deductions_from_hit_reports(self, client: TestClient):
+        from game.model import Coord, GameBoard, Orientation, Ship, ShipType
+        from routes.gameplay import _render_hit_inference
+
+        board = GameBoard()
+        board.place_ship(Ship(ShipType.DESTROYER), Coord.E5, Orientation.HORIZONTAL)
+        board.receive_salvo([Coord.E5, Coord.E6, Coord.J10], 1)
+
+        html = _render_hit_inference(board)
+
+        assert 'data-testid="hit-inference-rounds"' in html
+        assert "Destroyer &times;2" in html
+        assert "Destroyer (sunk)" in html
+        assert "E5, E6" in html
+
+
+class TestFireAtComputer:
+    """Tests for POST /game/{game_id}/fire"""
+
+    def _launch_game(self, client: TestClient) -> str:
+        client.post("/random-ship-placement", data={"player_name": "Alice"})
+        create_response = client.post(
+            "/start-game",
+            data={"action": "launch_game", "player_name": "Alice"},
+            follow_redirects=False,
+        )
+        return create_response.headers["location"].split("/")[-1]
+
+    def test_game_page_shows_fire_form(self, authenticated_client: TestClient):
+        game_id = self._launch_game(authenticated_client)
+
+        response = authenticated_client.get(f"/game/{game_id}")
+
+        assert 'data-testid="fire-form"' in response.text
+        assert "Up to 6 cells" in response.text
+
+    def test_fire_resolves_the_round(self, authenticated_client: TestClient):
+        game_id = self._launch_game(authenticated_client)
+
+        response = authenticated_client.post(
+            f"/game/{game_id}/fire",
+            data={"shots": "a1, C4 E7"},
+            follow_redirects=False,
+        )
+
+        assert response.status_code == status.HTTP_303_SEE_OTHER
+        assert response.headers["location"] == f"/game/{game_id}"
+        page = authenticated_client.get(f"/game/{game_id}")
+        assert "Round 2" in page.text
+        snapshot = authenticated_client.get(
+            f"/game/{game_id}/deltas", params={"since": 999}
+        ).json()["snapshot"]
+        assert snapshot["opponent_board"]["shots_received"] == {
+            "A1": 1,
+            "C4": 1,
+            "E7": 1,
+        }
+        assert len(snapshot["player_board"]["shots_received"]) == 6
+
+    def test_opponent_grid_does_not_reveal_hits(self, authenticated_client: TestClient):
+        from main import game_service
+
+        game_id = self._launch_game(authenticated_client)
+        game = game_service.games[game_id]
+        computer_board = game.board[game.player_2]
+        ship_cells = [coord.name for coord in computer_board.ships[0].positions]
+        authenticated_client.post(
+            f"/game/{game_id}/fire", data={"shots": " ".join(ship_cells[:2])}
+        )
+
+        page = authenticated_client.get(f"/game/{game_id}").text
+
+        opponent_cells = re.findall(r'<td id="opponent-cell-[^>]*>', page)
+        assert len(opponent_cells) == 100
+        assert not any('data-shot="hit"' in cell for cell in opponent_cells)
+        assert not any('data-shot="miss"' in cell for cell in opponent_cells)
+        assert not any("data-ship" in cell for cell in opponent_cells)
+
+    def test_fire_rejects_unknown_cells(self, authenticated_client: TestClient):
+        game_id = self._launch_game(authenticated_client)
+
+        response = authenticated_client.post(
+            f"/game/{game_id}/fire", data={"shots": "A1 K11"}
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "K11" in response.json()["detail"]
+
+    def test_fire_rejects_repeated_shots(self, authenticated_client: TestClient):
+        game_id = self._launch_game(authenticated_client)
+        authenticated_client.post(f"/game/{game_id}/fire", data={"shots": "A1"})
+
+        response = authenticated_client.post(
+            f"/game/{game_id}/fire", data={"shots": "A1"}
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "repeats a shot" in response.json()["detail"]
+
+    def test_fire_forbidden_for_player_not_in_game(
+        self, alice_client: TestClient, bob_client: TestClient
+    ):
+        game_id = self._launch_game(alice_client)
+
+        response = bob_client.post(f"/game/{game_id}/fire", data={"shots": "A1"})
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
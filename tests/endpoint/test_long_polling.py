@@ -55,7 +55,8 @@ class TestLongPollingEndpoint:
         elapsed_time = time.time() - start_time
 
         # Verify: Should wait close to timeout duration (2 seconds ± 0.5s)
-        assert response.status_code == status.HTTP_200_OK
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert response.headers["hx-trigger"] == "long-poll-idle"
         assert 1.5 < elapsed_time < 2.5, f"Expected ~2s wait, got {elapsed_time:.2f}s"
 
     def test_long_poll_returns_early_on_state_change(
@@ -99,7 +100,7 @@ class TestLongPollingEndpoint:
         elapsed_time = time.time() - start_time
 
         # Verify: Should timeout after ~1 second
-        assert response.status_code == status.HTTP_200_OK
+        assert response.status_code == status.HTTP_204_NO_CONTENT
         assert 0.5 < elapsed_time < 1.5, (
             f"Expected ~1s timeout, got {elapsed_time:.2f}s"
         )
@@ -170,6 +171,23 @@ class TestLongPollingEndpoint:
         # Should contain some expected HTML elements
         assert "<" in response.text and ">" in response.text
 
+    def test_timeout_response_has_no_body(self, alice_client: TestClient):
+        """An idle timeout sends no fragment; the poll re-arms via HX-Trigger"""
+        alice_client.get("/lobby/status/long-poll")  # Initial call
+
+        response = alice_client.get(
+            "/lobby/status/long-poll", params={"timeout": "0", "version": "1"}
+        )
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert response.content == b""
+
+    def test_component_re_arms_on_idle_event(self, alice_client: TestClient):
+        """The polling element listens for the idle event sent on timeout"""
+        response = alice_client.get("/lobby/status/long-poll")
+
+        assert "long-poll-idle" in response.text
+
 
 class TestLongPollingStateChangeDetection:
     """Tests for state change detection in long polling"""
@@ -56,7 +56,7 @@ class TestLongPollingWithEvents:
         elapsed_time = time.time() - start_time
 
         # Verify: Should still timeout properly (1 second ± 0.5s)
-        assert response.status_code == status.HTTP_200_OK
+        assert response.status_code == status.HTTP_204_NO_CONTENT
         assert 0.5 < elapsed_time < 1.5, (
             f"Expected ~1s timeout, got {elapsed_time:.2f}s"
         )
@@ -132,7 +132,8 @@ class TestMultiplayerShipPlacement:
             )
             duration = time.time() - start_time
 
-            assert response.status_code == status.HTTP_200_OK
+            assert response.status_code == status.HTTP_204_NO_CONTENT
+            assert response.headers["hx-trigger"] == "long-poll-idle"
             assert duration >= 1.5  # Should wait at least close to 2 seconds
         else:
             pytest.fail("Could not extract version from opponent status component")
@@ -692,3 +692,405 @@ class TestResetAllShipsEndpoint:
         status_element = soup.find(attrs={"data-testid": "ship-placement-count"})
         assert status_element is not None
         assert "0 of 5 ships placed" in status_element.text
+
+
+class TestPlacementFragmentResponses:
+    """HTMX placement actions return only the changed parts of the page"""
+
+    CARRIER_A1: dict[str, str] = {
+        "player_name": "Alice",
+        "ship_name": "Carrier",
+        "start_coordinate": "A1",
+        "orientation": "horizontal",
+    }
+
+    def test_htmx_place_ship_returns_oob_fragments(
+        self, authenticated_client: TestClient
+    ):
+        response = authenticated_client.post(
+            "/place-ship", data=self.CARRIER_A1, headers={"HX-Request": "true"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert "<html" not in response.text
+        soup = BeautifulSoup(response.text, "html.parser")
+        swapped_ids = {
+            element["id"] for element in soup.find_all(attrs={"hx-swap-oob": "true"})
+        }
+        assert "placed-ships" in swapped_ids
+        assert "placement-progress" in swapped_ids
+        # Only the carrier's cells are sent, not the whole board
+        assert "ship-grid-container" not in swapped_ids
+        cells = soup.find("template").find_all("td")
+        assert [cell["id"] for cell in cells] == [
+            f"grid-cell-A{i}" for i in range(1, 6)
+        ]
+        assert all(cell["data-ship"] == "carrier" for cell in cells)
+        assert soup.find(attrs={"data-testid": "placed-ship-carrier"}) is not None
+
+    def test_htmx_fragments_are_much_smaller_than_the_page(
+        self, authenticated_client: TestClient
+    ):
+        fragment = authenticated_client.post(
+            "/random-ship-placement",
+            data={"player_name": "Alice"},
+            headers={"HX-Request": "true"},
+        )
+        page = authenticated_client.post(
+            "/random-ship-placement", data={"player_name": "Alice"}
+        )
+
+        assert len(fragment.content) < len(page.content)
+        assert "<html" in page.text
+
+    def test_htmx_placement_error_is_swapped_in(self, authenticated_client: TestClient):
+        authenticated_client.post("/place-ship", data=self.CARRIER_A1)
+
+        response = authenticated_client.post(
+            "/place-ship", data=self.CARRIER_A1, headers={"HX-Request": "true"}
+        )
+
+        soup = BeautifulSoup(response.text, "html.parser")
+        error_slot = soup.find(id="placement-error-slot")
+        assert error_slot["hx-swap-oob"] == "true"
+        assert error_slot.find(attrs={"data-testid": "placement-error"}) is not None
+
+    def test_htmx_reset_clears_ship_list(self, authenticated_client: TestClient):
+        authenticated_client.post("/place-ship", data=self.CARRIER_A1)
+
+        response = authenticated_client.post(
+            "/reset-all-ships",
+            data={"player_name": "Alice"},
+            headers={"HX-Request": "true"},
+        )
+
+        assert "No ships placed yet." in response.text
+        assert 'data-testid="placed-ship-carrier"' not in response.text
+        assert 'id="ship-grid-container" hx-swap-oob="true"' in response.text
+
+    def test_htmx_remove_ship_deletes_its_row(self, authenticated_client: TestClient):
+        authenticated_client.post("/place-ship", data=self.CARRIER_A1)
+        authenticated_client.post(
+            "/place-ship",
+            data={
+                **self.CARRIER_A1,
+                "ship_name": "Destroyer",
+                "start_coordinate": "J1",
+            },
+        )
+
+        response = authenticated_client.post(
+            "/remove-ship",
+            data={"player_name": "Alice", "ship_name": "Carrier"},
+            headers={"HX-Request": "true"},
+        )
+
+        soup = BeautifulSoup(response.text, "html.parser")
+        assert soup.find(id="placed-ship-carrier")["hx-swap-oob"] == "delete"
+        assert len(soup.find("template").find_all("td")) == 5
+
+    def test_placement_forms_post_over_htmx(self, authenticated_client: TestClient):
+        response = authenticated_client.get("/place-ships")
+
+        soup = BeautifulSoup(response.text, "html.parser")
+        form = soup.find("form", id="place-ship-form")
+        assert form["hx-post"] == "/place-ship"
+        assert form["hx-swap"] == "none"
+
+
+class TestLegalStartsEndpoint:
+    """Tests for GET /place-ships/legal-starts"""
+
+    def test_empty_board_lists_all_in_bounds_starts(
+        self, authenticated_client: TestClient
+    ):
+        response = authenticated_client.get(
+            "/place-ships/legal-starts",
+            params={"ship_name": "Carrier", "orientation": "vertical"},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        body = response.json()
+        assert body["ship_name"] == "Carrier"
+        assert body["orientation"] == "vertical"
+        assert len(body["cells"]) == 60
+        assert "F1" in body["cells"]
+        assert "G1" not in body["cells"]
+
+    def test_excludes_cells_touching_placed_ships(
+        self, authenticated_client: TestClient
+    ):
+        authenticated_client.post(
+            "/place-ship",
+            data={
+                "player_name": "Alice",
+                "ship_name": "Carrier",
+                "start_coordinate": "A1",
+                "orientation": "horizontal",
+            },
+        )
+
+        body = authenticated_client.get(
+            "/place-ships/legal-starts",
+            params={"ship_name": "Destroyer", "orientation": "diagonal-down"},
+        ).json()
+
+        assert "B1" not in body["cells"]
+        assert "C1" in body["cells"]
+
+    def test_invalid_orientation_returns_400(self, authenticated_client: TestClient):
+        response = authenticated_client.get(
+            "/place-ships/legal-starts",
+            params={"ship_name": "Carrier", "orientation": "sideways"},
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+class TestPlaceFleetEndpoint:
+    """Tests for POST /place-fleet"""
+
+    def test_place_fleet_from_share_code(self, authenticated_client: TestClient):
+        response = authenticated_client.post(
+            "/place-fleet",
+            data={"player_name": "Alice", "share_code": "AA1H.BC1H.CE1V.SE5D.DJ9H"},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["share_code"] == "AA1H.BC1H.CE1V.SE5D.DJ9H"
+        page = authenticated_client.get("/place-ships")
+        assert "5 of 5 ships placed" in page.text
+
+    def test_place_fleet_from_form_fields(self, authenticated_client: TestClient):
+        response = authenticated_client.post(
+            "/place-fleet",
+            data={
+                "player_name": "Alice",
+                "ship_name": [
+                    "Carrier",
+                    "Battleship",
+                    "Cruiser",
+                    "Submarine",
+                    "Destroyer",
+                ],
+                "start_coordinate": ["A1", "C1", "E1", "E5", "J9"],
+                "orientation": [
+                    "horizontal",
+                    "horizontal",
+                    "vertical",
+                    "diagonal-down",
+                    "horizontal",
+                ],
+            },
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["share_code"] == "AA1H.BC1H.CE1V.SE5D.DJ9H"
+
+    def test_invalid_fleet_reports_all_violations(
+        self, authenticated_client: TestClient
+    ):
+        response = authenticated_client.post(
+            "/place-fleet",
+            data={"player_name": "Alice", "share_code": "AA1H.BA2H.CJ9H"},
+        )
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        violations = response.json()["violations"]
+        assert "Battleship overlaps Carrier" in violations
+        assert "Cruiser at J9 horizontal goes outside the board" in violations
+        assert "Submarine is missing" in violations
+        page = authenticated_client.get("/place-ships")
+        assert "0 of 5 ships placed" in page.text
+
+    def test_place_fleet_refused_once_ready(self, authenticated_client: TestClient):
+        from main import game_service
+
+        authenticated_client.get("/place-ships")
+        (player_id,) = game_service.ship_placement_boards
+        game_service.set_player_ready(player_id)
+
+        response = authenticated_client.post(
+            "/place-fleet",
+            data={"player_name": "Alice", "share_code": "AA1H.BC1H.CE1V.SE5D.DJ9H"},
+        )
+
+        assert response.status_code == status.HTTP_409_CONFLICT
+        assert game_service.ship_placement_boards[player_id].ships == []
+
+
+BLOCKED_FOR_CARRIER: list[tuple[str, str]] = [
+    ("Battleship", "F2"),
+    ("Cruiser", "F5"),
+    ("Submarine", "B5"),
+    ("Destroyer", "D9"),
+]
+
+
+def _block_the_carrier(client: TestClient) -> None:
+    for ship_name, start in BLOCKED_FOR_CARRIER:
+        client.post(
+            "/place-ship",
+            data={
+                "player_name": "Alice",
+                "ship_name": ship_name,
+                "start_coordinate": start,
+                "orientation": "diagonal-down",
+            },
+        )
+
+
+class TestFleetFeasibilityEndpoint:
+    """Tests for GET /place-ships/feasibility"""
+
+    def test_empty_board_is_feasible(self, authenticated_client: TestClient):
+        response = authenticated_client.get("/place-ships/feasibility")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["feasible"] is True
+        assert response.json()["remaining"] == [
+            "Carrier",
+            "Battleship",
+            "Cruiser",
+            "Submarine",
+            "Destroyer",
+        ]
+
+    def test_reports_when_remaining_ships_no_longer_fit(
+        self, authenticated_client: TestClient
+    ):
+        _block_the_carrier(authenticated_client)
+
+        response = authenticated_client.get("/place-ships/feasibility")
+
+        assert response.json()["feasible"] is False
+        assert response.json()["remaining"] == ["Carrier"]
+
+    def test_placement_page_warns_when_fleet_no_longer_fits(
+        self, authenticated_client: TestClient
+    ):
+        _block_the_carrier(authenticated_client)
+
+        response = authenticated_client.get("/place-ships")
+
+        assert "The remaining ships no longer fit" in response.text
+
+
+class TestAutoCompleteShipsEndpoint:
+    """Tests for POST /auto-complete-ships"""
+
+    def test_fills_in_remaining_ships_keeping_placed_ones(
+        self, authenticated_client: TestClient
+    ):
+        authenticated_client.post(
+            "/place-ship",
+            data={
+                "player_name": "Alice",
+                "ship_name": "Carrier",
+                "start_coordinate": "J1",
+                "orientation": "horizontal",
+            },
+        )
+
+        response = authenticated_client.post(
+            "/auto-complete-ships", data={"player_name": "Alice"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert "5 of 5 ships placed" in response.text
+        soup = BeautifulSoup(response.text, "html.parser")
+        for col in range(1, 6):
+            cell = soup.find(attrs={"data-testid": f"grid-cell-J{col}"})
+            assert cell is not None and "A" in cell.get_text()
+
+    def test_unsolvable_board_shows_error_and_is_unchanged(
+        self, authenticated_client: TestClient
+    ):
+        _block_the_carrier(authenticated_client)
+
+        response = authenticated_client.post(
+            "/auto-complete-ships", data={"player_name": "Alice"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert "The remaining ships no longer fit" in response.text
+        page = authenticated_client.get("/place-ships")
+        assert "4 of 5 ships placed" in page.text
+
+
+class TestUndoRedoPlacementEndpoints:
+    """Tests for POST /undo-placement and POST /redo-placement"""
+
+    def _place(self, client: TestClient, ship_name: str, start: str) -> None:
+        client.post(
+            "/place-ship",
+            data={
+                "player_name": "Alice",
+                "ship_name": ship_name,
+                "start_coordinate": start,
+                "orientation": "horizontal",
+            },
+        )
+
+    def test_undo_removes_last_ship_and_redo_restores_it(
+        self, authenticated_client: TestClient
+    ):
+        self._place(authenticated_client, "Destroyer", "A1")
+        self._place(authenticated_client, "Cruiser", "C1")
+
+        undone = authenticated_client.post(
+            "/undo-placement", data={"player_name": "Alice"}
+        )
+
+        assert undone.status_code == status.HTTP_200_OK
+        assert "1 of 5 ships placed" in undone.text
+        redone = authenticated_client.post(
+            "/redo-placement", data={"player_name": "Alice"}
+        )
+        assert "2 of 5 ships placed" in redone.text
+
+    def test_undo_reverts_random_placement_in_one_step(
+        self, authenticated_client: TestClient
+    ):
+        self._place(authenticated_client, "Destroyer", "A1")
+        authenticated_client.post(
+            "/random-ship-placement", data={"player_name": "Alice"}
+        )
+
+        response = authenticated_client.post(
+            "/undo-placement", data={"player_name": "Alice"}
+        )
+
+        assert "1 of 5 ships placed" in response.text
+
+    def test_buttons_reflect_history(self, authenticated_client: TestClient):
+        page = BeautifulSoup(
+            authenticated_client.get("/place-ships").text, "html.parser"
+        )
+        undo = page.find(attrs={"data-testid": "undo-placement-button"})
+        assert undo is not None and undo.has_attr("disabled")
+
+        self._place(authenticated_client, "Destroyer", "A1")
+
+        page = BeautifulSoup(
+            authenticated_client.get("/place-ships").text, "html.parser"
+        )
+        undo = page.find(attrs={"data-testid": "undo-placement-button"})
+        redo = page.find(attrs={"data-testid": "redo-placement-button"})
+        assert undo is not None and not undo.has_attr("disabled")
+        assert redo is not None and redo.has_attr("disabled")
+
+    def test_htmx_undo_sends_history_controls(self, authenticated_client: TestClient):
+        self._place(authenticated_client, "Destroyer", "A1")
+
+        response = authenticated_client.post(
+            "/undo-placement",
+            data={"player_name": "Alice"},
+            headers={"HX-Request": "true"},
+        )
+
+        soup = BeautifulSoup(response.text, "html.parser")
+        controls = soup.find(id="placement-history")
+        assert controls is not None and controls.get("hx-swap-oob") == "true"
+        redo = controls.find(attrs={"data-testid": "redo-placement-button"})
+        assert redo is not None and not redo.has_attr("disabled")
@@ -0,0 +1,118 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from game.batch_engine import NO_SHOT, BatchBoards, play_random
+from game.mask_board import MaskBoard
+from game.model import ORIENTATION_STEPS, Orientation
+from game.rules import Rules
+
+
+def _placed_boards(rules: Rules, count: int, seed: int) -> list[MaskBoard]:
+    rng = random.Random(seed)
+    boards: list[MaskBoard] = []
+    for _ in range(count):
+        board = MaskBoard(rules)
+        board.place_fleet_randomly(rng)
+        boards.append(board)
+    return boards
+
+
+class TestCrossValidation:
+    @pytest.mark.parametrize("rules", [Rules(), Rules.scaled(20, 20)])
+    def test_batch_matches_scalar_engine(self, rules: Rules):
+        scalar_boards = _placed_boards(rules, 64, seed=rules.rows)
+        batch = BatchBoards.from_mask_boards(scalar_boards)
+        rng = np.random.default_rng(rules.rows)
+
+        while not batch.defeated.all():
+            sizes = rng.integers(0, rules.shots_per_round + 1, len(batch))
+            salvos = batch.random_salvos(rng, sizes)
+
+            result = batch.receive_salvos(salvos)
+
+            for row, board in enumerate(scalar_boards):
+                cells = [int(cell) for cell in salvos[row] if cell != NO_SHOT]
+                expected = board.receive_salvo(cells)
+                assert tuple(result.hits[row]) == expected.hits
+                assert tuple(np.flatnonzero(result.sunk[row])) == expected.sunk
+                assert batch.shots_available[row] == board.shots_available
+                assert batch.defeated[row] == board.is_defeated
+
+
+class TestBatchBoards:
+    def _batch(self) -> BatchBoards:
+        board = MaskBoard()
+        board.place(0, 0, Orientation.HORIZONTAL)  # Carrier A1-A5
+        board.place(1, 20, Orientation.HORIZONTAL)  # Battleship C1-C4
+        board.place(2, 40, Orientation.HORIZONTAL)  # Cruiser E1-E3
+        board.place(3, 60, Orientation.HORIZONTAL)  # Submarine G1-G3
+        board.place(4, 80, Orientation.HORIZONTAL)  # Destroyer I1-I2
+        return BatchBoards.from_mask_boards([board, board])
+
+    def test_sinking_updates_shots_available(self):
+        batch = self._batch()
+
+        result = batch.receive_salvos(np.array([[80, 81], [80, NO_SHOT]]))
+
+        assert result.sunk[0].tolist() == [False, False, False, False, True]
+        assert not result.sunk[1].any()
+        assert batch.shots_available.tolist() == [5, 6]
+
+    def test_repeat_shot_is_rejected_without_applying(self):
+        batch = self._batch()
+        batch.receive_salvos(np.array([[0], [NO_SHOT]]))
+
+        with pytest.raises(ValueError):
+            batch.receive_salvos(np.array([[0], [1]]))
+        with pytest.raises(ValueError):
+            batch.receive_salvos(np.array([[5, 5], [NO_SHOT, NO_SHOT]]))
+        assert batch.shots.sum() == 1
+
+    def test_off_board_cell_is_rejected(self):
+        with pytest.raises(ValueError):
+            self._batch().receive_salvos(np.array([[100], [0]]))
+
+    def test_unplaced_fleet_cannot_be_packed(self):
+        with pytest.raises(ValueError):
+            BatchBoards.from_mask_boards([MaskBoard()])
+
+
+class TestPlayRandom:
+    def test_games_finish_and_are_reproducible(self):
+        outcome = play_random(200, seed=7)
+
+        assert (outcome.rounds > 0).all()
+        assert set(outcome.winner.tolist()) <= {0, 1, 2}
+        again = play_random(200, seed=7)
+        assert (again.rounds == outcome.rounds).all()
+        assert (again.winner == outcome.winner).all()
+
+
+class TestRandomPlacement:
+    @pytest.mark.parametrize("rules", [Rules(), Rules.scaled(26, 26), Rules(7, 7)])
+    def test_random_fleets_are_legal(self, rules: Rules):
+        batch = BatchBoards.random(300, rules, seed=1)
+
+        grid = rules.grid
+        legal_masks = {
+            (ship.length, mask)
+            for ship in rules.fleet
+            for row_step, col_step in ORIENTATION_STEPS.values()
+            for _, mask in grid.placements(ship.length, row_step, col_step)
+        }
+        for ship_ids in batch.ship_ids:
+            board = MaskBoard(rules)
+            for index, ship in enumerate(rules.fleet):
+                mask = grid.cells_to_mask(np.flatnonzero(ship_ids == index).tolist())
+                assert (ship.length, mask) in legal_masks
+                assert not mask & board.forbidden
+                board._add_ship(index, mask)
+
+    def test_placement_is_reproducible(self):
+        first = BatchBoards.random(50, seed=3)
+        second = BatchBoards.random(50, seed=3)
+
+        assert (first.ship_ids == second.ship_ids).all()
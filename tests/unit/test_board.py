@@ -1,6 +1,7 @@
 import pytest
 
 from game.model import (
+    BoardSnapshot,
     Coord,
     GameBoard,
     Ship,
@@ -11,6 +12,7 @@ from game.model import (
     ShipPlacementOutOfBoundsError,
     ShipPlacementTooCloseError,
 )
+from game.rules import STANDARD_RULES, Rules
 
 
 class TestGameBoard:
@@ -300,3 +302,276 @@ class TestShipPlacementExceptionMessages:
         
         assert hasattr(exc_info.value, 'user_message')
         assert exc_info.value.user_message == "Ships must have empty space around them"
+
+
+class TestGameBoardDisplayGrid:
+    def test_grid_is_10_by_10(self):
+        grid = GameBoard().display_grid()
+
+        assert [row.label for row in grid] == list("ABCDEFGHIJ")
+        assert all(len(row.cells) == 10 for row in grid)
+        assert grid[0].cells[0].coord == "A1"
+        assert grid[9].cells[9].coord == "J10"
+
+    def test_grid_shows_ship_codes(self):
+        board = GameBoard()
+        board.place_ship(Ship(ShipType.DESTROYER), Coord.B2, Orientation.VERTICAL)
+
+        grid = board.display_grid()
+
+        assert grid[1].cells[1].ship_code == "D"
+        assert grid[2].cells[1].ship_name == "Destroyer"
+        assert grid[0].cells[0].ship_code is None
+
+    def test_grid_shows_hits_and_misses(self):
+        board = GameBoard()
+        board.place_ship(Ship(ShipType.DESTROYER), Coord.A1, Orientation.HORIZONTAL)
+        board.receive_shot(Coord.A1, 1)
+        board.receive_shot(Coord.J10, 2)
+
+        grid = board.display_grid()
+
+        assert grid[0].cells[0].is_hit
+        assert grid[0].cells[0].shot_round == 1
+        assert grid[9].cells[9].is_miss
+        assert not grid[0].cells[1].is_hit
+
+    def test_opponent_grid_hides_ships_and_hits(self):
+        board = GameBoard()
+        board.place_ship(Ship(ShipType.DESTROYER), Coord.A1, Orientation.HORIZONTAL)
+        board.receive_shot(Coord.A1, 1)
+        board.receive_shot(Coord.J10, 2)
+
+        grid = board.display_grid(show_ships=False)
+
+        assert grid[0].cells[0].shot_round == 1
+        assert grid[0].cells[0].ship_code is None
+        assert not grid[0].cells[0].is_hit
+        assert not grid[9].cells[9].is_miss
+        assert board.display_grid(show_ships=False) is grid
+        assert board.display_grid()[0].cells[0].is_hit
+
+    def test_grid_is_memoised_until_board_changes(self):
+        board = GameBoard()
+        grid = board.display_grid()
+
+        assert board.display_grid() is grid
+
+        board.place_ship(Ship(ShipType.DESTROYER), Coord.A1, Orientation.HORIZONTAL)
+
+        assert board.display_grid() is not grid
+        assert board.display_grid()[0].cells[0].ship_code == "D"
+
+    def test_version_bumps_on_every_mutation(self):
+        board = GameBoard()
+        board.place_ship(Ship(ShipType.DESTROYER), Coord.A1, Orientation.HORIZONTAL)
+        board.receive_shot(Coord.A1, 1)
+        board.record_shot_fired(Coord.B5, 1)
+        board.remove_ship(ShipType.DESTROYER)
+
+        assert board.version == 4
+
+    def test_placed_ships_display_is_memoised(self):
+        board = GameBoard()
+        board.place_ship(Ship(ShipType.DESTROYER), Coord.A1, Orientation.HORIZONTAL)
+        placed = board.get_placed_ships_for_display()
+
+        assert board.get_placed_ships_for_display() is placed
+
+        board.clear_all_ships()
+
+        assert board.get_placed_ships_for_display() == {}
+
+
+class TestGameBoardSnapshot:
+    def test_snapshot_follows_placements(self):
+        board = GameBoard()
+        board.place_ship(Ship(ShipType.DESTROYER), Coord.A1, Orientation.HORIZONTAL)
+
+        snapshot = board.snapshot()
+
+        assert snapshot.version == board.version
+        assert snapshot.ships[0].ship_type == ShipType.DESTROYER
+        assert snapshot.ships[0].positions == (Coord.A1, Coord.A2)
+
+    def test_placing_a_ship_shares_the_earlier_entries(self):
+        board = GameBoard()
+        board.place_ship(Ship(ShipType.DESTROYER), Coord.A1, Orientation.HORIZONTAL)
+        before = board.snapshot()
+
+        board.place_ship(Ship(ShipType.CRUISER), Coord.C1, Orientation.HORIZONTAL)
+        after = board.snapshot()
+
+        assert after.ships[0] is before.ships[0]
+        assert len(before.ships) == 1  # The earlier snapshot is unchanged
+
+    def test_snapshot_is_unchanged_by_later_removal(self):
+        board = GameBoard()
+        board.place_ship(Ship(ShipType.DESTROYER), Coord.A1, Orientation.HORIZONTAL)
+        snapshot = board.snapshot()
+
+        board.remove_ship(ShipType.DESTROYER)
+
+        assert len(snapshot.ships) == 1
+        assert board.snapshot().ships == ()
+
+    def test_restore_brings_ships_back_and_bumps_version(self):
+        board = GameBoard()
+        board.place_ship(Ship(ShipType.DESTROYER), Coord.A1, Orientation.HORIZONTAL)
+        snapshot = board.snapshot()
+        board.clear_all_ships()
+        version = board.version
+
+        board.restore(snapshot)
+
+        assert board.version == version + 1
+        assert [ship.positions for ship in board.ships] == [[Coord.A1, Coord.A2]]
+        assert board.get_placed_ships_for_display()["Destroyer"]["cells"] == [
+            "A1",
+            "A2",
+        ]
+
+    def test_restore_empty_snapshot(self):
+        board = GameBoard()
+        board.place_ship(Ship(ShipType.DESTROYER), Coord.A1, Orientation.HORIZONTAL)
+
+        board.restore(BoardSnapshot(0))
+
+        assert board.ships == []
+
+    def test_boards_share_interned_placed_ships(self):
+        board_1 = GameBoard()
+        board_2 = GameBoard()
+        for board in (board_1, board_2):
+            board.place_ship(Ship(ShipType.CARRIER), Coord.A1, Orientation.HORIZONTAL)
+
+        assert board_1.snapshot().ships[0] is board_2.snapshot().ships[0]
+
+
+class TestGameBoardSalvo:
+    def _board(self) -> GameBoard:
+        board = GameBoard()
+        board.place_ship(Ship(ShipType.CARRIER), Coord.A1, Orientation.HORIZONTAL)
+        board.place_ship(Ship(ShipType.DESTROYER), Coord.J1, Orientation.HORIZONTAL)
+        return board
+
+    def test_salvo_reports_hits_per_ship_type(self):
+        board = self._board()
+
+        hits = board.receive_salvo([Coord.A1, Coord.A2, Coord.J1, Coord.E5], 1)
+
+        assert hits == {ShipType.CARRIER: 2, ShipType.DESTROYER: 1}
+        assert board.shots_received[Coord.E5] == 1
+
+    def test_sinking_a_ship_reduces_shots_available(self):
+        board = self._board()
+        assert board.shots_available == 3
+
+        board.receive_salvo([Coord.J1, Coord.J2], 1)
+
+        assert board.is_sunk(ShipType.DESTROYER)
+        assert not board.is_sunk(ShipType.CARRIER)
+        assert board.shots_available == 2
+        assert not board.all_ships_sunk
+
+    def test_repeated_shot_is_rejected(self):
+        board = self._board()
+        board.receive_salvo([Coord.A1], 1)
+
+        with pytest.raises(ValueError):
+            board.receive_salvo([Coord.B1, Coord.A1], 2)
+        with pytest.raises(ValueError):
+            board.receive_salvo([Coord.B1, Coord.B1], 2)
+        assert Coord.B1 not in board.shots_received
+
+    def test_all_ships_sunk(self):
+        board = self._board()
+
+        carrier = [Coord[f"A{col}"] for col in range(1, 6)]
+        board.receive_salvo([*carrier, Coord.J1, Coord.J2], 1)
+
+        assert board.all_ships_sunk
+        assert board.shots_available == 0
+
+
+class TestGameBoardRules:
+    RULES = Rules.scaled(20, 20)
+
+    def test_standard_board_plays_by_standard_rules(self):
+        board = GameBoard()
+
+        assert board.rules == STANDARD_RULES
+        assert board.fleet == tuple(ShipType)
+
+    def test_large_board_places_ships_beyond_j10(self):
+        board = GameBoard(self.RULES)
+        carrier, battleship = board.fleet[:2]
+
+        board.place_ship(Ship(carrier), board.coord("P20"), Orientation.VERTICAL)
+
+        assert [coord.name for coord in board.ships[0].positions] == [
+            "P20",
+            "Q20",
+            "R20",
+            "S20",
+            "T20",
+        ]
+        with pytest.raises(ShipPlacementOutOfBoundsError):
+            board.place_ship(Ship(battleship), board.coord("R20"), Orientation.VERTICAL)
+        with pytest.raises(ShipPlacementTooCloseError):
+            board.place_ship(
+                Ship(battleship), board.coord("O16"), Orientation.HORIZONTAL
+            )
+
+    def test_standard_coords_name_the_same_cells(self):
+        board = GameBoard(self.RULES)
+
+        board.place_ship(Ship(board.fleet[0]), Coord.A1, Orientation.HORIZONTAL)
+
+        assert board.ships[0].positions[0] is board.coord("A1")
+        assert board.ship_type_at(board.coord("A5")) == board.fleet[0]
+
+    def test_large_board_salvo_reports_hits_and_rejects_off_board_shots(self):
+        board = GameBoard(self.RULES)
+        destroyer = board.fleet[-1]
+        board.place_ship(Ship(destroyer), board.coord("T19"), Orientation.HORIZONTAL)
+
+        hits = board.receive_salvo([board.coord("T19"), board.coord("K11")], 1)
+
+        assert hits == {destroyer: 1}
+        with pytest.raises(ValueError):
+            board.receive_salvo([board.coord("T20"), board.coord("T19")], 2)
+        with pytest.raises(ValueError):
+            GameBoard().receive_salvo([board.coord("K11")], 1)
+        board.receive_salvo([board.coord("T20")], 2)
+        assert board.is_sunk(destroyer)
+
+    def test_display_grid_and_print_follow_the_board_size(self):
+        board = GameBoard(Rules(12, 14))
+
+        grid = board.display_grid()
+        lines = GameBoardHelper.print(board)
+
+        assert len(grid) == 12
+        assert all(len(row.cells) == 14 for row in grid)
+        assert grid[-1].cells[-1].coord == "L14"
+        assert lines[0] == "  " + " ".join(str(col) for col in range(1, 15))
+        assert lines[-1].startswith("L|")
+        assert len(lines) == 14
+
+
+class TestGameBoardPickle:
+    def test_copy_keeps_identity_ships_and_shots(self):
+        import pickle
+
+        board = GameBoard(Rules(12, 14))
+        board.place_ship(Ship(board.fleet[0]), Coord.A1, Orientation.HORIZONTAL)
+        board.receive_salvo([board.coord("A1"), board.coord("L14")], 1)
+
+        copy: GameBoard = pickle.loads(pickle.dumps(board))
+
+        assert (copy.uid, copy.version) == (board.uid, board.version)
+        assert copy.rules == board.rules
+        assert copy.ships[0].positions == board.ships[0].positions
+        assert copy.shots_received == board.shots_received
+        assert copy.coord("L14") is board.coord("L14")
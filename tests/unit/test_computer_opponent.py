@@ -0,0 +1,169 @@
+import random
+import threading
+
+import pytest
+
+from game.game_service import GameService, GameStatus
+from game.model import Coord, Orientation, Ship, ShipType
+from game.player import Player, PlayerStatus
+from services.computer_opponent import ComputerOpponents
+
+
+@pytest.fixture
+def game_service() -> GameService:
+    return GameService()
+
+
+def start_game(game_service: GameService) -> tuple[str, Player]:
+    """Start a single-player game with a randomly placed fleet for the human."""
+    player = Player(name="Alice", status=PlayerStatus.AVAILABLE)
+    game_service.add_player(player)
+    random.seed(1)
+    game_service.place_ships_randomly(player.id)
+    return game_service.start_single_player_game(player.id), player
+
+
+def unfired(game_service: GameService, game_id: str, player: Player) -> list[Coord]:
+    board = game_service.games[game_id].board[player]
+    return [coord for coord in Coord if coord not in board.shots_fired]
+
+
+class TestComputerOpponents:
+    def test_speculated_salvo_is_used_when_ready(self, game_service: GameService):
+        game_id, player = start_game(game_service)
+        opponents = ComputerOpponents(game_service)
+        speculated = opponents.prepare(game_id)
+        assert speculated is not None
+        expected = speculated.result(timeout=5)
+
+        report = opponents.play_round(game_id, player.id, [Coord.A1])
+
+        board = game_service.games[game_id].board[player]
+        assert report.round_number == 1
+        assert sorted(board.shots_received, key=list(Coord).index) == sorted(
+            expected, key=list(Coord).index
+        )
+        assert opponents.get_stats()["speculated"] == 1
+        assert opponents.get_stats()["fallbacks"] == 0
+        opponents.shutdown()
+
+    def test_falls_back_without_speculation(self, game_service: GameService):
+        game_id, player = start_game(game_service)
+        opponents = ComputerOpponents(game_service, workers=0)
+
+        assert opponents.prepare(game_id) is None
+        opponents.play_round(game_id, player.id, [Coord.A1, Coord.B2])
+
+        board = game_service.games[game_id].board[player]
+        # A full fleet's shots
+        assert len(board.shots_received) == sum(
+            ship.shots_available for ship in ShipType
+        )
+        assert opponents.get_stats()["fallbacks"] == 1
+
+    def test_speculation_for_another_round_is_not_used(self, game_service: GameService):
+        game_id, player = start_game(game_service)
+        opponents = ComputerOpponents(game_service)
+        opponents.prepare(game_id).result(timeout=5)
+        computer_id = next(iter(game_service.computer_player_ids))
+        # The round resolves without the computer service knowing
+        game_service.resolve_round(
+            game_id, {player.id: [Coord.J10], computer_id: [Coord.J10]}
+        )
+
+        opponents.play_round(game_id, player.id, [Coord.J9])
+
+        assert opponents.get_stats()["fallbacks"] == 1
+        assert game_service.games[game_id].round_number == 3
+        opponents.shutdown()
+
+    def test_new_service_replays_the_game_so_far(self, game_service: GameService):
+        game_id, player = start_game(game_service)
+        first = ComputerOpponents(game_service, workers=0)
+        for _ in range(3):
+            first.play_round(
+                game_id, player.id, unfired(game_service, game_id, player)[:1]
+            )
+
+        # e.g. after a restart: the computer must not fire at the same cells again
+        second = ComputerOpponents(game_service, workers=0)
+        second.play_round(
+            game_id, player.id, unfired(game_service, game_id, player)[:1]
+        )
+
+        board = game_service.games[game_id].board[player]
+        assert set(board.shots_received.values()) == {1, 2, 3, 4}
+
+    def test_plays_a_game_to_the_end(self, game_service: GameService):
+        game_id, player = start_game(game_service)
+        opponents = ComputerOpponents(game_service)
+        game = game_service.games[game_id]
+
+        while game.status != GameStatus.FINISHED:
+            shots = game.board[player].shots_available
+            opponents.play_round(
+                game_id, player.id, unfired(game_service, game_id, player)[:shots]
+            )
+
+        assert opponents.get_stats()["games"] == 0
+        assert opponents.prepare(game_id) is None
+        opponents.shutdown()
+
+    def test_two_player_game_is_rejected(self, game_service: GameService):
+        alice = Player(name="Alice", status=PlayerStatus.AVAILABLE)
+        bob = Player(name="Bob", status=PlayerStatus.AVAILABLE)
+        game_service.add_player(alice)
+        game_service.add_player(bob)
+        game_id = game_service.create_two_player_game(alice.id, bob.id)
+        game_service.games[game_id].board[alice].place_ship(
+            Ship(ShipType.DESTROYER), Coord.A1, Orientation.HORIZONTAL
+        )
+        opponents = ComputerOpponents(game_service, workers=0)
+
+        assert opponents.prepare(game_id) is None
+        with pytest.raises(ValueError, match="not against the computer"):
+            opponents.play_round(game_id, alice.id, [Coord.A1])
+
+    def test_unknown_strategy_is_rejected(self, game_service: GameService):
+        with pytest.raises(ValueError, match="Unknown strategy"):
+            ComputerOpponents(game_service, strategy_name="psychic")
+
+    def test_finished_game_is_rejected_before_choosing_a_salvo(
+        self, game_service: GameService
+    ):
+        game_id, player = start_game(game_service)
+        game_service.set_game_status(game_id, GameStatus.FINISHED)
+        opponents = ComputerOpponents(game_service, workers=0)
+
+        with pytest.raises(ValueError, match="is over"):
+            opponents.play_round(game_id, player.id, [Coord.A1])
+
+        assert opponents.get_stats() == {"games": 0, "speculated": 0, "fallbacks": 0}
+
+    def test_round_does_not_wait_for_a_running_speculation(
+        self, game_service: GameService
+    ):
+        game_id, player = start_game(game_service)
+        opponents = ComputerOpponents(game_service, strategy_name="random", workers=0)
+        game = game_service.games[game_id]
+        assert game.player_2 is not None
+        opponent = opponents._opponent_for(game, game.player_2)
+        speculating = opponent.held
+        rng_state = speculating.strategy.rng.getstate()
+        result: list[object] = []
+
+        with speculating.lock:  # As if a speculation were still running
+            fire = threading.Thread(
+                target=lambda: result.append(
+                    opponents.play_round(game_id, player.id, [Coord.A1])
+                )
+            )
+            fire.start()
+            fire.join(timeout=5)
+
+            assert not fire.is_alive()
+        assert result[0].round_number == 1
+        # The speculation's strategy is untouched; the opponent plays on a copy
+        assert speculating.strategy.rng.getstate() == rng_state
+        assert opponent.strategy is not speculating.strategy
+        assert len(opponent.strategy.reports) == 1
@@ -1,5 +1,13 @@
 import pytest
-from game.model import Coord, CoordHelper, Orientation, CoordDetails
+from game.cells import CELL_COL, CELL_NAME, CELL_ROW, NEIGHBOURS, footprint, parse_cell
+from game.model import (
+    Coord,
+    CoordHelper,
+    Orientation,
+    CoordDetails,
+    cell_to_coord,
+    coord_to_cell,
+)
 
 
 class TestCoord:
@@ -206,3 +214,32 @@ class TestCoordHelperFunctions:
             diagonal
         )
         assert adjacent_coords == expected
+
+
+class TestFlyweightCells:
+    def test_cell_tables_match_coords(self):
+        for coord in Coord:
+            cell = coord_to_cell(coord)
+            assert cell_to_coord(cell) is coord
+            assert CELL_NAME[cell] == coord.name
+            assert CELL_ROW[cell] == coord.value.row_index
+            assert CELL_COL[cell] == coord.value.col_index
+
+    def test_parse_cell_is_case_insensitive(self):
+        assert parse_cell("e5") == coord_to_cell(Coord.E5)
+        with pytest.raises(KeyError):
+            parse_cell("K1")
+
+    def test_neighbours_match_coord_helper(self):
+        for coord in Coord:
+            neighbours = {
+                cell_to_coord(cell) for cell in NEIGHBOURS[coord_to_cell(coord)]
+            }
+            assert neighbours == CoordHelper.coords_adjacent_to_a_coords_list([coord])
+
+    def test_footprint_off_the_board_is_none(self):
+        assert footprint(coord_to_cell(Coord.A8), 3, 0, 1) == tuple(
+            coord_to_cell(coord) for coord in (Coord.A8, Coord.A9, Coord.A10)
+        )
+        assert footprint(coord_to_cell(Coord.A9), 3, 0, 1) is None
+        assert footprint(coord_to_cell(Coord.A1), 2, -1, 1) is None
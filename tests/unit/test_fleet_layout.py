@@ -0,0 +1,100 @@
+import pytest
+
+from game.exceptions import FleetLayoutError
+from game.fleet_layout import (
+    ShipPlacement,
+    parse_share_code,
+    to_share_code,
+    validate_fleet,
+)
+from game.game_service import GameService
+from game.model import Coord, GameBoard, Orientation, Ship, ShipType
+from game.player import Player, PlayerStatus
+
+VALID_CODE: str = "AA1H.BC1H.CE1V.SE5D.DJ9H"
+
+
+def _valid_fleet() -> list[ShipPlacement]:
+    return parse_share_code(VALID_CODE)
+
+
+class TestShareCode:
+    def test_parse_share_code(self):
+        placements = parse_share_code(VALID_CODE)
+
+        assert placements[0] == ShipPlacement(
+            ShipType.CARRIER, Coord.A1, Orientation.HORIZONTAL
+        )
+        assert placements[3] == ShipPlacement(
+            ShipType.SUBMARINE, Coord.E5, Orientation.DIAGONAL_DOWN
+        )
+
+    def test_parse_is_case_insensitive_and_accepts_two_digit_columns(self):
+        assert parse_share_code("da10v") == [
+            ShipPlacement(ShipType.DESTROYER, Coord.A10, Orientation.VERTICAL)
+        ]
+
+    def test_parse_reports_every_bad_token(self):
+        with pytest.raises(FleetLayoutError) as exc_info:
+            parse_share_code("XA1H.AK1H.AA1Q")
+
+        assert len(exc_info.value.violations) == 3
+
+    def test_share_code_round_trip(self):
+        board = GameBoard()
+        for placement in _valid_fleet():
+            board.place_ship(
+                Ship(placement.ship_type), placement.start, placement.orientation
+            )
+
+        assert to_share_code(board) == VALID_CODE
+
+
+class TestValidateFleet:
+    def test_valid_fleet_has_no_violations(self):
+        assert validate_fleet(_valid_fleet()) == []
+
+    def test_reports_every_violation_at_once(self):
+        placements = [
+            ShipPlacement(ShipType.CARRIER, Coord.A1, Orientation.HORIZONTAL),
+            ShipPlacement(ShipType.BATTLESHIP, Coord.A3, Orientation.VERTICAL),
+            ShipPlacement(ShipType.CRUISER, Coord.B1, Orientation.HORIZONTAL),
+            ShipPlacement(ShipType.SUBMARINE, Coord.J9, Orientation.HORIZONTAL),
+            ShipPlacement(ShipType.CARRIER, Coord.G1, Orientation.HORIZONTAL),
+        ]
+
+        violations = validate_fleet(placements)
+
+        assert violations == [
+            "Battleship overlaps Carrier",
+            "Cruiser touches Carrier",
+            "Cruiser overlaps Battleship",
+            "Submarine at J9 horizontal goes outside the board",
+            "Carrier is placed more than once",
+            "Destroyer is missing",
+        ]
+
+
+class TestGameServicePlaceFleet:
+    def test_place_fleet_replaces_existing_ships(self):
+        game_service = GameService()
+        player = Player("Alice", PlayerStatus.AVAILABLE)
+        game_service.add_player(player)
+        game_service.place_ships_randomly(player.id)
+
+        game_service.place_fleet(player.id, _valid_fleet())
+
+        board = game_service.get_or_create_ship_placement_board(player.id)
+        assert to_share_code(board) == VALID_CODE
+
+    def test_invalid_fleet_leaves_board_untouched(self):
+        game_service = GameService()
+        player = Player("Alice", PlayerStatus.AVAILABLE)
+        game_service.add_player(player)
+        board = game_service.get_or_create_ship_placement_board(player.id)
+        board.place_ship(Ship(ShipType.DESTROYER), Coord.J1, Orientation.HORIZONTAL)
+
+        with pytest.raises(FleetLayoutError):
+            game_service.place_fleet(player.id, _valid_fleet()[:4])
+
+        assert [ship.ship_type for ship in board.ships] == [ShipType.DESTROYER]
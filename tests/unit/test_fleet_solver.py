@@ -0,0 +1,133 @@
+import random
+import time
+
+import pytest
+
+from game.fleet_layout import validate_fleet
+from game.fleet_solver import can_complete, complete_fleet, remaining_ship_types
+from game.game_service import GameService
+from game.model import (
+    Coord,
+    GameBoard,
+    Orientation,
+    Ship,
+    ShipPlacementOutOfBoundsError,
+    ShipPlacementTooCloseError,
+    ShipType,
+)
+from game.player import Player, PlayerStatus
+
+
+def _blocked_board() -> GameBoard:
+    """Four ships laid out so there is no legal spot left for the Carrier."""
+    board = GameBoard()
+    for ship_type, start in [
+        (ShipType.BATTLESHIP, Coord.F2),
+        (ShipType.CRUISER, Coord.F5),
+        (ShipType.SUBMARINE, Coord.B5),
+        (ShipType.DESTROYER, Coord.D9),
+    ]:
+        board.place_ship(Ship(ship_type), start, Orientation.DIAGONAL_DOWN)
+    return board
+
+
+def _random_partial_board(rng: random.Random) -> GameBoard:
+    board = GameBoard()
+    for ship_type in rng.sample(list(ShipType), rng.randint(0, 4)):
+        for _ in range(50):
+            try:
+                board.place_ship(
+                    Ship(ship_type),
+                    rng.choice(list(Coord)),
+                    rng.choice(list(Orientation)),
+                )
+                break
+            except (ShipPlacementOutOfBoundsError, ShipPlacementTooCloseError):
+                continue
+    return board
+
+
+class TestCompleteFleet:
+    def test_remaining_ship_types_are_longest_first(self):
+        board = GameBoard()
+        board.place_ship(Ship(ShipType.CRUISER), Coord.A1, Orientation.HORIZONTAL)
+
+        assert remaining_ship_types(board) == [
+            ShipType.CARRIER,
+            ShipType.BATTLESHIP,
+            ShipType.SUBMARINE,
+            ShipType.DESTROYER,
+        ]
+
+    def test_completes_an_empty_board(self):
+        placements = complete_fleet(GameBoard())
+
+        assert placements is not None
+        assert validate_fleet(placements) == []
+
+    def test_complete_board_needs_nothing(self):
+        board = GameBoard()
+        board.place_ship(Ship(ShipType.CARRIER), Coord.A1, Orientation.HORIZONTAL)
+        board.place_ship(Ship(ShipType.BATTLESHIP), Coord.C1, Orientation.HORIZONTAL)
+        board.place_ship(Ship(ShipType.CRUISER), Coord.E1, Orientation.VERTICAL)
+        board.place_ship(Ship(ShipType.SUBMARINE), Coord.E5, Orientation.DIAGONAL_DOWN)
+        board.place_ship(Ship(ShipType.DESTROYER), Coord.J9, Orientation.HORIZONTAL)
+
+        assert complete_fleet(board) == []
+
+    def test_detects_no_room_for_the_carrier(self):
+        board = _blocked_board()
+
+        assert not can_complete(board)
+        assert complete_fleet(board) is None
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_completion_keeps_placed_ships_and_obeys_the_rules(self, seed: int):
+        board = _random_partial_board(random.Random(seed))
+
+        placements = complete_fleet(board, random.Random(seed))
+
+        assert placements is not None
+        for placement in placements:
+            board.place_ship(
+                Ship(placement.ship_type), placement.start, placement.orientation
+            )
+        assert len(board.ships) == len(ShipType)
+
+    def test_answers_within_milliseconds(self):
+        rng = random.Random(7)
+        boards = [_random_partial_board(rng) for _ in range(50)] + [_blocked_board()]
+
+        slowest = 0.0
+        for board in boards:
+            started = time.perf_counter()
+            can_complete(board)
+            slowest = max(slowest, time.perf_counter() - started)
+
+        assert slowest < 0.1  # Typically well under 10ms
+
+
+class TestGameServiceAutoCompleteFleet:
+    def test_keeps_the_players_ships(self):
+        game_service = GameService()
+        player = Player("Alice", PlayerStatus.AVAILABLE)
+        game_service.add_player(player)
+        board = game_service.get_or_create_ship_placement_board(player.id)
+        board.place_ship(Ship(ShipType.CARRIER), Coord.E3, Orientation.DIAGONAL_UP)
+        carrier_positions = list(board.ships[0].positions)
+
+        assert game_service.auto_complete_fleet(player.id)
+
+        assert len(board.ships) == len(ShipType)
+        assert board.ships[0].positions == carrier_positions
+
+    def test_leaves_an_unsolvable_board_untouched(self):
+        game_service = GameService()
+        player = Player("Alice", PlayerStatus.AVAILABLE)
+        game_service.add_player(player)
+        game_service.ship_placement_boards[player.id] = _blocked_board()
+        version = game_service.ship_placement_boards[player.id].version
+
+        assert not game_service.auto_complete_fleet(player.id)
+
+        assert game_service.ship_placement_boards[player.id].version == version
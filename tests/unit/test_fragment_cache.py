@@ -0,0 +1,59 @@
+import sys
+
+import pytest
+
+from services.fragment_cache import FragmentCache
+
+
+class TestFragmentCache:
+    def test_miss_then_hit(self):
+        cache = FragmentCache()
+
+        assert cache.get("board") is None
+        cache.put("board", "<table></table>")
+
+        assert cache.get("board") == "<table></table>"
+        assert cache.get_stats()["hits"] == 1
+        assert cache.get_stats()["misses"] == 1
+
+    def test_evicts_least_recently_used_to_stay_within_budget(self):
+        html: str = "x" * 100
+        cache = FragmentCache(max_bytes=2 * sys.getsizeof(html))
+        cache.put("a", html)
+        cache.put("b", html)
+        cache.get("a")  # "b" is now least recently used
+
+        cache.put("c", html)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == html
+        assert cache.get("c") == html
+        assert cache.get_stats()["evictions"] == 1
+        assert cache.bytes_used <= cache.max_bytes
+
+    def test_replacing_an_entry_does_not_double_count(self):
+        cache = FragmentCache()
+        cache.put("a", "old")
+        cache.put("a", "new")
+
+        assert cache.get("a") == "new"
+        assert cache.bytes_used == sys.getsizeof("new")
+
+    def test_fragment_larger_than_budget_is_not_cached(self):
+        cache = FragmentCache(max_bytes=10)
+
+        cache.put("a", "x" * 100)
+
+        assert cache.get("a") is None
+        assert cache.get_stats()["entries"] == 0
+
+    def test_zero_budget_disables_caching(self):
+        cache = FragmentCache(max_bytes=0)
+
+        cache.put("a", "")
+
+        assert cache.get("a") is None
+
+    def test_negative_budget_rejected(self):
+        with pytest.raises(ValueError):
+            FragmentCache(max_bytes=-1)
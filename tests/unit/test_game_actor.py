@@ -0,0 +1,128 @@
+import asyncio
+
+import pytest
+
+from game.game_service import GameService
+from game.model import GameStatus
+from game.player import Player, PlayerStatus
+from services.game_actor import GameActorRegistry, GameCommand
+
+
+@pytest.fixture
+def game_service() -> GameService:
+    return GameService()
+
+
+def _add_players(game_service: GameService, *names: str) -> list[Player]:
+    players = [Player(name, PlayerStatus.AVAILABLE) for name in names]
+    for player in players:
+        game_service.add_player(player)
+    return players
+
+
+class TestGameActorRegistry:
+    @pytest.mark.asyncio
+    async def test_commands_for_one_game_run_in_order(self, game_service: GameService):
+        alice, bob = _add_players(game_service, "Alice", "Bob")
+        game_service.create_two_player_game(alice.id, bob.id)
+        registry = GameActorRegistry(game_service)
+        log: list[str] = []
+
+        async def slow(label: str) -> str:
+            log.append(f"{label} start")
+            await asyncio.sleep(0.01)
+            log.append(f"{label} end")
+            return label
+
+        results = await asyncio.gather(
+            registry.submit(alice.id, GameCommand.PLACE, slow, "alice"),
+            registry.submit(bob.id, GameCommand.PLACE, slow, "bob"),
+        )
+
+        assert results == ["alice", "bob"]
+        assert log == ["alice start", "alice end", "bob start", "bob end"]
+        assert len(registry.actors) == 1
+        await registry.stop()
+
+    @pytest.mark.asyncio
+    async def test_slow_game_does_not_block_other_games(
+        self, game_service: GameService
+    ):
+        alice, bob = _add_players(game_service, "Alice", "Bob")
+        registry = GameActorRegistry(game_service)
+        blocker: asyncio.Event = asyncio.Event()
+
+        blocked = asyncio.create_task(
+            registry.submit(alice.id, GameCommand.PLACE, blocker.wait)
+        )
+        result = await asyncio.wait_for(
+            registry.submit(bob.id, GameCommand.PLACE, lambda: "done"), timeout=1
+        )
+
+        assert result == "done"
+        assert not blocked.done()
+        blocker.set()
+        await blocked
+        await registry.stop()
+
+    @pytest.mark.asyncio
+    async def test_busy_while_a_command_is_in_flight(self, game_service: GameService):
+        (alice,) = _add_players(game_service, "Alice")
+        registry = GameActorRegistry(game_service)
+        blocker: asyncio.Event = asyncio.Event()
+
+        command = asyncio.create_task(
+            registry.submit(alice.id, GameCommand.PLACE, blocker.wait)
+        )
+        await asyncio.sleep(0)
+        assert registry.is_busy(alice.id)
+
+        blocker.set()
+        await command
+        assert not registry.is_busy(alice.id)
+        await registry.stop()
+
+    @pytest.mark.asyncio
+    async def test_exceptions_propagate_and_actor_keeps_running(
+        self, game_service: GameService
+    ):
+        (alice,) = _add_players(game_service, "Alice")
+        registry = GameActorRegistry(game_service)
+
+        def fail() -> None:
+            raise ValueError("bad placement")
+
+        with pytest.raises(ValueError, match="bad placement"):
+            await registry.submit(alice.id, GameCommand.PLACE, fail)
+        assert await registry.submit(alice.id, GameCommand.READY, lambda: 1) == 1
+        await registry.stop()
+
+    @pytest.mark.asyncio
+    async def test_idle_actor_exits_and_is_forgotten(self, game_service: GameService):
+        (alice,) = _add_players(game_service, "Alice")
+        registry = GameActorRegistry(game_service, idle_timeout=0.01)
+
+        await registry.submit(alice.id, GameCommand.PLACE, lambda: None)
+        await asyncio.sleep(0.05)
+
+        assert registry.actors == {}
+
+    @pytest.mark.asyncio
+    async def test_abandon_command_marks_game_abandoned(
+        self, game_service: GameService
+    ):
+        alice, bob = _add_players(game_service, "Alice", "Bob")
+        game_id = game_service.create_two_player_game(alice.id, bob.id)
+        registry = GameActorRegistry(game_service)
+
+        await registry.submit(
+            alice.id,
+            GameCommand.ABANDON,
+            game_service.abandon_game_by_player_id,
+            alice.id,
+        )
+
+        assert game_service.get_game_status_by_game_id(game_id) == (
+            GameStatus.ABANDONED
+        )
+        await registry.stop()
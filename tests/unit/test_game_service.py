@@ -1,3 +1,5 @@
+import random
+
 import pytest
 from game.player import Player, PlayerStatus
 
@@ -13,7 +15,8 @@ from game.game_service import (
     UnknownGameException,
 )
 from game.model import GameBoard
-from game.model import ShipType, Coord, CoordHelper
+from game.model import ShipType, Coord, CoordHelper, Orientation, Ship
+from game.rules import Rules
 
 
 class TestGameService:
@@ -619,6 +622,20 @@ class TestPlaceShipsRandomly:
         board = game_service.get_or_create_ship_placement_board(player_id)
         assert len(board.ships) == 5
 
+    def test_seeded_rng_gives_repeatable_placement(
+        self, game_service: GameService, player_in_game: Player
+    ) -> None:
+        """Test that the same seed places the fleet the same way"""
+        player_id = player_in_game.id
+
+        layouts = []
+        for _ in range(2):
+            game_service.place_ships_randomly(player_id, random.Random(7))
+            board = game_service.get_or_create_ship_placement_board(player_id)
+            layouts.append(board.get_placed_ships_for_display())
+
+        assert layouts[0] == layouts[1]
+
 
 class TestIsMultiplayer:
     """Tests for GameService.is_multiplayer() method"""
@@ -701,3 +718,171 @@ class TestIsMultiplayer:
 
         result = game_service.is_multiplayer(bob.id)
         assert result is True
+
+
+class TestResolveRound:
+    """Tests for GameService.resolve_round()"""
+
+    @pytest.fixture
+    def game_service(self) -> GameService:
+        return GameService()
+
+    @pytest.fixture
+    def game(self, game_service: GameService) -> Game:
+        alice = Player(name="Alice", status=PlayerStatus.AVAILABLE)
+        bob = Player(name="Bob", status=PlayerStatus.AVAILABLE)
+        game_service.add_player(alice)
+        game_service.add_player(bob)
+        game_id = game_service.create_two_player_game(alice.id, bob.id)
+        game = game_service.games[game_id]
+        for player in (alice, bob):
+            game.board[player].place_ship(
+                Ship(ShipType.DESTROYER), Coord.A1, Orientation.HORIZONTAL
+            )
+            game.board[player].place_ship(
+                Ship(ShipType.CRUISER), Coord.J1, Orientation.HORIZONTAL
+            )
+        game_service.start_game(game_id)
+        return game
+
+    def test_reports_each_players_hits(self, game_service: GameService, game: Game):
+        alice, bob = game.player_1, game.player_2
+
+        reports = game_service.resolve_round(
+            game.id, {alice.id: [Coord.A1, Coord.E5], bob.id: [Coord.J1]}
+        )
+
+        assert reports[alice.id].round_number == 1
+        assert reports[alice.id].hits == {ShipType.DESTROYER: 1}
+        assert reports[bob.id].hits == {ShipType.CRUISER: 1}
+        assert game.board[bob].shots_received == {Coord.A1: 1, Coord.E5: 1}
+        assert game.board[alice].shots_fired == {Coord.A1: 1, Coord.E5: 1}
+        assert game.round_number == 2
+
+    def test_sinking_a_fleet_finishes_the_game(
+        self, game_service: GameService, game: Game
+    ):
+        alice, bob = game.player_1, game.player_2
+        game_service.resolve_round(game.id, {alice.id: [Coord.A1, Coord.A2]})
+
+        reports = game_service.resolve_round(game.id, {alice.id: [Coord.J1, Coord.J2]})
+        assert reports[alice.id].sunk == ()
+        reports = game_service.resolve_round(game.id, {alice.id: [Coord.J3]})
+
+        assert reports[alice.id].sunk == (ShipType.CRUISER,)
+        assert game.status == GameStatus.FINISHED
+        with pytest.raises(ValueError, match="is over"):
+            game_service.resolve_round(game.id, {bob.id: [Coord.E5]})
+
+    def test_invalid_salvo_changes_nothing(self, game_service: GameService, game: Game):
+        alice, bob = game.player_1, game.player_2
+        game_service.resolve_round(game.id, {alice.id: [Coord.A1]})
+        version = game.version
+
+        with pytest.raises(ValueError, match="repeats a shot"):
+            game_service.resolve_round(
+                game.id, {bob.id: [Coord.E5], alice.id: [Coord.A1]}
+            )
+        with pytest.raises(ValueError, match="1 to 2 shots"):
+            game_service.resolve_round(
+                game.id, {alice.id: [Coord.E5, Coord.E6, Coord.E7]}
+            )
+
+        assert game.board[alice].shots_received == {}
+        assert game.version == version
+
+    def test_player_not_in_game_is_rejected(
+        self, game_service: GameService, game: Game
+    ):
+        with pytest.raises(PlayerNotInGameException):
+            game_service.resolve_round(game.id, {"nobody": [Coord.A1]})
+
+
+class TestGameServiceRules:
+    """Tests for a GameService that plays by non-standard rules"""
+
+    RULES = Rules.scaled(20, 20)
+
+    @pytest.fixture
+    def game_service(self) -> GameService:
+        return GameService(rules=self.RULES)
+
+    @pytest.fixture
+    def game(self, game_service: GameService) -> Game:
+        alice = Player(name="Alice", status=PlayerStatus.AVAILABLE)
+        bob = Player(name="Bob", status=PlayerStatus.AVAILABLE)
+        game_service.add_player(alice)
+        game_service.add_player(bob)
+        for player in (alice, bob):
+            game_service.place_ships_randomly(player.id, random.Random(player.name))
+        game_id = game_service.create_two_player_game(alice.id, bob.id)
+        for player in (alice, bob):
+            game_service.transfer_ship_placement_board_to_game(
+                game_id, player.id, player
+            )
+        game_service.start_game(game_id)
+        return game_service.games[game_id]
+
+    def test_games_and_boards_carry_the_service_rules(
+        self, game_service: GameService, game: Game
+    ):
+        assert game.rules == self.RULES
+        for board in game.board.values():
+            assert board.rules == self.RULES
+            assert len(board.ships) == len(self.RULES.fleet)
+            assert [ship.ship_type for ship in board.ships] == list(board.fleet)
+            assert all(
+                len(ship.positions) == ship.ship_type.length for ship in board.ships
+            )
+
+    def test_random_placement_spreads_over_the_whole_board(
+        self, game_service: GameService, game: Game
+    ):
+        rows = {
+            coord.value.row_index
+            for board in game.board.values()
+            for ship in board.ships
+            for coord in ship.positions
+        }
+
+        assert max(rows) > 10
+
+    def test_rounds_are_played_until_a_fleet_is_sunk(
+        self, game_service: GameService, game: Game
+    ):
+        alice, bob = game.player_1, game.player_2
+        target = game.board[bob]
+        remaining = [coord for ship in target.ships for coord in ship.positions]
+
+        while remaining:
+            shots = game.board[alice].shots_available
+            salvo, remaining = remaining[:shots], remaining[shots:]
+            reports = game_service.resolve_round(game.id, {alice.id: salvo})
+            assert sum(reports[alice.id].hits.values()) == len(salvo)
+
+        assert target.all_ships_sunk
+        assert game.status == GameStatus.FINISHED
+
+    def test_shots_off_a_smaller_board_are_rejected(self):
+        game_service = GameService(rules=Rules(8, 8))
+        alice = Player(name="Alice", status=PlayerStatus.AVAILABLE)
+        bob = Player(name="Bob", status=PlayerStatus.AVAILABLE)
+        game_service.add_player(alice)
+        game_service.add_player(bob)
+        game_id = game_service.create_two_player_game(alice.id, bob.id)
+        game_service.start_game(game_id)
+        game_service.games[game_id].board[alice].place_ship(
+            Ship(ShipType.DESTROYER), Coord.A1, Orientation.HORIZONTAL
+        )
+
+        with pytest.raises(ValueError, match="off the board"):
+            game_service.resolve_round(game_id, {alice.id: [Coord.J10]})
+
+    def test_fleet_layouts_need_the_standard_rules(self, game_service: GameService):
+        alice = Player(name="Alice", status=PlayerStatus.AVAILABLE)
+        game_service.add_player(alice)
+
+        with pytest.raises(ValueError, match="standard rules"):
+            game_service.place_fleet(alice.id, [])
+        with pytest.raises(ValueError, match="standard rules"):
+            game_service.auto_complete_fleet(alice.id)
@@ -1,6 +1,7 @@
 import pytest
 
 from game.game_service import Game, GameMode, GameStatus
+from game.model import DeltaKind, GameDelta
 from game.player import Player, PlayerStatus
 
 
@@ -72,3 +73,65 @@ class TestGameModel:
             ValueError, match="Single player games cannot have two players"
         ):
             Game(player_1=alice, player_2=bob, game_mode=GameMode.SINGLE_PLAYER)
+
+
+class TestGameDeltaFeed:
+    """Unit tests for the Game version and delta ring buffer"""
+
+    @pytest.fixture
+    def game(self) -> Game:
+        alice = Player("Alice", PlayerStatus.AVAILABLE)
+        bob = Player("Bob", PlayerStatus.AVAILABLE)
+        return Game(player_1=alice, player_2=bob, game_mode=GameMode.TWO_PLAYER)
+
+    def test_status_change_records_delta(self, game: Game):
+        game.status = GameStatus.PLAYING
+
+        assert game.version == 1
+        assert game.deltas_since(0) == [
+            GameDelta(1, DeltaKind.STATUS, {"status": "playing"})
+        ]
+
+    def test_setting_same_status_does_not_bump_version(self, game: Game):
+        game.status = GameStatus.CREATED
+        assert game.version == 0
+
+    def test_up_to_date_client_gets_no_deltas(self, game: Game):
+        game.record_delta(DeltaKind.SHOT, {"coord": "A1"})
+        assert game.deltas_since(1) == []
+
+    def test_client_gets_only_missing_deltas(self, game: Game):
+        for name in ("A1", "B2", "C3"):
+            game.record_delta(DeltaKind.SHOT, {"coord": name})
+
+        deltas = game.deltas_since(1)
+
+        assert deltas is not None
+        assert [delta.data["coord"] for delta in deltas] == ["B2", "C3"]
+
+    def test_client_behind_buffer_needs_snapshot(self, game: Game):
+        for i in range(Game.DELTA_BUFFER_SIZE + 5):
+            game.record_delta(DeltaKind.SHOT, {"n": i})
+
+        assert game.deltas_since(0) is None
+        assert game.deltas_since(5) is not None
+        assert game.deltas_since(4) is None
+
+    def test_client_ahead_of_game_needs_snapshot(self, game: Game):
+        assert game.deltas_since(3) is None
+
+    def test_restored_version_requires_snapshot_for_older_clients(self, game: Game):
+        game.restore_version(GameStatus.PLAYING, 10)
+
+        assert game.status == GameStatus.PLAYING
+        assert game.deltas_since(10) == []
+        assert game.deltas_since(9) is None
+
+    def test_delta_buffer_is_created_on_first_delta(self, game: Game):
+        assert len(game.deltas) == 0
+        assert game.deltas_since(0) == []
+
+        game.record_delta(DeltaKind.SHOT, {"coord": "A1"})
+
+        assert len(game.deltas) == 1
+        assert game.deltas_since(0) == list(game.deltas)
@@ -0,0 +1,210 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from game.game_service import GameService
+from game.game_store import TieredGameStore
+from game.model import Coord, Game, GameBoard, GameMode, Orientation, Ship, ShipType
+from game.player import Player, PlayerStatus
+from game.rules import Rules
+from game.serialisation import (
+    board_from_dict,
+    board_to_dict,
+    game_from_dict,
+    game_to_dict,
+)
+
+
+class TestBoardSerialisation:
+    def test_board_round_trip(self):
+        board = GameBoard()
+        board.place_ship(Ship(ShipType.CARRIER), Coord.A1, Orientation.HORIZONTAL)
+        board.place_ship(Ship(ShipType.DESTROYER), Coord.J9, Orientation.HORIZONTAL)
+        board.shots_received[Coord.A1] = 1
+        board.shots_fired[Coord.E5] = 2
+
+        restored: GameBoard = board_from_dict(board_to_dict(board))
+
+        assert restored.get_placed_ships_for_display() == (
+            board.get_placed_ships_for_display()
+        )
+        assert restored.shots_received == {Coord.A1: 1}
+        assert restored.shots_fired == {Coord.E5: 2}
+
+    def test_board_round_trip_keeps_non_standard_rules(self):
+        rules = Rules.scaled(20, 20)
+        board = GameBoard(rules)
+        board.place_ship(
+            Ship(board.fleet[-1]), board.coord("T19"), Orientation.HORIZONTAL
+        )
+        board.shots_received[board.coord("K11")] = 1
+
+        restored: GameBoard = board_from_dict(board_to_dict(board))
+
+        assert restored.rules == rules
+        assert restored.ships == board.ships
+        assert restored.shots_received == {board.coord("K11"): 1}
+
+    def test_game_round_trip_keeps_non_standard_rules(self):
+        rules = Rules(12, 12)
+        alice = Player("Alice", PlayerStatus.AVAILABLE)
+        bob = Player("Bob", PlayerStatus.AVAILABLE)
+        game = Game(alice, GameMode.TWO_PLAYER, bob, rules)
+        game.board[bob].place_ship(
+            Ship(ShipType.CARRIER), game.board[bob].coord("L8"), Orientation.HORIZONTAL
+        )
+
+        restored: Game = game_from_dict(
+            game_to_dict(game), {alice.id: alice, bob.id: bob}
+        )
+
+        assert restored.rules == rules
+        assert restored.board[bob].rules == rules
+        assert restored.board[bob].ships == game.board[bob].ships
+        assert "rules" not in board_to_dict(GameBoard())
+
+
+class TestTieredGameStore:
+    @pytest.fixture
+    def game_service(self, tmp_path: Path) -> GameService:
+        service = GameService()
+        service.enable_tiering(TieredGameStore(tmp_path, idle_threshold=60))
+        return service
+
+    def _start_game(self, game_service: GameService, name: str) -> tuple[Player, str]:
+        player = Player(name, PlayerStatus.AVAILABLE)
+        game_service.add_player(player)
+        game_service.place_ships_randomly(player.id)
+        return player, game_service.start_single_player_game(player.id)
+
+    def test_idle_game_spilled_and_reloaded_by_get_game_board(
+        self, game_service: GameService, tmp_path: Path
+    ):
+        alice, game_id = self._start_game(game_service, "Alice")
+        before = game_service.get_game_board(alice.id).get_placed_ships_for_display()
+
+        spilled = game_service.spill_idle_games(now=time.monotonic() + 61)
+
+        game = game_service.games[game_id]
+        assert spilled == 1
+        assert game.is_spilled
+        assert (tmp_path / f"{game_id}.json").exists()
+
+        after = game_service.get_game_board(alice.id).get_placed_ships_for_display()
+        assert after == before
+        assert not game.is_spilled
+        assert not (tmp_path / f"{game_id}.json").exists()
+        assert game_service.game_store is not None
+        assert game_service.game_store.reload_latency.count == 1
+
+    def test_recently_active_game_not_spilled(self, game_service: GameService):
+        self._start_game(game_service, "Alice")
+        assert game_service.spill_idle_games() == 0
+
+    def test_direct_board_access_faults_game_in(self, game_service: GameService):
+        alice, game_id = self._start_game(game_service, "Alice")
+        game = game_service.games[game_id]
+        assert game_service.game_store is not None
+        game_service.game_store.spill(game)
+
+        assert game.board[alice].ships, "Ships should be reloaded from disk"
+
+    def test_lru_cap_spills_least_recently_used(self, tmp_path: Path):
+        game_service = GameService()
+        game_service.enable_tiering(TieredGameStore(tmp_path, max_resident=2))
+        games = [self._start_game(game_service, name) for name in ("Al", "Bo", "Cy")]
+
+        first_game = game_service.games[games[0][1]]
+        assert first_game.is_spilled
+        assert game_service.game_store is not None
+        assert game_service.game_store.resident_count == 2
+
+        # Touching the oldest game reloads it and spills the next least recent
+        game_service.touch_player(games[0][0].id)
+        assert not first_game.is_spilled
+        assert game_service.games[games[1][1]].is_spilled
+
+    def test_evicted_game_spill_file_removed(
+        self, game_service: GameService, tmp_path: Path
+    ):
+        _, game_id = self._start_game(game_service, "Alice")
+        game_service.spill_idle_games(now=time.monotonic() + 61)
+
+        game_service.evict_game(game_id)
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_direct_board_access_respects_lru_cap(self, tmp_path: Path):
+        game_service = GameService()
+        game_service.enable_tiering(TieredGameStore(tmp_path, max_resident=2))
+        games = [self._start_game(game_service, name) for name in ("Al", "Bo", "Cy")]
+        first_game = game_service.games[games[0][1]]
+        assert first_game.is_spilled
+
+        first_game.board  # noqa: B018 - fault in without going through touch
+
+        assert game_service.game_store is not None
+        assert game_service.game_store.resident_count == 2
+        assert game_service.games[games[1][1]].is_spilled
+
+    def test_failed_reload_can_be_retried(
+        self, game_service: GameService, tmp_path: Path
+    ):
+        alice, game_id = self._start_game(game_service, "Alice")
+        game = game_service.games[game_id]
+        assert game_service.game_store is not None
+        game_service.game_store.spill(game)
+        spill_file = tmp_path / f"{game_id}.json"
+        record = spill_file.read_text()
+        spill_file.write_text("{")
+
+        with pytest.raises(ValueError):
+            game.board  # noqa: B018
+
+        spill_file.write_text(record)
+        assert game.board[alice].ships
+
+    def test_concurrent_access_reloads_once(self, game_service: GameService):
+        alice, game_id = self._start_game(game_service, "Alice")
+        game = game_service.games[game_id]
+        assert game_service.game_store is not None
+        game_service.game_store.spill(game)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            boards = list(executor.map(lambda _: game.board, range(8)))
+
+        assert all(board is boards[0] for board in boards)
+        assert game_service.game_store.reload_latency.count == 1
+
+    def test_game_locked_elsewhere_is_not_spilled(self, game_service: GameService):
+        _, game_id = self._start_game(game_service, "Alice")
+        game = game_service.games[game_id]
+        locked: threading.Event = threading.Event()
+        release: threading.Event = threading.Event()
+
+        def hold_game_lock() -> None:
+            with game_service.locks.hold(game_id):
+                locked.set()
+                release.wait()
+
+        holder = threading.Thread(target=hold_game_lock)
+        holder.start()
+        locked.wait()
+        spilled = game_service.spill_idle_games(now=time.monotonic() + 61)
+        release.set()
+        holder.join()
+
+        assert spilled == 0
+        assert not game.is_spilled
+        assert game_service.spill_idle_games(now=time.monotonic() + 61) == 1
+
+    def test_busy_game_is_not_spilled(self, game_service: GameService):
+        _, game_id = self._start_game(game_service, "Alice")
+        assert game_service.game_store is not None
+        game_service.game_store.is_busy = lambda busy_id: busy_id == game_id
+
+        assert game_service.spill_idle_games(now=time.monotonic() + 61) == 0
+        assert not game_service.games[game_id].is_spilled
@@ -0,0 +1,135 @@
+import itertools
+import math
+import random
+
+import pytest
+
+from game.fleet_solver import complete_fleet
+from game.hit_inference import (
+    HALOS,
+    RoundEvidence,
+    evidence_from_board,
+    infer,
+)
+from game.model import Coord, GameBoard, Orientation, Ship, ShipType, coord_to_cell
+from game.salvo_optimiser import PlacementTable
+from game.strategies import RoundReport, make_strategy
+
+
+def mask_of(*coords: Coord) -> int:
+    mask = 0
+    for coord in coords:
+        mask |= 1 << coord_to_cell(coord)
+    return mask
+
+
+def random_board(seed: int) -> GameBoard:
+    board = GameBoard()
+    for placement in complete_fleet(board, random.Random(seed)):
+        board.place_ship(
+            Ship(placement.ship_type), placement.start, placement.orientation
+        )
+    return board
+
+
+def play_rounds(board: GameBoard, seed: int):
+    """Fire at `board` round by round, yielding the evidence after each."""
+    strategy = make_strategy("likeliest", random.Random(seed))
+    round_number = 0
+    while not board.all_ships_sunk:
+        round_number += 1
+        salvo = strategy.choose_salvo(board.shots_available)
+        hits = board.receive_salvo(salvo, round_number)
+        sunk = tuple(ship for ship in hits if board.is_sunk(ship))
+        strategy.observe(RoundReport(round_number, tuple(salvo), hits, sunk))
+        yield evidence_from_board(board)
+
+
+class TestEvidenceFromBoard:
+    def test_reports_hits_and_sinkings_per_round(self):
+        board = GameBoard()
+        board.place_ship(Ship(ShipType.DESTROYER), Coord.A1, Orientation.HORIZONTAL)
+        board.place_ship(Ship(ShipType.CARRIER), Coord.J1, Orientation.HORIZONTAL)
+        board.receive_salvo([Coord.A1, Coord.J1, Coord.E5], 1)
+        board.receive_salvo([Coord.A2], 2)
+
+        evidence = evidence_from_board(board)
+
+        assert evidence == [
+            RoundEvidence(
+                1,
+                mask_of(Coord.A1, Coord.J1, Coord.E5),
+                {ShipType.DESTROYER: 1, ShipType.CARRIER: 1},
+                (),
+            ),
+            RoundEvidence(
+                2, mask_of(Coord.A2), {ShipType.DESTROYER: 1}, (ShipType.DESTROYER,)
+            ),
+        ]
+
+
+class TestInfer:
+    def test_no_evidence_leaves_every_placement(self):
+        inference = infer([])
+
+        for ship in inference.ships:
+            assert ship.placements > 0
+            assert ship.certain == 0
+            assert not ship.sunk
+        assert sum(inference.chances()) == pytest.approx(
+            sum(ship.length for ship in ShipType)
+        )
+
+    def test_true_layout_is_never_ruled_out(self):
+        for seed in range(3):
+            board = random_board(seed)
+            for evidence in play_rounds(board, seed):
+                inference = infer(evidence)
+                for ship in board.ships:
+                    (found,) = [
+                        s for s in inference.ships if s.ship_type == ship.ship_type
+                    ]
+                    assert all(
+                        found.chances[coord_to_cell(coord)] > 0
+                        for coord in ship.positions
+                    )
+
+    def test_sunk_ship_is_pinned_down(self):
+        board = GameBoard()
+        board.place_ship(Ship(ShipType.DESTROYER), Coord.E5, Orientation.HORIZONTAL)
+        board.place_ship(Ship(ShipType.CARRIER), Coord.A1, Orientation.HORIZONTAL)
+        board.receive_salvo([Coord.E5, Coord.E6, Coord.J10], 1)
+
+        inference = infer(evidence_from_board(board))
+
+        (destroyer,) = [s for s in inference.ships if s.ship_type == ShipType.DESTROYER]
+        assert destroyer.sunk
+        assert destroyer.placements == 1
+        assert destroyer.certain == mask_of(Coord.E5, Coord.E6)
+
+    def test_joint_counts_match_brute_force(self):
+        board = random_board(7)
+        for evidence in play_rounds(board, 7):
+            table = PlacementTable()
+            for report in evidence:
+                table.add_round(report.shots, report.hits, report.sunk)
+            sizes = [len(masks) for masks in table.placements.values()]
+            if math.prod(sizes) <= 50_000:
+                break
+
+        layouts = [
+            layout
+            for layout in itertools.product(*table.placements.values())
+            if all(not a & HALOS[b] for a, b in itertools.combinations(layout, 2))
+        ]
+        inference = infer(evidence, budget=10)
+
+        assert all(ship.joint for ship in inference.ships)
+        assert inference.layouts == len(layouts)
+        for index, ship in enumerate(inference.ships):
+            assert ship.placements == len({layout[index] for layout in layouts})
+
+    def test_answers_within_the_budget(self):
+        board = random_board(11)
+        for evidence in play_rounds(board, 11):
+            assert infer(evidence).elapsed < 0.5
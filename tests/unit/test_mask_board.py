@@ -0,0 +1,190 @@
+import random
+
+import pytest
+
+from game.cells import grid_for
+from game.mask_board import MaskBoard
+from game.model import (
+    Coord,
+    GameBoard,
+    Orientation,
+    Ship,
+    ShipAlreadyPlacedError,
+    ShipPlacementOutOfBoundsError,
+    ShipPlacementTooCloseError,
+    ShipType,
+    coord_to_cell,
+)
+from game.rules import STANDARD_FLEET, Rules, ShipSpec
+
+CARRIER, BATTLESHIP, CRUISER, SUBMARINE, DESTROYER = range(5)
+
+
+class TestRules:
+    def test_standard_rules(self):
+        rules = Rules()
+
+        assert (rules.rows, rules.cols) == (10, 10)
+        assert [ship.name for ship in rules.fleet] == [
+            "Carrier",
+            "Battleship",
+            "Cruiser",
+            "Submarine",
+            "Destroyer",
+        ]
+        assert rules.shots_per_round == 6
+
+    @pytest.mark.parametrize("rows, cols", [(0, 10), (27, 10), (10, 27)])
+    def test_board_size_is_limited_to_26(self, rows: int, cols: int):
+        with pytest.raises(ValueError):
+            Rules(rows, cols)
+
+    def test_ship_must_fit_the_board(self):
+        with pytest.raises(ValueError):
+            Rules(4, 4, (ShipSpec("Carrier", 5, 2, "A"),))
+
+    def test_scaled_rules_keep_fleet_density(self):
+        rules = Rules.scaled(20, 20)
+
+        assert len(rules.fleet) == 4 * len(STANDARD_FLEET)
+        assert rules.fleet[5].name == "Carrier 2"
+
+    def test_grid_names_run_to_z26(self):
+        grid = Rules(26, 26).grid
+
+        assert grid.cell_name[0] == "A1"
+        assert grid.cell_name[-1] == "Z26"
+        assert grid.parse("z26") == 26 * 26 - 1
+
+    def test_non_square_grid(self):
+        grid = grid_for(3, 8)
+
+        assert grid.cell_name[8] == "B1"
+        assert grid.cell_at(3, 9) is None
+        assert grid.footprint(0, 3, 1, 0) == (0, 8, 16)
+        assert grid.footprint(0, 4, 1, 0) is None
+
+
+class TestMaskBoardPlacement:
+    def test_placement_rules_match_game_board(self):
+        rng = random.Random(3)
+        for _ in range(200):
+            game_board = GameBoard()
+            mask_board = MaskBoard()
+            for index, ship_type in enumerate(ShipType):
+                start = rng.choice(list(Coord))
+                orientation = rng.choice(list(Orientation))
+                try:
+                    game_board.place_ship(Ship(ship_type), start, orientation)
+                    expected = None
+                except (ShipPlacementOutOfBoundsError, ShipPlacementTooCloseError) as e:
+                    expected = type(e)
+                if expected is None:
+                    mask_board.place(index, coord_to_cell(start), orientation)
+                else:
+                    with pytest.raises(expected):
+                        mask_board.place(index, coord_to_cell(start), orientation)
+            assert mask_board.occupied == MaskBoard.from_game_board(game_board).occupied
+
+    def test_ship_cannot_be_placed_twice(self):
+        board = MaskBoard()
+        board.place(DESTROYER, 0, Orientation.HORIZONTAL)
+
+        with pytest.raises(ShipAlreadyPlacedError):
+            board.place(DESTROYER, 50, Orientation.HORIZONTAL)
+
+    @pytest.mark.parametrize("size", [10, 20, 26])
+    def test_random_fleet_obeys_spacing(self, size: int):
+        rules = Rules.scaled(size, size)
+        board = MaskBoard(rules)
+
+        board.place_fleet_randomly(random.Random(size))
+
+        grid = grid_for(size, size)
+        assert all(board.ship_masks)
+        for index, mask in enumerate(board.ship_masks):
+            assert mask.bit_count() == rules.fleet[index].length
+            halo = 0
+            for cell in grid.mask_to_cells(mask):
+                halo |= grid.halo_masks[cell]
+            others = board.occupied & ~mask
+            assert not halo & others
+
+    @pytest.mark.parametrize("size", [2, 10, 20])
+    def test_placement_of_replays_each_ship(self, size: int):
+        rules = Rules(size, size, (ShipSpec("Boat", 2, 1, "B"),))
+        for orientation in Orientation:
+            for start in range(rules.grid.cell_count):
+                board = MaskBoard(rules)
+                try:
+                    board.place(0, start, orientation)
+                except ShipPlacementOutOfBoundsError:
+                    continue
+                replayed = MaskBoard(rules)
+
+                replayed.place(0, *board.placement_of(0))
+
+                assert replayed.ship_masks == board.ship_masks
+
+    def test_fleet_too_big_for_board_raises(self):
+        rules = Rules(3, 3, tuple(ShipSpec(f"Boat {i}", 2, 1, "B") for i in range(4)))
+
+        with pytest.raises(RuntimeError):
+            MaskBoard(rules).place_fleet_randomly(random.Random(0))
+
+
+class TestMaskBoardShots:
+    def _board(self) -> MaskBoard:
+        board = MaskBoard()
+        board.place(CARRIER, coord_to_cell(Coord.A1), Orientation.HORIZONTAL)
+        board.place(DESTROYER, coord_to_cell(Coord.J1), Orientation.HORIZONTAL)
+        return board
+
+    def test_salvo_reports_hits_per_ship(self):
+        board = self._board()
+
+        result = board.receive_salvo(
+            [coord_to_cell(Coord.A1), coord_to_cell(Coord.A2), coord_to_cell(Coord.E5)]
+        )
+
+        assert result.hits[CARRIER] == 2
+        assert result.sunk == ()
+
+    def test_sinking_reduces_shots_available(self):
+        board = self._board()
+        assert board.shots_available == 3
+
+        result = board.receive_salvo([coord_to_cell(Coord.J1), coord_to_cell(Coord.J2)])
+
+        assert result.sunk == (DESTROYER,)
+        assert board.shots_available == 2
+        assert not board.is_defeated
+
+    def test_repeat_shot_is_rejected(self):
+        board = self._board()
+        board.receive_salvo([0])
+
+        with pytest.raises(ValueError):
+            board.receive_salvo([0])
+        with pytest.raises(ValueError):
+            board.receive_salvo([5, 5])
+
+    def test_defeated_once_every_ship_is_sunk(self):
+        board = self._board()
+
+        board.receive_salvo(range(100))
+
+        assert board.is_defeated
+        assert board.shots_available == 0
+
+    def test_from_game_board_carries_shots(self):
+        game_board = GameBoard()
+        game_board.place_ship(
+            Ship(ShipType.DESTROYER), Coord.J1, Orientation.HORIZONTAL
+        )
+        game_board.receive_shot(Coord.J1, 1)
+
+        board = MaskBoard.from_game_board(game_board)
+
+        assert board.hit_masks[DESTROYER] == 1 << coord_to_cell(Coord.J1)
+        assert not board.is_sunk(DESTROYER)
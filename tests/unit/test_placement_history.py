@@ -0,0 +1,84 @@
+from game.game_service import GameService
+from game.model import BoardSnapshot, Coord, Orientation, Ship, ShipType
+from game.placement_history import PlacementHistory
+from game.player import Player, PlayerStatus
+
+
+class TestPlacementHistory:
+    def test_undo_and_redo_move_along_the_history(self):
+        history = PlacementHistory()
+        first, second, third = BoardSnapshot(1), BoardSnapshot(2), BoardSnapshot(3)
+        history.record(first)
+        history.record(second)
+
+        assert history.undo(third) is second
+        assert history.undo(second) is first
+        assert history.undo(first) is None
+        assert history.redo(first) is second
+        assert history.redo(second) is third
+        assert history.redo(third) is None
+
+    def test_new_action_discards_redo(self):
+        history = PlacementHistory()
+        history.record(BoardSnapshot(1))
+        history.undo(BoardSnapshot(2))
+
+        history.record(BoardSnapshot(1))
+
+        assert not history.can_redo
+
+    def test_history_is_bounded(self):
+        history = PlacementHistory(max_steps=3)
+        for version in range(10):
+            history.record(BoardSnapshot(version))
+
+        steps = 0
+        while history.undo(BoardSnapshot(99)) is not None:
+            steps += 1
+
+        assert steps == 3
+
+
+class TestGameServicePlacementHistory:
+    def _service_with_player(self) -> tuple[GameService, str]:
+        game_service = GameService()
+        player = Player("Alice", PlayerStatus.AVAILABLE)
+        game_service.add_player(player)
+        return game_service, player.id
+
+    def test_each_step_can_be_undone_and_redone(self):
+        game_service, player_id = self._service_with_player()
+        with game_service.placement_step(player_id) as board:
+            board.place_ship(Ship(ShipType.DESTROYER), Coord.A1, Orientation.HORIZONTAL)
+        with game_service.placement_step(player_id) as board:
+            board.place_ship(Ship(ShipType.CRUISER), Coord.C1, Orientation.HORIZONTAL)
+
+        assert game_service.undo_placement(player_id)
+        assert [ship.ship_type for ship in board.ships] == [ShipType.DESTROYER]
+        assert game_service.undo_placement(player_id)
+        assert board.ships == []
+        assert not game_service.undo_placement(player_id)
+
+        assert game_service.redo_placement(player_id)
+        assert game_service.redo_placement(player_id)
+        assert [ship.ship_type for ship in board.ships] == [
+            ShipType.DESTROYER,
+            ShipType.CRUISER,
+        ]
+        assert not game_service.redo_placement(player_id)
+
+    def test_random_placement_is_a_single_step(self):
+        game_service, player_id = self._service_with_player()
+        with game_service.placement_step(player_id):
+            game_service.place_ships_randomly(player_id)
+
+        assert game_service.undo_placement(player_id)
+        assert game_service.get_or_create_ship_placement_board(player_id).ships == []
+        assert not game_service.undo_placement(player_id)
+
+    def test_unchanged_board_records_nothing(self):
+        game_service, player_id = self._service_with_player()
+        with game_service.placement_step(player_id) as board:
+            board.remove_ship(ShipType.CARRIER)
+
+        assert not game_service.get_placement_history(player_id).can_undo
@@ -0,0 +1,117 @@
+import random
+import timeit
+
+import pytest
+
+from game.model import (
+    Coord,
+    GameBoard,
+    Orientation,
+    Ship,
+    ShipAlreadyPlacedError,
+    ShipPlacementOutOfBoundsError,
+    ShipPlacementTooCloseError,
+    ShipType,
+)
+from game.placement_masks import (
+    cell_bit,
+    coords_to_mask,
+    forbidden_mask,
+    legal_starts,
+    mask_to_coords,
+)
+
+
+def _legal_by_trial(
+    board: GameBoard, ship_type: ShipType, orientation: Orientation
+) -> list[Coord]:
+    """Brute force: try place_ship at every start on a copy of the board."""
+    legal: list[Coord] = []
+    for start in Coord:
+        trial = GameBoard()
+        trial.ships = list(board.ships)
+        try:
+            trial.place_ship(Ship(ship_type), start, orientation)
+        except (
+            ShipAlreadyPlacedError,
+            ShipPlacementOutOfBoundsError,
+            ShipPlacementTooCloseError,
+        ):
+            continue
+        legal.append(start)
+    return legal
+
+
+def _random_board(rng: random.Random) -> GameBoard:
+    board = GameBoard()
+    for ship_type in rng.sample(list(ShipType), rng.randint(0, 4)):
+        for _ in range(50):
+            try:
+                board.place_ship(
+                    Ship(ship_type),
+                    rng.choice(list(Coord)),
+                    rng.choice(list(Orientation)),
+                )
+                break
+            except (ShipPlacementOutOfBoundsError, ShipPlacementTooCloseError):
+                continue
+    return board
+
+
+class TestMasks:
+    def test_cell_bits_run_a1_to_j10(self):
+        assert cell_bit(Coord.A1) == 0
+        assert cell_bit(Coord.A10) == 9
+        assert cell_bit(Coord.J10) == 99
+
+    def test_mask_round_trip(self):
+        coords = [Coord.A1, Coord.C5, Coord.J10]
+
+        assert mask_to_coords(coords_to_mask(coords)) == coords
+
+    def test_forbidden_zone_includes_halo(self):
+        board = GameBoard()
+        board.place_ship(Ship(ShipType.DESTROYER), Coord.A1, Orientation.HORIZONTAL)
+
+        forbidden = mask_to_coords(forbidden_mask(board))
+
+        assert forbidden == [Coord.A1, Coord.A2, Coord.A3, Coord.B1, Coord.B2, Coord.B3]
+
+
+class TestLegalStarts:
+    def test_empty_board_horizontal_carrier(self):
+        starts = legal_starts(GameBoard(), ShipType.CARRIER, Orientation.HORIZONTAL)
+
+        assert len(starts) == 60  # 10 rows x 6 columns
+        assert Coord.A6 in starts
+        assert Coord.A7 not in starts
+
+    def test_already_placed_ship_has_no_legal_starts(self):
+        board = GameBoard()
+        board.place_ship(Ship(ShipType.DESTROYER), Coord.A1, Orientation.HORIZONTAL)
+
+        assert legal_starts(board, ShipType.DESTROYER, Orientation.VERTICAL) == []
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_matches_place_ship_validation(self, seed: int):
+        rng = random.Random(seed)
+        board = _random_board(rng)
+
+        for ship_type in ShipType:
+            for orientation in Orientation:
+                assert legal_starts(board, ship_type, orientation) == _legal_by_trial(
+                    board, ship_type, orientation
+                )
+
+    def test_takes_microseconds(self):
+        board = _random_board(random.Random(1))
+
+        seconds = min(
+            timeit.repeat(
+                lambda: legal_starts(board, ShipType.CARRIER, Orientation.DIAGONAL_UP),
+                number=100,
+                repeat=3,
+            )
+        )
+
+        assert seconds / 100 < 1e-3  # Typically a few tens of microseconds
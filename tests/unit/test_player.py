@@ -34,6 +34,13 @@ class TestPlayer:
         assert player
         assert player.id
 
+    def test_player_has_no_instance_dict(self):
+        player: Player = Player("David", PlayerStatus.AVAILABLE)
+
+        assert not hasattr(player, "__dict__")
+        with pytest.raises(AttributeError):
+            player.nickname = "Dave"  # type: ignore[attr-defined]
+
     def test_add_player_only_accepts_player_status_enum(self):
         with pytest.raises(TypeError):
             Player("David", "InvalidStatus")  # type: ignore
@@ -0,0 +1,222 @@
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from game.game_service import GameService
+from game.lobby import Lobby
+from game.model import GameBoard, GameStatus
+from game.player import Player, PlayerStatus
+from services.lobby_service import LobbyService
+from services.reaper_service import ReaperConfig, ReaperService, ReapResult
+
+
+TTL: float = 100.0
+
+
+class TestReaperService:
+    @pytest.fixture
+    def game_service(self) -> GameService:
+        return GameService()
+
+    @pytest.fixture
+    def lobby_service(self) -> LobbyService:
+        return LobbyService(Lobby())
+
+    @pytest.fixture
+    def reaper(
+        self, game_service: GameService, lobby_service: LobbyService
+    ) -> ReaperService:
+        config = ReaperConfig(
+            finished_game_ttl=TTL,
+            idle_game_ttl=TTL,
+            placement_board_ttl=TTL,
+            ready_flag_ttl=TTL,
+            player_ttl=TTL,
+        )
+        return ReaperService(game_service, lobby_service, config)
+
+    def _later(self) -> float:
+        return time.monotonic() + TTL + 1
+
+    def test_nothing_reaped_while_state_is_fresh(
+        self, game_service: GameService, reaper: ReaperService
+    ):
+        alice = Player("Alice", PlayerStatus.AVAILABLE)
+        game_service.add_player(alice)
+        game_service.get_or_create_ship_placement_board(alice.id)
+
+        assert reaper.reap() == ReapResult()
+        assert alice.id in game_service.players
+        assert alice.id in game_service.ship_placement_boards
+
+    def test_idle_single_player_game_evicted_with_computer_player(
+        self, game_service: GameService, reaper: ReaperService
+    ):
+        alice = Player("Alice", PlayerStatus.AVAILABLE)
+        game_service.add_player(alice)
+        game_service.place_ships_randomly(alice.id)
+        game_id = game_service.start_single_player_game(alice.id)
+        computer_id = game_service.get_opponent_id(alice.id)
+
+        result = reaper.reap(now=self._later())
+
+        assert result.games == 1
+        assert game_id not in game_service.games
+        assert alice.id not in game_service.games_by_player
+        assert computer_id not in game_service.players
+        assert computer_id not in game_service.computer_player_ids
+
+    def test_finished_game_evicted_and_archived(
+        self, game_service: GameService, lobby_service: LobbyService, tmp_path: Path
+    ):
+        reaper = ReaperService(
+            game_service,
+            lobby_service,
+            ReaperConfig(finished_game_ttl=0, archive_dir=str(tmp_path)),
+        )
+        alice = Player("Alice", PlayerStatus.AVAILABLE)
+        bob = Player("Bob", PlayerStatus.AVAILABLE)
+        game_service.add_player(alice)
+        game_service.add_player(bob)
+        game_id = game_service.create_two_player_game(alice.id, bob.id)
+        game_service.set_game_status(game_id, GameStatus.FINISHED)
+
+        result = reaper.reap()
+
+        assert result.games == 1
+        assert result.archived_games == 1
+        archive_files = list(tmp_path.glob("*.json"))
+        assert len(archive_files) == 1
+        assert archive_files[0].name.endswith(f"_{game_id}.json")
+        record = json.loads(archive_files[0].read_text())
+        assert record["game_id"] == game_id
+        assert record["status"] == "finished"
+        assert record["players"] == {alice.id: "Alice", bob.id: "Bob"}
+
+    def test_players_with_the_same_name_are_archived_separately(
+        self, game_service: GameService, lobby_service: LobbyService, tmp_path: Path
+    ):
+        reaper = ReaperService(
+            game_service,
+            lobby_service,
+            ReaperConfig(finished_game_ttl=0, archive_dir=str(tmp_path)),
+        )
+        alice = Player("Alice", PlayerStatus.AVAILABLE)
+        other_alice = Player("Alice", PlayerStatus.AVAILABLE)
+        game_service.add_player(alice)
+        game_service.add_player(other_alice)
+        game_id = game_service.create_two_player_game(alice.id, other_alice.id)
+        game_service.set_game_status(game_id, GameStatus.FINISHED)
+
+        reaper.reap()
+
+        (archive_file,) = tmp_path.glob("*.json")
+        record = json.loads(archive_file.read_text())
+        assert record["boards"].keys() == {alice.id, other_alice.id}
+
+    def test_evicted_idle_game_returns_players_to_the_lobby(
+        self,
+        game_service: GameService,
+        lobby_service: LobbyService,
+        reaper: ReaperService,
+    ):
+        alice = Player("Alice", PlayerStatus.AVAILABLE)
+        bob = Player("Bob", PlayerStatus.AVAILABLE)
+        for player in (alice, bob):
+            game_service.add_player(player)
+            lobby_service.join_lobby(player)
+        lobby_service.send_game_request(alice.id, bob.id)
+        lobby_service.accept_game_request(bob.id)
+        game_id = game_service.create_game_from_accepted_request(alice.id, bob.id)
+        game_service.start_game(game_id)
+        # Keep the players themselves from being reaped as idle
+        later = self._later()
+        for player in (alice, bob):
+            game_service.player_last_activity[player.id] = later
+
+        assert reaper.reap(now=later).games == 1
+
+        assert game_id not in game_service.games
+        assert alice.status == PlayerStatus.AVAILABLE
+        assert bob.status == PlayerStatus.AVAILABLE
+        assert lobby_service.get_opponent(alice.id) is None
+        assert lobby_service.get_opponent(bob.id) is None
+
+    def test_active_game_not_evicted_when_players_are_active(
+        self, game_service: GameService, reaper: ReaperService
+    ):
+        alice = Player("Alice", PlayerStatus.AVAILABLE)
+        bob = Player("Bob", PlayerStatus.AVAILABLE)
+        game_service.add_player(alice)
+        game_service.add_player(bob)
+        game_id = game_service.create_two_player_game(alice.id, bob.id)
+
+        # Activity recorded "in the future" keeps the game alive
+        later = self._later()
+        game_service.game_last_activity[game_id] = later
+
+        assert reaper.reap(now=later).games == 0
+        assert game_id in game_service.games
+
+    def test_orphaned_placement_board_and_ready_flag_reaped(
+        self, game_service: GameService, reaper: ReaperService
+    ):
+        game_service.ship_placement_boards["ghost"] = GameBoard()
+        game_service.ready_players.add("ghost")
+
+        result = reaper.reap()
+
+        assert result.placement_boards == 1
+        assert result.ready_flags == 1
+        assert "ghost" not in game_service.ship_placement_boards
+        assert "ghost" not in game_service.ready_players
+
+    def test_placement_counts_as_activity(
+        self, game_service: GameService, reaper: ReaperService
+    ):
+        alice = Player("Alice", PlayerStatus.AVAILABLE)
+        game_service.add_player(alice)
+        game_service.player_last_activity[alice.id] = time.monotonic() - TTL - 1
+
+        game_service.place_ships_randomly(alice.id)
+        result = reaper.reap()
+
+        assert result.placement_boards == 0
+        assert alice.id in game_service.ship_placement_boards
+
+    def test_idle_players_removed_from_service_and_lobby(
+        self,
+        game_service: GameService,
+        lobby_service: LobbyService,
+        reaper: ReaperService,
+    ):
+        alice = Player("Alice", PlayerStatus.AVAILABLE)
+        bob = Player("Bob", PlayerStatus.AVAILABLE)
+        game_service.add_player(alice)
+        game_service.add_player(bob)
+        lobby_service.join_lobby(alice)
+        lobby_service.join_lobby(bob)
+        lobby_service.send_game_request(alice.id, bob.id)
+        lobby_service.decline_game_request(bob.id)
+
+        result = reaper.reap(now=self._later())
+
+        assert result.players == 2
+        assert result.decline_notifications == 1
+        assert game_service.players == {}
+        assert not lobby_service.is_in_lobby(alice.id)
+        assert lobby_service.lobby.decline_notifications == {}
+
+    def test_totals_accumulate_across_sweeps(
+        self, game_service: GameService, reaper: ReaperService
+    ):
+        for name in ("Alice", "Bob"):
+            game_service.add_player(Player(name, PlayerStatus.AVAILABLE))
+            reaper.reap(now=self._later())
+
+        stats = reaper.get_stats()
+        assert stats["sweeps"] == 2
+        assert stats["totals"]["players"] == 2
+        assert stats["last"]["players"] == 1
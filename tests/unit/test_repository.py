@@ -0,0 +1,220 @@
+import sqlite3
+import threading
+from pathlib import Path
+
+import pytest
+
+from game.game_service import GameService
+from game.game_store import TieredGameStore
+from game.lobby import Lobby
+from game.model import GameStatus
+from game.player import Player, PlayerStatus
+from game.repository import InMemoryRepository, SqliteRepository
+from services.lobby_service import LobbyService
+
+
+class TestInMemoryRepository:
+    def test_services_share_repository_collections(self):
+        repository = InMemoryRepository()
+        game_service = GameService(repository)
+        lobby = Lobby(repository)
+
+        alice = Player("Alice", PlayerStatus.AVAILABLE)
+        game_service.add_player(alice)
+        lobby.add_player(alice)
+
+        assert repository.players[alice.id] is alice
+        assert repository.lobby_players[alice.id] is alice
+
+    def test_default_services_get_separate_repositories(self):
+        assert GameService().repository is not GameService().repository
+
+
+class TestSqliteRepository:
+    @pytest.fixture
+    def db_path(self, tmp_path: Path) -> str:
+        return str(tmp_path / "state.db")
+
+    def _populate(self, repository: SqliteRepository) -> dict[str, str]:
+        game_service = GameService(repository)
+        lobby_service = LobbyService(Lobby(repository))
+
+        alice = Player("Alice", PlayerStatus.AVAILABLE)
+        bob = Player("Bob", PlayerStatus.AVAILABLE)
+        charlie = Player("Charlie", PlayerStatus.AVAILABLE)
+        for player in (alice, bob, charlie):
+            game_service.add_player(player)
+            lobby_service.join_lobby(player)
+
+        lobby_service.send_game_request(alice.id, bob.id)
+        lobby_service.accept_game_request(bob.id)
+        game_id = game_service.create_game_from_accepted_request(alice.id, bob.id)
+        game_service.place_ships_randomly(alice.id)
+        game_service.set_player_ready(alice.id)
+        game_service.get_or_create_ship_placement_board(charlie.id)
+
+        return {
+            "alice": alice.id,
+            "bob": bob.id,
+            "charlie": charlie.id,
+            "game": game_id,
+        }
+
+    def test_uses_wal_journal_mode(self, db_path: str):
+        repository = SqliteRepository(db_path)
+        repository.close()
+
+        connection = sqlite3.connect(db_path)
+        assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        connection.close()
+
+    def test_state_survives_restart(self, db_path: str):
+        repository = SqliteRepository(db_path)
+        ids = self._populate(repository)
+        repository.close()
+
+        reopened = SqliteRepository(db_path)
+        game_service = GameService(reopened)
+        lobby = Lobby(reopened)
+
+        alice = game_service.get_player(ids["alice"])
+        assert alice is not None
+        assert alice.status == PlayerStatus.IN_GAME
+        assert lobby.players[ids["alice"]] is alice
+        assert lobby.get_opponent(ids["alice"]) == ids["bob"]
+
+        game = game_service.games[ids["game"]]
+        assert game.status == GameStatus.SETUP
+        assert game_service.games_by_player[ids["bob"]] is game
+        assert game.player_1 is alice
+        assert len(game_service.get_game_board(ids["alice"]).ships) == 5
+        assert game_service.is_player_ready(ids["alice"])
+        assert ids["charlie"] in game_service.ship_placement_boards
+        reopened.close()
+
+    def test_deletions_are_persisted(self, db_path: str):
+        repository = SqliteRepository(db_path)
+        ids = self._populate(repository)
+        repository.flush()
+
+        game_service = GameService(repository)
+        game_service.evict_game(ids["game"])
+        repository.close()
+
+        reopened = SqliteRepository(db_path)
+        assert ids["game"] not in reopened.games
+        assert ids["alice"] not in reopened.games_by_player
+        assert ids["alice"] not in reopened.ready_players
+        reopened.close()
+
+    def test_writer_thread_batches_changes(self, db_path: str):
+        repository = SqliteRepository(db_path, batch_interval=0.05)
+        self._populate(repository)
+        repository.close()
+
+        # Many mutations are coalesced into a handful of transactions
+        assert 1 <= repository.batches_written < 10
+
+    def test_activity_alone_writes_nothing(self, db_path: str):
+        repository = SqliteRepository(db_path)
+        ids = self._populate(repository)
+        repository.flush()
+        batches: int = repository.batches_written
+
+        game_service = GameService(repository)
+        game_service.touch_player(ids["alice"])
+        game_service.touch_game(ids["game"])
+        repository.flush()
+
+        assert repository.batches_written == batches
+        repository.close()
+
+    def test_only_marked_rows_are_written(self, db_path: str):
+        repository = SqliteRepository(db_path)
+        ids = self._populate(repository)
+        repository.flush()
+        written: list[list[tuple[str, str]]] = []
+        repository.on_batch = written.append
+
+        GameService(repository).place_ships_randomly(ids["charlie"])
+        repository.flush()
+
+        assert written == [[("ship_placement_boards", ids["charlie"])]]
+        repository.close()
+
+    def test_rows_survive_a_failed_encoding(
+        self, db_path: str, monkeypatch: pytest.MonkeyPatch
+    ):
+        repository = SqliteRepository(db_path)
+        ids = self._populate(repository)
+        repository.flush()
+        GameService(repository).place_ships_randomly(ids["charlie"])
+
+        def fail(collection: str, key: str) -> str | None:
+            raise ValueError("cannot encode")
+
+        with monkeypatch.context() as patch:
+            patch.setattr(repository, "_encode_unlocked_row", fail)
+            with pytest.raises(ValueError):
+                repository.flush()
+        written: list[list[tuple[str, str]]] = []
+        repository.on_batch = written.append
+        repository.flush()
+
+        assert written == [[("ship_placement_boards", ids["charlie"])]]
+        repository.close()
+
+    def test_rows_are_encoded_under_their_owner_lock(self, db_path: str):
+        repository = SqliteRepository(db_path)
+        ids = self._populate(repository)
+        repository.flush()
+        game_service = GameService(repository)
+        game_service.place_ships_randomly(ids["charlie"])
+
+        with game_service.locks.hold(ids["charlie"]):
+            flusher = threading.Thread(target=repository.flush)
+            flusher.start()
+            flusher.join(timeout=0.1)
+            assert flusher.is_alive()
+        flusher.join(timeout=5)
+
+        assert not flusher.is_alive()
+        repository.close()
+
+    def test_game_board_changes_are_persisted(self, db_path: str):
+        repository = SqliteRepository(db_path)
+        ids = self._populate(repository)
+        repository.flush()
+
+        game_service = GameService(repository)
+        game_service.place_ships_randomly(ids["bob"])
+        repository.close()
+
+        reopened = SqliteRepository(db_path)
+        game_service = GameService(reopened)
+        assert len(game_service.get_game_board(ids["bob"]).ships) == 5
+        reopened.close()
+
+    def test_spilled_game_is_written_without_reloading_boards(
+        self, db_path: str, tmp_path: Path
+    ):
+        repository = SqliteRepository(db_path)
+        ids = self._populate(repository)
+        repository.flush()
+        game_service = GameService(repository)
+        store = TieredGameStore(tmp_path / "spill")
+        game_service.enable_tiering(store)
+        game = game_service.games[ids["game"]]
+        store.spill(game)
+
+        game.status = GameStatus.PLAYING
+        repository.mark_dirty("games", ids["game"])
+        repository.flush()
+
+        assert game.is_spilled
+        repository.close()
+        reopened = SqliteRepository(db_path)
+        restored = reopened.games[ids["game"]]
+        assert restored.status == GameStatus.PLAYING
+        assert len(GameService(reopened).get_game_board(ids["alice"]).ships) == 5
+        reopened.close()
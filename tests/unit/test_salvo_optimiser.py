@@ -0,0 +1,95 @@
+import pytest
+
+from game.model import Coord, ShipType, coord_to_cell
+from game.salvo_optimiser import (
+    PLACEMENTS,
+    PlacementTable,
+    choose_salvo,
+    salvo_information,
+)
+
+
+def mask_of(*coords: Coord) -> int:
+    mask = 0
+    for coord in coords:
+        mask |= 1 << coord_to_cell(coord)
+    return mask
+
+
+class TestPlacementTable:
+    def test_starts_with_every_placement(self):
+        table = PlacementTable()
+
+        for ship_type in ShipType:
+            assert len(table.placements[ship_type]) == len(PLACEMENTS[ship_type.length])
+        assert sum(table.marginals()) == pytest.approx(
+            sum(ship.length for ship in ShipType)
+        )
+
+    def test_misses_rule_out_placements(self):
+        table = PlacementTable()
+        row_a = mask_of(*(Coord[f"A{col}"] for col in range(1, 11)))
+
+        table.add_round(row_a, {}, ())
+
+        for masks in table.placements.values():
+            assert not any(mask & row_a for mask in masks)
+
+    def test_sinking_pins_the_ship_down(self):
+        table = PlacementTable()
+        salvo = mask_of(Coord.E5, Coord.E6, Coord.J10)
+
+        table.add_round(salvo, {ShipType.DESTROYER: 2}, (ShipType.DESTROYER,))
+
+        assert table.placements[ShipType.DESTROYER] == [mask_of(Coord.E5, Coord.E6)]
+        assert len(table.afloat()) == 4
+
+    def test_hit_ship_afloat_is_not_fully_covered(self):
+        table = PlacementTable()
+
+        table.add_round(mask_of(Coord.E5, Coord.E6), {ShipType.DESTROYER: 2}, ())
+
+        # Both cells hit but not sunk: impossible for a destroyer
+        assert table.placements[ShipType.DESTROYER] == []
+
+
+class TestChooseSalvo:
+    def test_salvo_is_distinct_unfired_cells(self):
+        table = PlacementTable()
+        fired = mask_of(Coord.E5, Coord.E6)
+        table.add_round(fired, {}, ())
+
+        salvo = choose_salvo(table, 6)
+
+        assert len(set(salvo)) == 6
+        assert not any(fired >> cell & 1 for cell in salvo)
+
+    def test_no_information_weight_picks_the_likeliest_cells(self):
+        table = PlacementTable()
+        chances = table.marginals()
+
+        salvo = choose_salvo(table, 6, information_weight=0)
+
+        assert sorted(chances[cell] for cell in salvo) == sorted(chances)[-6:]
+
+    def test_joint_salvo_is_more_informative_than_the_likeliest_cells(self):
+        table = PlacementTable()
+        table.add_round(mask_of(Coord.E5, Coord.B2), {ShipType.CARRIER: 1}, ())
+
+        joint = choose_salvo(table, 6, budget=10)
+        likeliest = choose_salvo(table, 6, information_weight=0)
+
+        assert salvo_information(table, joint) > salvo_information(table, likeliest)
+
+    def test_spent_budget_falls_back_to_the_likeliest_cells(self):
+        table = PlacementTable()
+
+        assert choose_salvo(table, 6, budget=0) == choose_salvo(
+            table, 6, information_weight=0
+        )
+
+    def test_short_of_cells(self):
+        table = PlacementTable()
+        table.add_round((1 << 98) - 1, {}, ())
+
+        assert sorted(choose_salvo(table, 6)) == [98, 99]
@@ -0,0 +1,55 @@
+import threading
+
+import pytest
+
+from services.shard_router import ShardRouter
+
+
+class TestShardRouter:
+    def test_shard_for_is_stable_and_in_range(self):
+        router = ShardRouter(4)
+        shards = {router.shard_for(f"player-{i}") for i in range(100)}
+
+        assert shards == {0, 1, 2, 3}
+        assert router.shard_for("player-1") == ShardRouter(4).shard_for("player-1")
+        router.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_inline_router_runs_on_calling_thread(self):
+        router = ShardRouter()
+
+        thread_name = await router.run(
+            "player-1", lambda: threading.current_thread().name
+        )
+
+        assert thread_name == threading.current_thread().name
+        assert router.tasks_run == [1]
+
+    @pytest.mark.asyncio
+    async def test_same_key_always_runs_on_same_shard_thread(self):
+        router = ShardRouter(4)
+
+        names = {
+            await router.run("game-1", lambda: threading.current_thread().name)
+            for _ in range(10)
+        }
+
+        assert len(names) == 1
+        assert names.pop().startswith("game-shard-")
+        assert sum(router.tasks_run) == 10
+        router.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_exceptions_propagate_to_caller(self):
+        router = ShardRouter(2)
+
+        def fail() -> None:
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            await router.run("player-1", fail)
+        router.shutdown()
+
+    def test_negative_shard_count_rejected(self):
+        with pytest.raises(ValueError):
+            ShardRouter(-1)
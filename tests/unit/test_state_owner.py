@@ -0,0 +1,186 @@
+import asyncio
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from fastapi import HTTPException
+
+import routes.helpers as helpers
+from game.game_service import GameService
+from game.lobby import Lobby
+from game.model import GameBoard
+from game.player import Player, PlayerStatus
+from routes.helpers import _on_shard, _submit_command
+from routes.ship_placement import _get_opponent_id_or_404, _place_ship
+from services.game_actor import GameActorRegistry, GameCommand
+from services.lobby_service import LobbyService
+from services.state_owner import (
+    RemoteGameService,
+    RemoteLobbyService,
+    StateClient,
+    StateOwner,
+)
+
+
+class OwnerProcess:
+    """A StateOwner serving from its own thread and event loop, as its own
+    process would."""
+
+    def __init__(self, socket_path: str) -> None:
+        self.lobby_service = LobbyService(Lobby())
+        self.game_service = GameService()
+        self.game_actors = GameActorRegistry(self.game_service)
+        self.owner = StateOwner(socket_path, self.lobby_service, self.game_service)
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+
+    def start(self) -> None:
+        self.thread.start()
+        asyncio.run_coroutine_threadsafe(self.owner.start(), self.loop).result(5)
+
+    def stop(self) -> None:
+        asyncio.run_coroutine_threadsafe(self.owner.stop(), self.loop).result(5)
+        asyncio.run_coroutine_threadsafe(self.game_actors.stop(), self.loop).result(5)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+
+
+@pytest.fixture
+def owner(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[OwnerProcess]:
+    process = OwnerProcess(str(tmp_path / "state.sock"))
+    # Route functions run in the owner find its services through the helpers
+    monkeypatch.setattr(helpers, "_game_service", process.game_service)
+    monkeypatch.setattr(helpers, "_lobby_service", process.lobby_service)
+    monkeypatch.setattr(helpers, "_game_actors", process.game_actors)
+    monkeypatch.setattr(helpers, "_state_client", None)
+    process.start()
+    yield process
+    process.stop()
+
+
+@pytest.fixture
+def clients(owner: OwnerProcess) -> Iterator[list[StateClient]]:
+    pair = [StateClient(owner.owner.socket_path) for _ in range(2)]
+    yield pair
+    for client in pair:
+        for sock in list(client._sockets):
+            sock.close()
+
+
+class TestStateOwner:
+    def test_write_on_one_worker_is_read_on_another(self, clients: list[StateClient]):
+        alice = Player("Alice", PlayerStatus.AVAILABLE)
+
+        RemoteGameService(clients[0]).add_player(alice)
+        RemoteLobbyService(clients[0]).join_lobby(alice)
+
+        copy: Player | None = RemoteGameService(clients[1]).get_player(alice.id)
+        assert copy is not None and copy.name == "Alice"
+        assert RemoteLobbyService(clients[1]).get_player_status(alice.id) == (
+            PlayerStatus.AVAILABLE
+        )
+
+    def test_state_is_held_once(self, owner: OwnerProcess, clients: list[StateClient]):
+        alice = Player("Alice", PlayerStatus.AVAILABLE)
+        RemoteGameService(clients[0]).add_player(alice)
+
+        assert owner.game_service.get_player(alice.id) is not None
+        assert owner.owner.calls_served == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_placements_from_two_workers_both_land(
+        self, owner: OwnerProcess, clients: list[StateClient]
+    ):
+        alice = Player("Alice", PlayerStatus.AVAILABLE)
+        owner.game_service.add_player(alice)
+
+        await asyncio.gather(
+            *(
+                client.call_async(
+                    _submit_command,
+                    alice.id,
+                    GameCommand.PLACE,
+                    _on_shard,
+                    alice.id,
+                    _place_ship,
+                    alice.id,
+                    ship_name,
+                    start,
+                    "horizontal",
+                )
+                for client, ship_name, start in (
+                    (clients[0], "Destroyer", "A1"),
+                    (clients[1], "Cruiser", "C1"),
+                )
+            )
+        )
+
+        board: GameBoard = RemoteGameService(
+            clients[0]
+        ).get_or_create_ship_placement_board(alice.id)
+        assert {ship.ship_type.ship_name for ship in board.ships} == {
+            "Destroyer",
+            "Cruiser",
+        }
+
+    def test_placement_board_keeps_its_identity_across_calls(
+        self, owner: OwnerProcess, clients: list[StateClient]
+    ):
+        alice = Player("Alice", PlayerStatus.AVAILABLE)
+        owner.game_service.add_player(alice)
+        held: GameBoard = owner.game_service.get_or_create_ship_placement_board(
+            alice.id
+        )
+
+        copy: GameBoard = RemoteGameService(
+            clients[0]
+        ).get_or_create_ship_placement_board(alice.id)
+
+        assert (copy.uid, copy.version) == (held.uid, held.version)
+
+    def test_errors_are_raised_in_the_worker(self, clients: list[StateClient]):
+        with pytest.raises(ValueError):
+            RemoteLobbyService(clients[0]).leave_lobby("nobody")
+        with pytest.raises(HTTPException) as error:
+            clients[0].call(_get_opponent_id_or_404, "nobody")
+        assert error.value.status_code == 404
+
+        # The connection is still usable afterwards
+        assert RemoteLobbyService(clients[0]).get_lobby_version() == 0
+
+    @pytest.mark.asyncio
+    async def test_change_on_one_worker_wakes_long_poll_on_another(
+        self, clients: list[StateClient]
+    ):
+        watcher, writer = clients
+        await watcher.start()
+        lobby = RemoteLobbyService(watcher)
+        version: int = lobby.get_lobby_version()
+        waiting = asyncio.create_task(lobby.wait_for_lobby_change(version))
+        await asyncio.sleep(0.05)
+        assert not waiting.done()
+
+        await asyncio.to_thread(
+            RemoteLobbyService(writer).join_lobby,
+            Player("Alice", PlayerStatus.AVAILABLE),
+        )
+
+        await asyncio.wait_for(waiting, timeout=2)
+        await watcher.stop()
+
+    @pytest.mark.asyncio
+    async def test_second_owner_on_same_socket_rejected(self, owner: OwnerProcess):
+        second = StateOwner(
+            owner.owner.socket_path, LobbyService(Lobby()), GameService()
+        )
+
+        with pytest.raises(OSError):
+            await second.start()
+
+    def test_unreachable_owner_raises_connection_error(self, tmp_path: Path):
+        client = StateClient(str(tmp_path / "missing.sock"))
+
+        with pytest.raises(ConnectionError):
+            RemoteLobbyService(client).get_lobby_version()
@@ -0,0 +1,134 @@
+"""Threaded stress tests for GameService and Lobby invariants.
+
+Threads hammer overlapping players with requests, accepts, declines, game
+creation and eviction, then the cross-collection invariants are checked. A
+tiny switch interval forces frequent thread switches on GIL builds; on
+free-threaded builds the threads genuinely run in parallel.
+"""
+
+import random
+import sys
+import threading
+from collections.abc import Callable, Iterator
+
+import pytest
+
+from game.exceptions import UnknownGameException
+from game.game_service import GameService
+from game.lobby import Lobby
+from game.locks import StripedLock
+from game.player import Player, PlayerStatus
+from services.lobby_service import LobbyService
+
+THREADS: int = 8
+OPERATIONS_PER_THREAD: int = 400
+PLAYERS: int = 24
+
+
+@pytest.fixture(autouse=True)
+def frequent_thread_switches() -> Iterator[None]:
+    interval: float = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def _run_threads(worker: Callable[[random.Random], None]) -> None:
+    errors: list[BaseException] = []
+
+    def run(seed: int) -> None:
+        try:
+            worker(random.Random(seed))
+        except BaseException as e:  # pragma: no cover - reported below
+            errors.append(e)
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+
+
+class TestStripedLock:
+    def test_overlapping_key_sets_do_not_deadlock(self):
+        locks = StripedLock(stripes=4)
+        counter: list[int] = [0]
+
+        def worker(rng: random.Random) -> None:
+            for _ in range(OPERATIONS_PER_THREAD):
+                keys = rng.sample(["a", "b", "c", "d", "e"], 3)
+                with locks.hold(*keys):
+                    counter[0] += 1
+
+        _run_threads(worker)
+        assert counter[0] == THREADS * OPERATIONS_PER_THREAD
+
+
+class TestGameServiceThreadSafety:
+    def test_games_by_player_consistent_with_games(self):
+        game_service = GameService()
+        players = [Player(f"P{i}", PlayerStatus.AVAILABLE) for i in range(PLAYERS)]
+        for player in players:
+            game_service.add_player(player)
+
+        def worker(rng: random.Random) -> None:
+            for _ in range(OPERATIONS_PER_THREAD):
+                sender, receiver = rng.sample(players, 2)
+                if rng.random() < 0.6:
+                    game_service.create_game_from_accepted_request(
+                        sender.id, receiver.id
+                    )
+                else:
+                    game = game_service.games_by_player.get(sender.id)
+                    if game is None:
+                        continue
+                    try:
+                        game_service.evict_game(game.id)
+                    except UnknownGameException:
+                        continue  # Evicted by another thread first
+
+        _run_threads(worker)
+
+        for player_id, game in game_service.games_by_player.items():
+            assert game_service.games.get(game.id) is game
+            assert player_id in (game.player_1.id, game.player_2.id)
+        for game_id, game in game_service.games.items():
+            for player in (game.player_1, game.player_2):
+                assert game_service.games_by_player[player.id] is game
+
+
+class TestLobbyThreadSafety:
+    def test_lobby_statuses_consistent_with_active_games(self):
+        lobby_service = LobbyService(Lobby())
+        players = [Player(f"P{i}", PlayerStatus.AVAILABLE) for i in range(PLAYERS)]
+        for player in players:
+            lobby_service.join_lobby(player)
+
+        def worker(rng: random.Random) -> None:
+            for _ in range(OPERATIONS_PER_THREAD):
+                sender, receiver = rng.sample(players, 2)
+                action: float = rng.random()
+                try:
+                    if action < 0.5:
+                        lobby_service.send_game_request(sender.id, receiver.id)
+                    elif action < 0.75:
+                        lobby_service.accept_game_request(receiver.id)
+                    else:
+                        lobby_service.decline_game_request(receiver.id)
+                except ValueError:
+                    continue  # Not available / no pending request
+
+        _run_threads(worker)
+
+        lobby = lobby_service.lobby
+        for player_id, opponent_id in lobby.active_games.items():
+            assert lobby.active_games.get(opponent_id) == player_id
+        for player in lobby.players.values():
+            in_game: bool = player.status == PlayerStatus.IN_GAME
+            assert in_game == (player.id in lobby.active_games)
+        for receiver_id, request in lobby.game_requests.items():
+            assert lobby.players[receiver_id].status == PlayerStatus.PENDING_RESPONSE
+            assert (
+                lobby.players[request.sender_id].status == PlayerStatus.REQUESTING_GAME
+            )
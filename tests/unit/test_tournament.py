@@ -0,0 +1,138 @@
+import random
+
+import pytest
+
+from game.cells import NEIGHBOURS
+from game.game_service import GameService
+from game.model import Coord, ShipType, coord_to_cell
+from game.strategies import (
+    STRATEGIES,
+    HuntStrategy,
+    RandomStrategy,
+    RoundReport,
+    Strategy,
+    make_strategy,
+)
+from game.tournament import play_game, run_tournament, schedule
+
+
+class TestStrategies:
+    @pytest.mark.parametrize("name", list(STRATEGIES))
+    def test_salvo_is_distinct_unfired_cells(self, name: str):
+        strategy = make_strategy(name, random.Random(0))
+        strategy.observe(RoundReport(1, (Coord.A1, Coord.E5), {}, ()))
+
+        salvo = strategy.choose_salvo(6)
+
+        assert len(set(salvo)) == 6
+        assert not {Coord.A1, Coord.E5} & set(salvo)
+
+    @pytest.mark.parametrize("name", list(STRATEGIES))
+    def test_salvo_is_cut_short_when_cells_run_out(self, name: str):
+        strategy = make_strategy(name, random.Random(0))
+        strategy.observe(RoundReport(1, tuple(Coord)[:97], {}, ()))
+
+        assert len(strategy.choose_salvo(6)) == 3
+
+    def test_unknown_strategy(self):
+        with pytest.raises(ValueError):
+            make_strategy("psychic")
+
+    def test_strategy_must_implement_choose_salvo(self):
+        with pytest.raises(TypeError):
+            Strategy()  # type: ignore[abstract]
+
+    def test_error_in_strategy_constructor_is_not_reported_as_unknown(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        class Broken(RandomStrategy):
+            def __init__(self, rng: random.Random | None = None) -> None:
+                raise KeyError("missing setting")
+
+        monkeypatch.setitem(STRATEGIES, "broken", Broken)
+
+        with pytest.raises(KeyError):
+            make_strategy("broken")
+
+    def test_hunt_follows_up_a_hit_on_a_live_ship(self):
+        strategy = HuntStrategy(random.Random(0))
+        strategy.observe(RoundReport(1, (Coord.E5,), {ShipType.CARRIER: 1}, ()))
+
+        salvo = strategy.choose_salvo(6)
+
+        neighbours = set(NEIGHBOURS[coord_to_cell(Coord.E5)])
+        assert {coord_to_cell(coord) for coord in salvo} <= neighbours
+
+    def test_hunt_ignores_hits_on_sunk_ships(self):
+        strategy = HuntStrategy(random.Random(0))
+        strategy.observe(
+            RoundReport(
+                1, (Coord.A1, Coord.A2), {ShipType.DESTROYER: 2}, (ShipType.DESTROYER,)
+            )
+        )
+
+        salvo = strategy.choose_salvo(2)
+
+        # Spread out, rather than packed round the sunk destroyer
+        assert coord_to_cell(salvo[1]) not in NEIGHBOURS[coord_to_cell(salvo[0])]
+
+
+class TestTournament:
+    def test_game_is_played_to_the_end_and_cleaned_up(self):
+        game_service = GameService()
+
+        result = play_game(game_service, ("hunt", "random"), seed=1)
+
+        assert result.winner in (0, 1, 2)
+        assert 1 <= result.rounds <= 100
+        assert len(result.latencies[0]) == result.rounds
+        assert game_service.games == {}
+        assert game_service.players == {}
+
+    def test_games_are_repeatable(self):
+        first = play_game(GameService(), ("hunt", "random"), seed=5)
+        second = play_game(GameService(), ("hunt", "random"), seed=5)
+
+        assert (first.winner, first.rounds) == (second.winner, second.rounds)
+
+    def test_searching_strategies_are_repeatable(self):
+        first = play_game(GameService(), ("optimiser", "likeliest"), seed=5)
+        second = play_game(GameService(), ("optimiser", "likeliest"), seed=5)
+
+        assert (first.winner, first.rounds) == (second.winner, second.rounds)
+
+    def test_global_random_state_is_left_alone(self):
+        random.seed(42)
+        expected = random.random()
+        random.seed(42)
+
+        play_game(GameService(), ("hunt", "random"), seed=5)
+
+        assert random.random() == expected
+
+    def test_seats_alternate(self):
+        games = list(schedule(["hunt", "random"], 4, seed=0))
+
+        assert [seats for seats, _ in games] == [
+            ("hunt", "random"),
+            ("random", "hunt"),
+        ] * 2
+        assert len({seed for _, seed in games}) == 4
+
+    def test_results_do_not_depend_on_workers(self):
+        in_process = run_tournament(["hunt", "random"], 12, seed=3, workers=1)
+        pooled = run_tournament(["hunt", "random"], 12, seed=3, workers=2)
+
+        for name in ("hunt", "random"):
+            assert in_process[name].games == 12
+            assert (in_process[name].wins, in_process[name].rounds) == (
+                pooled[name].wins,
+                pooled[name].rounds,
+            )
+            assert len(pooled[name].latencies) == pooled[name].rounds
+
+    def test_self_play(self):
+        stats = run_tournament(["random"], 4, workers=1)["random"]
+
+        assert stats.games == 8  # Both seats of every game
+        assert stats.win_rate == pytest.approx(0.5)